@@ -1,18 +1,30 @@
 """Adds music to the library."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 import moe
 from moe import config
 
-from . import add_cli, add_core
-from .add_core import *  # noqa: F403
+if TYPE_CHECKING:
+    from .add_core import *  # noqa: F403
 
-__all__ = []
-__all__.extend(add_core.__all__)
+PLUGIN_INFO = config.PluginInfo(
+    hooks=frozenset({"add_import_prompt_choice", "pre_add"}),
+    commands=frozenset({"add"}),
+)
 
 
 @moe.hookimpl
 def plugin_registration() -> None:
     """Only register the cli sub-plugin if the cli is enabled."""
+    from . import add_cli, add_core  # noqa: PLC0415 deferred, see `PLUGIN_INFO`
+
     config.CONFIG.pm.register(add_core, "add_core")
     if config.CONFIG.pm.has_plugin("cli"):
         config.CONFIG.pm.register(add_cli, "add_cli")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 any attribute of the core api
+    """Imports the core API once it's used."""
+    return getattr(importlib.import_module(f"{__name__}.add_core"), name)
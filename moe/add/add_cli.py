@@ -8,8 +8,8 @@ from typing import TYPE_CHECKING, cast
 
 import moe
 import moe.add
-from moe.add.add_core import AddError
-from moe.library import Album, AlbumError, Extra, Track, TrackError
+from moe.add.add_core import AddError, SkipAddError
+from moe.library import Album, AlbumError, Extra, LibItem, Track, TrackError
 from moe.query import QueryType
 from moe.util.cli import PromptChoice
 from moe.util.cli.query import cli_query
@@ -24,10 +24,6 @@ log = logging.getLogger("moe.cli.add")
 __all__: list[str] = []
 
 
-class SkipAddError(Exception):
-    """Used to skip adding a single item."""
-
-
 @moe.hookimpl
 def add_command(cmd_parsers: argparse._SubParsersAction) -> None:
     """Adds the ``add`` command to Moe's CLI."""
@@ -67,7 +63,8 @@ def _skip_import(
 def _parse_args(session: Session, args: argparse.Namespace) -> None:
     """Parses the given commandline arguments.
 
-    Tracks can be added as files or albums as directories.
+    Tracks can be added as files or albums as directories. All the items are added
+    to the library at once.
 
     Args:
         session: Library db session.
@@ -90,44 +87,48 @@ def _parse_args(session: Session, args: argparse.Namespace) -> None:
         album = albums[0]
 
     error_count = 0
+    items: list[LibItem] = []
     for path in paths:
         try:
-            _add_path(session, path, album)
+            items.append(_get_item(path, album))
         except (AddError, AlbumError):  # noqa: PERF203
             log.exception("Error adding item.")
             error_count += 1
-        except SkipAddError:
-            log.debug(f"Skipped adding item. [{path=}]")
+
+    if items:
+        _, failed_items = moe.add.add_items(session, items)
+        error_count += len(failed_items)
 
     if error_count:
         raise SystemExit(1)
 
 
-def _add_path(session: Session, path: Path, album: Album | None) -> None:
-    """Adds an item to the library from a given path.
+def _get_item(path: Path, album: Album | None) -> LibItem:
+    """Creates an item to add to the library from a given path.
 
     Args:
-        session: Library db session.
         path: Path to add. Either a directory for an Album or a file for a Track.
         album: If ``path`` is a file, add it to ``album`` if given. Note, this
             argument is required if adding an Extra.
 
+    Returns:
+        The item to add.
+
     Raises:
-        AddError: Path not found or other issue adding the item to the library.
+        AddError: Path not found or an album is required to add an extra.
         AlbumError: Could not create an album from the given directory.
-        SkipAddError: External program or user elected to skip adding the item.
     """
     if path.is_file():
         try:
-            moe.add.add_item(session, Track.from_file(path, album=album))
+            return Track.from_file(path, album=album)
         except TrackError:
             if not album:
                 err_msg = f"An album query is required to add an extra. [{path=}]"
                 raise AddError(err_msg) from None
 
-            moe.add.add_item(session, Extra(album, path))
+            return Extra(album, path)
     elif path.is_dir():
-        moe.add.add_item(session, Album.from_dir(path))
-    else:
-        err_msg = f"Path not found. [{path=}]"
-        raise AddError(err_msg)
+        return Album.from_dir(path)
+
+    err_msg = f"Path not found. [{path=}]"
+    raise AddError(err_msg)
@@ -1,9 +1,12 @@
 """Adds music to the library.
 
-This module provides the main entry point into the add process via ``add_item()``.
+This module provides the main entry points into the add process via ``add_item()``,
+or ``add_items()`` to add many items at once.
 """
 
 import logging
+from collections.abc import Iterable
+from itertools import islice
 
 import pluggy
 from sqlalchemy.orm.session import Session
@@ -12,10 +15,12 @@ import moe
 from moe import config
 from moe.library import LibItem
 
-__all__ = ["AddAbortError", "AddError", "add_item"]
+__all__ = ["AddAbortError", "AddError", "SkipAddError", "add_item", "add_items"]
 
 log = logging.getLogger("moe.add")
 
+DEFAULT_BATCH_SIZE = 500
+
 
 class Hooks:
     """Add plugin hook specifications."""
@@ -31,6 +36,9 @@ class Hooks:
         Args:
             item: Library item being added.
 
+        Raises:
+            SkipAddError: Skip adding the item.
+
         Note:
             Any UI application should have a way of detecting and resolving duplicate
             items prior to them being added to the database. You may consider
@@ -62,6 +70,10 @@ class AddAbortError(Exception):
     """Add process has been aborted by the user."""
 
 
+class SkipAddError(Exception):
+    """Used to skip adding a single item."""
+
+
 def add_item(session: Session, item: LibItem) -> None:
     """Adds a LibItem to the library.
 
@@ -71,6 +83,7 @@ def add_item(session: Session, item: LibItem) -> None:
 
     Raises:
         AddError: Unable to add the item to the library.
+        SkipAddError: External program or user elected to skip adding the item.
     """
     log.debug(f"Adding item to the library. [{item=}]")
 
@@ -79,3 +92,67 @@ def add_item(session: Session, item: LibItem) -> None:
     session.flush()
 
     log.info(f"Added item to the library. [{item=!s}]")
+
+
+def add_items(
+    session: Session, items: Iterable[LibItem], batch_size: int = DEFAULT_BATCH_SIZE
+) -> tuple[list[LibItem], list[LibItem]]:
+    """Adds many LibItems to the library.
+
+    Items are flushed to the database in batches, so the ``edit_new_items`` and
+    ``process_new_items`` hooks are given each batch of items at once rather than one
+    item at a time. Any items skipped or that fail during the ``pre_add`` hook are not
+    added, and any failures are logged.
+
+    Args:
+        session: Library db session.
+        items: Items to be added.
+        batch_size: Number of items to flush to the database at a time.
+
+    Returns:
+        The items added to the library, and the items that failed to be added.
+
+    Raises:
+        ValueError: ``batch_size`` is less than 1.
+    """
+    if batch_size < 1:
+        err_msg = f"The batch size must be at least 1. [{batch_size=}]"
+        raise ValueError(err_msg)
+
+    added_items: list[LibItem] = []
+    failed_items: list[LibItem] = []
+    items_iter = iter(items)
+    while batch := list(islice(items_iter, batch_size)):
+        log.debug(f"Adding items to the library. [{batch=}]")
+
+        new_items, batch_failed_items = _pre_add_batch(batch)
+        session.add_all(new_items)
+        session.flush()
+        added_items.extend(new_items)
+        failed_items.extend(batch_failed_items)
+
+    log.info(f"Added items to the library. [{len(added_items)=}, {len(failed_items)=}]")
+    return added_items, failed_items
+
+
+def _pre_add_batch(batch: list[LibItem]) -> tuple[list[LibItem], list[LibItem]]:
+    """Runs the ``pre_add`` hook for each item of a batch.
+
+    Returns:
+        The items of the batch to add, i.e. that weren't skipped, and the items that
+        failed to be added.
+    """
+    new_items: list[LibItem] = []
+    failed_items: list[LibItem] = []
+    for item in batch:
+        try:
+            config.CONFIG.pm.hook.pre_add(item=item)
+        except SkipAddError:  # noqa: PERF203 try-except must be inside loop
+            log.debug(f"Skipped adding item. [{item=}]")
+        except AddError:
+            log.exception(f"Unable to add item. [path={item.path}]")
+            failed_items.append(item)
+        else:
+            new_items.append(item)
+
+    return new_items, failed_items
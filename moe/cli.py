@@ -100,9 +100,9 @@ def _parse_args(args: list[str]) -> None:
     """
     moe_parser = _create_arg_parser()
 
-    # load all sub-commands
     cmd_parsers = moe_parser.add_subparsers(help="command to run", dest="command")
-    config.CONFIG.pm.hook.add_command(cmd_parsers=cmd_parsers)
+    command = next((arg for arg in args if not arg.startswith("-")), None)
+    _add_commands(cmd_parsers, command)
 
     parsed_args = moe_parser.parse_args(args)
 
@@ -122,6 +122,27 @@ def _parse_args(args: list[str]) -> None:
             raise
 
 
+def _add_commands(cmd_parsers: argparse._SubParsersAction, command: str | None) -> None:
+    """Adds the sub-commands, only loading the plugins of ``command`` if possible.
+
+    Args:
+        cmd_parsers: Parsers to add the sub-commands to.
+        command: Sub-command being run, if any.
+    """
+    pm = config.CONFIG.pm
+    pm.load_command_plugins(command)
+    pm.hook.add_command(cmd_parsers=cmd_parsers)
+    if command and command in cmd_parsers.choices:
+        return
+
+    # unknown or missing sub-command, so add them all to show in the help message
+    added_plugins = pm.get_plugins()
+    pm.load_command_plugins(None)
+    pm.subset_hook_caller("add_command", remove_plugins=added_plugins)(
+        cmd_parsers=cmd_parsers
+    )
+
+
 def _create_arg_parser() -> argparse.ArgumentParser:
     """Creates the root argument parser."""
     version = importlib.metadata.version("moe")
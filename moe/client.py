@@ -0,0 +1,128 @@
+"""Entry point of the ``moe`` command.
+
+If a ``moe serve`` daemon is running, the command is sent to it instead of paying the
+startup cost of initializing the configuration, plugins, and database. Otherwise, the
+command is run by ``moe.cli`` as usual.
+
+Note:
+    This module is imported by every ``moe`` command, so it should only import what's
+    needed to talk to the daemon.
+"""
+
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+from pathlib import Path
+
+__all__ = ["LOCAL_COMMANDS", "main", "run_on_daemon"]
+
+log = logging.getLogger("moe.client")
+
+SOCKET_FILENAME = "moe.sock"
+STD_FDS = (0, 1, 2)  # stdin, stdout, and stderr are sent to the daemon
+
+LOCAL_COMMANDS = frozenset({"api", "serve"})
+"""Commands that run until they're interrupted, so they're never sent to the daemon."""
+
+
+def main(args: list[str] = sys.argv[1:]) -> None:
+    """Runs the CLI, on the ``moe serve`` daemon if it's running."""
+    exit_code = run_on_daemon(args)
+    if exit_code is not None:
+        raise SystemExit(exit_code)
+
+    import moe.cli  # noqa: PLC0415 slow to import, and not needed if the daemon is up
+
+    moe.cli.main(args)
+
+
+def run_on_daemon(args: list[str], socket_path: Path | None = None) -> int | None:
+    """Runs a command on the daemon, if it's running.
+
+    The daemon uses this process' standard streams, working directory, and
+    environment.
+
+    Args:
+        args: Commandline arguments of the command to run.
+        socket_path: Filesystem path of the daemon's socket. Defaults to the socket
+            in the configuration directory.
+
+    Returns:
+        The exit code of the command, or ``None`` if no daemon is running or the
+        command is in :const:`LOCAL_COMMANDS`.
+    """
+    if sys.platform == "win32" or get_command(args) in LOCAL_COMMANDS:
+        return None
+
+    socket_path = socket_path or _get_config_dir() / SOCKET_FILENAME
+    sock = connect(socket_path)
+    if not sock:
+        return None
+
+    log.debug(f"Running command on the daemon. [{args=}, {socket_path=}]")
+    with sock:
+        return _request(sock, args)
+
+
+def connect(socket_path: Path) -> socket.socket | None:
+    """Returns a socket connected to ``socket_path``, or None if nothing's listening."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+
+    return sock
+
+
+def get_command(args: list[str]) -> str | None:
+    """Returns the sub-command given in ``args``, if any."""
+    return next((arg for arg in args if not arg.startswith("-")), None)
+
+
+def _get_config_dir() -> Path:
+    """Returns the configuration directory the same way `Config` does."""
+    try:
+        return Path(os.environ["MOE_CONFIG_DIR"])
+    except KeyError:
+        return Path.home() / ".config" / "moe"
+
+
+def _request(sock: socket.socket, args: list[str]) -> int:
+    """Sends a command to the daemon and waits for it to finish.
+
+    Each line the daemon sends back is a json object with either the ``pid`` of the
+    process running the command, or its ``exit_code`` once it's done.
+
+    Args:
+        sock: Socket connected to the daemon.
+        args: Commandline arguments of the command to run.
+
+    Returns:
+        The exit code of the command.
+    """
+    request = {"args": args, "cwd": str(Path.cwd()), "env": dict(os.environ)}
+    socket.send_fds(sock, [json.dumps(request).encode() + b"\n"], list(STD_FDS))
+
+    responses = sock.makefile("rb")
+    pid = None
+    while True:
+        try:
+            line = responses.readline()
+        except KeyboardInterrupt:
+            if pid:  # the command runs outside of our terminal's process group
+                os.kill(pid, signal.SIGINT)
+            continue
+
+        if not line:
+            log.error("Lost connection to the daemon.")
+            return 1
+
+        response = json.loads(line)
+        if "exit_code" in response:
+            return response["exit_code"]
+        pid = response["pid"]
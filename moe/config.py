@@ -25,15 +25,15 @@ See Also:
 import importlib.metadata
 import logging
 import os
-import re
+import sqlite3
 import sys
+import threading
+from collections.abc import Callable
 from itertools import chain
 from pathlib import Path
 from types import ModuleType
 from typing import Any, NamedTuple, cast
 
-import alembic.command
-import alembic.config
 import dynaconf
 import dynaconf.base
 import dynaconf.validator
@@ -42,18 +42,27 @@ import sqlalchemy
 import sqlalchemy.event
 import sqlalchemy.orm
 from sqlalchemy.engine.base import Connection
+from sqlalchemy.pool import ConnectionPoolEntry
 
 import moe
 
 moe_sessionmaker = sqlalchemy.orm.sessionmaker(autoflush=False)
 
-__all__ = ["CONFIG", "Config", "ConfigValidationError", "ExtraPlugin"]
+__all__ = [
+    "CONFIG",
+    "Config",
+    "ConfigValidationError",
+    "ExtraPlugin",
+    "PluginInfo",
+    "PluginManager",
+]
 
 log = logging.getLogger("moe.config")
 
 DEFAULT_PLUGINS = {
     "add": "moe.add",
     "cli": "moe.cli",
+    "db": "moe.db",
     "duplicate": "moe.duplicate",
     "edit": "moe.edit",
     "import": "moe.moe_import",
@@ -61,12 +70,60 @@ DEFAULT_PLUGINS = {
     "move": "moe.move",
     "read": "moe.read",
     "remove": "moe.remove",
+    "serve": "moe.serve",
+    "stats": "moe.stats",
+    "sync": "moe.sync",
     "write": "moe.write",
 }
 OFFICIAL_PLUGINS = {
+    "api": "moe.plugins.api",
     "musicbrainz": "moe.plugins.musicbrainz",
     "transcode": "moe.plugins.transcode",
 }
+
+
+class PluginInfo(NamedTuple):
+    """Metadata of a plugin package, used to defer registering its sub-plugins.
+
+    A plugin package may declare its metadata as ``PLUGIN_INFO`` in its
+    ``__init__.py``. The package itself is registered on startup as usual, but its
+    ``plugin_registration`` hook, and so the import and registration of its
+    sub-plugins, is deferred until one of the hooks or commands below is needed.
+
+    Attributes:
+        hooks: Hooks specified or implemented by the plugin's sub-plugins. The
+            sub-plugins are registered once any of them is called. ``add_command``,
+            ``add_hooks``, and ``plugin_registration`` are implied.
+        commands: CLI sub-commands, including aliases, added by the plugin's
+            sub-plugins. The sub-plugins are registered if any of them is run.
+    """
+
+    hooks: frozenset[str] = frozenset()
+    commands: frozenset[str] = frozenset()
+
+
+DEFAULT_AUDIO_EXTENSIONS = [
+    "aac",
+    "aif",
+    "aifc",
+    "aiff",
+    "alac",
+    "ape",
+    "asf",
+    "dsf",
+    "flac",
+    "m4a",
+    "m4b",
+    "mp3",
+    "mp4",
+    "mpc",
+    "oga",
+    "ogg",
+    "opus",
+    "wav",
+    "wma",
+    "wv",
+]
 CORE_PLUGINS = {
     "config": "moe.config",
     "album": "moe.library.album",
@@ -75,6 +132,23 @@ CORE_PLUGINS = {
     "lib_item": "moe.library.lib_item",
 }  # {name: module} of plugins that cannot be overwritten by the config
 
+SCHEMA_REVISION = "2b8e6f0d4a93"
+"""Alembic head revision of the library database, i.e. of the newest migration.
+
+This must be updated along with each new migration, and lets Moe skip loading alembic
+when the database is already up to date.
+"""
+
+# `database` settings applied to each sqlite connection, in order
+SQLITE_PRAGMAS = (
+    "busy_timeout",  # first, so changing the journal mode waits on any locks
+    "journal_mode",
+    "synchronous",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+)
+
 CONFIG = cast("Config", None)
 
 
@@ -199,11 +273,35 @@ class Hooks:
 def add_config_validator(settings: dynaconf.base.LazySettings) -> None:
     """Validate move plugin configuration settings."""
     moe_validators = [
+        dynaconf.Validator("AUDIO_EXTENSIONS", default=DEFAULT_AUDIO_EXTENSIONS),
+        dynaconf.Validator("DATABASE.BUSY_TIMEOUT", default=5000, gte=0),
+        dynaconf.Validator("DATABASE.CACHE_SIZE", default=-65536, is_type_of=int),
+        dynaconf.Validator(
+            "DATABASE.JOURNAL_MODE",
+            default="wal",
+            cast=str.lower,
+            is_in=["delete", "memory", "off", "persist", "truncate", "wal"],
+        ),
+        dynaconf.Validator("DATABASE.MMAP_SIZE", default=268435456, gte=0),
+        dynaconf.Validator(
+            "DATABASE.SYNCHRONOUS",
+            default="normal",
+            cast=str.lower,
+            is_in=["extra", "full", "normal", "off"],
+        ),
+        dynaconf.Validator(
+            "DATABASE.TEMP_STORE",
+            default="memory",
+            cast=str.lower,
+            is_in=["default", "file", "memory"],
+        ),
         dynaconf.Validator("DEFAULT_PLUGINS", default=DEFAULT_PLUGINS),
         dynaconf.Validator("DISABLE_PLUGINS", default=set()),
         dynaconf.Validator("ENABLE_PLUGINS", default=set()),
+        dynaconf.Validator("INDEXED_FIELDS", default={}, is_type_of=dict),
         dynaconf.Validator("LIBRARY_PATH", default="~/Music"),
         dynaconf.Validator("ORIGINAL_DATE", default=False),
+        dynaconf.Validator("READ_THREADS", default=1, gte=1),
     ]
     settings.validators.register(*moe_validators)  # type: ignore[reportCallIssue, reportAttributeAccessIssue]
 
@@ -220,6 +318,162 @@ class ExtraPlugin(NamedTuple):
     name: str
 
 
+class PluginManager(pluggy.PluginManager):
+    """Plugin manager that can defer registering sub-plugins until they're needed.
+
+    Plugins declaring a `PluginInfo` as ``PLUGIN_INFO`` are registered as usual, but
+    their sub-plugins are only imported and registered once one of their hooks is
+    accessed through ``hook``, one of their commands is run, or they, or one of their
+    sub-plugins, are looked up by name. This keeps Moe's startup time from growing
+    with each enabled plugin.
+    """
+
+    def __init__(self, project_name: str) -> None:
+        """Creates a plugin manager for ``project_name`` hooks."""
+        super().__init__(project_name)
+        self.hook = _LazyHookRelay(self)  # type: ignore[reportAttributeAccessIssue]
+        self._deferred_plugins: dict[str, PluginInfo] = {}
+        self._loading: set[str] = set()
+        self._load_lock = threading.RLock()
+        self._registering = threading.local()  # per thread, as others may load plugins
+
+    def is_deferred(self, name: str) -> bool:
+        """Returns whether the sub-plugins of ``name`` are yet to be registered."""
+        return name in self._deferred_plugins
+
+    def register_sub_plugins(self) -> None:
+        """Calls ``plugin_registration`` for each plugin that isn't deferred."""
+        registered_plugins = dict(self.list_name_plugin())
+        deferred_plugins = [registered_plugins[name] for name in self._deferred_plugins]
+        self.subset_hook_caller("plugin_registration", remove_plugins=deferred_plugins)(
+            pm=self
+        )
+
+    def load_command_plugins(self, command: str | None) -> None:
+        """Loads the deferred plugins adding a CLI sub-command.
+
+        Args:
+            command: Sub-command to load the plugins of. If ``None``, every deferred
+                plugin that adds a sub-command is loaded, e.g. to display them all in
+                the help message.
+        """
+        if command is None:
+            self._load_deferred(lambda _, info: bool(info.commands))
+        else:
+            self._load_deferred(lambda _, info: command in info.commands)
+
+    def load_deferred_plugins(self) -> None:
+        """Loads every deferred plugin."""
+        self._load_deferred(lambda _name, _info: True)
+
+    def get_plugin(self, name: str) -> Any | None:  # noqa: ANN401 any plugin
+        """Returns the plugin registered as ``name``, loading it first if deferred.
+
+        Sub-plugins of deferred plugins, e.g. ``edit_cli``, are also loaded.
+        """
+        self._load_deferred(
+            lambda plugin_name, _: name == plugin_name
+            or name.startswith(f"{plugin_name}_")
+        )
+        return super().get_plugin(name)
+
+    def add_hookspecs(self, module_or_class: object) -> None:
+        """Adds new hook specifications defined in ``module_or_class``."""
+        registering = getattr(self._registering, "active", False)
+        self._registering.active = True
+        try:
+            super().add_hookspecs(module_or_class)
+        finally:
+            self._registering.active = registering
+
+    def register(self, plugin: object, name: str | None = None) -> str | None:
+        """Registers a plugin and its hook implementations.
+
+        If the plugin declares ``PLUGIN_INFO``, its sub-plugins are deferred.
+        """
+        registering = getattr(self._registering, "active", False)
+        self._registering.active = True
+        try:
+            plugin_name = super().register(plugin, name)
+        finally:
+            self._registering.active = registering
+
+        info = getattr(plugin, "PLUGIN_INFO", None)
+        if plugin_name and isinstance(info, PluginInfo):
+            self._deferred_plugins[plugin_name] = info
+        return plugin_name
+
+    def _load_hook_plugins(self, hook_name: str) -> None:
+        """Loads the deferred plugins implementing ``hook_name``."""
+        if not getattr(self._registering, "active", False):
+            self._load_deferred(lambda _, info: hook_name in info.hooks)
+
+    def _find_deferred(self, predicate: Callable[[str, PluginInfo], bool]) -> list[str]:
+        """Returns the names of the deferred plugins matching ``predicate``.
+
+        Plugins that are already being loaded are excluded.
+        """
+        return [
+            name
+            for name, info in self._deferred_plugins.items()
+            if name not in self._loading and predicate(name, info)
+        ]
+
+    def _load_deferred(self, predicate: Callable[[str, PluginInfo], bool]) -> None:
+        """Registers the sub-plugins of the deferred plugins matching ``predicate``.
+
+        Hooks may be called from several threads, so plugins are loaded under a lock
+        and stay deferred until they're fully registered. This way, other threads
+        wait for them rather than calling a hook without them.
+        """
+        if not self._deferred_plugins:
+            return
+
+        with self._load_lock:
+            for name in self._find_deferred(predicate):
+                if name not in self._deferred_plugins:
+                    continue  # loaded while loading a previous plugin
+
+                self._loading.add(name)
+                try:
+                    self._load_plugin(name)
+                finally:
+                    self._loading.discard(name)
+                    del self._deferred_plugins[name]
+
+    def _load_plugin(self, name: str) -> None:
+        """Registers the sub-plugins of the deferred plugin ``name``."""
+        plugin = super().get_plugin(name)
+        if plugin is None:
+            return  # unregistered since
+
+        log.debug(f"Loading deferred plugin. [{name=}]")
+
+        # mirror the start-up registration of the plugin's sub-plugins
+        registered_plugins = set(super().get_plugins())
+        self.subset_hook_caller(
+            "plugin_registration", remove_plugins=registered_plugins - {plugin}
+        )(pm=self)
+        self.subset_hook_caller("add_hooks", remove_plugins=registered_plugins)(pm=self)
+
+
+class _LazyHookRelay(pluggy.HookRelay):  # type: ignore[reportGeneralTypeIssues]
+    """Hook relay that loads any deferred plugins implementing a hook on access."""
+
+    # hook callers are stored in `__dict__`, so the manager must be kept out of it
+    __slots__ = ("_pm",)
+
+    def __init__(self, pm: PluginManager) -> None:
+        """Creates a hook relay for ``pm``."""
+        self._pm = pm
+
+    def __getattribute__(self, name: str) -> Any:  # noqa: ANN401 any attribute
+        """Loads any deferred plugins implementing hook ``name`` before returning."""
+        if name[0] != "_":
+            object.__getattribute__(self, "_pm")._load_hook_plugins(name)  # noqa: SLF001
+        return object.__getattribute__(self, name)
+
+
 class Config:
     """Initializes moe configuration settings and database.
 
@@ -289,22 +543,45 @@ class Config:
         if not self.engine:
             self.engine = sqlalchemy.create_engine("sqlite:///" + str(db_path))
 
+        @sqlalchemy.event.listens_for(self.engine, "connect")
+        def set_sqlite_pragmas(
+            dbapi_connection: sqlite3.Connection,
+            connection_record: ConnectionPoolEntry,  # noqa: ARG001
+        ) -> None:
+            """Applies the ``database`` settings to each new sqlite connection.
+
+            Args:
+                dbapi_connection: Raw DB-API connection object.
+                connection_record: Pool entry of the connection.
+            """
+            cursor = dbapi_connection.cursor()
+            for pragma in SQLITE_PRAGMAS:
+                # values are validated, so they're safe to format into the statement
+                value = self.settings.database[pragma]
+                cursor.execute(f"PRAGMA {pragma} = {value}")
+            cursor.close()
+
         moe_sessionmaker.configure(bind=self.engine)
 
         # create and update database tables
         if create_tables:
-            config_path = Path(__file__)
-            alembic_cfg = alembic.config.Config(
-                str(config_path.parents[0] / "moe_alembic" / "alembic.ini")
+            from moe.library.lib_item import (  # noqa: PLC0415 prevent circular import
+                update_indexed_fields,
             )
-            alembic_cfg.attributes["configure_logger"] = False
+
+            schema_revision = self._get_schema_revision()
             with self.engine.begin() as connection:
-                alembic_cfg.attributes["connection"] = connection
-                alembic.command.upgrade(alembic_cfg, "head")
+                if schema_revision != SCHEMA_REVISION:
+                    _upgrade_db(connection, schema_revision)
+                update_indexed_fields(connection)
 
         self.pm.hook.register_sa_event_listeners()
 
         # create regular expression function for sqlite queries
+        from moe.util.core.regex import (  # noqa: PLC0415 prevent circular import
+            regexp,
+        )
+
         @sqlalchemy.event.listens_for(self.engine, "begin")
         def sqlite_engine_connect(conn: Connection) -> None:
             """Use the python re module for sqlite regex functionality.
@@ -312,23 +589,20 @@ class Config:
             Args:
                 conn: Raw DB-API connection object
             """
-            conn.connection.create_function("regexp", 2, _regexp, deterministic=True)  # type: ignore[reportAttributeAccessIssue]
-
-        def _regexp(pattern: str, col_value: object) -> bool:
-            """Use the python re module for sqlite regular expression functionality.
-
-            Args:
-                pattern: Regular expression pattern.
-                col_value: Column value to match against. The match will be against
-                    the str of the value.
-
-            Returns:
-                Whether or not the match was successful.
-            """
-            return re.search(pattern, str(col_value), re.IGNORECASE) is not None
+            conn.connection.create_function("regexp", 2, regexp, deterministic=True)  # type: ignore[reportAttributeAccessIssue]
 
         log.debug(f"Initialized database. [engine={self.engine!r}]")
 
+    def _get_schema_revision(self) -> str | None:
+        """Returns the alembic revision of the database, or None if it has none."""
+        with self.engine.connect() as connection:
+            try:
+                return connection.exec_driver_sql(
+                    "SELECT version_num FROM alembic_version"
+                ).scalar()
+            except sqlalchemy.exc.OperationalError:
+                return None  # new database
+
     def _read_config(self) -> None:
         """Reads the user configuration settings.
 
@@ -376,9 +650,7 @@ class Config:
         """Setup pm and hook logic."""
         log.debug("Setting up plugins.")
 
-        self.pm = cast(
-            "Any", pluggy.PluginManager("moe")
-        )  # avoids pluggy hook type errors
+        self.pm = cast("Any", PluginManager("moe"))  # avoids pluggy hook type errors
 
         # register core modules that cannot be disabled by the config
         for plugin_name, module in CORE_PLUGINS.items():
@@ -418,9 +690,9 @@ class Config:
                 self.enabled_plugins, self.config_dir / "plugins"
             )
 
-        # register third-party installed plugins
-        plugins = importlib.metadata.entry_points().select(group="moe.plugins")
-        if plugins:
+        # register third-party installed plugins, if any other plugins are enabled
+        if any(not self._is_registered(plugin) for plugin in self.enabled_plugins):
+            plugins = importlib.metadata.entry_points().select(group="moe.plugins")
             for plugin in plugins:
                 if plugin.name in self.enabled_plugins:
                     self.pm.register(plugin.load(), plugin.name)
@@ -429,17 +701,21 @@ class Config:
         for extra_plugin in self._extra_plugins:
             self.pm.register(extra_plugin.plugin, extra_plugin.name)
 
-        # register individual plugin sub-modules
-        self.pm.hook.plugin_registration(pm=self.pm)
+        # register individual plugin sub-modules, unless deferred
+        self.pm.register_sub_plugins()
 
         # check if all enabled plugins were loaded
         for plugin in self.enabled_plugins:
-            if not self.pm.has_plugin(plugin):
+            if not self._is_registered(plugin):
                 log.warning(
                     f"Plugin {plugin!r} is enabled in the configuration but could not "
                     "be loaded. Is it installed?"
                 )
 
+    def _is_registered(self, plugin_name: str) -> bool:
+        """Returns whether a plugin is registered, without loading any sub-plugins."""
+        return dict(self.pm.list_name_plugin()).get(plugin_name) is not None
+
     def _register_local_plugins(
         self, enabled_plugins: set[str], plugin_dir: Path, pkg_name: str = ""
     ) -> None:
@@ -457,3 +733,27 @@ class Config:
             if plugin_path.stem in enabled_plugins:
                 plugin = importlib.import_module(pkg_name + plugin_name)
                 self.pm.register(plugin, plugin_name)
+
+
+def _upgrade_db(connection: Connection, schema_revision: str | None) -> None:
+    """Creates or migrates the database tables to the latest revision.
+
+    Args:
+        connection: Connection to the library database.
+        schema_revision: Current alembic revision of the database.
+    """
+    log.info(
+        "Upgrading library database. "
+        f"[{schema_revision=}, head_revision={SCHEMA_REVISION!r}]"
+    )
+
+    # alembic is slow to import and load, so only do so when needed
+    import alembic.command  # noqa: PLC0415
+    import alembic.config  # noqa: PLC0415
+
+    alembic_cfg = alembic.config.Config(
+        str(Path(__file__).parent / "moe_alembic" / "alembic.ini")
+    )
+    alembic_cfg.attributes["configure_logger"] = False
+    alembic_cfg.attributes["connection"] = connection
+    alembic.command.upgrade(alembic_cfg, "head")
@@ -0,0 +1,27 @@
+"""Maintains and inspects the library database."""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+import moe
+from moe import config
+
+if TYPE_CHECKING:
+    from .db_core import *  # noqa: F403
+
+PLUGIN_INFO = config.PluginInfo(commands=frozenset({"db"}))
+
+
+@moe.hookimpl
+def plugin_registration() -> None:
+    """Only register the cli sub-plugin if the cli is enabled."""
+    from . import db_cli, db_core  # noqa: PLC0415 deferred, see `PLUGIN_INFO`
+
+    config.CONFIG.pm.register(db_core, "db_core")
+    if config.CONFIG.pm.has_plugin("cli"):
+        config.CONFIG.pm.register(db_cli, "db_cli")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 any attribute of the core api
+    """Imports the core API once it's used."""
+    return getattr(importlib.import_module(f"{__name__}.db_core"), name)
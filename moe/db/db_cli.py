@@ -0,0 +1,71 @@
+"""Adds the ``db`` command to moe."""
+
+import argparse
+import logging
+
+from sqlalchemy.orm.session import Session
+
+import moe
+from moe import db
+from moe.query import QueryError
+
+log = logging.getLogger("moe.cli.db")
+
+__all__: list[str] = []
+
+
+@moe.hookimpl
+def add_command(cmd_parsers: argparse._SubParsersAction) -> None:
+    """Adds the ``db`` command to Moe's CLI."""
+    db_parser = cmd_parsers.add_parser(
+        "db",
+        description="Maintain and inspect the library database.",
+        help="maintain and inspect the library database",
+    )
+    db_cmd_parsers = db_parser.add_subparsers(
+        title="db commands", dest="db_command", required=True
+    )
+
+    analyze_parser = db_cmd_parsers.add_parser(
+        "analyze",
+        description=(
+            "Gather statistics to help plan queries, and report any query terms that "
+            "have to scan every item of their type."
+        ),
+        help="gather query statistics and report slow query terms",
+    )
+    analyze_parser.add_argument(
+        "terms",
+        metavar="term",
+        nargs="*",
+        help="query term to check (default: a term for each field)",
+    )
+    analyze_parser.set_defaults(func=_parse_analyze_args)
+
+
+def _parse_analyze_args(session: Session, args: argparse.Namespace) -> None:
+    """Parses the given commandline arguments for the ``analyze`` command.
+
+    Args:
+        session: Library db session.
+        args: Commandline arguments to parse.
+
+    Raises:
+        SystemExit: Invalid query term given.
+    """
+    db.analyze_db(session)
+
+    try:
+        scanned_terms = db.find_scans(session, args.terms or None)
+    except QueryError as err:
+        log.exception("Failed query.")
+        raise SystemExit(1) from err
+
+    if not scanned_terms:
+        print("No query terms scan the library.")  # noqa: T201 cli output
+        return
+
+    scanned_terms_str = "\n".join(f"\t{term}" for term in scanned_terms)
+    print(  # noqa: T201 cli output
+        f"Query terms that scan every item of their type:\n{scanned_terms_str}"
+    )
@@ -0,0 +1,127 @@
+"""Core api for maintaining and inspecting the library database."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import sqlite
+
+from moe.library import Album, Extra, Track
+from moe.query import QueryType, create_query
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.orm.session import Session
+
+__all__ = ["analyze_db", "explain_query", "find_scans"]
+
+log = logging.getLogger("moe.db")
+
+_TERM_PREFIXES = {
+    QueryType.ALBUM: ("a:", Album),
+    QueryType.EXTRA: ("e:", Extra),
+    QueryType.TRACK: ("t:", Track),
+}
+
+
+def analyze_db(session: Session) -> None:
+    """Gathers statistics about the library so sqlite can better plan queries.
+
+    Args:
+        session: Library db session.
+    """
+    log.debug("Analyzing the database.")
+
+    session.execute(sa.text("ANALYZE"))
+
+    log.info("Analyzed the database.")
+
+
+def explain_query(session: Session, query_str: str, query_type: QueryType) -> list[str]:
+    """Explains how sqlite will search the library for the given query.
+
+    Args:
+        session: Library db session.
+        query_str: Query string to explain. See the query docs for more info.
+        query_type: Type of library item to query for.
+
+    Returns:
+        Each step of sqlite's query plan, e.g. ``SCAN track`` or
+        ``SEARCH album USING INDEX ix_album_artist (artist>? AND artist<?)``.
+
+    Raises:
+        QueryError: Invalid query.
+    """
+    compiled = create_query(query_str, query_type).compile(
+        dialect=sqlite.dialect(paramstyle="named")
+    )
+    # the plan only depends on the shape of each value, not its exact type
+    params = {
+        key: value
+        if value is None or isinstance(value, int | float | str)
+        else str(value)
+        for key, value in compiled.params.items()
+    }
+
+    plan = session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {compiled}", params
+    )
+    return [row[3] for row in plan]
+
+
+def find_scans(session: Session, terms: Iterable[str] | None = None) -> list[str]:
+    """Finds any query terms that have to scan every item of their type.
+
+    Each term is queried for items of the term's own type, e.g. ``a:artist:x`` is
+    queried for albums. A scanned term can still be fast on small libraries, but
+    will slow down linearly as the library grows.
+
+    Args:
+        session: Library db session.
+        terms: Query terms to check. Defaults to a term for each field of each item
+            type.
+
+    Returns:
+        Each term that would scan its item type's table.
+
+    Raises:
+        QueryError: Invalid query term.
+    """
+    if terms is None:
+        terms = _default_terms()
+
+    scanned_terms = []
+    for term in terms:
+        if term.startswith(_TERM_PREFIXES[QueryType.ALBUM][0]):
+            query_type = QueryType.ALBUM
+        elif term.startswith(_TERM_PREFIXES[QueryType.EXTRA][0]):
+            query_type = QueryType.EXTRA
+        else:
+            query_type = QueryType.TRACK
+        table = query_type.value
+
+        plan = explain_query(session, term, query_type)
+        if any(
+            step == f"SCAN {table}" or step.startswith(f"SCAN {table} ")
+            for step in plan
+        ):
+            scanned_terms.append(term)
+
+    log.debug(f"Found query terms that scan the library. [{scanned_terms=}]")
+    return scanned_terms
+
+
+def _default_terms() -> list[str]:
+    """Returns a simple string match term for each database field."""
+    terms = []
+    for prefix, item_class in _TERM_PREFIXES.values():
+        terms.extend(
+            f"{prefix}{column.key}:a"
+            for column in sa.inspect(item_class).column_attrs
+            if not column.key.startswith("_") and column.key != "custom"
+        )
+
+    return terms
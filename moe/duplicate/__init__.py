@@ -1,15 +1,25 @@
 """Handles duplicate detection and resolution in the library."""
 
+import importlib
 import logging
+from typing import TYPE_CHECKING, Any
 
 import moe
 from moe import config
 
-from . import dup_cli, dup_core
-from .dup_core import *  # noqa: F403
+if TYPE_CHECKING:
+    from .dup_core import *  # noqa: F403
 
-__all__ = []
-__all__.extend(dup_core.__all__)
+PLUGIN_INFO = config.PluginInfo(
+    hooks=frozenset(
+        {
+            "edit_changed_items",
+            "edit_new_items",
+            "get_unique_keys",
+            "resolve_dup_items",
+        }
+    )
+)
 
 log = logging.getLogger("moe.dup")
 
@@ -17,6 +27,13 @@ log = logging.getLogger("moe.dup")
 @moe.hookimpl
 def plugin_registration() -> None:
     """Only register the cli sub-plugin if the cli is enabled."""
+    from . import dup_cli, dup_core  # noqa: PLC0415 deferred, see `PLUGIN_INFO`
+
     config.CONFIG.pm.register(dup_core, "dup_core")
     if config.CONFIG.pm.has_plugin("cli"):
         config.CONFIG.pm.register(dup_cli, "dup_cli")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 any attribute of the core api
+    """Imports the core API once it's used."""
+    return getattr(importlib.import_module(f"{__name__}.dup_core"), name)
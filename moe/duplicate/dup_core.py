@@ -1,11 +1,19 @@
-"""Detect and handle duplicates in the library."""
+"""Detect and handle duplicates in the library.
+
+Rather than comparing an item against every other item in the library, only items
+sharing a "unique key" with it, e.g. the same path, are compared using
+:meth:`~moe.library.lib_item.LibItem.is_unique`. Plugins may add keys using the
+:meth:`~moe.duplicate.dup_core.Hooks.get_unique_keys` hook.
+"""
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
 
 import sqlalchemy
+import sqlalchemy.orm
 
 import moe
 from moe import config
@@ -13,8 +21,9 @@ from moe.library import Album, Extra, LibItem, Track
 from moe.query import QueryType, query
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Sequence
+    from collections.abc import Generator, Hashable, Iterable, Sequence
 
+    import pluggy
     from sqlalchemy.orm.session import Session
 
 __all__ = ["DuplicateError", "get_duplicates", "resolve_duplicates"]
@@ -66,6 +75,51 @@ class Hooks:
             * The :meth:`~moe.library.track.Hooks.is_unique_track` hook.
         """
 
+    @staticmethod
+    @moe.hookspec
+    def get_unique_keys(item: LibItem) -> list[dict[str, Any]]:  # type: ignore[reportReturnType]
+        """Add keys identifying potential duplicates of an item.
+
+        Each key maps fields to the values an item of the same type must also have
+        to potentially be a duplicate, e.g. ``{"path": item.path}``. Only items
+        sharing at least one key are compared using
+        :meth:`~moe.library.lib_item.LibItem.is_unique`, so potential duplicates can
+        be found using indexed database lookups rather than by comparing an item
+        against the entire library. Items with the same path, and tracks with the same
+        album, disc, and track number, are always potential duplicates.
+
+        Important:
+            If your plugin implements any of the ``is_unique_*`` hooks, it should also
+            implement this hook, such that any two items your plugin doesn't consider
+            unique share at least one key. Otherwise, items of that type will be
+            compared against the entire library.
+
+        Args:
+            item: Library item to get the keys of.
+
+        Returns:
+            Keys of ``item``. Fields may be custom fields, and values must be hashable
+            or a library item, e.g. a track's album, which is compared by its path.
+            Keys with any ``None`` values are ignored.
+
+        Example:
+            A plugin whose ``is_unique_track`` implementation considers any tracks
+            with the same title duplicates would return:
+
+            .. code:: python
+
+                if isinstance(item, Track):
+                    return [{"title": item.title}]
+        """
+
+
+@moe.hookimpl
+def add_hooks(pm: pluggy._manager.PluginManager) -> None:
+    """Registers `duplicate` hookspecs to Moe."""
+    from moe.duplicate.dup_core import Hooks  # noqa: PLC0415
+
+    pm.add_hookspecs(Hooks)
+
 
 @moe.hookimpl(hookwrapper=True)
 def edit_changed_items(
@@ -103,12 +157,13 @@ def resolve_duplicates(session: Session, items: Sequence[LibItem]) -> None:
     """Search for and resolve any duplicates of items in ``items``."""
     log.debug(f"Checking for duplicate items. [{items=}]")
 
+    key_index = _KeyIndex(items)
     resolved_items = []
     for item in items:
         if _is_removed(item):
             continue
 
-        dup_items = get_duplicates(session, item, items)
+        dup_items = key_index.get_duplicates(item)
         dup_items += get_duplicates(session, item)
 
         for dup_item in dup_items:
@@ -157,15 +212,137 @@ def get_duplicates(
         session: Library db session.
         item: Library item to get duplicates of.
         others: Items to compare against. If not given, will query the database
-            and compare against all items in the library.
+            and compare against any items in the library sharing a unique key with
+            ``item``.
 
     Returns:
         Any items considered a duplicate as defined by
         :meth:`~moe.library.lib_item.LibItem.is_unique`.
     """
-    if not others:
-        others = query(session, "*", QueryType(type(item).__name__.lower()))
-
+    if others:
+        return _KeyIndex(others).get_duplicates(item)
+
+    item_class = type(item)
+    query_type = QueryType(item_class.__name__.lower())
+    if not _has_unique_keys(item_class):
+        # tracks and extras are compared using their albums
+        load = () if query_type == QueryType.ALBUM else ("album",)
+        return _compare(item, query(session, "*", query_type, load=load))
+
+    keys = _get_unique_keys(item)
+    if not keys:
+        return []
+
+    candidates = sqlalchemy.select(item_class).where(
+        sqlalchemy.or_(*(_get_key_clause(item_class, key) for key in keys))
+    )
+    if query_type != QueryType.ALBUM:
+        candidates = candidates.options(
+            sqlalchemy.orm.joinedload(item_class.album)  # type: ignore[reportAttributeAccessIssue]
+        )
+    return _compare(item, session.scalars(candidates).unique())
+
+
+class _KeyIndex:
+    """Index of items by their unique keys, to find duplicates amongst them."""
+
+    def __init__(self, items: Sequence[LibItem]) -> None:
+        """Indexes ``items`` by their unique keys."""
+        self.items = items
+        self.buckets: defaultdict[Hashable, list[LibItem]] = defaultdict(list)
+        self.has_unique_keys = {
+            item_class: _has_unique_keys(item_class)
+            for item_class in {type(item) for item in items}
+        }
+
+        for item in items:
+            if self.has_unique_keys[type(item)]:
+                for key in _get_unique_keys(item):
+                    self.buckets[_get_bucket(item, key)].append(item)
+
+    def get_duplicates(self, item: LibItem) -> list[LibItem]:
+        """Returns the indexed items considered duplicates of ``item``."""
+        if type(item) not in self.has_unique_keys:
+            self.has_unique_keys[type(item)] = _has_unique_keys(type(item))
+        if not self.has_unique_keys[type(item)]:
+            return _compare(item, self.items)
+
+        candidates: dict[int, LibItem] = {}
+        for key in _get_unique_keys(item):
+            for other in self.buckets.get(_get_bucket(item, key), []):
+                candidates.setdefault(id(other), other)
+
+        return _compare(item, candidates.values())
+
+
+def _compare(item: LibItem, others: Iterable[LibItem]) -> list[LibItem]:
+    """Returns the items in ``others`` considered duplicates of ``item``."""
     return [
         other for other in others if item is not other and not item.is_unique(other)
     ]
+
+
+def _has_unique_keys(item_class: type[LibItem]) -> bool:
+    """Whether unique keys cover every uniqueness condition of ``item_class`` items.
+
+    Plugins implementing an ``is_unique_*`` hook without implementing the
+    ``get_unique_keys`` hook may consider items duplicates without them sharing a key.
+    """
+    pm = config.CONFIG.pm
+    is_unique_hook = getattr(pm.hook, f"is_unique_{item_class.__name__.lower()}")
+    is_unique_plugins = {impl.plugin_name for impl in is_unique_hook.get_hookimpls()}
+    key_plugins = {impl.plugin_name for impl in pm.hook.get_unique_keys.get_hookimpls()}
+
+    return is_unique_plugins <= key_plugins
+
+
+def _get_unique_keys(item: LibItem) -> list[dict[str, Any]]:
+    """Returns the unique keys of ``item``, including those added by plugins."""
+    keys: list[dict[str, Any]] = [{"path": item.path}]
+    if isinstance(item, Track):
+        keys.append(
+            {"album": item.album, "disc": item.disc, "track_num": item.track_num}
+        )
+
+    for plugin_keys in config.CONFIG.pm.hook.get_unique_keys(item=item):
+        keys.extend(plugin_keys)
+
+    return [key for key in keys if None not in key.values()]
+
+
+def _get_bucket(item: LibItem, key: dict[str, Any]) -> Hashable:
+    """Returns a hashable representation of an item's unique key."""
+    return (
+        type(item),
+        frozenset(
+            (field, value.path if isinstance(value, LibItem) else value)
+            for field, value in key.items()
+        ),
+    )
+
+
+def _get_key_clause(
+    item_class: type[LibItem], key: dict[str, Any]
+) -> sqlalchemy.ColumnElement[bool]:
+    """Returns a filter for items of ``item_class`` sharing a unique key."""
+    clauses: list[sqlalchemy.ColumnElement[bool]] = []
+    for field, value in key.items():
+        attr = getattr(item_class, field, None)
+        if attr is None:
+            # assume custom field
+            clauses.append(
+                sqlalchemy.func.json_extract(item_class.custom, f'$."{field}"') == value
+            )
+        elif isinstance(value, LibItem):
+            # compare related items by path to make use of its index
+            (local_column,) = attr.property.local_columns
+            clauses.append(
+                local_column
+                == sqlalchemy.select(type(value)._id)  # noqa: SLF001
+                .where(type(value).path == value.path)
+                .scalar_subquery()
+            )
+        else:
+            clauses.append(attr == value)
+
+    return sqlalchemy.and_(*clauses)
@@ -1,18 +1,27 @@
 """Edits music in the library."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 import moe
 from moe import config
 
-from . import edit_cli, edit_core
-from .edit_core import *  # noqa: F403
+if TYPE_CHECKING:
+    from .edit_core import *  # noqa: F403
 
-__all__ = []
-__all__.extend(edit_core.__all__)
+PLUGIN_INFO = config.PluginInfo(commands=frozenset({"edit"}))
 
 
 @moe.hookimpl
 def plugin_registration() -> None:
     """Only register the cli sub-plugin if the cli is enabled."""
+    from . import edit_cli, edit_core  # noqa: PLC0415 deferred, see `PLUGIN_INFO`
+
     config.CONFIG.pm.register(edit_core, "edit_core")
     if config.CONFIG.pm.has_plugin("cli"):
         config.CONFIG.pm.register(edit_cli, "edit_cli")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 any attribute of the core api
+    """Imports the core API once it's used."""
+    return getattr(importlib.import_module(f"{__name__}.edit_core"), name)
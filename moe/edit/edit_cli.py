@@ -7,10 +7,18 @@ from sqlalchemy.orm.session import Session
 
 import moe
 from moe import edit
+from moe.query import QueryType
 from moe.util.cli import cli_query, query_parser
 
 log = logging.getLogger("moe.cli.edit")
 
+# relationships walked when writing the edited items' tags
+_LOAD_PROFILES: dict[QueryType, tuple[str, ...]] = {
+    QueryType.ALBUM: ("tracks",),
+    QueryType.EXTRA: ("album",),
+    QueryType.TRACK: ("album",),
+}
+
 
 @moe.hookimpl
 def add_command(cmd_parsers: argparse._SubParsersAction) -> None:
@@ -55,7 +63,9 @@ def _parse_args(session: Session, args: argparse.Namespace) -> None:
         SystemExit: Invalid query, no items found to edit, or invalid field or
             field_value term format.
     """
-    items = cli_query(session, args.query, args.query_type)
+    items = cli_query(
+        session, args.query, args.query_type, load=_LOAD_PROFILES[args.query_type]
+    )
 
     error_count = 0
     for term in args.fv_terms:
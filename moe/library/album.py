@@ -5,10 +5,11 @@ from __future__ import annotations
 import datetime  # noqa: TC003 necessary for sqlalchemy
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Optional, cast
 
 import sqlalchemy as sa
-from sqlalchemy import Integer
+from sqlalchemy import Index, Integer, text
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.ext.mutable import MutableSet
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -22,6 +23,9 @@ from moe.library.lib_item import (
     MetaLibItem,
     SABase,
     SetType,
+    custom_field_table,
+    fts_table,
+    multi_value_table,
 )
 
 if sys.version_info < (3, 11):
@@ -30,13 +34,14 @@ else:
     from typing import Self
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from pathlib import Path, PurePath
 
     import pluggy
     from sqlalchemy.sql import ColumnExpressionArgument
 
     from moe.library.extra import Extra
-    from moe.library.track import MetaTrack, Track
+    from moe.library.track import MetaTrack, Track, TrackReadContext
 
 __all__ = ["Album", "AlbumError", "MetaAlbum"]
 
@@ -337,7 +342,7 @@ class Album(LibItem, SABase, MetaAlbum):
         MutableSet.as_mutable(SetType()), nullable=True
     )
     country: Mapped[Optional[str]]  # noqa: UP045 sqlachemy does not support
-    date: Mapped[datetime.date]
+    date: Mapped[datetime.date] = mapped_column(index=True)
     disc_total: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     label: Mapped[Optional[str]]  # noqa: UP045 sqlachemy does not support
     media: Mapped[Optional[str]]  # noqa: UP045 sqlachemy does not support
@@ -357,6 +362,12 @@ class Album(LibItem, SABase, MetaAlbum):
         collection_class=list,
     )
 
+    # NOCASE indexes can be used by (case insensitive) LIKE queries
+    __table_args__ = (
+        Index("ix_album_artist", text("artist COLLATE NOCASE")),
+        Index("ix_album_title", text("title COLLATE NOCASE")),
+    )
+
     def __init__(  # noqa: PLR0913
         self,
         path: Path,
@@ -395,13 +406,17 @@ class Album(LibItem, SABase, MetaAlbum):
         log.debug(f"Album created. [album={self!r}]")
 
     @classmethod
-    def from_dir(cls, album_path: Path) -> Album:
+    def from_dir(
+        cls, album_path: Path, file_paths: Iterable[Path] | None = None
+    ) -> Album:
         """Creates an album from a directory.
 
         Args:
             album_path: Album directory path. The directory will be scanned for any
                 files to be added to the album. Any non-track files will be added as
                 extras.
+            file_paths: Files within ``album_path`` to add to the album. If ``None``,
+                every file in ``album_path`` will be added.
 
         Returns:
             Created album.
@@ -410,31 +425,37 @@ class Album(LibItem, SABase, MetaAlbum):
             AlbumError: No tracks found in the given directory.
         """
         from moe.library.extra import Extra  # noqa: PLC0415 prevents circular import
-        from moe.library.track import (  # noqa: PLC0415 prevents circular import
-            Track,
-            TrackError,
-        )
+        from moe.library.track import Track  # noqa: PLC0415 prevents circular import
 
         log.debug(f"Creating album from directory. [dir={album_path}]")
 
         extra_paths = []
-        album_file_paths = [path for path in album_path.rglob("*") if path.is_file()]
+        if file_paths is None:
+            album_file_paths = [
+                path for path in album_path.rglob("*") if path.is_file()
+            ]
+        else:
+            album_file_paths = list(file_paths)
         album: Album | None = None
-        for file_path in album_file_paths:
-            try:
-                track = Track.from_file(file_path, album, album_path)
-            except TrackError:  # noqa: PERF203
+        for file_path, read_context in zip(
+            album_file_paths, _read_track_files(album_file_paths), strict=True
+        ):
+            if not read_context:
                 extra_paths.append(file_path)
-            else:
-                if not album:
-                    album = track.album
+                continue
+
+            track = Track.from_file(
+                file_path, album, album_path, read_context=read_context
+            )
+            if not album:
+                album = track.album
 
         if not album:
             err_msg = f"No tracks found in album directory. [dir={album_path}]"
             raise AlbumError(err_msg)
 
         for extra_path in extra_paths:
-            Extra(album, extra_path)
+            Extra(album, extra_path).set_file_synced()
 
         log.debug(f"Album created from directory. [dir={album_path}, {album=}]")
         return album
@@ -595,3 +616,85 @@ class Album(LibItem, SABase, MetaAlbum):
 
         repr_str += ")"
         return repr_str
+
+
+# indexed side tables of each album catalog number and custom field for queries
+album_catalog_nums = multi_value_table("album", "catalog_nums")
+album_custom = custom_field_table("album")
+
+# full-text search table of album text fields for `~` queries
+album_fts = fts_table("album", ("artist", "label", "title"))
+
+
+def _read_track_files(paths: list[Path]) -> Iterator[TrackReadContext | None]:
+    """Reads the tags of each file in ``paths``.
+
+    Files are parsed concurrently using the configured number of ``read_threads``,
+    but all hooks run on the calling thread, and read contexts are always yielded in
+    the same order as ``paths``.
+
+    Args:
+        paths: File paths to read.
+
+    Yields:
+        Read context of each track file, or ``None`` if the file is not a track.
+    """
+    read_contexts = list(map(_get_read_context, paths))
+
+    read_threads = config.CONFIG.settings.read_threads if len(paths) > 1 else 1
+    if read_threads == 1:
+        yield from map(_read_tags, read_contexts)
+        return
+
+    log.debug(f"Reading track files concurrently. [{read_threads=}]")
+    with ThreadPoolExecutor(max_workers=read_threads) as executor:
+        parsed_contexts = executor.map(_parse_track_file, read_contexts)
+        yield from map(_read_tags, parsed_contexts)
+
+
+def _get_read_context(path: Path) -> TrackReadContext | None:
+    """Returns a read context for ``path``, or ``None`` if it is not a track file."""
+    from moe.library.track import (  # noqa: PLC0415 prevents circular import
+        TrackReadContext,
+    )
+
+    if not config.CONFIG.pm.hook.is_track_file(path=path):
+        log.debug(f"Skipping reading non-track file. [{path=}]")
+        return None
+
+    return TrackReadContext(path)
+
+
+def _parse_track_file(
+    read_context: TrackReadContext | None,
+) -> TrackReadContext | None:
+    """Parses a track file, returning ``None`` if it cannot be parsed.
+
+    This is run on the reader threads, and so must not call any hooks.
+    """
+    from moe.library.track import TrackError  # noqa: PLC0415 prevents circular import
+
+    if not read_context:
+        return None
+
+    try:
+        read_context.parse()
+    except TrackError:
+        return None
+
+    return read_context
+
+
+def _read_tags(read_context: TrackReadContext | None) -> TrackReadContext | None:
+    """Reads the tags of a track file, returning ``None`` if it cannot be read."""
+    from moe.library.track import TrackError  # noqa: PLC0415 prevents circular import
+
+    if not read_context:
+        return None
+
+    try:
+        read_context.read_tags()
+    except TrackError:
+        return None
+
+    return read_context
@@ -12,7 +12,13 @@ from sqlalchemy.schema import ForeignKey
 import moe
 from moe import config
 from moe.library.album import Album
-from moe.library.lib_item import LibItem, MergeStrategy, SABase
+from moe.library.lib_item import (
+    FileLibItem,
+    LibItem,
+    MergeStrategy,
+    SABase,
+    custom_field_table,
+)
 
 if sys.version_info < (3, 11):
     from typing_extensions import Self
@@ -46,7 +52,7 @@ def add_hooks(pm: pluggy._manager.PluginManager) -> None:
     pm.add_hookspecs(Hooks)
 
 
-class Extra(LibItem, SABase):  # noqa: PLW1641 MetaTracks are unhashable
+class Extra(FileLibItem, SABase):  # noqa: PLW1641 MetaTracks are unhashable
     """An Album can have any number of extra files such as logs, cues, etc.
 
     Attributes:
@@ -57,7 +63,7 @@ class Extra(LibItem, SABase):  # noqa: PLW1641 MetaTracks are unhashable
 
     __tablename__ = "extra"
 
-    _album_id: Mapped[int] = mapped_column(Integer, ForeignKey("album._id"))
+    _album_id: Mapped[int] = mapped_column(Integer, ForeignKey("album._id"), index=True)
     album: Mapped["Album"] = relationship(back_populates="extras")
 
     def __init__(self, album: Album, path: Path, **kwargs: object) -> None:
@@ -133,6 +139,8 @@ class Extra(LibItem, SABase):  # noqa: PLW1641 MetaTracks are unhashable
             ):
                 self.custom[custom_field] = other_value
 
+        self._merge_file_synced(other, merge_strategy)
+
         log.debug(
             f"Extras merged. [extra_a={self!r}, extra_b={other!r}, {merge_strategy=}]"
         )
@@ -179,3 +187,7 @@ class Extra(LibItem, SABase):  # noqa: PLW1641 MetaTracks are unhashable
     def __str__(self) -> str:
         """String representation of an Extra."""
         return f"{self.album}: {self.rel_path}"
+
+
+# indexed side table of each extra custom field for queries
+extra_custom = custom_field_table("extra")
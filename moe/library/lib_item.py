@@ -5,8 +5,8 @@ from __future__ import annotations
 import logging
 import sys
 from enum import Enum, auto
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from pathlib import Path  # noqa: TC003 necessary for sqlalchemy
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, cast
 
 import sqlalchemy
 import sqlalchemy.event
@@ -26,16 +26,20 @@ else:
     from typing import Self
 
 if TYPE_CHECKING:
+    import os
     from collections.abc import Iterable
 
     import pluggy
 
-__all__ = ["LibItem", "LibraryError", "MergeStrategy", "MetaLibItem"]
+__all__ = ["FileLibItem", "LibItem", "LibraryError", "MergeStrategy", "MetaLibItem"]
 
 log = logging.getLogger("moe.lib_item")
 
 T = TypeVar("T", bound="MetaLibItem")
 
+# full-text search table and indexed fields of each item table, see `fts_table()`
+FTS_TABLES: dict[str, tuple[sqlalchemy.TableClause, tuple[str, ...]]] = {}
+
 
 class SABase(DeclarativeBase):
     pass
@@ -55,6 +59,30 @@ class MergeStrategy(Enum):
 class Hooks:
     """General usage library item hooks."""
 
+    @staticmethod
+    @moe.hookspec
+    def index_custom_fields() -> dict[str, list[str]]:  # type: ignore[reportReturnType]
+        """Declare any custom fields to index so they can be queried quickly.
+
+        Queries on a custom field normally have to search the custom fields of every
+        item of its type. Indexed custom fields instead have their values stored in an
+        indexed side table, at the cost of a slightly larger database and slower
+        writes. Only index fields that are commonly queried.
+
+        Users can also index custom fields with the ``indexed_fields`` config option.
+
+        Returns:
+            The names of the custom fields to index, keyed by their item type
+            (``album``, ``extra``, or ``track``).
+
+        Example:
+            .. code:: python
+
+                @moe.hookimpl
+                def index_custom_fields():
+                    return {"album": ["mb_album_id"], "track": ["mb_track_id"]}
+        """
+
     @staticmethod
     @moe.hookspec
     def edit_changed_items(session: Session, items: list[LibItem]) -> None:
@@ -285,7 +313,7 @@ class PathType(sqlalchemy.types.TypeDecorator):
         if path_str is None:
             return None
 
-        return Path(self.library_path / path_str)
+        return self.library_path / path_str
 
 
 class SetType(sqlalchemy.types.TypeDecorator):
@@ -319,6 +347,257 @@ class SetType(sqlalchemy.types.TypeDecorator):
         return None
 
 
+def multi_value_table(item_table: str, field: str) -> sqlalchemy.Table:
+    """Creates a side table holding each value of a multi-value (``SetType``) field.
+
+    The field's json column remains the source of truth for the ORM, while the side
+    table is kept in sync by database triggers and indexed by value so queries on the
+    field don't have to expand every item's json. The table is named
+    ``{item_table}_{field}``, e.g. ``track_genres``.
+
+    Args:
+        item_table: Name of the item's table, e.g. ``track``.
+        field: Name of the multi-value field's column, e.g. ``genres``.
+
+    Returns:
+        The side table with an ``item_id`` and ``value`` column.
+    """
+    table_name = f"{item_table}_{field}"
+    table = sqlalchemy.Table(
+        table_name,
+        SABase.metadata,
+        sqlalchemy.Column(
+            "item_id",
+            Integer,
+            sqlalchemy.ForeignKey(f"{item_table}._id"),
+            primary_key=True,
+        ),
+        sqlalchemy.Column("value", sqlalchemy.String, primary_key=True),
+        sqlalchemy.Index(
+            f"ix_{table_name}_value", sqlalchemy.text("value COLLATE NOCASE")
+        ),
+        info={"multi_value": True},
+    )
+
+    # table and field names are only ever given by moe itself
+    insert_values = (
+        f"INSERT OR IGNORE INTO {table_name} (item_id, value) "  # noqa: S608
+        f"SELECT new._id, value FROM json_each(new.{field}) WHERE value IS NOT NULL;"
+    )
+    delete_values = f"DELETE FROM {table_name} WHERE item_id = old._id;"  # noqa: S608
+    triggers = (
+        f"CREATE TRIGGER {table_name}_ai AFTER INSERT ON {item_table} "
+        f"BEGIN {insert_values} END",
+        f"CREATE TRIGGER {table_name}_au AFTER UPDATE OF {field} ON {item_table} "
+        f"BEGIN {delete_values} {insert_values} END",
+        f"CREATE TRIGGER {table_name}_ad AFTER DELETE ON {item_table} "
+        f"BEGIN {delete_values} END",
+    )
+    for trigger in triggers:
+        sqlalchemy.event.listen(table, "after_create", sqlalchemy.DDL(trigger))
+
+    return table
+
+
+def fts_table(item_table: str, fields: tuple[str, ...]) -> sqlalchemy.TableClause:
+    """Creates a full-text search (FTS5) table over an item's text fields.
+
+    Each row's ``rowid`` is the ``_id`` of its item. Like `multi_value_table()`, the
+    table is kept in sync with its item table by database triggers, and is named
+    ``{item_table}_fts``.
+
+    Args:
+        item_table: Name of the item's table, e.g. ``track``.
+        fields: Text fields of the item to index.
+
+    Returns:
+        The full-text search table with a ``rowid`` and ``rank`` column, as well as a
+        column for each indexed field.
+    """
+    table_name = f"{item_table}_fts"
+    table = sqlalchemy.table(
+        table_name,
+        sqlalchemy.column("rowid", Integer),
+        sqlalchemy.column("rank"),
+        *(sqlalchemy.column(field, sqlalchemy.String) for field in fields),
+    )
+    FTS_TABLES[item_table] = (table, fields)
+
+    # table and field names are only ever given by moe itself
+    columns = ", ".join(fields)
+    new_columns = ", ".join(f"new.{field}" for field in fields)
+    insert_row = (
+        f"INSERT INTO {table_name} (rowid, {columns}) "  # noqa: S608
+        f"VALUES (new._id, {new_columns});"
+    )
+    delete_row = f"DELETE FROM {table_name} WHERE rowid = old._id;"  # noqa: S608
+    ddl = (
+        f"CREATE VIRTUAL TABLE {table_name} USING fts5({columns}, "
+        "tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER {table_name}_ai AFTER INSERT ON {item_table} "
+        f"BEGIN {insert_row} END",
+        f"CREATE TRIGGER {table_name}_au AFTER UPDATE OF {columns} ON {item_table} "
+        f"BEGIN {delete_row} {insert_row} END",
+        f"CREATE TRIGGER {table_name}_ad AFTER DELETE ON {item_table} "
+        f"BEGIN {delete_row} END",
+    )
+
+    # virtual tables aren't part of the metadata, so create them alongside it
+    for statement in ddl:
+        sqlalchemy.event.listen(
+            SABase.metadata, "after_create", sqlalchemy.DDL(statement)
+        )
+
+    return table
+
+
+# indexed custom fields of each item table, see `update_indexed_fields()`
+indexed_field_table = sqlalchemy.Table(
+    "indexed_field",
+    SABase.metadata,
+    sqlalchemy.Column("item_table", sqlalchemy.String, primary_key=True),
+    sqlalchemy.Column("field", sqlalchemy.String, primary_key=True),
+)
+
+
+def custom_field_table(item_table: str) -> sqlalchemy.Table:
+    """Creates a side table holding each value of an item's indexed custom fields.
+
+    Like `multi_value_table()`, the ``custom`` json column remains the source of
+    truth, while the side table is kept in sync by database triggers for the fields
+    in the ``indexed_field`` table. The table is named ``{item_table}_custom``.
+
+    Args:
+        item_table: Name of the item's table, e.g. ``track``.
+
+    Returns:
+        The side table with an ``item_id``, ``field``, and ``value`` column.
+    """
+    table_name = f"{item_table}_custom"
+    table = sqlalchemy.Table(
+        table_name,
+        SABase.metadata,
+        sqlalchemy.Column(
+            "item_id",
+            Integer,
+            sqlalchemy.ForeignKey(f"{item_table}._id"),
+            primary_key=True,
+        ),
+        sqlalchemy.Column("field", sqlalchemy.String, primary_key=True),
+        sqlalchemy.Column("value", sqlalchemy.String, primary_key=True),
+        sqlalchemy.Index(
+            f"ix_{table_name}_field_value",
+            "field",
+            sqlalchemy.text("value COLLATE NOCASE"),
+        ),
+        info={"custom_fields": True},
+    )
+
+    # table names are only ever given by moe itself
+    insert_values = (
+        f"INSERT OR IGNORE INTO {table_name} (item_id, field, value) "  # noqa: S608
+        "SELECT new._id, indexed_field.field, json_each.value "
+        "FROM indexed_field, json_each(new.custom, '$.' || indexed_field.field) "
+        f"WHERE indexed_field.item_table = '{item_table}' "
+        "AND json_each.value IS NOT NULL;"
+    )
+    delete_values = f"DELETE FROM {table_name} WHERE item_id = old._id;"  # noqa: S608
+    triggers = (
+        f"CREATE TRIGGER {table_name}_ai AFTER INSERT ON {item_table} "
+        f"BEGIN {insert_values} END",
+        f"CREATE TRIGGER {table_name}_au AFTER UPDATE OF custom ON {item_table} "
+        f"BEGIN {delete_values} {insert_values} END",
+        f"CREATE TRIGGER {table_name}_ad AFTER DELETE ON {item_table} "
+        f"BEGIN {delete_values} END",
+    )
+    for trigger in triggers:
+        sqlalchemy.event.listen(table, "after_create", sqlalchemy.DDL(trigger))
+
+    return table
+
+
+def get_indexed_fields() -> dict[str, set[str]]:
+    """Returns the custom fields to index, keyed by their item table.
+
+    Indexed fields are declared by the ``indexed_fields`` config option and by the
+    ``index_custom_fields`` hook.
+    """
+    indexed_fields: dict[str, set[str]] = {
+        "album": set(),
+        "extra": set(),
+        "track": set(),
+    }
+
+    declared_fields = [
+        config.CONFIG.settings.indexed_fields,
+        *config.CONFIG.pm.hook.index_custom_fields(),
+    ]
+    for item_fields in declared_fields:
+        for item_table, fields in indexed_fields.items():
+            fields.update(item_fields.get(item_table, []))
+
+    return indexed_fields
+
+
+def update_indexed_fields(connection: sqlalchemy.Connection) -> None:
+    """Syncs the indexed custom fields in the database with the declared fields.
+
+    Newly declared fields are indexed from the existing custom values of each item,
+    while fields that are no longer declared have their values removed.
+
+    Args:
+        connection: Connection to the library database.
+    """
+    declared_fields = {
+        (item_table, field)
+        for item_table, fields in get_indexed_fields().items()
+        for field in fields
+    }
+    db_fields = {
+        (row.item_table, row.field)
+        for row in connection.execute(sqlalchemy.select(indexed_field_table))
+    }
+    if declared_fields == db_fields:
+        return
+
+    log.debug(
+        "Updating indexed custom fields. "
+        f"[new={declared_fields - db_fields}, removed={db_fields - declared_fields}]"
+    )
+    for item_table, field in db_fields - declared_fields:
+        custom_table = SABase.metadata.tables[f"{item_table}_custom"]
+        connection.execute(
+            sqlalchemy.delete(custom_table).where(custom_table.c.field == field)
+        )
+        connection.execute(
+            sqlalchemy.delete(indexed_field_table).where(
+                indexed_field_table.c.item_table == item_table,
+                indexed_field_table.c.field == field,
+            )
+        )
+    for item_table, field in declared_fields - db_fields:
+        connection.execute(
+            sqlalchemy.insert(indexed_field_table).values(
+                item_table=item_table, field=field
+            )
+        )
+        item = SABase.metadata.tables[item_table]
+        values = sqlalchemy.func.json_each(item.c.custom, f"$.{field}").table_valued(
+            "value", joins_implicitly=True
+        )
+        connection.execute(
+            sqlalchemy.insert(SABase.metadata.tables[f"{item_table}_custom"])
+            .from_select(
+                ["item_id", "field", "value"],
+                sqlalchemy.select(
+                    item.c["_id"], sqlalchemy.literal(field), values.c.value
+                ).where(values.c.value.is_not(None)),
+            )
+            .prefix_with("OR IGNORE")
+        )
+    log.debug("Updated indexed custom fields.")
+
+
 class MetaLibItem(Generic[T]):
     """Base class for MetaTrack and MetaAlbum objects representing metadata-only.
 
@@ -361,3 +640,79 @@ class LibItem(MetaLibItem):
     def is_unique(self, other: Self) -> bool:
         """Returns whether an item is unique in the library from ``other``."""
         raise NotImplementedError
+
+
+class FileLibItem(LibItem):
+    """Base class for library items backed by a single file i.e. Extras and Tracks.
+
+    A fingerprint of the item's file, i.e. its modification time, size, and inode, is
+    stored whenever the item is synced with its file. This allows cheaply checking
+    whether the file has changed since without reading it.
+    """
+
+    _synced_mtime_ns: Mapped[Optional[int]] = mapped_column(  # noqa: UP045 sqlalchemy does not support
+        "synced_mtime_ns", Integer, nullable=True
+    )
+    _synced_size: Mapped[Optional[int]] = mapped_column(  # noqa: UP045 sqlalchemy does not support
+        "synced_size", Integer, nullable=True
+    )
+    _synced_inode: Mapped[Optional[int]] = mapped_column(  # noqa: UP045 sqlalchemy does not support
+        "synced_inode", Integer, nullable=True
+    )
+
+    @property
+    def file_fingerprint(self) -> tuple[int, int, int] | None:
+        """Returns the item's file ``(mtime_ns, size, inode)`` as of its last sync.
+
+        Returns ``None`` if the item was never synced with its file.
+        """
+        if self._synced_mtime_ns is None:
+            return None
+
+        return (
+            self._synced_mtime_ns,
+            cast("int", self._synced_size),
+            cast("int", self._synced_inode),
+        )
+
+    def is_file_changed(self, stat: os.stat_result | None = None) -> bool:
+        """Returns whether the item's file has changed since it was last synced.
+
+        Items that were never synced with their file are always considered changed.
+
+        Args:
+            stat: Stat result of the item's file if already known. If ``None``, the
+                file will be stat'd.
+
+        Raises:
+            OSError: Unable to stat the item's file.
+        """
+        if self.file_fingerprint is None:
+            return True
+
+        stat = stat or self.path.stat()
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino) != self.file_fingerprint
+
+    def set_file_synced(self, stat: os.stat_result | None = None) -> None:
+        """Marks the item as synced with the current state of its file.
+
+        Args:
+            stat: Stat result of the item's file if already known. If ``None``, the
+                file will be stat'd.
+
+        Raises:
+            OSError: Unable to stat the item's file.
+        """
+        stat = stat or self.path.stat()
+        self._synced_mtime_ns = stat.st_mtime_ns
+        self._synced_size = stat.st_size
+        self._synced_inode = stat.st_ino
+
+    def _merge_file_synced(self, other: Self, merge_strategy: MergeStrategy) -> None:
+        """Merges the file fingerprint of another item into this one."""
+        if other._synced_mtime_ns is None:  # noqa: SLF001
+            return
+        if merge_strategy == MergeStrategy.OVERWRITE or self._synced_mtime_ns is None:
+            self._synced_mtime_ns = other._synced_mtime_ns  # noqa: SLF001
+            self._synced_size = other._synced_size  # noqa: SLF001
+            self._synced_inode = other._synced_inode  # noqa: SLF001
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import logging
 import sys
-from typing import TYPE_CHECKING, Any, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 import mediafile
-from sqlalchemy import Integer
+from sqlalchemy import Float, Index, Integer, String, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.ext.mutable import MutableSet
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.schema import ForeignKey, UniqueConstraint
@@ -16,12 +18,16 @@ import moe
 from moe import config
 from moe.library.album import Album, MetaAlbum
 from moe.library.lib_item import (
+    FileLibItem,
     LibItem,
     LibraryError,
     MergeStrategy,
     MetaLibItem,
     SABase,
     SetType,
+    custom_field_table,
+    fts_table,
+    multi_value_table,
 )
 
 if sys.version_info < (3, 11):
@@ -33,11 +39,38 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     import pluggy
+    from sqlalchemy.sql import ColumnExpressionArgument
 
-__all__ = ["MetaTrack", "Track", "TrackError"]
+__all__ = ["MetaTrack", "Track", "TrackError", "TrackReadContext"]
 
 log = logging.getLogger("moe.track")
 
+# (attribute, mediafile attribute) of each stored audio stream property
+_AUDIO_PROPERTIES = (
+    ("_audio_format", "type"),
+    ("_bit_depth", "bitdepth"),
+    ("_bitrate", "bitrate"),
+    ("_duration", "length"),
+    ("_sample_rate", "samplerate"),
+)
+
+# (offset, magic bytes) identifying each supported audio container
+_AUDIO_HEADERS: tuple[tuple[int, bytes], ...] = (
+    (0, b"ID3"),  # id3v2 tagged file, e.g. mp3
+    (0, b"fLaC"),
+    (0, b"OggS"),  # ogg vorbis, opus
+    (0, b"MAC "),  # monkey's audio
+    (0, b"wvpk"),  # wavpack
+    (0, b"MPCK"),  # musepack sv8
+    (0, b"MP+"),  # musepack sv7
+    (0, b"RIFF"),  # wav
+    (0, b"FORM"),  # aiff
+    (0, b"DSD "),
+    (0, b"\x30\x26\xb2\x75\x8e\x66\xcf\x11"),  # asf
+    (4, b"ftyp"),  # mp4, e.g. m4a and alac
+)
+_HEADER_SIZE = 12
+
 
 class Hooks:
     """Track hook specifications."""
@@ -55,7 +88,10 @@ class Hooks:
     @staticmethod
     @moe.hookspec
     def read_custom_tags(
-        track_path: Path, album_fields: dict[str, Any], track_fields: dict[str, Any]
+        track_path: Path,
+        album_fields: dict[str, Any],
+        track_fields: dict[str, Any],
+        read_context: TrackReadContext,
     ) -> None:
         """Read and set any fields from a track_path.
 
@@ -63,6 +99,10 @@ class Hooks:
         Internally, Moe uses the `mediafile <https://github.com/beetbox/mediafile>`_
         library to read tags.
 
+        Hook implementations are always called on the thread creating the track, even
+        when ``read_threads`` is used to parse album files concurrently, so they need
+        not be thread-safe.
+
         Args:
             track_path: Path of the track file to read.
             album_fields: Dictionary of album fields to read from the given track file's
@@ -73,11 +113,15 @@ class Hooks:
                 tags. The dictionary may contain existing fields and values, and you
                 can choose to either override the existing fields, or to provide new
                 fields.
+            read_context: Read context of the track file shared between all hook
+                implementations. Use its ``audio_file`` rather than opening the file
+                yourself to ensure the file is only parsed once. Implementations that
+                don't need it may omit this argument.
 
         Example:
             .. code:: python
 
-                audio_file = mediafile.MediaFile(track_path)
+                audio_file = read_context.audio_file
                 album_fields["title"] = audio_file.album
                 track_fields["title"] = audio_file.title
 
@@ -88,6 +132,27 @@ class Hooks:
               tags.
         """
 
+    @staticmethod
+    @moe.hookspec(firstresult=True)
+    def is_track_file(path: Path) -> bool | None:  # type: ignore[reportReturnType]
+        """Classify whether a file in an album directory may be a track file.
+
+        When scanning an album directory, each file is first classified using this
+        hook. Any files that are not track files are added as extras without ever
+        being parsed, while any potential track files then have their tags read.
+        Internally, files are classified using the ``audio_extensions`` config option
+        and the first few bytes of the file.
+
+        The first implementation to return a non-``None`` value decides the outcome.
+
+        Args:
+            path: Path of the file to classify.
+
+        Returns:
+            ``True`` if the file should be read as a track, ``False`` if it should be
+            treated as an extra, or ``None`` to defer to other implementations.
+        """
+
 
 @moe.hookimpl
 def add_hooks(pm: pluggy._manager.PluginManager) -> None:
@@ -99,10 +164,12 @@ def add_hooks(pm: pluggy._manager.PluginManager) -> None:
 
 @moe.hookimpl(tryfirst=True)
 def read_custom_tags(
-    track_path: Path, album_fields: dict[str, Any], track_fields: dict[str, Any]
+    album_fields: dict[str, Any],
+    track_fields: dict[str, Any],
+    read_context: TrackReadContext,
 ) -> None:
     """Read and set internally tracked fields."""
-    audio_file = mediafile.MediaFile(track_path)
+    audio_file = read_context.audio_file
 
     album_fields["artist"] = audio_file.albumartist or audio_file.artist
     album_fields["barcode"] = audio_file.barcode
@@ -129,10 +196,97 @@ def read_custom_tags(
     track_fields["track_num"] = audio_file.track
 
 
+@moe.hookimpl(trylast=True)
+def is_track_file(path: Path) -> bool:
+    """Classify files by their extension and header."""
+    extensions = {ext.lower() for ext in config.CONFIG.settings.audio_extensions}
+    if path.suffix.lower().lstrip(".") not in extensions:
+        return False
+
+    try:
+        with path.open("rb") as track_file:
+            header = track_file.read(_HEADER_SIZE)
+    except OSError:
+        return False
+
+    if len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0:  # noqa: PLR2004
+        return True  # mpeg audio or adts frame sync without an id3 tag
+
+    return any(
+        header[offset : offset + len(magic)] == magic
+        for offset, magic in _AUDIO_HEADERS
+    )
+
+
 class TrackError(LibraryError):
     """Error performing some operation on a Track."""
 
 
+class TrackReadContext:
+    """Shared state for reading the tags of a single track file.
+
+    A read context is given to each ``read_custom_tags`` hook implementation so the
+    track file only needs to be parsed once, regardless of how many plugins read it.
+
+    Attributes:
+        album_fields (dict[str, Any]): Album fields read by ``read_tags()``.
+        path (Path): Filesystem path of the track file.
+        track_fields (dict[str, Any]): Track fields read by ``read_tags()``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Creates a read context for the track file at ``path``."""
+        self.path = path
+        self.album_fields: dict[str, Any] = {}
+        self.track_fields: dict[str, Any] = {}
+
+    @cached_property
+    def audio_file(self) -> mediafile.MediaFile:
+        """Returns the parsed track file, parsing it on first access.
+
+        Raises:
+            mediafile.UnreadableFileError: The file is not a readable track file.
+        """
+        log.debug(f"Parsing track file. [path={self.path}]")
+
+        return mediafile.MediaFile(self.path)
+
+    def parse(self) -> None:
+        """Parses the track file without reading its tags into any fields.
+
+        Only the track file itself is touched and no hooks are called, so separate
+        files may be parsed concurrently.
+
+        Raises:
+            TrackError: ``path`` does not correspond to a track file.
+        """
+        try:
+            self.audio_file  # noqa: B018 parses the file
+        except mediafile.UnreadableFileError as err:
+            err_msg = (
+                "Unable to create track; given path is not a track file. "
+                f"[path={self.path}]"
+            )
+            raise TrackError(err_msg) from err
+
+    def read_tags(self) -> None:
+        """Reads the track file's tags into ``album_fields`` and ``track_fields``.
+
+        The file is parsed if it hasn't been already, and then each
+        ``read_custom_tags`` hook implementation is called on the current thread.
+
+        Raises:
+            TrackError: ``path`` does not correspond to a track file.
+        """
+        self.parse()
+        config.CONFIG.pm.hook.read_custom_tags(
+            track_path=self.path,
+            album_fields=self.album_fields,
+            track_fields=self.track_fields,
+            read_context=self,
+        )
+
+
 class MetaTrack(MetaLibItem):  # noqa: PLW1641 MetaTracks are unhashable
     """A track containing only metadata.
 
@@ -313,7 +467,7 @@ class MetaTrack(MetaLibItem):  # noqa: PLW1641 MetaTracks are unhashable
         return f"{self.artist} - {self.title}"
 
 
-class Track(LibItem, SABase, MetaTrack):
+class Track(FileLibItem, SABase, MetaTrack):
     """A single track in the library.
 
     Attributes:
@@ -329,6 +483,10 @@ class Track(LibItem, SABase, MetaTrack):
         title (str)
         track_num (int)
 
+    The read-only audio stream properties ``audio_format``, ``bit_depth``,
+    ``bitrate``, ``duration``, and ``sample_rate`` are stored in the library and only
+    re-read from the track file if it has changed since they were last read.
+
     Note:
         Altering any album-related property attributes, will result in changing the
         album field and thus all other tracks in the album as well.
@@ -349,10 +507,33 @@ class Track(LibItem, SABase, MetaTrack):
     title: Mapped[str]
     track_num: Mapped[int]
 
-    _album_id: Mapped[int] = mapped_column(Integer, ForeignKey("album._id"))
+    # audio stream properties are read from the file whenever the track is synced
+    # with it, see `FileLibItem.set_file_synced()`
+    _audio_format: Mapped[Optional[str]] = mapped_column(  # noqa: UP045 sqlalchemy does not support
+        "audio_format", String, nullable=True
+    )
+    _bit_depth: Mapped[Optional[int]] = mapped_column(  # noqa: UP045 sqlalchemy does not support
+        "bit_depth", Integer, nullable=True
+    )
+    _bitrate: Mapped[Optional[int]] = mapped_column(  # noqa: UP045 sqlalchemy does not support
+        "bitrate", Integer, nullable=True
+    )
+    _duration: Mapped[Optional[float]] = mapped_column(  # noqa: UP045 sqlalchemy does not support
+        "duration", Float, nullable=True
+    )
+    _sample_rate: Mapped[Optional[int]] = mapped_column(  # noqa: UP045 sqlalchemy does not support
+        "sample_rate", Integer, nullable=True
+    )
+
+    _album_id: Mapped[int] = mapped_column(Integer, ForeignKey("album._id"), index=True)
     album: Mapped[Album] = relationship(back_populates="tracks")
 
-    __table_args__ = (UniqueConstraint("disc", "track_num", "_album_id"),)
+    # NOCASE indexes can be used by (case insensitive) LIKE queries
+    __table_args__ = (
+        UniqueConstraint("disc", "track_num", "_album_id"),
+        Index("ix_track_artist", text("artist COLLATE NOCASE")),
+        Index("ix_track_title", text("title COLLATE NOCASE")),
+    )
 
     def __init__(  # noqa: PLR0913
         self,
@@ -434,6 +615,7 @@ class Track(LibItem, SABase, MetaTrack):
         track_path: Path,
         album: Album | None = None,
         album_path: Path | None = None,
+        read_context: TrackReadContext | None = None,
     ) -> Track:
         """Alternate initializer that creates a Track from a track file.
 
@@ -447,6 +629,8 @@ class Track(LibItem, SABase, MetaTrack):
             album_path: When ``album`` is ``None``, this is the path of the created
                 album. If ``None`` it defaults to the parent directory of
                 ``track_path``.
+            read_context: Read context of ``track_path`` whose tags have already
+                been read. If ``None``, the tags will be read from ``track_path``.
 
         Returns:
             Track instance.
@@ -457,20 +641,11 @@ class Track(LibItem, SABase, MetaTrack):
         """
         log.debug(f"Creating track from path. [path={track_path}, {album=}]")
 
-        try:
-            mediafile.MediaFile(track_path)
-        except mediafile.UnreadableFileError as err:
-            err_msg = (
-                "Unable to create track; given path is not a track file. "
-                f"[path={track_path}]"
-            )
-            raise TrackError(err_msg) from err
-
-        album_fields: dict[str, Any] = {}
-        track_fields: dict[str, Any] = {}
-        config.CONFIG.pm.hook.read_custom_tags(
-            track_path=track_path, album_fields=album_fields, track_fields=track_fields
-        )
+        if not read_context:
+            read_context = TrackReadContext(track_path)
+            read_context.read_tags()
+        album_fields = dict(read_context.album_fields)
+        track_fields = dict(read_context.track_fields)
 
         title = track_fields.pop("title")
         track_num = track_fields.pop("track_num")
@@ -505,49 +680,128 @@ class Track(LibItem, SABase, MetaTrack):
                 **album_fields,
             )
 
-        return cls(
+        track = cls(
             album=album,
             path=track_path,
             title=title,
             track_num=track_num,
             **track_fields,
         )
+        track._set_audio_properties(read_context.audio_file)
+        track.set_file_synced()
 
-    @property
+        return track
+
+    @hybrid_property
     def audio_format(self) -> str:
         """Returns the audio format of the track.
 
         One of ['aac', 'aiff', 'alac', 'ape', 'asf', 'dsf', 'flac', 'ogg', 'opus',
             'mp3', 'mpc', 'wav', 'wv'].
         """
-        return mediafile.MediaFile(self.path).type
+        return cast("str", self._audio_format)
 
-    @property
+    @audio_format.inplace.expression  # type: ignore[reportArgumentType]
+    @classmethod
+    def _audio_format_expression(cls: type[Track]) -> ColumnExpressionArgument[str]:
+        """Returns the stored audio format at the sql level."""
+        return cls._audio_format
+
+    @hybrid_property
     def bit_depth(self) -> int:
         """Returns the number of bits per sample in the audio encoding.
 
         The bit depth is an integer and zero when unavailable or when the file format
         does not support bit depth.
         """
-        return mediafile.MediaFile(self.path).bitdepth
+        return cast("int", self._bit_depth)
 
-    @property
-    def duration(self) -> float:
+    @bit_depth.inplace.expression  # type: ignore[reportArgumentType]
+    @classmethod
+    def _bit_depth_expression(cls: type[Track]) -> ColumnExpressionArgument[int]:
+        """Returns the stored bit depth at the sql level."""
+        return cls._bit_depth
+
+    @hybrid_property
+    def bitrate(self) -> int:
+        """Returns the bitrate of the track in bits per second."""
+        return cast("int", self._bitrate)
+
+    @bitrate.inplace.expression  # type: ignore[reportArgumentType]
+    @classmethod
+    def _bitrate_expression(cls: type[Track]) -> ColumnExpressionArgument[int]:
+        """Returns the stored bitrate at the sql level."""
+        return cls._bitrate
+
+    @hybrid_property
+    def duration(self) -> float:  # type: ignore[reportIncompatibleVariableOverride]
         """Returns the duration of the track in seconds."""
-        return mediafile.MediaFile(self.path).length
+        return cast("float", self._duration)
+
+    @duration.inplace.expression  # type: ignore[reportArgumentType]
+    @classmethod
+    def _duration_expression(cls: type[Track]) -> ColumnExpressionArgument[float]:
+        """Returns the stored duration at the sql level."""
+        return cls._duration
 
     @property
     def fields(self) -> set[str]:
         """Returns any editable, track-specific fields."""
         return super().fields.union({"path"}) - {"duration"}
 
-    @property
+    @hybrid_property
     def sample_rate(self) -> int:
         """Returns the sampling rate of the track.
 
         The sampling rate is in Hertz (Hz) as an integer and zero when unavailable.
         """
-        return mediafile.MediaFile(self.path).samplerate
+        return cast("int", self._sample_rate)
+
+    @sample_rate.inplace.expression  # type: ignore[reportArgumentType]
+    @classmethod
+    def _sample_rate_expression(cls: type[Track]) -> ColumnExpressionArgument[int]:
+        """Returns the stored sample rate at the sql level."""
+        return cls._sample_rate
+
+    def refresh_audio_properties(self, *, force: bool = False) -> bool:
+        """Reads the audio stream properties from the track file if they are stale.
+
+        Audio stream properties, i.e. the audio format, bit depth, bitrate, duration,
+        and sample rate, are stored in the library whenever the track is synced with
+        its file. Getting a property only ever returns the stored value, so the file
+        will only be read here if it has changed since it was last synced, or if the
+        properties were never read.
+
+        If the track was never synced with its file, e.g. it was added before file
+        fingerprints were stored, it's marked as synced once its properties are read,
+        as its tags were already read when it was added. Otherwise, only the audio
+        properties are read, so a changed track file stays marked as changed until
+        its tags are read with `moe.read.read_item()`.
+
+        Args:
+            force: Read the track file regardless of whether it has changed.
+
+        Returns:
+            Whether the track file was read.
+        """
+        if not force and self._audio_format is not None:
+            try:
+                if not self.is_file_changed():
+                    return False
+            except OSError:
+                return False  # keep the stored properties if the file is unavailable
+
+        log.debug(f"Reading audio properties of track. [track={self!r}]")
+        stat = self.path.stat()
+        self._set_audio_properties(mediafile.MediaFile(self.path))
+        if self.file_fingerprint is None:
+            self.set_file_synced(stat)
+        return True
+
+    def _set_audio_properties(self, audio_file: mediafile.MediaFile) -> None:
+        """Stores the audio stream properties of an opened track file."""
+        for attr, mediafile_attr in _AUDIO_PROPERTIES:
+            setattr(self, attr, getattr(audio_file, mediafile_attr))
 
     def is_unique(self, other: LibItem) -> bool:
         """Returns whether a track is unique in the library from ``other``."""
@@ -568,3 +822,37 @@ class Track(LibItem, SABase, MetaTrack):
         )
 
         return False not in custom_uniqueness
+
+    def merge(
+        self,
+        other: MetaTrack | Track,
+        merge_strategy: MergeStrategy = MergeStrategy.KEEP_EXISTING,
+    ) -> None:
+        """Merges another track into this one.
+
+        Any stored audio stream properties and file fingerprint of ``other`` will
+        also be merged.
+
+        Args:
+            other: Other track to be merged with the current track.
+            merge_strategy: Which MergeStrategy to use when a conflict exists.
+        """
+        super().merge(other, merge_strategy)
+
+        if not isinstance(other, Track):
+            return
+        self._merge_file_synced(other, merge_strategy)
+        if other._audio_format is None:  # noqa: SLF001
+            return
+        if merge_strategy == MergeStrategy.OVERWRITE or self._audio_format is None:
+            for attr, _ in _AUDIO_PROPERTIES:
+                setattr(self, attr, getattr(other, attr))
+
+
+# indexed side tables of each track artist, genre, and custom field for queries
+track_artists = multi_value_table("track", "artists")
+track_custom = custom_field_table("track")
+track_genres = multi_value_table("track", "genres")
+
+# full-text search table of track text fields for `~` queries
+track_fts = fts_table("track", ("artist", "composer", "title"))
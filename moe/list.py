@@ -7,7 +7,6 @@ Note:
 import argparse
 import logging
 from collections import OrderedDict
-from collections.abc import Sequence
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -16,12 +15,25 @@ import moe
 import moe.cli
 from moe import config
 from moe.library import Album, Extra, LibItem, Track
-from moe.util.cli import cli_query, query_parser
+from moe.query import DEFAULT_ORDER_BY, QueryType
+from moe.util.cli import cli_iter_query, cli_iter_rows, query_parser
 
 __all__: list[str] = []
 
 log = logging.getLogger("moe.cli.list")
 
+# relationships each item type's output needs
+_LOAD_PROFILES: dict[QueryType, tuple[str, ...]] = {
+    QueryType.ALBUM: (),
+    QueryType.EXTRA: ("album",),
+    QueryType.TRACK: (),
+}
+_INFO_LOAD_PROFILES: dict[QueryType, tuple[str, ...]] = {
+    QueryType.ALBUM: ("tracks", "extras"),
+    QueryType.EXTRA: ("album",),
+    QueryType.TRACK: ("album",),
+}
+
 
 @moe.hookimpl
 def plugin_registration() -> None:
@@ -53,6 +65,13 @@ def add_command(cmd_parsers: argparse._SubParsersAction) -> None:
         action="store_true",
         help="list paths",
     )
+    ls_parser.add_argument(
+        "-s",
+        "--sort",
+        type=lambda keys: keys.split(","),
+        help="comma-separated fields to sort by, e.g. 'a:date,title'; "
+        "prefix a field with '-' to sort descending, e.g. '--sort=-a:date'",
+    )
     ls_parser.set_defaults(func=_parse_args)
 
 
@@ -66,29 +85,30 @@ def _parse_args(session: Session, args: argparse.Namespace) -> None:
     Raises:
         SystemExit: Invalid query or no items found.
     """
-    items = cli_query(session, args.query, args.query_type)
-    items.sort()
-
-    if args.info:
-        print(_fmt_infos(items), end="")  # noqa: T201 cli output
-    else:
-        for item in items:
-            if args.paths:
-                print(item.path)  # noqa: T201 cli output
-            else:
-                print(item)  # noqa: T201 cli output
-
-
-def _fmt_infos(items: Sequence[LibItem]) -> str:
-    """Formats information for multiple items together."""
-    out_str = ""
-    for item in items:
-        out_str += _fmt_info(item) + "\n"
-
-        if item is not items[-1]:
-            out_str += "\n"
+    order_by = args.sort or DEFAULT_ORDER_BY[args.query_type]
+    if args.paths and not args.info:
+        # paths don't need full library items
+        for row in cli_iter_rows(
+            session, args.query, args.query_type, ["path"], order_by=order_by
+        ):
+            print(row.path)  # noqa: T201 cli output
+        return
+
+    items = cli_iter_query(
+        session,
+        args.query,
+        args.query_type,
+        order_by=order_by,
+        load=(_INFO_LOAD_PROFILES if args.info else _LOAD_PROFILES)[args.query_type],
+    )
 
-    return out_str
+    for item_num, item in enumerate(items):
+        if args.info:
+            if item_num:
+                print()  # noqa: T201 cli output
+            print(_fmt_info(item))  # noqa: T201 cli output
+        else:
+            print(item)  # noqa: T201 cli output
 
 
 def _fmt_info(item: LibItem) -> str:
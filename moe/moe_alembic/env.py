@@ -34,6 +34,9 @@ if config.attributes.get("configure_logger", True):
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
+# NOTE: the triggers syncing the side tables of each item table aren't part of the
+# metadata, so they're never autogenerated. Batch operations that recreate an item
+# table also drop its triggers and index collations, which must then be recreated.
 target_metadata = SABase.metadata
 
 # other values from the config, defined by the needs of env.py,
@@ -0,0 +1,58 @@
+"""keep the full-text search tables in sync with triggers.
+
+Revision ID: 2b8e6f0d4a93
+Revises: 7d2c9a4f1b60
+Create Date: 2026-10-17 23:12:44.905127
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2b8e6f0d4a93"
+down_revision = "7d2c9a4f1b60"
+branch_labels = None
+depends_on = None
+
+FTS_FIELDS = {
+    "album": ("artist", "label", "title"),
+    "track": ("artist", "composer", "title"),
+}
+
+
+def upgrade():
+    for item_table, fields in FTS_FIELDS.items():
+        table_name = f"{item_table}_fts"
+        columns = ", ".join(fields)
+        new_columns = ", ".join(f"new.{field}" for field in fields)
+        insert_row = (
+            f"INSERT INTO {table_name} (rowid, {columns}) "  # noqa: S608
+            f"VALUES (new._id, {new_columns});"
+        )
+        delete_row = f"DELETE FROM {table_name} WHERE rowid = old._id;"  # noqa: S608
+        op.execute(
+            f"CREATE TRIGGER {table_name}_ai AFTER INSERT ON {item_table} "
+            f"BEGIN {insert_row} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table_name}_au "
+            f"AFTER UPDATE OF {columns} ON {item_table} "
+            f"BEGIN {delete_row} {insert_row} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table_name}_ad AFTER DELETE ON {item_table} "
+            f"BEGIN {delete_row} END"
+        )
+
+        # rebuild the index in case any items were changed outside of the orm
+        op.execute(f"DELETE FROM {table_name}")  # noqa: S608
+        op.execute(
+            f"INSERT INTO {table_name} (rowid, {columns}) "  # noqa: S608
+            f"SELECT _id, {columns} FROM {item_table}"
+        )
+
+
+def downgrade():
+    for item_table in FTS_FIELDS:
+        for suffix in ("ai", "au", "ad"):
+            op.execute(f"DROP TRIGGER {item_table}_fts_{suffix}")
@@ -0,0 +1,39 @@
+"""store audio stream properties.
+
+Revision ID: 4b1f0c9e2d7a
+Revises: 16590851e88e
+Create Date: 2026-10-17 09:12:44.183512
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4b1f0c9e2d7a"
+down_revision = "16590851e88e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # existing tracks are backfilled with `moe read --properties '*'`
+    with op.batch_alter_table("track", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("audio_format", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("bit_depth", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("bitrate", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("duration", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("sample_rate", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("file_mtime_ns", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("file_size", sa.Integer(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("track", schema=None) as batch_op:
+        batch_op.drop_column("file_size")
+        batch_op.drop_column("file_mtime_ns")
+        batch_op.drop_column("sample_rate")
+        batch_op.drop_column("duration")
+        batch_op.drop_column("bitrate")
+        batch_op.drop_column("bit_depth")
+        batch_op.drop_column("audio_format")
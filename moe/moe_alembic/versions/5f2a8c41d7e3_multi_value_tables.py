@@ -0,0 +1,73 @@
+"""index multi-value fields in side tables.
+
+Revision ID: 5f2a8c41d7e3
+Revises: e1b7d52f3a90
+Create Date: 2026-10-17 15:22:51.094611
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5f2a8c41d7e3"
+down_revision = "e1b7d52f3a90"
+branch_labels = None
+depends_on = None
+
+MULTI_VALUE_FIELDS = (
+    ("album", "catalog_nums"),
+    ("track", "artists"),
+    ("track", "genres"),
+)
+
+
+def upgrade():
+    for item_table, field in MULTI_VALUE_FIELDS:
+        table_name = f"{item_table}_{field}"
+        op.create_table(
+            table_name,
+            sa.Column("item_id", sa.Integer(), nullable=False),
+            sa.Column("value", sa.String(), nullable=False),
+            sa.ForeignKeyConstraint(["item_id"], [f"{item_table}._id"]),
+            sa.PrimaryKeyConstraint("item_id", "value"),
+        )
+        op.create_index(
+            f"ix_{table_name}_value", table_name, [sa.text("value COLLATE NOCASE")]
+        )
+
+        insert_values = (
+            f"INSERT OR IGNORE INTO {table_name} (item_id, value) "  # noqa: S608
+            f"SELECT new._id, value FROM json_each(new.{field}) "
+            "WHERE value IS NOT NULL;"
+        )
+        delete_values = f"DELETE FROM {table_name} WHERE item_id = old._id;"  # noqa: S608
+        op.execute(
+            f"CREATE TRIGGER {table_name}_ai AFTER INSERT ON {item_table} "
+            f"BEGIN {insert_values} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table_name}_au AFTER UPDATE OF {field} ON {item_table} "
+            f"BEGIN {delete_values} {insert_values} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table_name}_ad AFTER DELETE ON {item_table} "
+            f"BEGIN {delete_values} END"
+        )
+
+        # backfill from the existing json values
+        op.execute(
+            f"INSERT OR IGNORE INTO {table_name} (item_id, value) "  # noqa: S608
+            f"SELECT {item_table}._id, json_each.value "
+            f"FROM {item_table}, json_each({item_table}.{field}) "
+            "WHERE json_each.value IS NOT NULL"
+        )
+
+
+def downgrade():
+    for item_table, field in MULTI_VALUE_FIELDS:
+        table_name = f"{item_table}_{field}"
+        for trigger_suffix in ("ai", "au", "ad"):
+            op.execute(f"DROP TRIGGER {table_name}_{trigger_suffix}")
+        op.drop_index(f"ix_{table_name}_value", table_name)
+        op.drop_table(table_name)
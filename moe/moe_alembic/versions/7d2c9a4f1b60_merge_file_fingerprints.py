@@ -0,0 +1,83 @@
+"""merge audio property file fingerprints into the synced file fingerprints.
+
+Revision ID: 7d2c9a4f1b60
+Revises: c4f19b7e82d6
+Create Date: 2026-10-17 20:41:09.518302
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d2c9a4f1b60"
+down_revision = "c4f19b7e82d6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # dropping columns recreates the table, which drops its triggers and loses the
+    # collation of its indexes, so they must be recreated too
+    with op.batch_alter_table("track", schema=None) as batch_op:
+        batch_op.drop_column("file_size")
+        batch_op.drop_column("file_mtime_ns")
+
+    for field in ("artist", "title"):
+        op.drop_index(f"ix_track_{field}", "track")
+        op.create_index(
+            f"ix_track_{field}", "track", [sa.text(f"{field} COLLATE NOCASE")]
+        )
+    _create_track_triggers()
+
+
+def downgrade():
+    with op.batch_alter_table("track", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("file_mtime_ns", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("file_size", sa.Integer(), nullable=True))
+
+
+def _create_track_triggers():
+    """Creates any missing triggers syncing the track side tables with its table."""
+    for field in ("artists", "genres"):
+        table_name = f"track_{field}"
+        insert_values = (
+            f"INSERT OR IGNORE INTO {table_name} (item_id, value) "  # noqa: S608
+            f"SELECT new._id, value FROM json_each(new.{field}) "
+            "WHERE value IS NOT NULL;"
+        )
+        delete_values = f"DELETE FROM {table_name} WHERE item_id = old._id;"  # noqa: S608
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table_name}_ai AFTER INSERT ON track "
+            f"BEGIN {insert_values} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table_name}_au "
+            f"AFTER UPDATE OF {field} ON track "
+            f"BEGIN {delete_values} {insert_values} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table_name}_ad AFTER DELETE ON track "
+            f"BEGIN {delete_values} END"
+        )
+
+    insert_values = (
+        "INSERT OR IGNORE INTO track_custom (item_id, field, value) "
+        "SELECT new._id, indexed_field.field, json_each.value "
+        "FROM indexed_field, json_each(new.custom, '$.' || indexed_field.field) "
+        "WHERE indexed_field.item_table = 'track' "
+        "AND json_each.value IS NOT NULL;"
+    )
+    delete_values = "DELETE FROM track_custom WHERE item_id = old._id;"
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS track_custom_ai AFTER INSERT ON track "
+        f"BEGIN {insert_values} END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS track_custom_au AFTER UPDATE OF custom ON track "
+        f"BEGIN {delete_values} {insert_values} END"
+    )
+    op.execute(
+        "CREATE TRIGGER IF NOT EXISTS track_custom_ad AFTER DELETE ON track "
+        f"BEGIN {delete_values} END"
+    )
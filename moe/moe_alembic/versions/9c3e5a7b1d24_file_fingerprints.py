@@ -0,0 +1,35 @@
+"""store synced file fingerprints.
+
+Revision ID: 9c3e5a7b1d24
+Revises: 4b1f0c9e2d7a
+Create Date: 2026-10-17 11:03:27.640215
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9c3e5a7b1d24"
+down_revision = "4b1f0c9e2d7a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # existing items are considered changed until they are next read or written
+    for table in ("extra", "track"):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column("synced_mtime_ns", sa.Integer(), nullable=True)
+            )
+            batch_op.add_column(sa.Column("synced_size", sa.Integer(), nullable=True))
+            batch_op.add_column(sa.Column("synced_inode", sa.Integer(), nullable=True))
+
+
+def downgrade():
+    for table in ("extra", "track"):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column("synced_inode")
+            batch_op.drop_column("synced_size")
+            batch_op.drop_column("synced_mtime_ns")
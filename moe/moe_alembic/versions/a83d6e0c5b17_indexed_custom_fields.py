@@ -0,0 +1,76 @@
+"""index declared custom fields in side tables.
+
+Revision ID: a83d6e0c5b17
+Revises: 5f2a8c41d7e3
+Create Date: 2026-10-17 16:48:02.731904
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a83d6e0c5b17"
+down_revision = "5f2a8c41d7e3"
+branch_labels = None
+depends_on = None
+
+ITEM_TABLES = ("album", "extra", "track")
+
+
+def upgrade():
+    # fields are declared, and their values backfilled, when moe starts
+    op.create_table(
+        "indexed_field",
+        sa.Column("item_table", sa.String(), nullable=False),
+        sa.Column("field", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("item_table", "field"),
+    )
+
+    for item_table in ITEM_TABLES:
+        table_name = f"{item_table}_custom"
+        op.create_table(
+            table_name,
+            sa.Column("item_id", sa.Integer(), nullable=False),
+            sa.Column("field", sa.String(), nullable=False),
+            sa.Column("value", sa.String(), nullable=False),
+            sa.ForeignKeyConstraint(["item_id"], [f"{item_table}._id"]),
+            sa.PrimaryKeyConstraint("item_id", "field", "value"),
+        )
+        op.create_index(
+            f"ix_{table_name}_field_value",
+            table_name,
+            ["field", sa.text("value COLLATE NOCASE")],
+        )
+
+        insert_values = (
+            f"INSERT OR IGNORE INTO {table_name} (item_id, field, value) "  # noqa: S608
+            "SELECT new._id, indexed_field.field, json_each.value "
+            "FROM indexed_field, json_each(new.custom, '$.' || indexed_field.field) "
+            f"WHERE indexed_field.item_table = '{item_table}' "
+            "AND json_each.value IS NOT NULL;"
+        )
+        delete_values = f"DELETE FROM {table_name} WHERE item_id = old._id;"  # noqa: S608
+        op.execute(
+            f"CREATE TRIGGER {table_name}_ai AFTER INSERT ON {item_table} "
+            f"BEGIN {insert_values} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table_name}_au AFTER UPDATE OF custom ON {item_table} "
+            f"BEGIN {delete_values} {insert_values} END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table_name}_ad AFTER DELETE ON {item_table} "
+            f"BEGIN {delete_values} END"
+        )
+
+
+def downgrade():
+    for item_table in ITEM_TABLES:
+        table_name = f"{item_table}_custom"
+        for trigger_suffix in ("ai", "au", "ad"):
+            op.execute(f"DROP TRIGGER {table_name}_{trigger_suffix}")
+        op.drop_index(f"ix_{table_name}_field_value", table_name)
+        op.drop_table(table_name)
+
+    op.drop_table("indexed_field")
@@ -0,0 +1,38 @@
+"""full-text search tables for album and track text fields.
+
+Revision ID: c4f19b7e82d6
+Revises: a83d6e0c5b17
+Create Date: 2026-10-17 18:05:37.226140
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c4f19b7e82d6"
+down_revision = "a83d6e0c5b17"
+branch_labels = None
+depends_on = None
+
+FTS_FIELDS = {
+    "album": ("artist", "label", "title"),
+    "track": ("artist", "composer", "title"),
+}
+
+
+def upgrade():
+    for item_table, fields in FTS_FIELDS.items():
+        columns = ", ".join(fields)
+        op.execute(
+            f"CREATE VIRTUAL TABLE {item_table}_fts USING fts5({columns}, "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            f"INSERT INTO {item_table}_fts (rowid, {columns}) "  # noqa: S608
+            f"SELECT _id, {columns} FROM {item_table}"
+        )
+
+
+def downgrade():
+    for item_table in FTS_FIELDS:
+        op.execute(f"DROP TABLE {item_table}_fts")
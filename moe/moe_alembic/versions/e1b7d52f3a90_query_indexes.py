@@ -0,0 +1,36 @@
+"""index commonly queried fields.
+
+Revision ID: e1b7d52f3a90
+Revises: 9c3e5a7b1d24
+Create Date: 2026-10-17 13:41:09.518372
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e1b7d52f3a90"
+down_revision = "9c3e5a7b1d24"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_album_artist", "album", [sa.text("artist COLLATE NOCASE")])
+    op.create_index("ix_album_date", "album", ["date"])
+    op.create_index("ix_album_title", "album", [sa.text("title COLLATE NOCASE")])
+    op.create_index("ix_extra__album_id", "extra", ["_album_id"])
+    op.create_index("ix_track__album_id", "track", ["_album_id"])
+    op.create_index("ix_track_artist", "track", [sa.text("artist COLLATE NOCASE")])
+    op.create_index("ix_track_title", "track", [sa.text("title COLLATE NOCASE")])
+
+
+def downgrade():
+    op.drop_index("ix_track_title", "track")
+    op.drop_index("ix_track_artist", "track")
+    op.drop_index("ix_track__album_id", "track")
+    op.drop_index("ix_extra__album_id", "extra")
+    op.drop_index("ix_album_title", "album")
+    op.drop_index("ix_album_date", "album")
+    op.drop_index("ix_album_artist", "album")
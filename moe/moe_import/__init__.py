@@ -1,20 +1,55 @@
 """Imports metadata for music in your library."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+import dynaconf
+import dynaconf.base
+
 import moe
 from moe import config
 
-from . import import_cli, import_core
-from .import_cli import *  # noqa: F403
-from .import_core import *  # noqa: F403
+if TYPE_CHECKING:
+    from .import_cli import *  # noqa: F403
+    from .import_core import *  # noqa: F403
+
+PLUGIN_INFO = config.PluginInfo(
+    hooks=frozenset(
+        {
+            "add_candidate_prompt_choice",
+            "add_import_prompt_choice",
+            "get_candidates",
+            "pre_add",
+            "process_candidates",
+        }
+    )
+)
+
 
-__all__ = []
-__all__.extend(import_cli.__all__)
-__all__.extend(import_core.__all__)
+@moe.hookimpl
+def add_config_validator(settings: dynaconf.base.LazySettings) -> None:
+    """Validates import plugin configuration settings."""
+    settings.validators.register(  # type: ignore[reportAttributeAccessIssue] dynaconf doesn't have proper type stubs yet
+        dynaconf.Validator("import.max_candidates", default=5, gte=1)
+    )
 
 
 @moe.hookimpl
 def plugin_registration() -> None:
     """Only register the cli sub-plugin if the cli is enabled."""
+    from . import import_cli, import_core  # noqa: PLC0415 deferred, see `PLUGIN_INFO`
+
     config.CONFIG.pm.register(import_core, "import_core")
     if config.CONFIG.pm.has_plugin("cli"):
         config.CONFIG.pm.register(import_cli, "import_cli")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 any attribute of the api
+    """Imports the API once it's used."""
+    import_cli = importlib.import_module(f"{__name__}.import_cli")
+    import_core = importlib.import_module(f"{__name__}.import_core")
+    if name == "__all__":
+        return [*import_cli.__all__, *import_core.__all__]
+    if name in import_cli.__all__:
+        return getattr(import_cli, name)
+    return getattr(import_core, name)
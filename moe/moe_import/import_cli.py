@@ -6,8 +6,6 @@ import functools
 import logging
 from typing import TYPE_CHECKING
 
-import dynaconf
-import dynaconf.base
 from rich import box
 from rich.console import Group
 from rich.panel import Panel
@@ -116,14 +114,6 @@ def add_import_prompt_choice(prompt_choices: list[PromptChoice]) -> None:
     )
 
 
-@moe.hookimpl
-def add_config_validator(settings: dynaconf.base.LazySettings) -> None:
-    """Validates import plugin configuration settings."""
-    settings.validators.register(  # type: ignore[reportAttributeAccessIssue] dynaconf doesn't have proper type stubs yet
-        dynaconf.Validator("import.max_candidates", default=5, gte=1)
-    )
-
-
 @moe.hookimpl
 def process_candidates(new_album: Album, candidates: list[CandidateAlbum]) -> None:
     """Use the import prompt to select and process the imported candidate albums."""
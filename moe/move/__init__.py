@@ -1,18 +1,59 @@
 """Alters the location of items in your library."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+import dynaconf
+import dynaconf.base
+
 import moe
 from moe import config
 
-from . import move_cli, move_core
-from .move_core import *  # noqa: F403
+if TYPE_CHECKING:
+    from .move_core import *  # noqa: F403
 
-__all__ = []
-__all__.extend(move_core.__all__)
+PLUGIN_INFO = config.PluginInfo(
+    hooks=frozenset(
+        {
+            "create_path_template_func",
+            "edit_new_items",
+            "override_album_path_config",
+            "override_extra_path_config",
+        }
+    ),
+    commands=frozenset({"move", "mv"}),
+)
+
+
+@moe.hookimpl
+def add_config_validator(settings: dynaconf.base.LazySettings) -> None:
+    """Validate move plugin configuration settings."""
+    default_album_path = "{album.artist}/{album.title} ({album.year})"
+    default_extra_path = "{e_unique(extra)}"
+    default_track_path = (
+        "{f'Disc {track.disc:02}' if album.disc_total > 1 else ''}/"
+        "{track.track_num:02} - {track.title}{track.path.suffix}"
+    )
+
+    moe_validators = [
+        dynaconf.Validator("MOVE.ASCIIFY_PATHS", default=False),
+        dynaconf.Validator("MOVE.ALBUM_PATH", default=default_album_path),
+        dynaconf.Validator("MOVE.EXTRA_PATH", default=default_extra_path),
+        dynaconf.Validator("MOVE.TRACK_PATH", default=default_track_path),
+    ]
+    settings.validators.register(*moe_validators)  # type: ignore[reportCallIssue]
 
 
 @moe.hookimpl
 def plugin_registration() -> None:
     """Only register the cli sub-plugin if the cli is enabled."""
+    from . import move_cli, move_core  # noqa: PLC0415 deferred, see `PLUGIN_INFO`
+
     config.CONFIG.pm.register(move_core, "move_core")
     if config.CONFIG.pm.has_plugin("cli"):
         config.CONFIG.pm.register(move_cli, "move_cli")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 any attribute of the core api
+    """Imports the core API once it's used."""
+    return getattr(importlib.import_module(f"{__name__}.move_core"), name)
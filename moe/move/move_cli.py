@@ -2,6 +2,7 @@
 
 import argparse
 import logging
+from collections.abc import Iterable
 from typing import cast
 
 import sqlalchemy.orm
@@ -11,7 +12,7 @@ import moe
 from moe import move as moe_move
 from moe.library import Album
 from moe.query import QueryType
-from moe.util.cli import cli_query
+from moe.util.cli import cli_iter_query
 
 log = logging.getLogger("moe.cli.move")
 
@@ -46,7 +47,10 @@ def _parse_args(session: Session, args: argparse.Namespace) -> None:
     Raises:
         SystemExit: Invalid query or no items found to move.
     """
-    albums = cast("list[Album]", cli_query(session, "*", QueryType.ALBUM))
+    albums = cast(
+        "Iterable[Album]",
+        cli_iter_query(session, "*", QueryType.ALBUM, load=("tracks", "extras")),
+    )
 
     if args.dry_run:
         dry_run_str = _dry_run(albums)
@@ -57,7 +61,7 @@ def _parse_args(session: Session, args: argparse.Namespace) -> None:
             moe_move.move_item(album)
 
 
-def _dry_run(albums: list[Album]) -> str:
+def _dry_run(albums: Iterable[Album]) -> str:
     """Returns a string of output representing a 'dry-run' of moving albums."""
     dry_run_str = ""
 
@@ -9,8 +9,6 @@ from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import dynaconf
-import dynaconf.base
 from unidecode import unidecode
 
 import moe
@@ -109,25 +107,6 @@ def add_hooks(pm: pluggy._manager.PluginManager) -> None:
     pm.add_hookspecs(Hooks)
 
 
-@moe.hookimpl
-def add_config_validator(settings: dynaconf.base.LazySettings) -> None:
-    """Validate move plugin configuration settings."""
-    default_album_path = "{album.artist}/{album.title} ({album.year})"
-    default_extra_path = "{e_unique(extra)}"
-    default_track_path = (
-        "{f'Disc {track.disc:02}' if album.disc_total > 1 else ''}/"
-        "{track.track_num:02} - {track.title}{track.path.suffix}"
-    )
-
-    moe_validators = [
-        dynaconf.Validator("MOVE.ASCIIFY_PATHS", default=False),
-        dynaconf.Validator("MOVE.ALBUM_PATH", default=default_album_path),
-        dynaconf.Validator("MOVE.EXTRA_PATH", default=default_extra_path),
-        dynaconf.Validator("MOVE.TRACK_PATH", default=default_track_path),
-    ]
-    settings.validators.register(*moe_validators)  # type: ignore[reportCallIssue]
-
-
 @moe.hookimpl(trylast=True)
 def edit_new_items(items: list[LibItem]) -> None:
     """Copies and formats the path of an item after it has been added to the library."""
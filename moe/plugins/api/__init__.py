@@ -0,0 +1,42 @@
+"""Serves the library as a JSON API over HTTP."""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+import dynaconf
+import dynaconf.base
+
+import moe
+from moe import config
+
+if TYPE_CHECKING:
+    from .api_core import *  # noqa: F403
+
+PLUGIN_INFO = config.PluginInfo(commands=frozenset({"api"}))
+
+
+@moe.hookimpl
+def add_config_validator(settings: dynaconf.base.LazySettings) -> None:
+    """Validate api plugin configuration settings."""
+    settings.validators.register(  # type: ignore[reportCallIssue]
+        dynaconf.Validator("API.HOST", default="127.0.0.1"),
+        dynaconf.Validator("API.PORT", default=8338, gte=0, lte=65535),
+        dynaconf.Validator("API.SOCKET", default=""),
+        dynaconf.Validator("API.TOKEN", default=""),
+        dynaconf.Validator("API.WORKERS", default=4, gte=1),
+    )
+
+
+@moe.hookimpl
+def plugin_registration() -> None:
+    """Only register the cli sub-plugin if the cli is enabled."""
+    from . import api_cli, api_core  # noqa: PLC0415 deferred, see `PLUGIN_INFO`
+
+    config.CONFIG.pm.register(api_core, "api_core")
+    if config.CONFIG.pm.has_plugin("cli"):
+        config.CONFIG.pm.register(api_cli, "api_cli")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 any attribute of the core api
+    """Imports the core API once it's used."""
+    return getattr(importlib.import_module(f"{__name__}.api_core"), name)
@@ -0,0 +1,76 @@
+"""Adds the ``api`` command to moe."""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+from sqlalchemy.orm.session import Session
+
+import moe
+from moe import config
+from moe.plugins.api.api_core import LOCAL_HOSTS, Api, start_server
+
+log = logging.getLogger("moe.cli.api")
+
+__all__: list[str] = []
+
+
+@moe.hookimpl
+def add_command(cmd_parsers: argparse._SubParsersAction) -> None:
+    """Adds the ``api`` command to Moe's CLI."""
+    api_parser = cmd_parsers.add_parser(
+        "api",
+        description="Serves the library as a JSON API over HTTP.",
+        help="serve the library as a JSON API",
+    )
+    api_parser.set_defaults(func=_parse_args)
+
+
+def _parse_args(session: Session, args: argparse.Namespace) -> None:  # noqa: ARG001
+    """Parses the given commandline arguments.
+
+    Args:
+        session: Library db session.
+        args: Commandline arguments to parse.
+
+    Raises:
+        SystemExit: Unable to start the server.
+    """
+    # requests can't prompt for input, so disable any other plugins' cli hooks
+    pm = config.CONFIG.pm
+    pm.load_deferred_plugins()
+    for plugin_name, plugin in pm.list_name_plugin():
+        if plugin and plugin_name.endswith("_cli") and plugin_name != "api_cli":
+            pm.unregister(name=plugin_name)
+
+    api_settings = config.CONFIG.settings.api
+    api = Api(
+        workers=api_settings.workers,
+        token=api_settings.token or None,
+        # websites can't reach a unix socket, so any host is fine
+        hosts=None if api_settings.socket else {*LOCAL_HOSTS, api_settings.host},
+    )
+    try:
+        asyncio.run(_serve(api))
+    except OSError as err:
+        log.exception("Unable to start the api server.")
+        raise SystemExit(1) from err
+    except KeyboardInterrupt:
+        log.info("Stopping the api server.")
+    finally:
+        api.close()
+
+
+async def _serve(api: Api) -> None:
+    """Serves ``api`` until cancelled, as configured."""
+    api_settings = config.CONFIG.settings.api
+    server = await start_server(
+        api,
+        api_settings.host,
+        api_settings.port,
+        Path(api_settings.socket).expanduser() if api_settings.socket else None,
+    )
+
+    async with server:
+        await server.serve_forever()
@@ -0,0 +1,752 @@
+"""Core api for serving the library as a JSON API over HTTP.
+
+The API is implemented by :class:`Api`, which handles requests in-process, and is
+exposed over HTTP by :meth:`start_server`. Any blocking work, i.e. accessing the
+database or reading and writing files, is run by a bounded pool of worker threads,
+each using its own database session.
+
+Endpoints:
+    * ``GET /items`` - query the library. Accepts the ``query``, ``type`` (``album``,
+      ``extra``, or ``track``), ``order_by`` (comma-separated), ``limit``, and
+      ``offset`` parameters. Responses include an ``ETag`` that changes whenever the
+      library database does, so they can be cached using ``If-None-Match``.
+    * ``POST /items`` - add a file or directory to the library. The body should be a
+      json object with the ``path`` to add, and the ``album_id`` to add a track or
+      extra to.
+    * ``GET /items/<type>/<id>`` - get an item.
+    * ``PATCH /items/<type>/<id>`` - edit an item. The body should be a json object
+      of the fields to edit, and the values to set them to. Multi-value fields are set
+      to a list of strings, and a field set to ``null`` is cleared.
+    * ``DELETE /items/<type>/<id>`` - remove an item from the library.
+
+Request bodies must be sent as ``application/json``. To keep websites from reaching
+the API through DNS rebinding, requests sent to any host other than those the API
+expects are refused, and the API may also require a bearer token.
+
+Requests that write to the library are handled one at a time. If the library stays
+locked by another program, e.g. the cli, requests fail with ``503 Service
+Unavailable``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import functools
+import json
+import logging
+import secrets
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import sqlalchemy
+
+from moe import config
+from moe.add import AddError, add_item
+from moe.config import moe_sessionmaker
+from moe.duplicate import DuplicateError
+from moe.edit import EditError, edit_item
+from moe.library import Album, AlbumError, Extra, LibItem, Track, TrackError
+from moe.query import DEFAULT_ORDER_BY, QueryError, QueryType, query
+from moe.remove import remove_item
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Mapping
+
+    from sqlalchemy.orm.session import Session
+
+__all__ = ["LOCAL_HOSTS", "Api", "ApiResponse", "start_server"]
+
+log = logging.getLogger("moe.api")
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+MAX_BODY_SIZE = 1024 * 1024
+READ_TIMEOUT = 15  # seconds to wait on a client, e.g. on an idle keep-alive connection
+
+LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+"""Hosts the API may be reached through by default."""
+
+_ITEM_CLASSES: dict[str, type[Album | Extra | Track]] = {
+    "album": Album,
+    "extra": Extra,
+    "track": Track,
+}
+
+
+class ApiResponse(NamedTuple):
+    """Response to an API request.
+
+    Attributes:
+        status: HTTP status of the response.
+        headers: HTTP headers of the response.
+        body: json encoded body of the response, if any.
+    """
+
+    status: HTTPStatus
+    headers: dict[str, str]
+    body: bytes
+
+
+class _ApiError(Exception):
+    """Error handling an API request, returned as an error response."""
+
+    def __init__(
+        self,
+        status: HTTPStatus,
+        message: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.headers = headers
+
+
+class Api:
+    """JSON API of the library.
+
+    Requests are handled in-process by :meth:`request`, which may also be used as a
+    test client. Call :meth:`close` once done with the api.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        *,
+        token: str | None = None,
+        hosts: Collection[str] | None = LOCAL_HOSTS,
+    ) -> None:
+        """Creates the api.
+
+        Args:
+            workers: Maximum number of threads used to access the library.
+            token: If given, requests must include it as a bearer token in their
+                ``Authorization`` header.
+            hosts: Hosts that requests may be sent to, as given by their ``Host``
+                header. If ``None``, any host is allowed, e.g. when listening on a
+                Unix socket, which websites can't reach.
+        """
+        self._token = token
+        self._hosts = hosts
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="moe_api"
+        )
+        self._write_lock = threading.Lock()
+        self._data_version = _DataVersion(config.CONFIG.engine)
+
+        # data versions are only comparable between the same database connection
+        self._etag_prefix = secrets.token_hex(8)
+
+    def close(self) -> None:
+        """Waits for any running requests, then releases the api's resources."""
+        self._executor.shutdown()
+        self._data_version.close()
+
+    async def request(
+        self,
+        method: str,
+        target: str,
+        headers: Mapping[str, str] | None = None,
+        body: bytes = b"",
+    ) -> ApiResponse:
+        """Handles an API request.
+
+        Args:
+            method: HTTP method of the request, e.g. ``GET``.
+            target: Path and query string of the request, e.g. ``/items?query=*``.
+            headers: HTTP headers of the request.
+            body: json encoded body of the request, if any.
+
+        Returns:
+            The response to the request. Any error is returned as an error response.
+        """
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        try:
+            self._authorize(headers)
+            return await self._route(method, target, headers, body)
+        except _ApiError as err:
+            log.debug(f"Invalid API request. [{method=}, {target=}, {err=}]")
+            return _json_response(err.status, {"error": str(err)}, err.headers)
+        except DuplicateError as err:
+            log.debug(f"API request conflicts with the library. [{method=}, {err=}]")
+            return _json_response(HTTPStatus.CONFLICT, {"error": str(err)})
+        except Exception:
+            log.exception(
+                f"Unexpected error handling API request. [{method=}, {target=}]"
+            )
+            return _json_response(
+                HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error."}
+            )
+
+    async def _route(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> ApiResponse:
+        """Handles an API request by its endpoint.
+
+        Raises:
+            _ApiError: Invalid request.
+        """
+        url = urllib.parse.urlsplit(target)
+        params = dict(urllib.parse.parse_qsl(url.query))
+        route = url.path.strip("/").split("/")
+
+        if route == ["items"]:
+            if method == "GET":
+                return await self._query_items(params, headers)
+            if method == "POST":
+                return await self._add_item(_parse_body(body, headers))
+        elif len(route) == 3 and route[0] == "items":  # noqa: PLR2004 items/type/id
+            item_class = _get_item_class(route[1])
+            item_id = _parse_int("id", route[2])
+            if method == "GET":
+                item_dict = await self._run(_get_item, item_class, item_id)
+                return _json_response(HTTPStatus.OK, item_dict)
+            if method == "PATCH":
+                item_dict = await self._run(
+                    _edit_item,
+                    item_class,
+                    item_id,
+                    _parse_body(body, headers),
+                    write=True,
+                )
+                return _json_response(HTTPStatus.OK, item_dict)
+            if method == "DELETE":
+                await self._run(_remove_item, item_class, item_id, write=True)
+                return ApiResponse(HTTPStatus.NO_CONTENT, {}, b"")
+        else:
+            raise _ApiError(HTTPStatus.NOT_FOUND, f"Not found. [{url.path=}]")
+
+        raise _ApiError(
+            HTTPStatus.METHOD_NOT_ALLOWED, f"Method not allowed. [{method=}]"
+        )
+
+    def _authorize(self, headers: dict[str, str]) -> None:
+        """Checks that a request was sent to an expected host, with any required token.
+
+        Requests without a ``Host`` header, i.e. from clients other than browsers, may
+        be sent to any host.
+
+        Raises:
+            _ApiError: The request isn't authorized.
+        """
+        if self._hosts is not None and "host" in headers:
+            host = urllib.parse.urlsplit(f"//{headers['host']}").hostname
+            if host not in self._hosts:
+                err_msg = f"Invalid host. [host={headers['host']!r}]"
+                raise _ApiError(HTTPStatus.FORBIDDEN, err_msg)
+
+        if self._token is not None:
+            scheme, _, token = headers.get("authorization", "").partition(" ")
+            if scheme.lower() != "bearer" or not secrets.compare_digest(
+                token.strip().encode(), self._token.encode()
+            ):
+                raise _ApiError(
+                    HTTPStatus.UNAUTHORIZED,
+                    "A valid token is required.",
+                    {"WWW-Authenticate": "Bearer"},
+                )
+
+    async def _query_items(
+        self, params: dict[str, str], headers: dict[str, str]
+    ) -> ApiResponse:
+        """Queries the library for items, unless the client's cache is up to date."""
+        try:
+            query_type = QueryType(params.get("type", "track"))
+        except ValueError as err:
+            raise _ApiError(HTTPStatus.BAD_REQUEST, "Invalid item type.") from err
+        order_by = (
+            params["order_by"].split(",")
+            if params.get("order_by")
+            else DEFAULT_ORDER_BY[query_type]
+        )
+        limit = _parse_int("limit", params.get("limit", DEFAULT_LIMIT))
+        offset = _parse_int("offset", params.get("offset", 0))
+        if not 1 <= limit <= MAX_LIMIT:
+            err_msg = f"The limit must be between 1 and {MAX_LIMIT}."
+            raise _ApiError(HTTPStatus.BAD_REQUEST, err_msg)
+
+        # get the version before querying, so any change made in between only causes
+        # a needless refetch rather than caching outdated results
+        etag = f'"{self._etag_prefix}-{await self._run(self._data_version.get)}"'
+        cache_headers = {"Cache-Control": "no-cache", "ETag": etag}
+        if etag in {tag.strip() for tag in headers.get("if-none-match", "").split(",")}:
+            return ApiResponse(HTTPStatus.NOT_MODIFIED, cache_headers, b"")
+
+        items = await self._run(
+            _query_items,
+            params.get("query", "*"),
+            query_type,
+            order_by,
+            limit + 1,  # to tell if there's another page
+            offset,
+        )
+        return _json_response(
+            HTTPStatus.OK,
+            {
+                "items": items[:limit],
+                "limit": limit,
+                "offset": offset,
+                "next_offset": offset + limit if len(items) > limit else None,
+            },
+            cache_headers,
+        )
+
+    async def _add_item(self, body: dict[str, Any]) -> ApiResponse:
+        """Adds the path given in the request body to the library."""
+        if not isinstance(body.get("path"), str):
+            raise _ApiError(HTTPStatus.BAD_REQUEST, "A `path` to add is required.")
+        album_id = body.get("album_id")
+        if album_id is not None and not isinstance(album_id, int):
+            raise _ApiError(HTTPStatus.BAD_REQUEST, "The `album_id` must be an int.")
+        if not config.CONFIG.pm.has_plugin("add"):
+            raise _ApiError(HTTPStatus.NOT_FOUND, "The `add` plugin isn't enabled.")
+
+        item_dict = await self._run(_add_path, Path(body["path"]), album_id, write=True)
+        return _json_response(HTTPStatus.CREATED, item_dict)
+
+    async def _run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,  # noqa: ANN401 any arguments
+        write: bool = False,
+    ) -> Any:  # noqa: ANN401 any result
+        """Runs a blocking function in a worker thread.
+
+        Args:
+            func: Function to run.
+            *args: Arguments to call ``func`` with.
+            write: Whether ``func`` writes to the library. Such functions are run
+                one at a time, so they don't fail waiting on each other's locks.
+
+        Raises:
+            _ApiError: The library is locked by another program.
+        """
+        if write:
+            func = functools.partial(self._run_locked, func)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, func, *args)
+        except sqlalchemy.exc.OperationalError as err:
+            if "database is locked" not in str(err.orig):
+                raise
+
+            raise _ApiError(
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                "The library is busy, try again later.",
+                {"Retry-After": "1"},
+            ) from err
+
+    def _run_locked(self, func: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401 any result
+        """Runs ``func`` once no other request is writing to the library."""
+        with self._write_lock:
+            return func(*args)
+
+
+class _DataVersion:
+    """Counts changes to the library database made by any connection."""
+
+    def __init__(self, engine: sqlalchemy.Engine) -> None:
+        # sqlite's data version excludes changes made by its own connection, so a
+        # separate connection that never writes is used
+        self._connection = engine.raw_connection()
+        self._lock = threading.Lock()
+
+    def get(self) -> int:
+        """Returns the current data version of the database."""
+        with self._lock:
+            cursor = self._connection.cursor()
+            try:
+                return cursor.execute("PRAGMA data_version").fetchone()[0]
+            finally:
+                cursor.close()
+
+    def close(self) -> None:
+        """Closes the connection."""
+        self._connection.close()
+
+
+async def start_server(
+    api: Api,
+    host: str = "127.0.0.1",
+    port: int = 8338,
+    socket_path: Path | None = None,
+) -> asyncio.Server:
+    """Starts an HTTP server for ``api``.
+
+    Args:
+        api: API to handle the requests.
+        host: Host to listen on.
+        port: Port to listen on. If 0, a free port is chosen.
+        socket_path: If given, listen on this Unix socket instead of ``host`` and
+            ``port``.
+
+    Returns:
+        The running server.
+    """
+    handle_connection = functools.partial(_handle_connection, api)
+    if socket_path:
+        server = await asyncio.start_unix_server(handle_connection, path=socket_path)
+    else:
+        server = await asyncio.start_server(handle_connection, host, port)
+
+    log.info(f"Serving the library api. [{server.sockets[0].getsockname()=}]")
+    return server
+
+
+async def _handle_connection(
+    api: Api, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Handles each HTTP request from a client until the connection is closed.
+
+    Connections are closed once the client takes longer than ``READ_TIMEOUT`` to send
+    a request, so idle keep-alive connections don't stay open forever.
+    """
+    try:
+        keep_alive = True
+        while keep_alive:
+            try:
+                request_head = await asyncio.wait_for(
+                    _read_request_head(reader), READ_TIMEOUT
+                )
+            except ValueError:
+                await _write_response(
+                    writer,
+                    _json_response(HTTPStatus.BAD_REQUEST, {"error": "Bad request."}),
+                )
+                break
+            if not request_head:
+                break
+
+            method, target, version, headers = request_head
+            content_length = int(headers.get("content-length", 0))
+            if content_length > MAX_BODY_SIZE:
+                await _write_response(
+                    writer,
+                    _json_response(
+                        HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                        {"error": "Body too large."},
+                    ),
+                )
+                break
+            body = await asyncio.wait_for(
+                reader.readexactly(content_length), READ_TIMEOUT
+            )
+
+            response = await api.request(method, target, headers, body)
+            log.info(f"{method} {target} {response.status.value}")
+
+            keep_alive = (
+                version == "HTTP/1.1" and headers.get("connection", "") != "close"
+            )
+            await _write_response(writer, response, keep_alive=keep_alive)
+    except asyncio.TimeoutError:
+        log.debug("Client timed out.")
+    except (asyncio.IncompleteReadError, ConnectionError):
+        log.debug("Client disconnected.")
+    finally:
+        writer.close()
+
+
+async def _read_request_head(
+    reader: asyncio.StreamReader,
+) -> tuple[str, str, str, dict[str, str]] | None:
+    """Reads the request line and headers of an HTTP request.
+
+    Returns:
+        The method, target, HTTP version, and headers, with lowercase names, of the
+        request, or None if the client closed the connection.
+
+    Raises:
+        ValueError: Malformed request, or an invalid ``Content-Length``.
+    """
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+
+    method, target, version = request_line.decode("latin-1").split()
+    headers = await _read_headers(reader)
+    if int(headers.get("content-length", 0)) < 0:
+        err_msg = f"Invalid content length. [{headers['content-length']=}]"
+        raise ValueError(err_msg)
+
+    return method, target, version, headers
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> dict[str, str]:
+    """Reads the HTTP headers of a request, with lowercase names.
+
+    Raises:
+        ValueError: Malformed header.
+    """
+    headers = {}
+    while (line := await reader.readline()) not in {b"\r\n", b"\n", b""}:
+        name, value = line.decode("latin-1").split(":", 1)
+        headers[name.strip().lower()] = value.strip()
+
+    return headers
+
+
+async def _write_response(
+    writer: asyncio.StreamWriter, response: ApiResponse, *, keep_alive: bool = False
+) -> None:
+    """Writes an HTTP response to the client."""
+    headers = {
+        **response.headers,
+        "Content-Length": str(len(response.body)),
+        "Connection": "keep-alive" if keep_alive else "close",
+    }
+    head = f"HTTP/1.1 {response.status.value} {response.status.phrase}\r\n"
+    head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+
+    writer.write(head.encode("latin-1") + b"\r\n" + response.body)
+    await writer.drain()
+
+
+def _json_response(
+    status: HTTPStatus,
+    data: Any,  # noqa: ANN401 any json
+    headers: dict[str, str] | None = None,
+) -> ApiResponse:
+    """Creates a response with a json body."""
+    return ApiResponse(
+        status,
+        {**(headers or {}), "Content-Type": "application/json"},
+        json.dumps(data, default=_json_default).encode(),
+    )
+
+
+def _json_default(value: Any) -> Any:  # noqa: ANN401 any json
+    """Converts any item values json doesn't support."""
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+
+    err_msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(err_msg)
+
+
+def _parse_body(body: bytes, headers: dict[str, str]) -> dict[str, Any]:
+    """Parses a request's json object body."""
+    content_type = headers.get("content-type", "").partition(";")[0].strip()
+    if content_type.lower() != "application/json":
+        err_msg = f"The body must be sent as application/json. [{content_type=}]"
+        raise _ApiError(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, err_msg)
+
+    try:
+        data = json.loads(body)
+    except ValueError as err:
+        raise _ApiError(HTTPStatus.BAD_REQUEST, "Invalid json body.") from err
+
+    if not isinstance(data, dict):
+        raise _ApiError(HTTPStatus.BAD_REQUEST, "The body must be a json object.")
+    return data
+
+
+def _parse_int(name: str, value: str | int) -> int:
+    """Parses an integer request parameter."""
+    try:
+        number = int(value)
+    except ValueError as err:
+        raise _ApiError(HTTPStatus.BAD_REQUEST, f"Invalid {name}. [{value=}]") from err
+
+    if number < 0:
+        raise _ApiError(HTTPStatus.BAD_REQUEST, f"Invalid {name}. [{value=}]")
+    return number
+
+
+def _get_item_class(item_type: str) -> type[Album | Extra | Track]:
+    """Returns the item class of an item type given in a request."""
+    try:
+        return _ITEM_CLASSES[item_type]
+    except KeyError as err:
+        raise _ApiError(
+            HTTPStatus.NOT_FOUND, f"Invalid item type. [{item_type=}]"
+        ) from err
+
+
+def _get_lib_item(
+    session: Session, item_class: type[Album | Extra | Track], item_id: int
+) -> Album | Extra | Track:
+    """Returns the item of ``item_class`` with the given id."""
+    item = session.get(item_class, item_id)
+    if not item:
+        err_msg = f"Item not found. [{item_id=}]"
+        raise _ApiError(HTTPStatus.NOT_FOUND, err_msg)
+
+    return item
+
+
+def _item_dict(item: LibItem) -> dict[str, Any]:
+    """Represents an item as a json object.
+
+    Tracks and extras refer to their album by its id, and albums include their tracks
+    and extras.
+    """
+    item_dict: dict[str, Any] = {"id": item._id}  # noqa: SLF001
+    for field in item.fields:
+        if field == "album":
+            item_dict["album_id"] = item._album_id  # type: ignore[reportAttributeAccessIssue] # noqa: SLF001
+        else:
+            item_dict[field] = getattr(item, field)
+    item_dict["custom"] = dict(item.custom)
+
+    return item_dict
+
+
+def _album_dict(album: Album) -> dict[str, Any]:
+    """Represents an album as a json object, including its tracks and extras."""
+    return _item_dict(album) | {
+        "tracks": [_item_dict(track) for track in sorted(album.tracks)],
+        "extras": [_item_dict(extra) for extra in sorted(album.extras)],
+    }
+
+
+def _query_items(
+    query_str: str,
+    query_type: QueryType,
+    order_by: list[str],
+    limit: int,
+    offset: int,
+) -> list[dict[str, Any]]:
+    """Queries the library for items."""
+    with moe_sessionmaker.begin() as session:
+        try:
+            items = query(
+                session,
+                query_str,
+                query_type,
+                order_by=order_by,
+                limit=limit,
+                offset=offset,
+            )
+        except QueryError as err:
+            raise _ApiError(HTTPStatus.BAD_REQUEST, str(err)) from err
+
+        return [_item_dict(item) for item in items]
+
+
+def _get_item(item_class: type[Album | Extra | Track], item_id: int) -> dict[str, Any]:
+    """Gets an item from the library."""
+    with moe_sessionmaker.begin() as session:
+        item = _get_lib_item(session, item_class, item_id)
+        return _album_dict(item) if isinstance(item, Album) else _item_dict(item)
+
+
+def _edit_item(
+    item_class: type[Album | Extra | Track], item_id: int, fields: dict[str, Any]
+) -> dict[str, Any]:
+    """Edits an item in the library.
+
+    Fields set to ``None`` are cleared.
+
+    Raises:
+        _ApiError: A field or value is invalid.
+    """
+    with moe_sessionmaker.begin() as session:
+        item = _get_lib_item(session, item_class, item_id)
+        for field, value in fields.items():
+            if value is None:
+                _clear_field(item, field)
+                continue
+
+            try:
+                edit_item(item, field, _edit_value(field, value))
+            except (EditError, ValueError) as err:
+                raise _ApiError(HTTPStatus.BAD_REQUEST, str(err)) from err
+        session.flush()
+
+        return _album_dict(item) if isinstance(item, Album) else _item_dict(item)
+
+
+def _edit_value(field: str, value: Any) -> str:  # noqa: ANN401 any json
+    """Returns a json value as a string to edit ``field`` with, like in the cli.
+
+    Raises:
+        _ApiError: ``value`` isn't a string, number, or list of strings.
+    """
+    # multi-value fields are edited as a ';' separated string
+    if isinstance(value, list) and all(isinstance(element, str) for element in value):
+        return ";".join(value)
+    if isinstance(value, str | int | float) and not isinstance(value, bool):
+        return str(value)
+
+    err_msg = f"Unsupported value given. [{field=}, {value=}]"
+    raise _ApiError(HTTPStatus.BAD_REQUEST, err_msg)
+
+
+def _clear_field(item: LibItem, field: str) -> None:
+    """Clears ``field`` of ``item``, or removes it if it's a custom field.
+
+    Raises:
+        _ApiError: ``field`` doesn't exist, or can't be cleared.
+    """
+    attr = getattr(type(item), field, None)
+    if attr is None:
+        if field not in item.custom:
+            err_msg = f"Invalid field given. [{field=}]"
+            raise _ApiError(HTTPStatus.BAD_REQUEST, err_msg)
+        del item.custom[field]
+        return
+
+    # only optional columns, or properties of them such as `genre`, can be cleared
+    column = sqlalchemy.inspect(type(item)).columns.get(field)
+    if (column is not None and column.nullable) or (
+        isinstance(attr, property) and attr.fset
+    ):
+        setattr(item, field, None)
+        return
+
+    err_msg = f"Field can't be cleared. [{field=}]"
+    raise _ApiError(HTTPStatus.BAD_REQUEST, err_msg)
+
+
+def _remove_item(item_class: type[Album | Extra | Track], item_id: int) -> None:
+    """Removes an item from the library."""
+    with moe_sessionmaker.begin() as session:
+        remove_item(session, _get_lib_item(session, item_class, item_id))
+
+
+def _add_path(path: Path, album_id: int | None) -> dict[str, Any]:
+    """Adds a file or directory to the library.
+
+    Args:
+        path: Path to add. Either a directory for an Album, or a file for a Track or
+            an Extra.
+        album_id: If ``path`` is a file, add it to the album with this id. Required
+            to add an Extra.
+
+    Returns:
+        The added item.
+    """
+    with moe_sessionmaker.begin() as session:
+        album = _get_lib_item(session, Album, album_id) if album_id else None
+
+        item: Album | Extra | Track
+        try:
+            if path.is_file():
+                try:
+                    item = Track.from_file(path, album=album)
+                except TrackError:
+                    if not album:
+                        err_msg = "An album id is required to add an extra."
+                        raise _ApiError(HTTPStatus.BAD_REQUEST, err_msg) from None
+                    item = Extra(album, path)
+            elif path.is_dir():
+                item = Album.from_dir(path)
+            else:
+                err_msg = f"Path not found. [{path=}]"
+                raise _ApiError(HTTPStatus.BAD_REQUEST, err_msg)
+
+            add_item(session, item)
+        except (AddError, AlbumError) as err:
+            raise _ApiError(HTTPStatus.UNPROCESSABLE_ENTITY, str(err)) from err
+
+        return _album_dict(item) if isinstance(item, Album) else _item_dict(item)
@@ -5,19 +5,83 @@ See Also:
     * https://python-musicbrainzngs.readthedocs.io/en/latest/api/
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+import dynaconf
+import dynaconf.base
+
 import moe
 from moe import config
 
-from . import mb_cli, mb_core
-from .mb_core import *  # noqa: F403
+if TYPE_CHECKING:
+    from .mb_core import *  # noqa: F403
 
-__all__ = []
-__all__.extend(mb_core.__all__)
+PLUGIN_INFO = config.PluginInfo(
+    hooks=frozenset(
+        {
+            "add_candidate_prompt_choice",
+            "get_candidates",
+            "process_new_items",
+            "process_removed_items",
+            "read_custom_tags",
+            "sync_metadata",
+            "write_custom_tags",
+        }
+    ),
+    commands=frozenset({"mbcol"}),
+)
+
+
+@moe.hookimpl
+def add_config_validator(settings: dynaconf.base.LazySettings) -> None:
+    """Validates musicbrainz plugin configuration settings."""
+    login_required = False
+
+    settings.validators.register(  # type: ignore[reportCallIssue]
+        dynaconf.Validator("musicbrainz.search_limit", default=5, gte=1)
+    )
+
+    settings.validators.register(  # type: ignore[reportCallIssue]
+        dynaconf.Validator(
+            "musicbrainz.collection.auto_add",
+            "musicbrainz.collection.auto_remove",
+            default=False,
+        )
+    )
+
+    if settings.get("musicbrainz.collection.auto_add", False) or settings.get(  # type: ignore[reportCallIssue]
+        "musicbrainz.collection.auto_remove", False
+    ):  # type: ignore[reportCallIssue]
+        login_required = True
+        settings.validators.register(  # type: ignore[reportCallIssue]
+            dynaconf.Validator("musicbrainz.collection.collection_id", must_exist=True)
+        )
+
+    if login_required:
+        settings.validators.register(  # type: ignore[reportCallIssue]
+            dynaconf.Validator(
+                "musicbrainz.username", "musicbrainz.password", must_exist=True
+            )
+        )
+
+
+@moe.hookimpl
+def index_custom_fields() -> dict[str, list[str]]:
+    """Index musicbrainz release IDs, as they're used to find existing releases."""
+    return {"album": ["mb_album_id"], "track": ["mb_track_id"]}
 
 
 @moe.hookimpl
 def plugin_registration() -> None:
     """Only register the cli sub-plugin if the cli is enabled."""
+    from . import mb_cli, mb_core  # noqa: PLC0415 deferred, see `PLUGIN_INFO`
+
     config.CONFIG.pm.register(mb_core, "musicbrainz_core")
     if config.CONFIG.pm.has_plugin("cli"):
         config.CONFIG.pm.register(mb_cli, "musicbrainz_cli")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 any attribute of the core api
+    """Imports the core API once it's used."""
+    return getattr(importlib.import_module(f"{__name__}.mb_core"), name)
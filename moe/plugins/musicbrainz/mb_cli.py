@@ -9,13 +9,13 @@ The ``musicbrainz`` cli plugin provides the following functionality:
 import argparse
 import logging
 
-import questionary
 from sqlalchemy.orm.session import Session
 
 import moe
 import moe.plugins.musicbrainz as moe_mb
 from moe import moe_import
 from moe.library import Album, Extra, Track
+from moe.query import QueryType
 from moe.util.cli import PromptChoice, cli_query, query_parser
 
 __all__: list[str] = []
@@ -56,7 +56,8 @@ def _parse_args(session: Session, args: argparse.Namespace) -> None:
     Raises:
         SystemExit: Invalid query given, or no items to remove.
     """
-    items = cli_query(session, args.query, query_type=args.query_type)
+    load = () if args.query_type == QueryType.ALBUM else ("album",)
+    items = cli_query(session, args.query, query_type=args.query_type, load=load)
 
     releases = set()
     for item in items:
@@ -91,6 +92,8 @@ def add_candidate_prompt_choice(prompt_choices: list[PromptChoice]) -> None:
 
 def _enter_id(new_album: Album, candidate: moe_import.CandidateAlbum) -> None:
     """Re-run the add prompt with the inputted Musibrainz release."""
+    import questionary  # noqa: PLC0415 slow to import, and only needed to prompt
+
     mb_id = questionary.text("Enter Musicbrainz ID: ").ask()
 
     log.debug(f"Running import prompt for a selected musicbrainz release. [{mb_id=!r}]")
@@ -9,17 +9,23 @@ import datetime
 import importlib.metadata
 import logging
 from collections.abc import Callable
-from pathlib import Path
 from typing import Any, cast
 
-import dynaconf.base
 import mediafile
 import musicbrainzngs
 from sqlalchemy.orm.session import Session
 
 import moe
 from moe import config
-from moe.library import Album, LibItem, MergeStrategy, MetaAlbum, MetaTrack, Track
+from moe.library import (
+    Album,
+    LibItem,
+    MergeStrategy,
+    MetaAlbum,
+    MetaTrack,
+    Track,
+    TrackReadContext,
+)
 from moe.moe_import import CandidateAlbum
 from moe.util.core import match
 
@@ -67,39 +73,6 @@ RELEASE_INCLUDES = [
 ]
 
 
-@moe.hookimpl
-def add_config_validator(settings: dynaconf.base.LazySettings) -> None:
-    """Validates musicbrainz plugin configuration settings."""
-    login_required = False
-
-    settings.validators.register(  # type: ignore[reportCallIssue]
-        dynaconf.Validator("musicbrainz.search_limit", default=5, gte=1)
-    )
-
-    settings.validators.register(  # type: ignore[reportCallIssue]
-        dynaconf.Validator(
-            "musicbrainz.collection.auto_add",
-            "musicbrainz.collection.auto_remove",
-            default=False,
-        )
-    )
-
-    if settings.get("musicbrainz.collection.auto_add", False) or settings.get(  # type: ignore[reportCallIssue]
-        "musicbrainz.collection.auto_remove", False
-    ):  # type: ignore[reportCallIssue]
-        login_required = True
-        settings.validators.register(  # type: ignore[reportCallIssue]
-            dynaconf.Validator("musicbrainz.collection.collection_id", must_exist=True)
-        )
-
-    if login_required:
-        settings.validators.register(  # type: ignore[reportCallIssue]
-            dynaconf.Validator(
-                "musicbrainz.username", "musicbrainz.password", must_exist=True
-            )
-        )
-
-
 @moe.hookimpl
 def get_candidates(album: Album) -> list[CandidateAlbum]:
     """Applies musicbrainz metadata changes to a given album.
@@ -186,10 +159,12 @@ def process_new_items(session: Session, items: list[LibItem]) -> None:  # noqa:
 
 @moe.hookimpl
 def read_custom_tags(
-    track_path: Path, album_fields: dict[str, Any], track_fields: dict[str, Any]
+    album_fields: dict[str, Any],
+    track_fields: dict[str, Any],
+    read_context: TrackReadContext,
 ) -> None:
     """Read and set musicbrainz release IDs from a track file."""
-    audio_file = mediafile.MediaFile(track_path)
+    audio_file = read_context.audio_file
 
     album_fields["mb_album_id"] = audio_file.mb_albumid
     track_fields["mb_track_id"] = audio_file.mb_releasetrackid
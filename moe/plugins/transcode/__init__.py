@@ -1,16 +1,40 @@
 """Transcode plugin."""
 
+import importlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import dynaconf
+import dynaconf.base
+
 import moe
 from moe import config
 
-from . import transcode_core
-from .transcode_core import *  # noqa: F403
+if TYPE_CHECKING:
+    from .transcode_core import *  # noqa: F403
+
+PLUGIN_INFO = config.PluginInfo()
+
 
-__all__ = []
-__all__.extend(transcode_core.__all__)
+@moe.hookimpl
+def add_config_validator(settings: dynaconf.base.LazySettings) -> None:
+    """Validate move plugin configuration settings."""
+    settings.validators.register(  # type: ignore[reportCallIssue]
+        dynaconf.Validator(
+            "TRANSCODE.TRANSCODE_PATH",
+            default=Path(settings.library_path) / "transcode",  # type: ignore[reportCallIssue]
+        )
+    )
 
 
 @moe.hookimpl
 def plugin_registration() -> None:
     """Register the core transcode plugin."""
+    from . import transcode_core  # noqa: PLC0415 deferred, see `PLUGIN_INFO`
+
     config.CONFIG.pm.register(transcode_core, "transcode_core")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 any attribute of the core api
+    """Imports the core API once it's used."""
+    return getattr(importlib.import_module(f"{__name__}.transcode_core"), name)
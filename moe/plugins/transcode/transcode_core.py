@@ -7,9 +7,6 @@ import subprocess
 from pathlib import Path
 from typing import Literal, TypeVar
 
-import dynaconf.base
-
-import moe
 from moe import config
 from moe.library import Album, Track
 from moe.move import fmt_item_path
@@ -26,17 +23,6 @@ FFMPEG_MP3_ARG = {
 }
 
 
-@moe.hookimpl
-def add_config_validator(settings: dynaconf.base.LazySettings) -> None:
-    """Validate move plugin configuration settings."""
-    settings.validators.register(  # type: ignore[reportCallIssue]
-        dynaconf.Validator(
-            "TRANSCODE.TRANSCODE_PATH",
-            default=Path(settings.library_path) / "transcode",  # type: ignore[reportCallIssue]
-        )
-    )
-
-
 I = TypeVar("I", Album, Track)  # noqa: E741
 """Type hint representing either an Album or a Track."""
 
@@ -2,24 +2,43 @@
 
 from __future__ import annotations
 
+import contextlib
+import datetime
+import functools
 import logging
 import re
 import shlex
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, cast
 
 import sqlalchemy as sa
+import sqlalchemy.orm
+from sqlalchemy.sql.selectable import TableValuedAlias
 
 from moe.library import Album, Extra, LibItem, Track
-from moe.library.lib_item import SetType
+from moe.library.lib_item import FTS_TABLES, SABase, SetType, get_indexed_fields
+from moe.util.core.regex import compile_regexp, regexp_like_pattern
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     from sqlalchemy.orm import InstrumentedAttribute
     from sqlalchemy.orm.session import Session
+    from sqlalchemy.orm.strategy_options import _AbstractLoad
     from sqlalchemy.sql.elements import KeyedColumnElement
 
-__all__: list[str] = ["QueryError", "QueryType", "query"]
+__all__: list[str] = [
+    "DEFAULT_ORDER_BY",
+    "QueryError",
+    "QueryType",
+    "create_query",
+    "get_item_class",
+    "iter_query",
+    "iter_rows",
+    "parse_field_key",
+    "query",
+]
 
 log = logging.getLogger("moe.query")
 
@@ -42,9 +61,36 @@ FIELD = "field"
 SEPARATOR = "separator"
 VALUE = "value"
 
+QUERY_BATCH_SIZE = 1000
+QUERY_CACHE_SIZE = 256
+
+# boolean query operators
+AND = "AND"
+NOT = "NOT"
+OR = "OR"
+
+_ALBUM_ORDER_BY = ("a:title", "a:artist", "a:date")
+DEFAULT_ORDER_BY: dict[QueryType, tuple[str, ...]] = {
+    QueryType.ALBUM: _ALBUM_ORDER_BY,
+    QueryType.EXTRA: (*_ALBUM_ORDER_BY, "e:path"),
+    QueryType.TRACK: (*_ALBUM_ORDER_BY, "t:disc", "t:track_num"),
+}
+"""The natural order of each item type, e.g. tracks are ordered by album then number.
+
+This matches how items themselves sort, except strings are compared
+case-insensitively.
+"""
+
 
-def query(
-    session: Session, query_str: str, query_type: QueryType
+def query(  # noqa: PLR0913
+    session: Session,
+    query_str: str,
+    query_type: QueryType,
+    *,
+    order_by: Sequence[str] | None = None,
+    load: Sequence[str] = (),
+    limit: int | None = None,
+    offset: int = 0,
 ) -> list[Album] | list[Extra] | list[Track]:
     """Queries the database for items matching the given query string.
 
@@ -52,6 +98,22 @@ def query(
         session: Library db session.
         query_str: Query string to parse. See the query docs for more info.
         query_type: Type of library item to return.
+        order_by: Keys to order the items by. Each key is a field, optionally
+            prefixed with its item type (``a:``, ``e:``, or ``t:``) as in a query
+            term. Fields without a prefix are of ``query_type``, and other than the
+            queried item type, only fields of its album may be used. Prefix a key
+            with ``-`` to order in descending order. Empty values are always
+            ordered last. By default, items aren't returned in any particular
+            order, except full-text search queries return the best matches first.
+            See ``DEFAULT_ORDER_BY`` for each item type's natural order.
+        load: Loading profile of relationships to load along with the items,
+            e.g. ``("tracks", "extras")`` for albums or ``("album",)`` for tracks.
+            Nested relationships are separated by a ``.``, e.g. ``"album.extras"``.
+            Any relationship not loaded is instead lazily loaded, one item at a
+            time, when first accessed.
+        limit: Maximum number of items to return. Use with ``order_by`` to page
+            through the matching items.
+        offset: Number of matching items to skip.
 
     Returns:
         All items matching the query of type ``query_type``.
@@ -64,36 +126,713 @@ def query(
     """
     log.debug(f"Querying library for items. [{query_str=}, {query_type=}]")
 
-    terms = shlex.split(query_str)
-    if not terms:
+    library_query = (
+        create_query(query_str, query_type, order_by, load).limit(limit).offset(offset)
+    )
+    with _fts_query_errors(query_str):
+        items = list(session.scalars(library_query))
+
+    # item reprs would lazily load every item's relationships
+    log.debug(f"Queried library for items. [num_items={len(items)}]")
+    return items
+
+
+def iter_query(  # noqa: PLR0913
+    session: Session,
+    query_str: str,
+    query_type: QueryType,
+    *,
+    order_by: Sequence[str] | None = None,
+    load: Sequence[str] = (),
+    batch_size: int = QUERY_BATCH_SIZE,
+) -> Iterator[Album | Extra | Track]:
+    """Iterates over the items in the database matching the given query string.
+
+    Unlike :meth:`query`, items are streamed from the database ``batch_size`` at a
+    time as they're iterated over, so only the current batch needs to be held in
+    memory. Use this when operating on a potentially large number of items.
+
+    Args:
+        session: Library db session.
+        query_str: Query string to parse. See the query docs for more info.
+        query_type: Type of library item to return.
+        order_by: Keys to order the items by. See :meth:`query` for more info.
+        load: Relationships to load along with each batch of items. See
+            :meth:`query` for more info.
+        batch_size: Number of items to load from the database at a time.
+
+    Yields:
+        Each item matching the query of type ``query_type``.
+
+    Raises:
+        QueryError: Invalid query. As with any generator, this is raised once
+            iteration begins rather than when ``iter_query`` is called.
+
+    See Also:
+        `The query docs <https://mrmoe.readthedocs.io/en/latest/query.html>`_
+    """
+    log.debug(f"Iterating library items. [{query_str=}, {query_type=}, {batch_size=}]")
+
+    library_query = create_query(
+        query_str, query_type, order_by, load
+    ).execution_options(yield_per=batch_size)
+    with _fts_query_errors(query_str):
+        yield from session.scalars(library_query)
+
+
+def iter_rows(  # noqa: PLR0913
+    session: Session,
+    query_str: str,
+    query_type: QueryType,
+    fields: Sequence[str],
+    *,
+    order_by: Sequence[str] | None = None,
+    batch_size: int = QUERY_BATCH_SIZE,
+) -> Iterator[sa.Row]:
+    """Iterates over the values of the given fields of items matching the query.
+
+    Only the given fields are selected from the database, and no library items are
+    created or tracked by the session, making this much cheaper than
+    :meth:`iter_query` for read-only uses such as listing paths. As with
+    :meth:`iter_query`, rows are streamed ``batch_size`` at a time.
+
+    Args:
+        session: Library db session.
+        query_str: Query string to parse. See the query docs for more info.
+        query_type: Type of library item to query for.
+        fields: Keys of the fields to select. Each key is a field, optionally
+            prefixed with its item type (``a:``, ``e:``, or ``t:``) as in a query
+            term. Fields without a prefix are of ``query_type``, and other than the
+            queried item type, only fields of its album may be used. Relationships
+            can't be selected.
+        order_by: Keys to order the rows by. See :meth:`query` for more info.
+        batch_size: Number of rows to load from the database at a time.
+
+    Yields:
+        A read-only, named tuple-like row of each matching item's field values, in
+        the order of ``fields``. Values are accessible by field name, e.g.
+        ``row.path``, unless prefixed with another item type, e.g. ``a:title``,
+        which is accessible as ``row.a_title``.
+
+    Raises:
+        QueryError: Invalid query or field. As with any generator, this is raised
+            once iteration begins rather than when ``iter_rows`` is called.
+
+    See Also:
+        `The query docs <https://mrmoe.readthedocs.io/en/latest/query.html>`_
+    """
+    log.debug(
+        f"Iterating library rows. [{query_str=}, {query_type=}, {fields=}, "
+        f"{batch_size=}]"
+    )
+
+    item_class = get_item_class(query_type.value)
+    columns: list[sa.ColumnElement] = []
+    for key in fields:
+        field_type, field = parse_field_key(key, query_type)
+        column = _row_column(get_item_class(field_type), field)
+        if field_type == query_type.value:
+            columns.append(column.label(field))
+        else:
+            # a correlated album lookup doesn't conflict with any album join, e.g.
+            # to order by the album
+            album_id = cast("type[Extra | Track]", item_class)._album_id  # noqa: SLF001
+            album_column = (
+                sa.select(column)
+                .where(Album._id == album_id)  # noqa: SLF001
+                .correlate_except(Album)
+                .scalar_subquery()
+            )
+            columns.append(album_column.label(f"{field_type[0]}_{field}"))
+
+    library_query = (
+        create_query(query_str, query_type, order_by)
+        .with_only_columns(*columns, maintain_column_froms=True)
+        .execution_options(yield_per=batch_size)
+    )
+    with _fts_query_errors(query_str):
+        yield from session.execute(library_query)
+
+
+def _row_column(item_class: type[LibItem], field: str) -> sa.ColumnElement:
+    """Gets the column expression of a field to select in :meth:`iter_rows`.
+
+    Raises:
+        QueryError: ``field`` can't be selected.
+    """
+    attr = getattr(item_class, field, None)
+    if attr is None:
+        # assume custom field
+        return sa.func.json_extract(item_class.custom, f'$."{field}"')
+
+    field_prop = getattr(attr, "property", None)
+    if not isinstance(attr, sqlalchemy.orm.QueryableAttribute) or isinstance(
+        field_prop, sqlalchemy.orm.RelationshipProperty
+    ):
+        err_msg = f"The given field can't be selected. [{field=}]"
+        raise QueryError(err_msg)
+
+    return attr
+
+
+@contextlib.contextmanager
+def _fts_query_errors(query_str: str) -> Iterator[None]:
+    """Converts errors from invalid full-text search queries into QueryErrors.
+
+    Raises:
+        QueryError: Invalid full-text search query.
+    """
+    try:
+        yield
+    except sa.exc.OperationalError as err:
+        if " MATCH " not in str(err.statement):
+            raise
+        err_msg = f"Invalid full-text search query. [{query_str=}]"
+        raise QueryError(err_msg) from err
+
+
+def create_query(
+    query_str: str,
+    query_type: QueryType,
+    order_by: Sequence[str] | None = None,
+    load: Sequence[str] = (),
+) -> sa.Select:
+    """Creates a select statement for items matching the given query string.
+
+    Args:
+        query_str: Query string to parse. See the query docs for more info.
+        query_type: Type of library item to select.
+        order_by: Keys to order the items by. See :meth:`query` for more info.
+        load: Relationships to load along with the items. See :meth:`query` for more
+            info.
+
+    Returns:
+        A select statement of ``query_type`` items.
+
+    Raises:
+        QueryError: Invalid query.
+    """
+    query_node = _parse_query(query_str)
+
+    item_class = get_item_class(query_type.value)
+    library_query = sa.select(item_class)
+
+    # full-text search terms required of every queried item are joined, so the best
+    # matches can be returned first
+    root_nodes = query_node.operands if isinstance(query_node, _And) else (query_node,)
+    rank_terms = [
+        node
+        for node in root_nodes
+        if isinstance(node, _Term)
+        and node.separator == "~"
+        and node.field_type == query_type.value
+    ]
+    if rank_terms:
+        fts_match = _fts_match(query_type.value, rank_terms)
+        fts, _ = FTS_TABLES[query_type.value]
+        library_query = library_query.join(
+            fts,
+            fts.c.rowid == item_class._id,  # noqa: SLF001
+        ).where(fts_match)
+        if order_by is None:
+            library_query = library_query.order_by(fts.c.rank)
+        query_node = _And(tuple(node for node in root_nodes if node not in rank_terms))
+
+    if order_by is not None:
+        library_query = _order_query(library_query, query_type, order_by)
+    if load:
+        library_query = library_query.options(
+            *(_load_option(item_class, rel_path) for rel_path in load)
+        )
+
+    return library_query.where(_compile_node(query_node, query_type))
+
+
+class _Term(NamedTuple):
+    """A single ``field:value`` query term."""
+
+    field_type: str
+    field: str
+    separator: str
+    value: str
+
+
+class _Not(NamedTuple):
+    """Negation of a query node."""
+
+    operand: _QueryNode
+
+
+class _And(NamedTuple):
+    """Query nodes that must all match."""
+
+    operands: tuple[_QueryNode, ...]
+
+
+class _Or(NamedTuple):
+    """Query nodes of which at least one must match."""
+
+    operands: tuple[_QueryNode, ...]
+
+
+_QueryNode = _Term | _Not | _And | _Or
+
+# a whitespace delimited token, where quoted or escaped whitespace doesn't delimit
+_TOKEN_RE = re.compile(r"""\s*((?:\\.|'[^']*'|"(?:\\.|[^"\\])*"|[^\s'"\\])+)""")
+
+
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _parse_query(query_str: str) -> _QueryNode:
+    """Parses a query string into a tree of query nodes.
+
+    Terms are implicitly joined with ``AND``, but may also be joined with ``OR``,
+    negated with ``NOT`` or a ``-`` prefix, and grouped with parentheses. ``NOT``
+    binds tightest, then ``AND``, then ``OR``. Parsed queries are cached, so
+    repeated queries aren't parsed again.
+
+    Args:
+        query_str: Query string to parse. See the query docs for more info.
+
+    Returns:
+        The root query node.
+
+    Raises:
+        QueryError: Invalid query.
+    """
+    tokens = _tokenize_query(query_str)
+    if not tokens:
         err_msg = "No query given."
         raise QueryError(err_msg)
 
-    if query_type == QueryType.ALBUM:
-        library_query = session.query(Album)
-        if session.query(Track).first():
-            library_query = library_query.join(Track)
-    elif query_type == QueryType.EXTRA:
-        library_query = session.query(Extra).join(Album).join(Track)
-    else:
-        library_query = session.query(Track).join(Album)
-    if query_type != QueryType.EXTRA and session.query(Extra).first():
-        library_query = library_query.join(Extra)
+    query_node, index = _parse_or(tokens, 0)
+    if index < len(tokens):
+        err_msg = f"Unexpected token in query. [token={tokens[index]!r}, {query_str=}]"
+        raise QueryError(err_msg)
+
+    return query_node
+
+
+def _tokenize_query(query_str: str) -> list[str | _Term]:
+    """Splits a query string into operators, parentheses, and terms.
+
+    Parentheses are only treated as grouping when they open a token, or close it
+    without a matching open parenthesis in the same token, so values containing
+    regular expression groups, e.g. ``title::(a|b)``, don't need to be quoted.
+
+    Raises:
+        QueryError: Unterminated quote.
+    """
+    tokens: list[str | _Term] = []
+    index = 0
+    while query_str[index:].strip():
+        token_match = _TOKEN_RE.match(query_str, index)
+        if not token_match:
+            err_msg = f"Unterminated quote in query. [{query_str=}]"
+            raise QueryError(err_msg)
+        index = token_match.end()
+        raw_token = token_match[1]
+
+        while raw_token.startswith(("(", "-")) and len(raw_token) > 1:
+            tokens.append("(" if raw_token[0] == "(" else NOT)
+            raw_token = raw_token[1:]
+
+        num_closed = 0
+        while raw_token.endswith(")") and raw_token.count(")") > raw_token.count("("):
+            raw_token = raw_token[:-1]
+            num_closed += 1
+
+        if raw_token in {AND, NOT, OR, "("}:
+            tokens.append(raw_token)
+        elif raw_token:
+            term_str = "".join(shlex.split(raw_token))
+            tokens.append(_Term(**_parse_term(term_str)))
+        tokens.extend(")" * num_closed)
+
+    return tokens
+
+
+def _parse_or(tokens: list[str | _Term], index: int) -> tuple[_QueryNode, int]:
+    """Parses nodes joined with ``OR``, starting at ``tokens[index]``."""
+    operands = []
+    operand, index = _parse_and(tokens, index)
+    operands.append(operand)
+    while index < len(tokens) and tokens[index] == OR:
+        operand, index = _parse_and(tokens, index + 1)
+        operands.append(operand)
+
+    if len(operands) == 1:
+        return operands[0], index
+    return _Or(tuple(operands)), index
+
+
+def _parse_and(tokens: list[str | _Term], index: int) -> tuple[_QueryNode, int]:
+    """Parses nodes joined with ``AND``, explicitly or not, at ``tokens[index]``."""
+    operands = []
+    operand, index = _parse_not(tokens, index)
+    operands.append(operand)
+    while index < len(tokens) and tokens[index] not in {OR, ")"}:
+        if tokens[index] == AND:
+            index += 1
+        operand, index = _parse_not(tokens, index)
+        operands.append(operand)
+
+    if len(operands) == 1:
+        return operands[0], index
+    return _And(tuple(operands)), index
+
+
+def _parse_not(tokens: list[str | _Term], index: int) -> tuple[_QueryNode, int]:
+    """Parses a term, group, or negation of either at ``tokens[index]``.
+
+    Raises:
+        QueryError: Missing term or unbalanced parentheses.
+    """
+    if index >= len(tokens):
+        err_msg = "Incomplete query, expected a term."
+        raise QueryError(err_msg)
+
+    lexeme = tokens[index]
+    if isinstance(lexeme, _Term):
+        return lexeme, index + 1
+    if lexeme == NOT:
+        operand, index = _parse_not(tokens, index + 1)
+        return _Not(operand), index
+    if lexeme == "(":
+        group, index = _parse_or(tokens, index + 1)
+        if index >= len(tokens) or tokens[index] != ")":
+            err_msg = "Unbalanced parentheses in query."
+            raise QueryError(err_msg)
+        return group, index + 1
+
+    err_msg = f"Unexpected token in query, expected a term. [{lexeme=}]"
+    raise QueryError(err_msg)
+
+
+def _compile_node(query_node: _QueryNode, query_type: QueryType) -> sa.ColumnElement:
+    """Compiles a query node into a where clause for ``query_type`` items.
+
+    Terms joined by the same ``AND`` are related to the queried items together, so
+    e.g. all track terms of an album query must match a single track.
+
+    Args:
+        query_node: Query node to compile.
+        query_type: Type of library item being queried.
+
+    Returns:
+        The where clause.
+
+    Raises:
+        QueryError: Invalid query term.
+    """
+    if isinstance(query_node, _Term):
+        return _compile_terms((query_node,), query_type)
+    if isinstance(query_node, _Not):
+        # fields without a value don't match a term, so they do match its negation
+        operand = _compile_node(query_node.operand, query_type)
+        return sa.not_(sa.func.coalesce(operand, sa.false(), type_=sa.Boolean))
+    if isinstance(query_node, _Or):
+        return sa.or_(
+            *(_compile_node(operand, query_type) for operand in query_node.operands)
+        )
+
+    terms = [operand for operand in query_node.operands if isinstance(operand, _Term)]
+    return sa.and_(
+        _compile_terms(terms, query_type),
+        *(
+            _compile_node(operand, query_type)
+            for operand in query_node.operands
+            if not isinstance(operand, _Term)
+        ),
+    )
 
+
+def _compile_terms(
+    terms: Sequence[_Term], query_type: QueryType
+) -> sa.ColumnElement[bool]:
+    """Compiles terms that must all match into a where clause for ``query_type`` items.
+
+    Raises:
+        QueryError: Invalid query term.
+    """
+    filters: dict[str, list[sa.ColumnElement[bool]]] = {
+        QueryType.ALBUM.value: [],
+        QueryType.EXTRA.value: [],
+        QueryType.TRACK.value: [],
+    }
+    fts_terms: dict[str, list[_Term]] = {
+        QueryType.ALBUM.value: [],
+        QueryType.EXTRA.value: [],
+        QueryType.TRACK.value: [],
+    }
     for term in terms:
-        parsed_term = _parse_term(term)
-        library_query = library_query.filter(
-            _create_filter_expression(
-                parsed_term[FIELD_TYPE],
-                parsed_term[FIELD],
-                parsed_term[SEPARATOR],
-                parsed_term[VALUE],
+        if term.separator == "~":
+            fts_terms[term.field_type].append(term)
+        else:
+            filters[term.field_type].append(
+                _create_filter_expression(
+                    term.field_type, term.field, term.separator, term.value
+                )
+            )
+
+    # all full-text search terms of an item type are matched in a single search
+    for field_type, field_type_fts_terms in fts_terms.items():
+        if field_type_fts_terms:
+            fts_match = _fts_match(field_type, field_type_fts_terms)
+            fts, _ = FTS_TABLES[field_type]
+            filters[field_type].append(
+                get_item_class(field_type)._id.in_(  # noqa: SLF001
+                    sa.select(fts.c.rowid).where(fts_match)
+                )
             )
+
+    clauses = _relate_filters(query_type, filters)
+    return sa.and_(*clauses) if clauses else sa.true()
+
+
+def _fts_match(field_type: str, terms: Sequence[_Term]) -> sa.ColumnElement[bool]:
+    """Creates a single full-text search matching all of the given terms.
+
+    Args:
+        field_type: LibItem type of every term.
+        terms: Full-text search terms to match.
+
+    Returns:
+        A ``MATCH`` expression against the item type's full-text search table.
+
+    Raises:
+        QueryError: A term's field isn't indexed for full-text search.
+    """
+    fts_query = " AND ".join(
+        _create_fts_filter(field_type, term.field, term.value) for term in terms
+    )
+    fts, _ = FTS_TABLES[field_type]
+    return sa.literal_column(fts.name).match(fts_query)
+
+
+def _load_option(item_class: type[LibItem], rel_path: str) -> _AbstractLoad:
+    """Creates a loader option to eagerly load the given relationship path.
+
+    Collections are loaded with a single ``SELECT ... IN`` per relationship (and per
+    batch of items if streaming), and albums are joined to the queried items.
+
+    Args:
+        item_class: Library item class being queried.
+        rel_path: Relationships to load, separated by a ``.``.
+
+    Returns:
+        The loader option.
+
+    Raises:
+        QueryError: Invalid relationship path.
+    """
+    loader: _AbstractLoad | None = None
+    rel_class = item_class
+    for rel_name in rel_path.split("."):
+        rel = getattr(rel_class, rel_name, None)
+        rel_prop = getattr(rel, "property", None)
+        if not isinstance(rel_prop, sqlalchemy.orm.RelationshipProperty):
+            err_msg = f"Invalid relationship to load. [{rel_path=}, {rel_name=}]"
+            raise QueryError(err_msg)
+
+        strategy = "selectinload" if rel_prop.uselist else "joinedload"
+        loader = getattr(loader or sqlalchemy.orm, strategy)(rel)
+        rel_class = rel_prop.mapper.class_
+
+    return cast("_AbstractLoad", loader)
+
+
+def _order_query(
+    library_query: sa.Select, query_type: QueryType, order_by: Sequence[str]
+) -> sa.Select:
+    """Orders a select statement of ``query_type`` items.
+
+    String fields are ordered case-insensitively so the ``NOCASE`` indexes on
+    commonly ordered fields can be used rather than sorting every item.
+
+    Args:
+        library_query: Select statement to order.
+        query_type: Type of library item selected.
+        order_by: Keys to order the items by. See :meth:`query` for more info.
+
+    Returns:
+        The ordered select statement.
+
+    Raises:
+        QueryError: Invalid order key.
+    """
+    item_class = get_item_class(query_type.value)
+    join_album = False
+    order_clauses: list[sa.ColumnElement] = []
+    for key in order_by:
+        descending = key.startswith("-")
+        field_type, field = parse_field_key(key.removeprefix("-"), query_type)
+        join_album |= field_type != query_type.value
+
+        order_clauses.append(
+            _order_clause(get_item_class(field_type), field, descending=descending)
         )
-    items = library_query.all()
 
-    log.debug(f"Queried library for items. [{items=}]")
-    return items
+    if join_album:
+        library_query = library_query.join(item_class.album)
+
+    # the id keeps the order stable between equal items
+    return library_query.order_by(*order_clauses, item_class._id)  # noqa: SLF001
+
+
+def parse_field_key(key: str, query_type: QueryType) -> tuple[str, str]:
+    """Parses a key referring to a field of ``query_type`` items or their album.
+
+    Keys are a field optionally prefixed with its item type as in a query term,
+    e.g. ``a:date``, and fields without a prefix are of ``query_type``.
+
+    Args:
+        key: Key to parse.
+        query_type: Type of library item being queried.
+
+    Returns:
+        The field type and field of the key.
+
+    Raises:
+        QueryError: Invalid key, or a key of an unrelated item type.
+    """
+    key_match = re.fullmatch(r"(?:(?P<field_type>[aet]):)?(?P<field>\w+)", key)
+    if not key_match:
+        err_msg = f"Invalid field key. [{key=}]"
+        raise QueryError(err_msg)
+
+    field_types = {
+        "a": QueryType.ALBUM.value,
+        "e": QueryType.EXTRA.value,
+        "t": QueryType.TRACK.value,
+    }
+    field_type = field_types.get(key_match["field_type"], query_type.value)
+    if field_type not in {query_type.value, QueryType.ALBUM.value}:
+        err_msg = (
+            "Only fields of the queried items or their albums can be used. "
+            f"[{key=}, {query_type=}]"
+        )
+        raise QueryError(err_msg)
+
+    return field_type, key_match["field"].lower()
+
+
+def _order_clause(
+    item_class: type[LibItem], field: str, *, descending: bool
+) -> sa.ColumnElement:
+    """Creates an ORDER BY clause for the given field.
+
+    Raises:
+        QueryError: ``field`` can't be ordered by.
+    """
+    attr = getattr(item_class, field, None)
+    nullable = True
+    if attr is None:
+        # assume custom field
+        order_expr = sa.func.json_extract(item_class.custom, f'$."{field}"')
+    else:
+        try:
+            column = attr.property.columns[0]
+        except AttributeError as err:
+            err_msg = f"Items can't be ordered by the given field. [{field=}]"
+            raise QueryError(err_msg) from err
+
+        nullable = bool(column.nullable)
+        order_expr = attr
+        if isinstance(column.type, sa.String):
+            order_expr = attr.collate("NOCASE")
+
+    if descending:
+        # sqlite already orders nulls first, i.e. last when descending
+        return order_expr.desc()
+    if nullable:
+        return order_expr.asc().nulls_last()
+    return order_expr.asc()
+
+
+def get_item_class(field_type: str) -> type[Album | Extra | Track]:
+    """Returns the library item class of the given field type."""
+    if field_type == QueryType.ALBUM.value:
+        return Album
+    if field_type == QueryType.EXTRA.value:
+        return Extra
+    return Track
+
+
+def _create_fts_filter(field_type: str, field: str, value: str) -> str:
+    """Maps a user-given full-text search term to an FTS5 query string.
+
+    Args:
+        field_type: LibItem type of ``field``.
+        field: The field to search, or ``*`` to search all full-text indexed fields.
+        value: FTS5 query to match.
+
+    Returns:
+        An FTS5 query string restricted to ``field``.
+
+    Raises:
+        QueryError: ``field`` is not indexed for full-text search.
+    """
+    try:
+        _, fts_fields = FTS_TABLES[field_type]
+    except KeyError as err:
+        err_msg = f"Full-text search isn't supported for {field_type}s. [{field=}]"
+        raise QueryError(err_msg) from err
+
+    if field == "*":
+        return f"({value})"
+    if field not in fts_fields:
+        err_msg = (
+            f"Field is not indexed for full-text search. [{field=}, {fts_fields=}]"
+        )
+        raise QueryError(err_msg)
+
+    return f"{field} : ({value})"
+
+
+def _relate_filters(
+    query_type: QueryType, filters: dict[str, list[sa.ColumnElement[bool]]]
+) -> list[sa.ColumnElement[bool]]:
+    """Relates each item type's filters to the item type being queried.
+
+    Filters on the queried item type are applied directly. Filters on any other item
+    type are grouped into a single correlated EXISTS subquery (via the album) so
+    only the tables a query actually references are searched, and a single related
+    item must match all of its type's filters.
+
+    Args:
+        query_type: Type of library item being queried.
+        filters: Filter expressions of each item type, keyed by the item type.
+
+    Returns:
+        Where clauses for a query of ``query_type`` items.
+    """
+    album_filters = filters[QueryType.ALBUM.value]
+    extra_filters = filters[QueryType.EXTRA.value]
+    track_filters = filters[QueryType.TRACK.value]
+
+    if query_type == QueryType.ALBUM:
+        clauses = list(album_filters)
+        if extra_filters:
+            clauses.append(Album.extras.any(sa.and_(*extra_filters)))
+        if track_filters:
+            clauses.append(Album.tracks.any(sa.and_(*track_filters)))
+        return clauses
+
+    if query_type == QueryType.EXTRA:
+        clauses = list(extra_filters)
+        related_filters, album_rel = track_filters, Album.tracks
+        item_album = Extra.album
+    else:
+        clauses = list(track_filters)
+        related_filters, album_rel = extra_filters, Album.extras
+        item_album = Track.album
+
+    album_clauses = list(album_filters)
+    if related_filters:
+        album_clauses.append(album_rel.any(sa.and_(*related_filters)))
+    if album_clauses:
+        clauses.append(item_album.has(sa.and_(*album_clauses)))
+    return clauses
 
 
 def _parse_term(term: str) -> dict[str, str]:
@@ -130,7 +869,7 @@ def _parse_term(term: str) -> dict[str, str]:
         rf"""
         (?P<{FIELD_TYPE}>[aet]:)?
         (?P<{FIELD}>\S+?)
-        (?P<{SEPARATOR}>::?)
+        (?P<{SEPARATOR}>::?|~)
         (?P<{VALUE}>.*)
         """,
         re.VERBOSE,
@@ -155,7 +894,7 @@ def _parse_term(term: str) -> dict[str, str]:
 
 def _create_filter_expression(
     field_type: str, field: str, separator: str, value: str
-) -> sa.sql.expression.ColumnExpressionArgument[bool]:
+) -> sa.ColumnElement[bool]:
     """Maps a user-given query term to a filter expression for the database query.
 
     Args:
@@ -167,41 +906,151 @@ def _create_filter_expression(
     Returns:
         A filter for the database query.
 
-        A "filter" is anything accepted by a sqlalchemy `Query.filter()`.
-        https://docs.sqlalchemy.org/en/20/orm/queryguide/query.html#sqlalchemy.orm.Query.filter
+        A "filter" is anything accepted by a sqlalchemy `Select.where()`.
+        https://docs.sqlalchemy.org/en/20/core/selectable.html#sqlalchemy.sql.expression.Select.where
 
     Raises:
         QueryError: Invalid query given.
     """
     attr = _get_field_attr(field, field_type)
+    expression = _match_attr(attr, separator, value)
+
+    attr_table = getattr(attr, "table", None)
+    if isinstance(attr_table, TableValuedAlias):
+        # match json values in a subquery rather than joining each value to the item
+        return sa.select(1).select_from(attr_table).where(expression).exists()
+    if isinstance(attr_table, sa.Table) and attr_table.info.get("multi_value"):
+        # search the indexed values first, then look up their items
+        item_id = next(iter(attr_table.c.item_id.foreign_keys)).column
+        return item_id.in_(sa.select(attr_table.c.item_id).where(expression))
+    if isinstance(attr_table, sa.Table) and attr_table.info.get("custom_fields"):
+        item_id = next(iter(attr_table.c.item_id.foreign_keys)).column
+        return item_id.in_(
+            sa.select(attr_table.c.item_id).where(
+                attr_table.c.field == field, expression
+            )
+        )
+    return expression
+
+
+def _match_attr(
+    attr: sa.sql.expression.ColumnClause | InstrumentedAttribute | KeyedColumnElement,
+    separator: str,
+    value: str,
+) -> sa.ColumnElement[bool]:
+    """Creates an expression matching ``attr`` to ``value`` based on ``separator``.
 
+    Raises:
+        QueryError: Invalid query given.
+    """
     if separator == ":":
-        if num_range := re.fullmatch(r"(?P<min>\d*)..(?P<max>\d*)", value):
-            if num_range["min"] and num_range["max"]:
-                return sa.and_(attr >= num_range["min"], attr <= num_range["max"])
-            if num_range["min"]:
-                return attr >= num_range["min"]
-            if num_range["max"]:
-                return attr <= num_range["max"]
+        range_expression = _match_range(attr, value)
+        if range_expression is not None:
+            return range_expression
 
         if str(attr).endswith(".path"):
             return attr == Path(value)
 
         # normal string match query - should be case insensitive
-        return attr.ilike(value, escape="/")
+        # sqlite's LIKE is already case insensitive and, unlike `ilike()`, can use the
+        # NOCASE indexes on commonly queried fields
+        return attr.like(value, escape="/")
     if separator == "::":
-        try:
-            re.compile(value)
-        except re.error as re_err:
-            err_msg = f"Invalid regular expression. [regex={value!r}]"
-            raise QueryError(err_msg) from re_err
-
-        return attr.op("regexp")(sa.sql.expression.literal(value))
+        return _match_regexp(attr, value)
 
     err_msg = f"Invalid query type separator. [{separator=}]"
     raise QueryError(err_msg)
 
 
+def _match_range(
+    attr: sa.sql.expression.ColumnClause | InstrumentedAttribute | KeyedColumnElement,
+    value: str,
+) -> sa.ColumnElement[bool] | None:
+    """Creates an expression matching ``attr`` to a range, if ``value`` is one.
+
+    Ranges are either numeric ranges, e.g. ``2000..2010``, or for date fields, a
+    date, month, or year, e.g. ``2000-01``.
+
+    Returns:
+        The expression, or ``None`` if ``value`` isn't a range.
+    """
+    if num_range := re.fullmatch(r"(?P<min>\d*)\.\.(?P<max>\d*)", value):
+        if num_range["min"] and num_range["max"]:
+            return sa.and_(attr >= num_range["min"], attr <= num_range["max"])
+        if num_range["min"]:
+            return attr >= num_range["min"]
+        if num_range["max"]:
+            return attr <= num_range["max"]
+
+    if isinstance(getattr(attr, "type", None), sa.Date) and (
+        date_range := _parse_date_range(value)
+    ):
+        # dates aren't stored with text affinity, so unlike a range, LIKE can't use
+        # their index
+        start_date, end_date = date_range
+        return sa.and_(attr >= start_date, attr < end_date)
+
+    return None
+
+
+def _parse_date_range(value: str) -> tuple[datetime.date, datetime.date] | None:
+    """Parses a date, month, or year, e.g. ``2020-01``, into the range it spans.
+
+    Returns:
+        The first date of the range and the date after the last, or ``None`` if
+        ``value`` isn't a valid date, month, or year.
+    """
+    date_match = re.fullmatch(
+        r"(?P<year>\d{4})(?:-(?P<month>\d{2})(?:-(?P<day>\d{2}))?)?", value
+    )
+    if not date_match:
+        return None
+
+    year = int(date_match["year"])
+    try:
+        if date_match["day"]:
+            start_date = datetime.date(
+                year, int(date_match["month"]), int(date_match["day"])
+            )
+            return start_date, start_date + datetime.timedelta(days=1)
+        if date_match["month"]:
+            month = int(date_match["month"])
+            return datetime.date(year, month, 1), datetime.date(
+                year + month // 12, month % 12 + 1, 1
+            )
+        return datetime.date(year, 1, 1), datetime.date(year + 1, 1, 1)
+    except (ValueError, OverflowError):
+        return None
+
+
+def _match_regexp(
+    attr: sa.sql.expression.ColumnClause | InstrumentedAttribute | KeyedColumnElement,
+    value: str,
+) -> sa.ColumnElement[bool]:
+    """Creates an expression matching ``attr`` to the regular expression ``value``.
+
+    Raises:
+        QueryError: Invalid regular expression.
+    """
+    try:
+        compile_regexp(value)
+    except re.error as re_err:
+        err_msg = f"Invalid regular expression. [regex={value!r}]"
+        raise QueryError(err_msg) from re_err
+
+    regexp_expr = attr.op("regexp")(sa.sql.expression.literal(value))
+    if like_pattern := regexp_like_pattern(value):
+        # let sqlite rule out most rows before calling back into python
+        return sa.and_(
+            sa.or_(
+                attr.like(sa.sql.expression.literal(like_pattern), escape="/"),
+                attr.is_(None),
+            ),
+            regexp_expr,
+        )
+    return regexp_expr
+
+
 def _get_field_attr(
     field: str, field_type: str
 ) -> sa.sql.expression.ColumnClause | InstrumentedAttribute | KeyedColumnElement:
@@ -227,6 +1076,10 @@ def _getattr(
         attr = getattr(item_class, field)
     except AttributeError:
         # assume custom field
+        if field in get_indexed_fields()[item_class.__tablename__]:
+            # see `custom_field_table()`
+            return SABase.metadata.tables[f"{item_class.__tablename__}_custom"].c.value
+
         custom_func = sa.func.json_each(item_class.custom, f"$.{field}").table_valued(
             "value", joins_implicitly=True
         )
@@ -240,9 +1093,10 @@ def _getattr(
         pass
     else:
         if isinstance(column_type, SetType):
-            multi_func = sa.func.json_each(
-                getattr(item_class, field), "$"
-            ).table_valued("value", joins_implicitly=True)
-            return multi_func.c.value
+            # see `multi_value_table()`
+            column_name = attr.property.columns[0].name
+            return SABase.metadata.tables[
+                f"{item_class.__tablename__}_{column_name}"
+            ].c.value
 
     return attr
@@ -1,18 +1,27 @@
 """Reads item files and updates moe with any changes."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 import moe
 from moe import config
 
-from . import read_cli, read_core
-from .read_core import *  # noqa: F403
+if TYPE_CHECKING:
+    from .read_core import *  # noqa: F403
 
-__all__ = []
-__all__.extend(read_core.__all__)
+PLUGIN_INFO = config.PluginInfo(commands=frozenset({"read"}))
 
 
 @moe.hookimpl
 def plugin_registration() -> None:
     """Only register the cli sub-plugin if the cli is enabled."""
+    from . import read_cli, read_core  # noqa: PLC0415 deferred, see `PLUGIN_INFO`
+
     config.CONFIG.pm.register(read_core, "read_core")
     if config.CONFIG.pm.has_plugin("cli"):
         config.CONFIG.pm.register(read_cli, "read_cli")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 any attribute of the core api
+    """Imports the core API once it's used."""
+    return getattr(importlib.import_module(f"{__name__}.read_core"), name)
@@ -8,12 +8,20 @@ from sqlalchemy.orm.session import Session
 import moe
 import moe.cli
 from moe import read, remove
-from moe.util.cli import cli_query, query_parser
+from moe.query import QueryType
+from moe.util.cli import cli_iter_query, query_parser
 
 log = logging.getLogger("moe.cli.read")
 
 __all__: list[str] = []
 
+# relationships read when reading each item type
+_LOAD_PROFILES: dict[QueryType, tuple[str, ...]] = {
+    QueryType.ALBUM: ("tracks", "extras"),
+    QueryType.EXTRA: ("album",),
+    QueryType.TRACK: ("album",),
+}
+
 
 @moe.hookimpl
 def add_command(cmd_parsers: argparse._SubParsersAction) -> None:
@@ -24,6 +32,18 @@ def add_command(cmd_parsers: argparse._SubParsersAction) -> None:
         help="read item files and update moe with any changes",
         parents=[query_parser],
     )
+    read_parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="read all files, even if they haven't changed since they were last read",
+    )
+    read_parser.add_argument(
+        "-p",
+        "--properties",
+        action="store_true",
+        help="only read audio properties (e.g. duration) of changed or unread tracks",
+    )
     read_parser.add_argument(
         "-r",
         "--remove",
@@ -45,12 +65,18 @@ def _parse_args(session: Session, args: argparse.Namespace) -> None:
     Raises:
         SystemExit: Path given does not exist.
     """
-    items = cli_query(session, args.query, args.query_type)
+    items = cli_iter_query(
+        session, args.query, args.query_type, load=_LOAD_PROFILES[args.query_type]
+    )
 
     error_count = 0
+    skip_count = 0
     for item in items:
         try:
-            read.read_item(item)
+            if args.properties:
+                read.read_audio_properties(item)
+            elif not read.read_item(item, force=args.force):
+                skip_count += 1
         except FileNotFoundError:  # noqa: PERF203 try-except must be inside loop
             if args.remove:
                 remove.remove_item(session, item)
@@ -58,5 +84,8 @@ def _parse_args(session: Session, args: argparse.Namespace) -> None:
                 log.exception(f"Could not find item's path. [{item=}]")
                 error_count += 1
 
+    if skip_count:
+        print(f"Skipped {skip_count} unchanged item(s).")  # noqa: T201 cli output
+
     if error_count:
         raise SystemExit(1)
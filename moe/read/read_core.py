@@ -1,32 +1,130 @@
 """Core api for read items from the library."""
 
 import logging
+from typing import TYPE_CHECKING
 
-from moe.library import Album, LibItem, MergeStrategy, Track
+from moe.library import (
+    Album,
+    AlbumError,
+    Extra,
+    FileLibItem,
+    LibItem,
+    MergeStrategy,
+    Track,
+)
+from moe.util.core import scan_files
 
-__all__ = ["read_item"]
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = ["read_audio_properties", "read_item"]
 
 log = logging.getLogger("moe.read")
 
 
-def read_item(item: LibItem) -> None:
+def read_item(item: LibItem, *, force: bool = False) -> bool:
     """Reads an item's file and updates the item with any changes.
 
+    Only files that have changed since the item was last synced with them, i.e. read
+    from or written to, are read. Changes are detected by comparing each file's
+    modification time, size, and inode with those stored in the library.
+
     Args:
         item: Item to update.
+        force: Read the item's files regardless of whether they have changed.
+
+    Returns:
+        Whether any of the item's files were read, i.e. ``False`` if all of them were
+        skipped as unchanged.
 
     Raises:
         FileNotFoundError: Item's path doesn't exist.
     """
-    log.debug(f"Reading item's file for changes. [{item=}]")
+    log.debug(f"Reading item's file for changes. [{item=}, {force=}]")
 
     if not item.path.exists():
         err_msg = f"Item's path does not exist. [path={item.path!r}]"
         raise FileNotFoundError(err_msg)
 
     if isinstance(item, Track):
+        if not force and not item.is_file_changed():
+            log.info(f"Skipped reading unchanged item. [item={item!s}]")
+            return False
+
         item.merge(Track.from_file(item.path), merge_strategy=MergeStrategy.OVERWRITE)
     elif isinstance(item, Album):
-        item.merge(Album.from_dir(item.path), merge_strategy=MergeStrategy.OVERWRITE)
+        if force:
+            item.merge(
+                Album.from_dir(item.path), merge_strategy=MergeStrategy.OVERWRITE
+            )
+        elif not _read_changed_album_files(item):
+            log.info(f"Skipped reading unchanged item. [item={item!s}]")
+            return False
+    else:
+        return False
 
     log.info(f"Updated item from filesystem. [{item=!s}]")
+    return True
+
+
+def _read_changed_album_files(album: Album) -> bool:
+    """Reads any new or changed files in an album's directory into the album.
+
+    Returns:
+        Whether any files were read.
+    """
+    synced_items: dict[Path, FileLibItem] = {
+        synced_item.path: synced_item for synced_item in [*album.tracks, *album.extras]
+    }
+    file_stats = dict(scan_files(album.path))
+    changed_paths = [
+        path
+        for path, stat in file_stats.items()
+        if path not in synced_items or synced_items[path].is_file_changed(stat)
+    ]
+    log.debug(
+        "Scanned album directory for changes. "
+        f"[dir={album.path}, changed={len(changed_paths)}, "
+        f"skipped={len(file_stats) - len(changed_paths)}]"
+    )
+    if not changed_paths:
+        return False
+
+    try:
+        changed_album = Album.from_dir(album.path, changed_paths)
+    except AlbumError:  # only extras changed; there are no tags to read
+        for path in changed_paths:
+            extra = album.get_extra(path.relative_to(album.path)) or Extra(album, path)
+            extra.set_file_synced(file_stats[path])
+    else:
+        album.merge(changed_album, merge_strategy=MergeStrategy.OVERWRITE)
+
+    return True
+
+
+def read_audio_properties(item: LibItem) -> None:
+    """Reads the audio stream properties of an item's track file(s).
+
+    Only track files that have changed since their properties were last read, or
+    whose properties were never read, will actually be read. This can be used to
+    populate the stored audio properties of an existing library.
+
+    Args:
+        item: Item to update. Albums will update all of their tracks, and extras are
+            ignored.
+
+    Raises:
+        FileNotFoundError: Item's path doesn't exist.
+    """
+    log.debug(f"Reading item's audio properties. [{item=}]")
+
+    if not item.path.exists():
+        err_msg = f"Item's path does not exist. [path={item.path!r}]"
+        raise FileNotFoundError(err_msg)
+
+    tracks = item.tracks if isinstance(item, Album) else [item]
+    for track in tracks:
+        if isinstance(track, Track) and track.path.exists():
+            track.refresh_audio_properties()
+
+    log.info(f"Updated audio properties from filesystem. [{item=!s}]")
@@ -1,18 +1,27 @@
 """Removes music from the library."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 import moe
 from moe import config
 
-from . import rm_cli, rm_core
-from .rm_core import *  # noqa: F403
+if TYPE_CHECKING:
+    from .rm_core import *  # noqa: F403
 
-__all__ = []
-__all__.extend(rm_core.__all__)
+PLUGIN_INFO = config.PluginInfo(commands=frozenset({"remove", "rm"}))
 
 
 @moe.hookimpl
 def plugin_registration() -> None:
     """Only register the cli sub-plugin if the cli is enabled."""
+    from . import rm_cli, rm_core  # noqa: PLC0415 deferred, see `PLUGIN_INFO`
+
     config.CONFIG.pm.register(rm_core, "remove_core")
     if config.CONFIG.pm.has_plugin("cli"):
         config.CONFIG.pm.register(rm_cli, "remove_cli")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401 any attribute of the core api
+    """Imports the core API once it's used."""
+    return getattr(importlib.import_module(f"{__name__}.rm_core"), name)
@@ -13,12 +13,20 @@ from sqlalchemy.orm.session import Session
 import moe
 import moe.cli
 from moe import remove as moe_rm
+from moe.query import QueryType
 from moe.util.cli import cli_query, query_parser
 
 __all__: list[str] = []
 
 log = logging.getLogger("moe.cli.remove")
 
+# relationships updated when removing each item type
+_LOAD_PROFILES: dict[QueryType, tuple[str, ...]] = {
+    QueryType.ALBUM: ("tracks", "extras"),
+    QueryType.EXTRA: ("album",),
+    QueryType.TRACK: ("album",),
+}
+
 
 @moe.hookimpl
 def add_command(cmd_parsers: argparse._SubParsersAction) -> None:
@@ -49,7 +57,9 @@ def _parse_args(session: Session, args: argparse.Namespace) -> None:
     Raises:
         SystemExit: Invalid query given, or no items to remove.
     """
-    items = cli_query(session, args.query, args.query_type)
+    items = cli_query(
+        session, args.query, args.query_type, load=_LOAD_PROFILES[args.query_type]
+    )
 
     for item in items:
         moe_rm.remove_item(session, item)
@@ -0,0 +1,315 @@
+"""Runs Moe as a daemon to avoid paying its startup cost on every command.
+
+``moe serve`` initializes the configuration, plugins, and database once, then listens
+on a Unix socket in the configuration directory. While it's running, ``moe`` forwards
+its arguments, working directory, environment, and standard streams to the daemon,
+which runs the command in a forked copy of itself, and exits with the command's exit
+code. See ``moe.client`` for the client side.
+
+Commands run concurrently, but only one may write to the library at a time. Each
+write transaction waits for any other to be committed or rolled back first.
+
+Note:
+    This plugin is enabled by default, and requires a POSIX system.
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import signal
+import socket
+import struct
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, NoReturn
+
+import sqlalchemy as sa
+from sqlalchemy.orm import ORMExecuteState
+from sqlalchemy.orm.session import Session
+
+import moe
+import moe.cli
+from moe import config
+from moe.client import SOCKET_FILENAME, STD_FDS, connect
+from moe.config import moe_sessionmaker
+
+__all__ = ["serve"]
+
+log = logging.getLogger("moe.cli.serve")
+
+LOCK_FILENAME = "serve.lock"
+
+_MSG_SIZE = 4096
+_RECV_TIMEOUT = 10  # seconds to wait on a client to send its request
+
+
+@moe.hookimpl
+def plugin_registration() -> None:
+    """Depend on the cli plugin."""
+    if not config.CONFIG.pm.has_plugin("cli"):
+        config.CONFIG.pm.set_blocked("serve")
+        log.warning("The 'serve' plugin requires the 'cli' plugin to be enabled.")
+
+
+@moe.hookimpl
+def add_command(cmd_parsers: argparse._SubParsersAction) -> None:
+    """Adds the ``serve`` command to Moe's CLI."""
+    serve_parser = cmd_parsers.add_parser(
+        "serve",
+        description="Runs Moe as a daemon that other `moe` commands are sent to.",
+        help="run moe as a daemon to speed up other commands",
+    )
+    serve_parser.set_defaults(func=_parse_args)
+
+
+def _parse_args(session: Session, args: argparse.Namespace) -> None:  # noqa: ARG001
+    """Parses the given commandline arguments.
+
+    Args:
+        session: Library db session.
+        args: Commandline arguments to parse.
+
+    Raises:
+        SystemExit: The daemon could not be started.
+    """
+    if sys.platform == "win32":
+        log.error("`moe serve` is not supported on Windows.")
+        raise SystemExit(1)
+
+    socket_path = config.CONFIG.config_dir / SOCKET_FILENAME
+    if sock := connect(socket_path):
+        sock.close()
+        log.error(f"A daemon is already running. [{socket_path=}]")
+        raise SystemExit(1)
+
+    try:
+        serve(socket_path)
+    except OSError as err:
+        log.exception("Unable to run the daemon.")
+        raise SystemExit(1) from err
+
+
+def serve(socket_path: Path) -> None:
+    """Runs commands sent to ``socket_path`` until interrupted.
+
+    Args:
+        socket_path: Filesystem path of the Unix socket to listen on.
+
+    Raises:
+        OSError: The socket could not be created.
+    """
+    socket_path.unlink(missing_ok=True)  # left over from a daemon that was killed
+
+    # import everything now so each command doesn't have to
+    config.CONFIG.pm.load_deferred_plugins()
+    config.CONFIG.engine.dispose()  # connections can't be shared with forked commands
+
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # automatically reap commands
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    with _listen(socket_path) as server:
+        log.info(f"Listening for commands. [{socket_path=}]")
+
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    _handle_connection(conn)
+        except KeyboardInterrupt:
+            log.info("Stopping the daemon.")
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def _listen(socket_path: Path) -> socket.socket:
+    """Returns a Unix socket listening on ``socket_path``.
+
+    The socket is only accessible by the current user from the moment it's created,
+    as any command sent to it runs as the user.
+
+    Raises:
+        OSError: The socket could not be created.
+    """
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        server.bind(str(socket_path))
+        server.listen()
+    except OSError:
+        server.close()
+        raise
+    finally:
+        os.umask(umask)
+
+    return server
+
+
+def _handle_connection(conn: socket.socket) -> None:
+    """Runs the command sent by a client in a forked process.
+
+    The request is received by the forked process, so a client that's slow to send it
+    can't keep the daemon from accepting other connections.
+
+    Args:
+        conn: Connection to the client.
+    """
+    peer_uid = _get_peer_uid(conn)
+    if peer_uid is not None and peer_uid != os.getuid():
+        log.warning(f"Refused a connection from another user. [{peer_uid=}]")
+        return
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if os.fork() == 0:
+        _run_command(conn)
+
+
+def _get_peer_uid(conn: socket.socket) -> int | None:
+    """Returns the user id of the client of ``conn``, or None if it can't be checked.
+
+    Without ``SO_PEERCRED``, i.e. on non-Linux systems, the permissions of the socket
+    still keep out other users.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+
+    creds = conn.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _, uid, _ = struct.unpack("3i", creds)  # pid, uid, gid
+    return uid
+
+
+def _receive_request(conn: socket.socket) -> tuple[dict[str, Any], list[int]] | None:
+    """Receives a command request from a client.
+
+    Returns:
+        The request, and the client's stdin, stdout, and stderr file descriptors, or
+        None if the client didn't send a valid request, e.g. if it was only checking if
+        the daemon is running.
+    """
+    conn.settimeout(_RECV_TIMEOUT)
+    try:
+        msg, fds, _, _ = socket.recv_fds(conn, _MSG_SIZE, len(STD_FDS))
+        while msg and not msg.endswith(b"\n"):
+            if not (data := conn.recv(_MSG_SIZE)):
+                break
+            msg += data
+    except TimeoutError:
+        log.warning("Timed out receiving a request.")
+        return None
+    finally:
+        conn.settimeout(None)
+
+    if not msg:
+        return None
+    try:
+        request = json.loads(msg)
+    except json.JSONDecodeError:
+        request = None
+    if not isinstance(request, dict) or len(fds) != len(STD_FDS):
+        log.error("Received an invalid request.")
+        return None
+
+    log.debug(f"Received command. [{request=}]")
+    return request, fds
+
+
+def _run_command(conn: socket.socket) -> NoReturn:
+    """Receives a command and runs it as the client, then exits the forked process.
+
+    Args:
+        conn: Connection to the client.
+    """
+    exit_code = 1
+    received = None
+    try:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        if not (received := _receive_request(conn)):
+            return
+        request, fds = received
+        conn.sendall(json.dumps({"pid": os.getpid()}).encode() + b"\n")
+
+        for std_fd, fd in zip(STD_FDS, fds, strict=True):
+            os.dup2(fd, std_fd)
+        sys.stdout.reconfigure(line_buffering=sys.stdout.isatty())  # type: ignore[reportAttributeAccessIssue]
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+
+        # detect the client's terminal, e.g. its size and colors, instead of ours; the
+        # console is re-initialized in place as plugins import it directly
+        moe.cli.console.__init__()
+
+        config.CONFIG.engine.dispose(close=False)
+        logging.getLogger("moe").setLevel(logging.NOTSET)
+
+        with _write_lock():
+            moe.cli.main(request["args"])
+        exit_code = 0
+    except SystemExit as err:
+        exit_code = _get_exit_code(err)
+    except KeyboardInterrupt:
+        exit_code = 130
+    except Exception:
+        log.exception("Unexpected error running command.")
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        if received:
+            with contextlib.suppress(OSError):
+                conn.sendall(json.dumps({"exit_code": exit_code}).encode() + b"\n")
+        os._exit(exit_code)
+
+
+@contextlib.contextmanager
+def _write_lock() -> Iterator[None]:
+    """Locks the library during each write transaction of the command.
+
+    The lock is taken before the session's first write, and released once the
+    transaction is committed or rolled back. Reads never wait on it, nor does a
+    command waiting on the user before it writes anything.
+    """
+    import fcntl  # noqa: PLC0415 not available on Windows
+
+    lock_path = config.CONFIG.config_dir / LOCK_FILENAME
+    with lock_path.open("a") as lock_file:
+
+        def lock(*_: Any) -> None:  # noqa: ANN401 event arguments aren't used
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        def lock_statement(orm_execute_state: ORMExecuteState) -> None:
+            if not orm_execute_state.is_select:
+                lock()
+
+        def unlock(*_: Any) -> None:  # noqa: ANN401 event arguments aren't used
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        listeners = (
+            ("before_flush", lock),
+            ("do_orm_execute", lock_statement),
+            ("after_commit", unlock),
+            ("after_rollback", unlock),
+        )
+        for identifier, listener in listeners:
+            sa.event.listen(moe_sessionmaker, identifier, listener)
+        try:
+            yield
+        finally:
+            for identifier, listener in listeners:
+                sa.event.remove(moe_sessionmaker, identifier, listener)
+
+
+def _get_exit_code(err: SystemExit) -> int:
+    """Returns the exit code of the process that raised ``err``."""
+    if err.code is None:
+        return 0
+    if isinstance(err.code, int):
+        return err.code
+
+    print(err.code, file=sys.stderr)  # noqa: T201 same as the interpreter
+    return 1
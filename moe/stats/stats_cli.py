@@ -0,0 +1,95 @@
+"""Adds the ``stats`` command to moe."""
+
+import argparse
+import datetime
+import logging
+
+from sqlalchemy.orm.session import Session
+
+import moe
+from moe import stats
+from moe.query import QueryError
+from moe.util.cli import query_parser
+
+log = logging.getLogger("moe.cli.stats")
+
+__all__: list[str] = []
+
+
+@moe.hookimpl
+def add_command(cmd_parsers: argparse._SubParsersAction) -> None:
+    """Adds the ``stats`` command to Moe's CLI."""
+    stats_parser = cmd_parsers.add_parser(
+        "stats",
+        description="Displays statistics about music in the library.",
+        help="display statistics about music in the library",
+        parents=[query_parser],
+    )
+    stats_parser.add_argument(
+        "-g",
+        "--group-by",
+        metavar="FIELD",
+        help="field to group the statistics by, e.g. 'genre' or 'a:year'",
+    )
+    stats_parser.set_defaults(func=_parse_args)
+
+
+def _parse_args(session: Session, args: argparse.Namespace) -> None:
+    """Parses the given commandline arguments.
+
+    Args:
+        session: Library db session.
+        args: Commandline arguments to parse.
+
+    Raises:
+        SystemExit: Invalid query or field given.
+    """
+    try:
+        library_stats = stats.get_stats(
+            session, args.query, args.query_type, group_by=args.group_by
+        )
+    except QueryError as err:
+        log.exception("Failed query.")
+        raise SystemExit(1) from err
+
+    item_type = args.query_type.value
+    if args.group_by is None:
+        (total,) = library_stats
+        print(f"{item_type.capitalize()}s: {total.count}")  # noqa: T201 cli output
+        if item_type != "extra":
+            print(f"Duration: {_fmt_duration(total.duration)}")  # noqa: T201 cli output
+            print(f"Size: {_fmt_size(total.size)}")  # noqa: T201 cli output
+        if total.num_unread:
+            print(f"Unread tracks: {total.num_unread}")  # noqa: T201 cli output
+    else:
+        for group in library_stats:
+            group_str = f"{'(none)' if group.value is None else group.value}: "
+            group_str += f"{group.count} {item_type}(s)"
+            if item_type != "extra":
+                group_str += (
+                    f", {_fmt_duration(group.duration)}, {_fmt_size(group.size)}"
+                )
+            if group.num_unread:
+                group_str += f", {group.num_unread} unread track(s)"
+            print(group_str)  # noqa: T201 cli output
+
+    if any(group.num_unread for group in library_stats):
+        log.warning(
+            "The duration or size of some tracks was never read, so they're missing "
+            "from the statistics. Run `moe read '*'` to read them."
+        )
+
+
+def _fmt_duration(duration: float) -> str:
+    """Formats a duration in seconds, e.g. ``1 day, 2:03:04``."""
+    return str(datetime.timedelta(seconds=round(duration)))
+
+
+def _fmt_size(size: float) -> str:
+    """Formats a size in bytes, e.g. ``1.2 GB``."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1000:  # noqa: PLR2004 next unit
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} {unit}"
+        size /= 1000
+
+    return f"{size:.1f} TB"
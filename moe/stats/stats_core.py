@@ -0,0 +1,180 @@
+"""Core api for computing statistics about the library."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import sqlalchemy as sa
+import sqlalchemy.orm
+
+from moe.library import Album, Track
+from moe.library.lib_item import SABase, SetType
+from moe.query import (
+    QueryError,
+    QueryType,
+    create_query,
+    get_item_class,
+    parse_field_key,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm.session import Session
+
+    from moe.library import LibItem
+
+__all__ = ["Stats", "get_stats"]
+
+log = logging.getLogger("moe.stats")
+
+# singular names of multi-value fields, as accepted in query terms
+_MULTI_VALUE_ALIASES = {
+    ("album", "catalog_num"): "catalog_nums",
+    ("track", "genre"): "genres",
+}
+
+
+class Stats(NamedTuple):
+    """Statistics of a group of library items.
+
+    Attributes:
+        value: Value of the field the items were grouped by, or ``None`` for items
+            without a value or if the items weren't grouped.
+        count: Number of items.
+        duration: Total duration, in seconds, of the items' tracks.
+        size: Total file size, in bytes, of the items' tracks.
+        num_unread: Number of the items' tracks whose duration or file size was never
+            read, e.g. tracks added before they were stored, and so are missing from
+            ``duration`` and ``size``.
+    """
+
+    value: Any
+    count: int
+    duration: float
+    size: int
+    num_unread: int = 0
+
+
+def get_stats(
+    session: Session,
+    query_str: str,
+    query_type: QueryType,
+    group_by: str | None = None,
+) -> list[Stats]:
+    """Computes statistics of the items matching the given query.
+
+    The statistics are computed by the database, so no items are loaded.
+
+    Args:
+        session: Library db session.
+        query_str: Query string to parse. See the query docs for more info.
+        query_type: Type of library item to compute statistics of.
+        group_by: Field to group the items by, optionally prefixed with its item type
+            (``a:``, ``e:``, or ``t:``) as in a query term. Fields without a prefix
+            are of ``query_type``, and other than the queried item type, only
+            fields of its album may be used. Items are counted once for each value
+            of a multi-value field, e.g. a track is counted in each of its genres.
+
+    Returns:
+        The statistics of each group of items, largest first, or a single
+        ``Stats`` of all matching items if ``group_by`` isn't given. Extras don't
+        have tracks, so their ``duration``, ``size``, and ``num_unread`` are always
+        ``0``.
+
+    Raises:
+        QueryError: Invalid query or ``group_by`` field.
+    """
+    log.debug(
+        f"Computing library statistics. [{query_str=}, {query_type=}, {group_by=}]"
+    )
+
+    item_class = get_item_class(query_type.value)
+    item_id = sa.inspect(item_class).primary_key[0]
+    item_ids = create_query(query_str, query_type).with_only_columns(item_id)
+
+    stats_query = sa.select(sa.func.count(sa.distinct(item_id)).label("count"))
+    if query_type == QueryType.EXTRA:
+        stats_query = stats_query.add_columns(
+            sa.literal(0).label("duration"),
+            sa.literal(0).label("size"),
+            sa.literal(0).label("num_unread"),
+        )
+    else:
+        track_size = Track.__table__.c.synced_size
+        is_unread = sa.or_(Track.duration.is_(None), track_size.is_(None))
+        stats_query = stats_query.add_columns(
+            sa.func.coalesce(sa.func.sum(Track.duration), 0).label("duration"),
+            sa.func.coalesce(sa.func.sum(track_size), 0).label("size"),
+            # albums without tracks have a null track id, so aren't counted
+            sa.func.count(sa.case((is_unread, sa.inspect(Track).primary_key[0]))).label(
+                "num_unread"
+            ),
+        )
+    stats_query = stats_query.select_from(item_class).where(item_id.in_(item_ids))
+    if query_type == QueryType.ALBUM:
+        stats_query = stats_query.outerjoin(Album.tracks)
+
+    if group_by is None:
+        stats_query = stats_query.add_columns(sa.null().label("value"))
+    else:
+        field_type, field = parse_field_key(group_by, query_type)
+        if field_type != query_type.value:
+            stats_query = stats_query.join(item_class.album)
+        group_class = get_item_class(field_type)
+        group_expr, group_table = _get_group_expression(group_class, field)
+        if group_table is not None:
+            stats_query = stats_query.outerjoin(
+                group_table,
+                group_table.c.item_id == sa.inspect(group_class).primary_key[0],
+            )
+        stats_query = (
+            stats_query.add_columns(group_expr.label("value"))
+            .group_by(group_expr)
+            .order_by(sa.desc("count"), group_expr)
+        )
+
+    stats = [
+        Stats(row.value, row.count, row.duration, row.size, row.num_unread)
+        for row in session.execute(stats_query)
+    ]
+    log.debug(f"Computed library statistics. [{stats=}]")
+    return stats
+
+
+def _get_group_expression(
+    item_class: type[LibItem], field: str
+) -> tuple[sa.ColumnElement, sa.Table | None]:
+    """Gets the expression to group items by the given field.
+
+    Args:
+        item_class: Library item class of ``field``.
+        field: Field to group by.
+
+    Returns:
+        The expression, and the multi-value side table it belongs to, if any.
+
+    Raises:
+        QueryError: ``field`` can't be grouped by.
+    """
+    field = _MULTI_VALUE_ALIASES.get((item_class.__tablename__, field), field)
+    attr = getattr(item_class, field, None)
+    if attr is None:
+        # assume custom field
+        return sa.func.json_extract(item_class.custom, f'$."{field}"'), None
+
+    field_prop = getattr(attr, "property", None)
+    if not isinstance(attr, sqlalchemy.orm.QueryableAttribute) or isinstance(
+        field_prop, sqlalchemy.orm.RelationshipProperty
+    ):
+        err_msg = f"Items can't be grouped by the given field. [{field=}]"
+        raise QueryError(err_msg)
+
+    if isinstance(field_prop, sqlalchemy.orm.ColumnProperty) and isinstance(
+        field_prop.columns[0].type, SetType
+    ):
+        # see `multi_value_table()`
+        column_name = field_prop.columns[0].name
+        table = SABase.metadata.tables[f"{item_class.__tablename__}_{column_name}"]
+        return table.c.value, table
+
+    return attr, None
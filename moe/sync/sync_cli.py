@@ -0,0 +1,92 @@
+"""Adds the ``sync`` command to moe."""
+
+import argparse
+import logging
+
+from sqlalchemy.orm.session import Session
+
+import moe
+from moe import sync as moe_sync
+from moe.sync.sync_core import LibraryDiff
+
+log = logging.getLogger("moe.cli.sync")
+
+__all__: list[str] = []
+
+
+@moe.hookimpl
+def add_command(cmd_parsers: argparse._SubParsersAction) -> None:
+    """Adds the ``sync`` command to Moe's CLI."""
+    sync_parser = cmd_parsers.add_parser(
+        "sync",
+        description="Sync the library with the files in your library path.",
+        help="sync the library with the files in your library path",
+    )
+    sync_parser.add_argument(
+        "-n",
+        "--dry-run",
+        action="store_true",
+        help="display what will be synced without actually changing the library",
+    )
+    sync_parser.set_defaults(func=_parse_args)
+
+
+def _parse_args(session: Session, args: argparse.Namespace) -> None:
+    """Parses the given commandline arguments.
+
+    Args:
+        session: Library db session.
+        args: Commandline arguments to parse.
+
+    Raises:
+        SystemExit: Unable to add a new album.
+    """
+    diff = moe_sync.diff_library(session)
+
+    if args.dry_run:
+        dry_run_str = _dry_run(diff)
+        if dry_run_str:
+            print(dry_run_str.lstrip())  # noqa: T201 cli output
+        return
+
+    failed_paths = moe_sync.sync_library(session, diff)
+    print(_fmt_summary(diff, len(failed_paths)))  # noqa: T201 cli output
+
+    if failed_paths:
+        raise SystemExit(1)
+
+
+def _dry_run(diff: LibraryDiff) -> str:
+    """Returns a string of output representing a 'dry-run' of syncing the library."""
+    dry_run_str = ""
+
+    for album_path, file_paths in diff.new_albums.items():
+        dry_run_str += f"\nadd: {album_path} ({len(file_paths)} files)"
+    for album in diff.changed_albums:
+        dry_run_str += f"\nread: {album}"
+    for album, new_path in diff.moved_albums:
+        dry_run_str += f"\nmove: {album.path}\n\t-> {new_path}"
+    for item, new_path in diff.moved_items:
+        dry_run_str += f"\nmove: {item.path}\n\t-> {new_path}"
+    for removed_item in diff.removed_items:
+        dry_run_str += f"\nremove: {removed_item}"
+    for unmatched_path in diff.unmatched_paths:
+        dry_run_str += f"\nskip: {unmatched_path}"
+
+    return dry_run_str
+
+
+def _fmt_summary(diff: LibraryDiff, failed_count: int) -> str:
+    """Formats a summary of the changes made while syncing."""
+    summary = (
+        f"Added {len(diff.new_albums) - failed_count} album(s), "
+        f"read {len(diff.changed_albums)} album(s), "
+        f"moved {len(diff.moved_items)} item(s), "
+        f"removed {len(diff.removed_items)} item(s)."
+    )
+    if diff.unmatched_paths:
+        summary += (
+            f"\nSkipped {len(diff.unmatched_paths)} file(s) not belonging to an album."
+        )
+
+    return summary
@@ -0,0 +1,367 @@
+"""Core api for syncing the library with the filesystem.
+
+Syncing happens in two steps. First, ``diff_library()`` walks ``library_path`` and
+compares each file against the library. Then, ``sync_library()`` applies those
+differences using the ``add``, ``read``, and ``remove`` core apis.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
+
+import sqlalchemy as sa
+
+from moe import add, config, read, remove
+from moe.library import Album, AlbumError, Extra, FileLibItem, LibItem, Track
+from moe.util.core import scan_files
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Iterator
+
+    from sqlalchemy.orm.session import Session
+
+__all__ = ["LibraryDiff", "diff_library", "sync_library"]
+
+log = logging.getLogger("moe.sync")
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_SIZE = 500
+_DISC_DIR_RE = re.compile(r"^(cd|dis[ck])\W*\d+$", re.IGNORECASE)
+
+
+class LibraryDiff(NamedTuple):
+    """Differences between the library and the files under ``library_path``.
+
+    Attributes:
+        changed_albums: Albums with new or modified files to read.
+        moved_albums: Albums whose directory moved along with their new path.
+        moved_items: Tracks and extras whose file moved along with their new path.
+        new_albums: Directories of new albums along with the files to add to each.
+        removed_items: Albums, tracks, and extras whose files no longer exist.
+        unmatched_paths: New files that don't belong to any album.
+    """
+
+    changed_albums: list[Album]
+    moved_albums: list[tuple[Album, Path]]
+    moved_items: list[tuple[FileLibItem, Path]]
+    new_albums: dict[Path, list[Path]]
+    removed_items: list[LibItem]
+    unmatched_paths: list[Path]
+
+
+def diff_library(session: Session, batch_size: int = DEFAULT_BATCH_SIZE) -> LibraryDiff:
+    """Compares the files under ``library_path`` against the library.
+
+    The library path is walked lazily, and each batch of walked files is looked up in
+    the library in bulk by path. The ids of the found items are kept in a temporary
+    table rather than in memory, so memory use only grows with the number of
+    differences rather than with the size of the library. Only the stat results of
+    each file are compared, so no file is ever opened.
+
+    Files are considered moved if a missing track or extra was last synced with a file
+    with the same inode and size. Files that were otherwise copied or moved, e.g. to
+    another filesystem, are instead considered removed and new. New files belong to
+    any album whose directory they are in. If there is no such album, new files are
+    grouped into new albums by their directory, where any disc sub-directories, e.g.
+    ``Disc 01``, are part of their parent's album.
+
+    Args:
+        session: Library db session.
+        batch_size: Number of files to look up in the library at a time.
+
+    Returns:
+        The differences between the library and the filesystem.
+    """
+    library_path = Path(config.CONFIG.settings.library_path).expanduser()
+    log.debug(f"Comparing the library against the filesystem. [{library_path=}]")
+
+    changed_albums: dict[Path, Album] = {}
+    new_files: dict[Path, os.stat_result] = {}
+    found_table = _create_found_table(session)
+    try:
+        for batch in _batched(scan_files(library_path), batch_size):
+            file_stats = dict(batch)
+            found_items = list(_get_items_by_path(session, list(file_stats)))
+            for item in found_items:
+                if item.is_file_changed(file_stats.pop(item.path)):
+                    changed_albums[item.album.path] = item.album
+            if found_items:
+                session.execute(
+                    sa.insert(found_table),
+                    [
+                        {"item_table": item.__tablename__, "item_id": item._id}  # noqa: SLF001
+                        for item in found_items
+                    ],
+                )
+            new_files.update(file_stats)
+
+        missing_items = _get_missing_items(
+            session, library_path, found_table, batch_size
+        )
+    finally:
+        session.execute(sa.text(f"DROP TABLE {found_table.name}"))
+
+    moved_items = _match_moved_items(missing_items, new_files)
+    moved_albums = _match_moved_albums(moved_items)
+
+    moved_item_ids = {id(item) for item, _ in moved_items}
+    moved_item_album_paths = {item.album.path for item, _ in moved_items}
+    removed_items: list[LibItem] = []
+    removed_albums: dict[Path, Album] = {}
+    for item in missing_items:
+        if id(item) in moved_item_ids:
+            continue
+        album = item.album
+        if album.path not in moved_item_album_paths and not album.path.exists():
+            removed_albums[album.path] = album  # remove the entire album at once
+        else:
+            removed_items.append(item)
+    removed_items.extend(removed_albums.values())
+
+    album_dirs = {album.path: album for album in changed_albums.values()}
+    album_dirs.update(
+        _get_albums_by_path(session, _get_parent_dirs(new_files, library_path))
+    )
+    album_dirs.update({new_path: album for album, new_path in moved_albums})
+    unowned_paths: list[Path] = []
+    for path in sorted(new_files):
+        album = next(
+            (album_dirs[parent] for parent in path.parents if parent in album_dirs),
+            None,
+        )
+        if album:
+            changed_albums[album.path] = album
+        else:
+            unowned_paths.append(path)
+    new_albums, unmatched_paths = _group_new_albums(unowned_paths, library_path)
+
+    diff = LibraryDiff(
+        changed_albums=list(changed_albums.values()),
+        moved_albums=moved_albums,
+        moved_items=moved_items,
+        new_albums=new_albums,
+        removed_items=removed_items,
+        unmatched_paths=unmatched_paths,
+    )
+    log.debug(f"Compared the library against the filesystem. [{diff=}]")
+    return diff
+
+
+def sync_library(
+    session: Session,
+    diff: LibraryDiff | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[Path]:
+    """Syncs the library with the files under ``library_path``.
+
+    Changes are flushed to the database in batches.
+
+    Args:
+        session: Library db session.
+        diff: Differences to apply. If ``None``, they will be found using
+            ``diff_library()``.
+        batch_size: Number of changes to flush to the database at a time.
+
+    Returns:
+        Directories of any new albums that could not be added.
+    """
+    diff = diff or diff_library(session, batch_size)
+    log.debug(f"Syncing the library with the filesystem. [{diff=}]")
+
+    for album, new_path in diff.moved_albums:
+        album.path = new_path  # flushed along with the album's moved items
+    for item, new_path in _flush_batches(session, diff.moved_items, batch_size):
+        item.path = new_path
+        item.set_file_synced()
+
+    for removed_item in diff.removed_items:
+        remove.remove_item(session, removed_item)
+
+    for album in _flush_batches(session, diff.changed_albums, batch_size):
+        read.read_item(album)
+
+    failed_paths: list[Path] = []
+    for album_path, file_paths in diff.new_albums.items():
+        try:
+            add.add_item(session, Album.from_dir(album_path, file_paths))
+        except (AlbumError, ValueError, add.AddError):  # noqa: PERF203 try-except must be inside loop
+            log.exception(f"Unable to add new album. [{album_path=}]")
+            failed_paths.append(album_path)
+
+    log.info("Synced the library with the filesystem.")
+    return failed_paths
+
+
+def _batched(iterable: Iterable[T], batch_size: int) -> Iterator[list[T]]:
+    """Yields successive lists of ``batch_size`` elements from ``iterable``."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def _flush_batches(
+    session: Session, items: Iterable[T], batch_size: int
+) -> Iterator[T]:
+    """Yields each of ``items``, flushing the session after every batch."""
+    for batch in _batched(items, batch_size):
+        yield from batch
+        session.flush()
+
+
+def _get_items_by_path(session: Session, paths: list[Path]) -> Iterator[FileLibItem]:
+    """Yields all tracks and extras in the library whose path is in ``paths``."""
+    item_classes: tuple[type[Track | Extra], ...] = (Track, Extra)
+    for item_class in item_classes:
+        yield from session.scalars(
+            sa.select(item_class).where(item_class.path.in_(paths))
+        )
+
+
+def _get_albums_by_path(session: Session, paths: Iterable[Path]) -> dict[Path, Album]:
+    """Returns all albums in the library whose path is in ``paths``."""
+    albums: dict[Path, Album] = {}
+    for batch in _batched(paths, DEFAULT_BATCH_SIZE):
+        albums.update(
+            (album.path, album)
+            for album in session.scalars(sa.select(Album).where(Album.path.in_(batch)))
+        )
+
+    return albums
+
+
+def _create_found_table(session: Session) -> sa.Table:
+    """Creates a temporary table for the ids of items found under ``library_path``.
+
+    Temporary tables only exist for the connection of the session, and should be
+    dropped once no longer needed.
+    """
+    found_table = sa.Table(
+        "sync_found_item",
+        sa.MetaData(),
+        sa.Column("item_table", sa.String, primary_key=True),
+        sa.Column("item_id", sa.Integer, primary_key=True),
+        prefixes=["TEMPORARY"],
+    )
+    found_table.create(session.connection())
+
+    return found_table
+
+
+def _get_missing_items(
+    session: Session, library_path: Path, found_table: sa.Table, batch_size: int
+) -> list[FileLibItem]:
+    """Returns any tracks and extras under ``library_path`` not in ``found_table``.
+
+    Only the items missing from ``found_table`` are streamed from the database.
+    """
+    missing_items: list[FileLibItem] = []
+    item_classes: tuple[type[Track | Extra], ...] = (Track, Extra)
+    for item_class in item_classes:
+        item_id = sa.inspect(item_class).primary_key[0]
+        found_ids = sa.select(found_table.c.item_id).where(
+            found_table.c.item_table == item_class.__tablename__
+        )
+        missing_items.extend(
+            item
+            for item in session.scalars(
+                sa.select(item_class)
+                .where(item_id.not_in(found_ids))
+                .execution_options(yield_per=batch_size)
+            )
+            if item.path.is_relative_to(library_path)
+        )
+
+    return missing_items
+
+
+def _match_moved_items(
+    missing_items: list[FileLibItem], new_files: dict[Path, os.stat_result]
+) -> list[tuple[FileLibItem, Path]]:
+    """Matches missing items with the new files they moved to.
+
+    Any matched files are removed from ``new_files``.
+    """
+    items_by_inode: dict[tuple[int, int], FileLibItem] = {}
+    for item in missing_items:
+        if fingerprint := item.file_fingerprint:
+            _, size, inode = fingerprint
+            items_by_inode[(inode, size)] = item
+
+    moved_items: list[tuple[FileLibItem, Path]] = []
+    matched_ids: set[int] = set()
+    for path, stat in sorted(new_files.items()):
+        item = items_by_inode.get((stat.st_ino, stat.st_size))
+        if item and id(item) not in matched_ids and item.path.suffix == path.suffix:
+            matched_ids.add(id(item))
+            moved_items.append((item, path))
+            del new_files[path]
+
+    return moved_items
+
+
+def _match_moved_albums(
+    moved_items: list[tuple[FileLibItem, Path]],
+) -> list[tuple[Album, Path]]:
+    """Finds the new path of any albums whose directory moved with its items."""
+    moved_albums: dict[Path, tuple[Album, Path]] = {}
+    for item, new_path in moved_items:
+        album = item.album
+        if album.path in moved_albums or album.path.exists():
+            continue
+
+        rel_parts = item.path.relative_to(album.path).parts
+        if new_path.parts[-len(rel_parts) :] == rel_parts:
+            moved_albums[album.path] = (album, Path(*new_path.parts[: -len(rel_parts)]))
+
+    return list(moved_albums.values())
+
+
+def _get_parent_dirs(paths: Iterable[Path], library_path: Path) -> set[Path]:
+    """Returns every parent directory of ``paths`` within ``library_path``."""
+    return {
+        parent
+        for path in paths
+        for parent in path.parents
+        if parent != library_path and parent.is_relative_to(library_path)
+    }
+
+
+def _group_new_albums(
+    paths: list[Path], library_path: Path
+) -> tuple[dict[Path, list[Path]], list[Path]]:
+    """Groups new files into new albums by their directory.
+
+    Returns:
+        The new albums' directories along with their files, and any files that don't
+        belong to a new album.
+    """
+    album_paths: set[Path] = set()
+    for path in paths:
+        if path.parent != library_path and config.CONFIG.pm.hook.is_track_file(
+            path=path
+        ):
+            album_path = path.parent
+            while _DISC_DIR_RE.match(album_path.name) and (
+                album_path.parent != library_path
+            ):
+                album_path = album_path.parent
+            album_paths.add(album_path)
+
+    new_albums: dict[Path, list[Path]] = {}
+    unmatched_paths: list[Path] = []
+    for path in paths:
+        album_path = next(
+            (parent for parent in path.parents if parent in album_paths), None
+        )
+        if album_path:
+            new_albums.setdefault(album_path, []).append(path)
+        else:
+            unmatched_paths.append(path)
+
+    return new_albums, unmatched_paths
@@ -5,8 +5,6 @@ import operator
 from collections.abc import Callable
 from dataclasses import dataclass
 
-import questionary
-
 __all__ = ["PromptChoice", "choice_prompt"]
 
 log = logging.getLogger("moe.cli")
@@ -50,6 +48,8 @@ def choice_prompt(
     Raises:
         SystemExit: Invalid user input.
     """
+    import questionary  # noqa: PLC0415 slow to import, and only needed to prompt
+
     prompt_choices.sort(key=operator.attrgetter("shortcut_key"))
 
     questionary_choices = [
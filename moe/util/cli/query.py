@@ -1,14 +1,17 @@
 """CLI-specific query help functionality."""
 
 import argparse
+import itertools
 import logging
+from collections.abc import Iterator, Sequence
 
+import sqlalchemy as sa
 from sqlalchemy.orm.session import Session
 
 from moe.library import Album, Extra, Track
-from moe.query import QueryError, QueryType, query
+from moe.query import QueryError, QueryType, iter_query, iter_rows, query
 
-__all__ = ["cli_query", "query_parser"]
+__all__ = ["cli_iter_query", "cli_iter_rows", "cli_query", "query_parser"]
 
 log = logging.getLogger("moe.cli")
 
@@ -61,7 +64,10 @@ query_parser.set_defaults(query_type=QueryType.TRACK)
 
 
 def cli_query(
-    session: Session, query_str: str, query_type: QueryType
+    session: Session,
+    query_str: str,
+    query_type: QueryType,
+    load: Sequence[str] = (),
 ) -> list[Album] | list[Extra] | list[Track]:
     """Wrapper around the core query call, with some added cli error handling.
 
@@ -69,6 +75,8 @@ def cli_query(
         session: Library db session.
         query_str: Query string to parse. See the query docs for more info.
         query_type: Type of library item to return.
+        load: Relationships to load along with the items. See
+            :meth:`moe.query.query` for more info.
 
     Returns:
         All items matching the given query found in ``args``.
@@ -80,7 +88,7 @@ def cli_query(
         `The query docs <https://mrmoe.readthedocs.io/en/latest/query.html>`_
     """
     try:
-        items = query(session, query_str, query_type)
+        items = query(session, query_str, query_type, load=load)
     except QueryError as err:
         log.exception("Failed query.")
         raise SystemExit(1) from err
@@ -90,3 +98,91 @@ def cli_query(
         raise SystemExit(1)
 
     return items
+
+
+def cli_iter_query(
+    session: Session,
+    query_str: str,
+    query_type: QueryType,
+    order_by: Sequence[str] | None = None,
+    load: Sequence[str] = (),
+) -> Iterator[Album | Extra | Track]:
+    """Wrapper around the core iter_query call, with some added cli error handling.
+
+    The query is started immediately so any errors are handled before the items are
+    iterated over.
+
+    Args:
+        session: Library db session.
+        query_str: Query string to parse. See the query docs for more info.
+        query_type: Type of library item to return.
+        order_by: Keys to order the items by. See :meth:`moe.query.query` for more
+            info.
+        load: Relationships to load along with the items. See
+            :meth:`moe.query.query` for more info.
+
+    Returns:
+        An iterator over all items matching the given query.
+
+    Raises:
+        SystemExit: QueryError or no items returned from the query.
+
+    See Also:
+        `The query docs <https://mrmoe.readthedocs.io/en/latest/query.html>`_
+    """
+    items = iter_query(session, query_str, query_type, order_by=order_by, load=load)
+    try:
+        first_item = next(items, None)
+    except QueryError as err:
+        log.exception("Failed query.")
+        raise SystemExit(1) from err
+
+    if first_item is None:
+        log.error("No items found for given query.")
+        raise SystemExit(1)
+
+    return itertools.chain([first_item], items)
+
+
+def cli_iter_rows(
+    session: Session,
+    query_str: str,
+    query_type: QueryType,
+    fields: Sequence[str],
+    order_by: Sequence[str] | None = None,
+) -> Iterator[sa.Row]:
+    """Wrapper around the core iter_rows call, with some added cli error handling.
+
+    The query is started immediately so any errors are handled before the rows are
+    iterated over.
+
+    Args:
+        session: Library db session.
+        query_str: Query string to parse. See the query docs for more info.
+        query_type: Type of library item to query for.
+        fields: Keys of the fields to select. See :meth:`moe.query.iter_rows` for
+            more info.
+        order_by: Keys to order the rows by. See :meth:`moe.query.query` for more
+            info.
+
+    Returns:
+        An iterator over the rows of all items matching the given query.
+
+    Raises:
+        SystemExit: QueryError or no items returned from the query.
+
+    See Also:
+        `The query docs <https://mrmoe.readthedocs.io/en/latest/query.html>`_
+    """
+    rows = iter_rows(session, query_str, query_type, fields, order_by=order_by)
+    try:
+        first_row = next(rows, None)
+    except QueryError as err:
+        log.exception("Failed query.")
+        raise SystemExit(1) from err
+
+    if first_row is None:
+        log.error("No items found for given query.")
+        raise SystemExit(1)
+
+    return itertools.chain([first_row], rows)
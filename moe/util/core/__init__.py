@@ -1,7 +1,11 @@
 """This package contains shared functionality for the core API."""
 
-from . import match
+from . import match, regex, scan
 from .match import *  # noqa: F403
+from .regex import *  # noqa: F403
+from .scan import *  # noqa: F403
 
 __all__ = []
 __all__.extend(match.__all__)
+__all__.extend(regex.__all__)
+__all__.extend(scan.__all__)
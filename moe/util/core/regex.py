@@ -0,0 +1,170 @@
+"""Regular expression matching for ``::`` queries.
+
+Sqlite has no built-in regular expression support, so the ``REGEXP`` operator calls
+back into python for every row it checks. To keep this cheap, each pattern is only
+compiled once, and queries can pre-filter rows with a ``LIKE`` expression derived from
+the literal text any match must contain, which sqlite evaluates natively.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+
+__all__ = ["compile_regexp", "regexp", "regexp_like_pattern"]
+
+REGEXP_CACHE_SIZE = 256
+
+_QUANTIFIERS = frozenset("*+?{")
+_SPECIAL_CHARS = frozenset(".^$*+?{}[]()|\\")
+_LIKE_ESCAPE = "/"
+_REPEAT_RE = re.compile(r"\d*(?:,\d*)?\}")
+
+
+@functools.lru_cache(maxsize=REGEXP_CACHE_SIZE)
+def compile_regexp(pattern: str) -> re.Pattern[str]:
+    """Compiles a case-insensitive query regular expression.
+
+    Args:
+        pattern: Regular expression to compile.
+
+    Returns:
+        The compiled pattern. Patterns are cached, so compiling the same pattern
+        again is free.
+
+    Raises:
+        re.error: Invalid regular expression.
+    """
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def regexp(pattern: str, col_value: object) -> bool:
+    """Sqlite ``REGEXP`` function using the python re module.
+
+    Args:
+        pattern: Regular expression pattern.
+        col_value: Column value to match against. The match will be against the str
+            of the value.
+
+    Returns:
+        Whether or not the match was successful.
+    """
+    if not isinstance(col_value, str):
+        col_value = str(col_value)
+
+    return compile_regexp(pattern).search(col_value) is not None
+
+
+@functools.lru_cache(maxsize=REGEXP_CACHE_SIZE)
+def regexp_like_pattern(pattern: str) -> str | None:
+    """Derives a ``LIKE`` pattern that every match of a regular expression satisfies.
+
+    The longest run of literal text that any match of ``pattern`` must contain is
+    used, e.g. ``beat.*s`` becomes ``%beat%``, and a run anchored to the start of the
+    pattern becomes a prefix match, e.g. ``^the`` becomes ``the%``. Patterns are
+    analyzed conservatively, so ``None`` is returned for any pattern using
+    alternation or inline flags, or without any required literal text.
+
+    Args:
+        pattern: Regular expression pattern.
+
+    Returns:
+        A case-insensitive ``LIKE`` pattern using ``/`` as its escape character, or
+        ``None`` if no useful pattern could be derived.
+    """
+    if "|" in pattern or "(?" in pattern:
+        return None
+
+    runs: list[tuple[str, bool]] = []  # (literal run, whether anchored to the start)
+    run = ""
+    run_anchored = pattern.startswith("^")
+    index = 1 if run_anchored else 0
+    group_depth = 0
+
+    def end_run() -> None:
+        nonlocal run, run_anchored
+        if run:
+            runs.append((run, run_anchored))
+        run = ""
+        run_anchored = False
+
+    while index < len(pattern):
+        if pattern[index] in "()":
+            # group contents may be optional, so only literals outside groups count
+            group_depth += 1 if pattern[index] == "(" else -1
+            literal, index = "", index + 1
+        else:
+            literal, index = _next_literal(pattern, index)
+
+        if not literal or group_depth or not literal.isascii():
+            # non-ascii characters aren't case folded by sqlite's LIKE
+            end_run()
+            continue
+
+        quantifier = pattern[index : index + 1]
+        if quantifier in _QUANTIFIERS - {"+"}:  # optional character
+            end_run()
+        elif quantifier == "+":
+            run += literal
+            end_run()
+        else:
+            run += literal
+    end_run()
+
+    if not runs:
+        return None
+
+    # the longest run filters out the most rows
+    literal, anchored = max(runs, key=lambda anchored_run: len(anchored_run[0]))
+    return _like_literal(literal, anchored=anchored)
+
+
+def _next_literal(pattern: str, index: int) -> tuple[str, int]:
+    """Consumes the next element of a regular expression pattern.
+
+    Args:
+        pattern: Regular expression pattern.
+        index: Index of the element to consume.
+
+    Returns:
+        The literal character the element matches, or an empty string if it doesn't
+        match a single literal character, and the index of the following element.
+    """
+    char = pattern[index]
+    index += 1
+
+    if char == "\\" and index < len(pattern):
+        # alphanumeric escapes are character classes, anchors, or backreferences
+        escaped = pattern[index]
+        return ("" if escaped.isalnum() else escaped), index + 1
+    if char == "[":
+        # skip the character class, including a leading or escaped ']'
+        if pattern[index : index + 1] == "^":
+            index += 1
+        if pattern[index : index + 1] == "]":
+            index += 1
+        while index < len(pattern) and pattern[index] != "]":
+            index += 2 if pattern[index] == "\\" else 1
+        return "", index + 1
+    if char == "{" and (repeat := _REPEAT_RE.match(pattern, index)):
+        return "", repeat.end()
+    if char in _SPECIAL_CHARS:
+        return "", index
+
+    return char, index
+
+
+def _like_literal(literal: str, *, anchored: bool) -> str:
+    """Creates a ``LIKE`` pattern matching text containing ``literal``.
+
+    Args:
+        literal: Literal text to match.
+        anchored: Whether the text must start with ``literal``.
+
+    Returns:
+        The ``LIKE`` pattern, escaped using ``/``.
+    """
+    escaped_literal = re.sub(r"([%_/])", rf"{_LIKE_ESCAPE}\1", literal)
+    if anchored:
+        return f"{escaped_literal}%"
+    return f"%{escaped_literal}%"
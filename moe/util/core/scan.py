@@ -0,0 +1,37 @@
+"""Cheap filesystem scanning that never opens the scanned files."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = ["scan_files"]
+
+
+def scan_files(dir_path: Path) -> Iterator[tuple[Path, os.stat_result]]:
+    """Recursively yields every file in a directory along with its stat result.
+
+    The directory tree is walked lazily using ``os.scandir``, so only the entries of
+    directories yet to be walked are held in memory. Symlinks to directories are not
+    followed.
+
+    Args:
+        dir_path: Directory to scan.
+
+    Yields:
+        Path and stat result of each file.
+    """
+    dir_paths = [dir_path]
+    while dir_paths:
+        with os.scandir(dir_paths.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dir_paths.append(Path(entry.path))
+                elif entry.is_file():
+                    # windows doesn't populate `st_ino` from directory entries
+                    stat = entry.stat() if os.name != "nt" else os.stat(entry.path)  # noqa: PTH116
+                    yield Path(entry.path), stat
@@ -1,9 +1,13 @@
 """Writes tags to track files."""
 
 import logging
+import os
 
 import mediafile
 import pluggy
+import sqlalchemy
+import sqlalchemy.orm
+import sqlalchemy.orm.attributes
 
 import moe
 from moe import config
@@ -53,22 +57,42 @@ def add_hooks(pm: pluggy._manager.PluginManager) -> None:
 
 
 @moe.hookimpl
-def process_new_items(items: list[LibItem]) -> None:
+def process_new_items(session: sqlalchemy.orm.Session, items: list[LibItem]) -> None:
     """Writes tags to any new tracks in the library."""
-    for item in items:
-        if isinstance(item, Track):
-            write_tags(item)
+    _write_flushed_tags(session, [item for item in items if isinstance(item, Track)])
 
 
 @moe.hookimpl
-def process_changed_items(items: list[LibItem]) -> None:
+def process_changed_items(
+    session: sqlalchemy.orm.Session, items: list[LibItem]
+) -> None:
     """Writes tags to any altered tracks or albums in the library."""
+    tracks: list[Track] = []
     for item in items:
         if isinstance(item, Track) and item.album not in items:
-            write_tags(item)
-        elif isinstance(item, Album):
-            for track in item.tracks:
-                write_tags(track)
+            if _fields_changed(item):
+                tracks.append(item)
+        elif isinstance(item, Album) and _fields_changed(item):
+            tracks.extend(item.tracks)
+
+    _write_flushed_tags(session, tracks)
+
+
+def _fields_changed(item: Album | Track) -> bool:
+    """Returns whether any fields of an item that are written as tags have changed.
+
+    Private attributes, such as the stored audio properties of a track, and paths
+    aren't written as tags, and writing to the file would only cause them to be read
+    again.
+    """
+    insp = sqlalchemy.inspect(item)
+
+    return any(
+        not attr.key.startswith("_")
+        and attr.key != "path"
+        and attr.history.has_changes()
+        for attr in insp.attrs
+    )
 
 
 @moe.hookimpl(tryfirst=True)
@@ -101,8 +125,54 @@ def write_custom_tags(track: Track) -> None:
 
 def write_tags(track: Track) -> None:
     """Write tags to a track's file."""
+    track.set_file_synced(_write_track_file(track))
+
+
+def _write_flushed_tags(session: sqlalchemy.orm.Session, tracks: list[Track]) -> None:
+    """Writes tags to tracks that were just flushed, and saves their new fingerprints.
+
+    Changes made to items after they're flushed aren't saved by the flush, so the
+    file fingerprints are committed to the tracks and saved directly as part of it
+    instead. This keeps the tracks from being dirtied again, which would otherwise
+    require another flush.
+    """
+    if not tracks:
+        return
+
+    fingerprints = []
+    for track in tracks:
+        stat = _write_track_file(track)
+        fingerprint = {
+            "_synced_mtime_ns": stat.st_mtime_ns,
+            "_synced_size": stat.st_size,
+            "_synced_inode": stat.st_ino,
+        }
+        for attr, value in fingerprint.items():
+            sqlalchemy.orm.attributes.set_committed_value(track, attr, value)
+        fingerprints.append({"track_id": track._id} | fingerprint)  # noqa: SLF001
+
+    track_table = Track.__table__
+    session.execute(
+        sqlalchemy.update(track_table)
+        .where(track_table.c["_id"] == sqlalchemy.bindparam("track_id"))
+        .values(
+            synced_mtime_ns=sqlalchemy.bindparam("_synced_mtime_ns"),
+            synced_size=sqlalchemy.bindparam("_synced_size"),
+            synced_inode=sqlalchemy.bindparam("_synced_inode"),
+        ),
+        fingerprints,
+    )
+
+
+def _write_track_file(track: Track) -> os.stat_result:
+    """Writes tags to a track's file without marking it as synced.
+
+    Returns:
+        The stat result of the written file.
+    """
     log.debug(f"Writing tags to track. [{track=}]")
 
     config.CONFIG.pm.hook.write_custom_tags(track=track)
 
     log.info(f"Wrote tags to track. [{track=!s}]")
+    return track.path.stat()
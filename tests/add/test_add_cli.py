@@ -16,8 +16,9 @@ from tests.conftest import album_factory, extra_factory, track_factory
 
 @pytest.fixture
 def mock_add() -> Iterator[FunctionType]:
-    """Mock the `add_item()` api call."""
-    with patch("moe.add.add_item", autospec=True) as mock_add:
+    """Mock the `add_items()` api call."""
+    with patch("moe.add.add_items", autospec=True) as mock_add:
+        mock_add.return_value = ([], [])
         yield mock_add
 
 
@@ -76,7 +77,7 @@ class TestCommand:
 
         moe.cli.main(cli_args)
 
-        mock_add.assert_called_once_with(ANY, track)
+        mock_add.assert_called_once_with(ANY, [track])
 
     def test_non_track_file(self, mock_add):
         """Raise SystemExit if bad track file given."""
@@ -99,15 +100,13 @@ class TestCommand:
         mock_add.assert_not_called()
 
     def test_multiple_items(self, mock_add):
-        """Items are added to the library when given a path."""
+        """All the items are added to the library at once."""
         items = [track_factory(exists=True), album_factory(exists=True)]
         cli_args = ["add", str(items[0].path), str(items[1].path)]
 
         moe.cli.main(cli_args)
 
-        mock_add.assert_any_call(ANY, items[0])
-        mock_add.assert_any_call(ANY, items[1])
-        assert mock_add.call_count == len(items)
+        mock_add.assert_called_once_with(ANY, items)
 
     def test_single_error(self, tmp_path, mock_add):
         """Don't exit after the first failed item if more to be added.
@@ -121,7 +120,18 @@ class TestCommand:
             moe.cli.main(cli_args)
 
         assert error.value.code != 0
-        mock_add.assert_called_once_with(ANY, track)
+        mock_add.assert_called_once_with(ANY, [track])
+
+    def test_failed_items(self, mock_add):
+        """Exit with an error if any items failed to be added."""
+        tracks = [track_factory(exists=True), track_factory(exists=True)]
+        mock_add.return_value = ([tracks[0]], [tracks[1]])
+
+        with pytest.raises(SystemExit) as error:
+            moe.cli.main(["add", str(tracks[0].path), str(tracks[1].path)])
+
+        assert error.value.code != 0
+        mock_add.assert_called_once_with(ANY, tracks)
 
     def test_extra_file(self, mock_add, mock_query):
         """Extra files are added as tracks."""
@@ -131,7 +141,7 @@ class TestCommand:
 
         moe.cli.main(cli_args)
 
-        mock_add.assert_called_once_with(ANY, extra)
+        mock_add.assert_called_once_with(ANY, [extra])
 
     def test_extra_no_album(self, mock_add):
         """Raise SystemExit if trying to add an extra but no query was given."""
@@ -1,5 +1,8 @@
 """Tests the add plugin."""
 
+from typing import ClassVar
+from unittest.mock import patch
+
 import pytest
 
 import moe
@@ -27,6 +30,47 @@ class AddPlugin:
             item.title = "pre_add"
 
 
+class ErrorPlugin:
+    """Test plugin that fails to add some items."""
+
+    @staticmethod
+    @moe.hookimpl
+    def pre_add(item: LibItem):
+        """Errors adding tracks titled "error"."""
+        if isinstance(item, Track) and item.title == "error":
+            raise moe.add.AddError
+
+
+class BatchPlugin:
+    """Test plugin that records the items given to the new item hooks."""
+
+    edited: ClassVar[list[list[LibItem]]] = []
+    processed: ClassVar[list[list[LibItem]]] = []
+
+    @staticmethod
+    @moe.hookimpl
+    def edit_new_items(items: list[LibItem]):
+        """Records the edited items."""
+        BatchPlugin.edited.append(items)
+
+    @staticmethod
+    @moe.hookimpl
+    def process_new_items(items: list[LibItem]):
+        """Records the processed items."""
+        BatchPlugin.processed.append(items)
+
+
+class SkipPlugin:
+    """Test plugin that skips adding some items."""
+
+    @staticmethod
+    @moe.hookimpl
+    def pre_add(item: LibItem):
+        """Skips adding tracks titled "skip"."""
+        if isinstance(item, Track) and item.title == "skip":
+            raise moe.add.SkipAddError
+
+
 class TestAddItem:
     """General functionality of `add_item`."""
 
@@ -96,6 +140,121 @@ class TestAddItem:
             assert track.genre == "pop"
 
 
+class TestAddItems:
+    """General functionality of `add_items`."""
+
+    @pytest.fixture
+    def _tmp_skip_config(self, tmp_config):
+        """A temporary config with a plugin that skips adding some items."""
+        tmp_config(
+            "default_plugins = ['add']",
+            extra_plugins=[ExtraPlugin(SkipPlugin, "skip_plugin")],
+            tmp_db=True,
+        )
+
+    @pytest.fixture
+    def _tmp_batch_config(self, tmp_config):
+        """A temporary config with a plugin that records the new item hooks."""
+        BatchPlugin.edited.clear()
+        BatchPlugin.processed.clear()
+        tmp_config(
+            "default_plugins = ['add']",
+            extra_plugins=[ExtraPlugin(BatchPlugin, "batch_plugin")],
+            tmp_db=True,
+        )
+
+    @pytest.mark.usefixtures("_tmp_add_config")
+    def test_items(self, tmp_session):
+        """We can add many items of any type to the library."""
+        album = album_factory()
+        track = track_factory()
+
+        added_items, failed_items = moe.add.add_items(tmp_session, [album, track])
+
+        assert added_items == [album, track]
+        assert not failed_items
+        assert tmp_session.query(Album).count() == 2  # noqa: PLR2004 track's album
+        assert track in tmp_session.query(Track).all()
+
+    @pytest.mark.usefixtures("_tmp_add_config")
+    def test_batches(self, tmp_session):
+        """Items are flushed to the database in batches."""
+        tracks = [track_factory() for _ in range(5)]
+
+        with patch.object(tmp_session, "flush", wraps=tmp_session.flush) as mock_flush:
+            moe.add.add_items(tmp_session, iter(tracks), batch_size=2)
+
+        assert mock_flush.call_count == 3  # noqa: PLR2004
+        assert tmp_session.query(Track).count() == len(tracks)
+
+    @pytest.mark.usefixtures("_tmp_batch_config")
+    def test_batch_hooks(self, tmp_session):
+        """The new item hooks are given each batch of items at once."""
+        tracks = [track_factory() for _ in range(5)]
+
+        moe.add.add_items(tmp_session, tracks, batch_size=2)
+
+        # session listeners may be registered more than once, so the hooks may be
+        # called more than once per batch
+        for batches in (BatchPlugin.edited, BatchPlugin.processed):
+            batch_tracks = [
+                [item for item in batch if isinstance(item, Track)] for batch in batches
+            ]
+            assert {len(batch) for batch in batch_tracks} == {1, 2}
+            assert all(
+                any(track in batch for batch in batch_tracks) for track in tracks
+            )
+
+    @pytest.mark.usefixtures("_tmp_add_config")
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    def test_invalid_batch_size(self, tmp_session, batch_size):
+        """The batch size must be at least 1."""
+        with pytest.raises(ValueError, match="batch size"):
+            moe.add.add_items(tmp_session, [track_factory()], batch_size=batch_size)
+
+    def test_error(self, tmp_config, tmp_session, caplog):
+        """Items that fail to be added are logged, and the rest are still added."""
+        tmp_config(
+            "default_plugins = ['add']",
+            extra_plugins=[ExtraPlugin(ErrorPlugin, "error_plugin")],
+            tmp_db=True,
+        )
+        tracks = [track_factory() for _ in range(5)]
+        error_track = tracks[2] = track_factory(title="error")  # in the middle batch
+
+        added_items, failed_items = moe.add.add_items(tmp_session, tracks, batch_size=2)
+
+        assert added_items == [track for track in tracks if track != error_track]
+        assert failed_items == [error_track]
+        db_tracks = tmp_session.query(Track).all()
+        assert len(db_tracks) == len(added_items)
+        assert error_track not in db_tracks
+        assert str(error_track.path) in caplog.text
+
+    @pytest.mark.usefixtures("_tmp_skip_config")
+    def test_skip(self, tmp_session):
+        """Items skipped during `pre_add` aren't added."""
+        track = track_factory()
+        skipped_track = track_factory(title="skip")
+
+        added_items, failed_items = moe.add.add_items(
+            tmp_session, [skipped_track, track]
+        )
+
+        assert added_items == [track]
+        assert not failed_items
+        assert tmp_session.query(Track).one() == track
+
+    @pytest.mark.usefixtures("_tmp_add_config")
+    def test_duplicate_list_field_tracks(self, tmp_session):
+        """Duplicate list fields don't error when added in the same batch."""
+        tracks = [track_factory(genres={"pop"}), track_factory(genres={"pop"})]
+
+        moe.add.add_items(tmp_session, tracks)
+
+        assert [track.genre for track in tmp_session.query(Track)] == ["pop", "pop"]
+
+
 class TestHookSpecs:
     """Test the various hook specifications."""
 
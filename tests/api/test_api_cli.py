@@ -0,0 +1,86 @@
+"""Tests the ``api`` cli plugin."""
+
+from unittest.mock import patch
+
+import pytest
+
+import moe.cli
+from moe import config
+
+
+@pytest.fixture
+def _tmp_api_config(tmp_config):
+    """A temporary config for the api plugin with the cli and a library."""
+    tmp_config(
+        'default_plugins = ["add", "cli", "edit"]\nenable_plugins = ["api"]',
+        init_db=True,
+    )
+
+
+@pytest.mark.usefixtures("_tmp_api_config")
+class TestCommand:
+    """Test the `api` command."""
+
+    def test_serve(self):
+        """Serve the api until stopped."""
+        with patch("moe.plugins.api.api_cli._serve", autospec=True) as mock_serve:
+            moe.cli.main(["api"])
+
+        mock_serve.assert_called_once()
+
+    def test_no_prompts(self):
+        """Requests can't prompt, so other plugins' cli hooks are disabled."""
+        with patch("moe.plugins.api.api_cli._serve", autospec=True):
+            moe.cli.main(["api"])
+
+        assert config.CONFIG.pm.has_plugin("add_core")
+        assert not config.CONFIG.pm.has_plugin("add_cli")
+        assert config.CONFIG.pm.has_plugin("api_cli")
+
+    def test_socket_any_host(self, tmp_config):
+        """Requests over a Unix socket may be sent to any host."""
+        tmp_config(
+            'default_plugins = ["add", "cli"]\nenable_plugins = ["api"]'
+            '\n[api]\nsocket = "moe.sock"\ntoken = "secret"',
+            init_db=True,
+        )
+        with (
+            patch("moe.plugins.api.api_cli._serve", autospec=True),
+            patch("moe.plugins.api.api_cli.Api", autospec=True) as mock_api,
+        ):
+            moe.cli.main(["api"])
+
+        mock_api.assert_called_once_with(workers=4, token="secret", hosts=None)
+
+    def test_unable_to_serve(self):
+        """Exit if the api can't be served, e.g. if the port is in use."""
+        with (
+            patch(
+                "moe.plugins.api.api_cli._serve",
+                autospec=True,
+                side_effect=OSError("Address already in use"),
+            ),
+            pytest.raises(SystemExit) as error,
+        ):
+            moe.cli.main(["api"])
+
+        assert error.value.code != 0
+
+
+class TestPluginRegistration:
+    """Test the `plugin_registration` hook implementation."""
+
+    def test_no_cli(self, tmp_config):
+        """Don't enable the api cli plugin if the `cli` plugin is not enabled."""
+        config = tmp_config(settings='default_plugins = []\nenable_plugins = ["api"]')
+
+        assert config.pm.has_plugin("api_core")
+        assert not config.pm.has_plugin("api_cli")
+
+    def test_cli(self, tmp_config):
+        """Enable the api cli plugin if the `cli` plugin is enabled."""
+        config = tmp_config(
+            settings='default_plugins = ["cli"]\nenable_plugins = ["api"]'
+        )
+
+        assert config.pm.has_plugin("api_cli")
@@ -0,0 +1,619 @@
+"""Tests the core api of the ``api`` plugin."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from collections.abc import Iterator
+from http import HTTPStatus
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import sqlalchemy as sa
+
+from moe.config import moe_sessionmaker
+from moe.library import Album
+from moe.plugins.api import Api, api_core, start_server
+from moe.write import write_tags
+from tests.conftest import album_factory
+
+
+@pytest.fixture
+def api(tmp_config) -> Iterator[Api]:
+    """A temporary api of a temporary library.
+
+    Yields:
+        The api.
+    """
+    yield from _create_api(tmp_config, ["add", "edit", "remove"])
+
+
+@pytest.fixture
+def write_api(tmp_config) -> Iterator[Api]:
+    """A temporary api of a temporary library that also writes tags.
+
+    Yields:
+        The api.
+    """
+    yield from _create_api(tmp_config, ["add", "write"])
+
+
+@pytest.fixture
+def dup_api(tmp_config) -> Iterator[Api]:
+    """A temporary api of a temporary library that rejects duplicate items.
+
+    Yields:
+        The api.
+    """
+    yield from _create_api(tmp_config, ["add", "duplicate", "write"])
+
+
+def _create_api(tmp_config, default_plugins: list[str]) -> Iterator[Api]:
+    """Creates an api of a temporary library with the given default plugins."""
+    tmp_config(
+        f"default_plugins = {json.dumps(default_plugins)}\nenable_plugins = ['api']",
+        init_db=True,
+    )
+    api = Api(workers=2)
+    yield api
+    api.close()
+
+
+def request(
+    api: Api,
+    method: str,
+    target: str,
+    headers: dict[str, str] | None = None,
+    body: Any = None,
+) -> tuple[HTTPStatus, dict[str, str], Any]:
+    """Sends a request to ``api``.
+
+    Bodies are sent as json.
+
+    Returns:
+        The status, headers, and decoded json body of the response.
+    """
+    if body is not None:
+        headers = {"Content-Type": "application/json", **(headers or {})}
+    response = asyncio.run(
+        api.request(method, target, headers, json.dumps(body).encode() if body else b"")
+    )
+    return (
+        response.status,
+        response.headers,
+        json.loads(response.body) if response.body else None,
+    )
+
+
+def add_albums(*albums: Album) -> list[int]:
+    """Adds albums to the library.
+
+    Returns:
+        The ids of the albums.
+    """
+    with moe_sessionmaker.begin() as session:
+        session.add_all(albums)
+        session.flush()
+        return [album._id for album in albums]  # noqa: SLF001
+
+
+class TestQuery:
+    """Test querying the library."""
+
+    def test_pages(self, api):
+        """Results are paginated."""
+        add_albums(*(album_factory(title=title) for title in ["b", "c", "a"]))
+
+        status, _, page = request(api, "GET", "/items?type=album&limit=2")
+        _, _, next_page = request(
+            api, "GET", f"/items?type=album&limit=2&offset={page['next_offset']}"
+        )
+
+        assert status == HTTPStatus.OK
+        assert [album["title"] for album in page["items"]] == ["a", "b"]
+        assert [album["title"] for album in next_page["items"]] == ["c"]
+        assert next_page["next_offset"] is None
+
+    def test_query(self, api):
+        """Only items matching the query are returned."""
+        add_albums(album_factory(title="a"), album_factory(title="b"))
+
+        _, _, page = request(api, "GET", "/items?type=track&query=a:title:b")
+
+        assert page["items"]
+        assert {track["album_id"] for track in page["items"]} == {
+            page["items"][0]["album_id"]
+        }
+        assert all(track["title"] for track in page["items"])
+
+    def test_order_by(self, api):
+        """Items can be ordered by any fields."""
+        add_albums(*(album_factory(title=title) for title in ["b", "c", "a"]))
+
+        _, _, page = request(api, "GET", "/items?type=album&order_by=-title")
+
+        assert [album["title"] for album in page["items"]] == ["c", "b", "a"]
+
+    @pytest.mark.parametrize(
+        "params",
+        ["query=bad", "type=bad", "limit=0", "limit=100000", "offset=-1", "limit=a"],
+    )
+    def test_bad_request(self, api, params):
+        """Invalid queries or parameters are a bad request."""
+        status, _, body = request(api, "GET", f"/items?{params}")
+
+        assert status == HTTPStatus.BAD_REQUEST
+        assert body["error"]
+
+
+class TestETag:
+    """Test caching query results."""
+
+    def test_not_modified(self, api):
+        """Don't query the library again if the client's results are up to date."""
+        add_albums(album_factory())
+        _, headers, _ = request(api, "GET", "/items")
+
+        status, not_modified_headers, body = request(
+            api, "GET", "/items", {"If-None-Match": headers["ETag"]}
+        )
+
+        assert status == HTTPStatus.NOT_MODIFIED
+        assert not_modified_headers["ETag"] == headers["ETag"]
+        assert body is None
+
+    def test_changed(self, api):
+        """The results are no longer cached once the library changes."""
+        (album_id,) = add_albums(album_factory())
+        _, headers, _ = request(api, "GET", "/items")
+
+        with moe_sessionmaker.begin() as session:
+            session.get(Album, album_id).title = "changed"
+        status, changed_headers, _ = request(
+            api, "GET", "/items", {"If-None-Match": headers["ETag"]}
+        )
+
+        assert status == HTTPStatus.OK
+        assert changed_headers["ETag"] != headers["ETag"]
+
+    def test_api_changes(self, api):
+        """Changes made through the api also change the results."""
+        (album_id,) = add_albums(album_factory())
+        _, headers, _ = request(api, "GET", "/items")
+
+        request(api, "PATCH", f"/items/album/{album_id}", body={"title": "new"})
+
+        _, changed_headers, _ = request(api, "GET", "/items")
+        assert changed_headers["ETag"] != headers["ETag"]
+
+
+class TestItem:
+    """Test getting, editing, and removing items."""
+
+    def test_get_album(self, api):
+        """Albums include their tracks and extras."""
+        album = album_factory()
+        title, path, date = album.title, str(album.path), album.date.isoformat()
+        num_tracks, num_extras = len(album.tracks), len(album.extras)
+        (album_id,) = add_albums(album)
+
+        status, _, album_dict = request(api, "GET", f"/items/album/{album_id}")
+
+        assert status == HTTPStatus.OK
+        assert album_dict["title"] == title
+        assert album_dict["path"] == path
+        assert album_dict["date"] == date
+        assert len(album_dict["tracks"]) == num_tracks
+        assert len(album_dict["extras"]) == num_extras
+
+    def test_get_track(self, api):
+        """Tracks refer to their album."""
+        (album_id,) = add_albums(album_factory())
+        _, _, album_dict = request(api, "GET", f"/items/album/{album_id}")
+        track_id = album_dict["tracks"][0]["id"]
+
+        _, _, track_dict = request(api, "GET", f"/items/track/{track_id}")
+
+        assert track_dict == album_dict["tracks"][0]
+        assert track_dict["album_id"] == album_id
+
+    @pytest.mark.parametrize("target", ["/items/album/1", "/items/bad/1", "/bad"])
+    def test_not_found(self, api, target):
+        """Missing items or unknown routes aren't found."""
+        status, _, _ = request(api, "GET", target)
+
+        assert status == HTTPStatus.NOT_FOUND
+
+    def test_method_not_allowed(self, api):
+        """Only supported methods are allowed."""
+        status, _, _ = request(api, "PUT", "/items")
+
+        assert status == HTTPStatus.METHOD_NOT_ALLOWED
+
+    def test_edit(self, api):
+        """Items can be edited."""
+        (album_id,) = add_albums(album_factory())
+
+        status, _, album_dict = request(
+            api,
+            "PATCH",
+            f"/items/album/{album_id}",
+            body={"title": "new", "catalog_nums": ["1", "2"]},
+        )
+
+        assert status == HTTPStatus.OK
+        assert album_dict["title"] == "new"
+        assert album_dict["catalog_nums"] == ["1", "2"]
+        with moe_sessionmaker.begin() as session:
+            assert session.get(Album, album_id).title == "new"
+
+    def test_edit_invalid_field(self, api):
+        """Nothing is edited if any field is invalid."""
+        (album_id,) = add_albums(album_factory(title="old"))
+
+        status, _, _ = request(
+            api,
+            "PATCH",
+            f"/items/album/{album_id}",
+            body={"title": "new", "bad field": "value"},
+        )
+
+        assert status == HTTPStatus.BAD_REQUEST
+        with moe_sessionmaker.begin() as session:
+            assert session.get(Album, album_id).title == "old"
+
+    def test_edit_clear(self, api):
+        """Fields set to null are cleared, and custom fields are removed."""
+        (album_id,) = add_albums(
+            album_factory(label="label", catalog_nums={"1"}, my_field="value")
+        )
+
+        status, _, album_dict = request(
+            api,
+            "PATCH",
+            f"/items/album/{album_id}",
+            body={"label": None, "catalog_num": None, "my_field": None},
+        )
+
+        assert status == HTTPStatus.OK
+        assert album_dict["label"] is None
+        assert album_dict["catalog_nums"] is None
+        assert "my_field" not in album_dict
+        with moe_sessionmaker.begin() as session:
+            album = session.get(Album, album_id)
+            assert album.label is None
+            assert "my_field" not in album.custom
+
+    @pytest.mark.parametrize("field", ["title", "path", "tracks", "bad field"])
+    def test_edit_clear_invalid(self, api, field):
+        """Required fields, or those that aren't editable, can't be cleared."""
+        (album_id,) = add_albums(album_factory(title="old"))
+
+        status, _, _ = request(
+            api, "PATCH", f"/items/album/{album_id}", body={field: None}
+        )
+
+        assert status == HTTPStatus.BAD_REQUEST
+        with moe_sessionmaker.begin() as session:
+            assert session.get(Album, album_id).title == "old"
+
+    @pytest.mark.parametrize("value", [True, {"a": "b"}, ["a", 1], [["a"]]])
+    def test_edit_unsupported_value(self, api, value):
+        """Values must be strings, numbers, or lists of strings."""
+        (album_id,) = add_albums(album_factory(title="old"))
+
+        status, _, body = request(
+            api, "PATCH", f"/items/album/{album_id}", body={"title": value}
+        )
+
+        assert status == HTTPStatus.BAD_REQUEST
+        assert "Unsupported value" in body["error"]
+
+    def test_content_type(self, api):
+        """Bodies must be sent as json."""
+        (album_id,) = add_albums(album_factory())
+
+        status, _, _ = request(
+            api,
+            "PATCH",
+            f"/items/album/{album_id}",
+            {"Content-Type": "application/x-www-form-urlencoded"},
+            body={"title": "new"},
+        )
+
+        assert status == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+
+    def test_invalid_body(self, api):
+        """The body of an edit must be a json object."""
+        (album_id,) = add_albums(album_factory())
+
+        status, _, _ = request(api, "PATCH", f"/items/album/{album_id}", body=["a"])
+
+        assert status == HTTPStatus.BAD_REQUEST
+
+    def test_remove(self, api):
+        """Items can be removed."""
+        (album_id,) = add_albums(album_factory())
+
+        status, _, _ = request(api, "DELETE", f"/items/album/{album_id}")
+
+        assert status == HTTPStatus.NO_CONTENT
+        assert request(api, "GET", f"/items/album/{album_id}")[0] == (
+            HTTPStatus.NOT_FOUND
+        )
+
+
+class TestAdd:
+    """Test adding items to the library."""
+
+    def test_album(self, write_api):
+        """Directories are added as albums."""
+        album = album_factory(exists=True, num_tracks=3)
+        for track in album.tracks:
+            write_tags(track)
+
+        status, _, album_dict = request(
+            write_api, "POST", "/items", body={"path": str(album.path)}
+        )
+
+        assert status == HTTPStatus.CREATED
+        assert album_dict["title"] == album.title
+        assert len(album_dict["tracks"]) == 3  # noqa: PLR2004
+        _, _, page = request(write_api, "GET", "/items?type=album")
+        assert [album["id"] for album in page["items"]] == [album_dict["id"]]
+
+    @pytest.mark.filterwarnings("ignore::pluggy.PluggyTeardownRaisedWarning")
+    def test_duplicate(self, dup_api):
+        """Adding an item that's already in the library is a conflict."""
+        album = album_factory(exists=True)
+        for track in album.tracks:
+            write_tags(track)
+        request(dup_api, "POST", "/items", body={"path": str(album.path)})
+
+        status, _, body = request(
+            dup_api, "POST", "/items", body={"path": str(album.path)}
+        )
+
+        assert status == HTTPStatus.CONFLICT
+        assert body["error"]
+
+    def test_content_type(self, api, tmp_path):
+        """Bodies must be sent as json."""
+        status, _, _ = request(
+            api,
+            "POST",
+            "/items",
+            {"Content-Type": "text/plain"},
+            body={"path": str(tmp_path)},
+        )
+
+        assert status == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+
+    def test_path_not_found(self, api, tmp_path):
+        """Paths that don't exist can't be added."""
+        status, _, _ = request(
+            api, "POST", "/items", body={"path": str(tmp_path / "missing")}
+        )
+
+        assert status == HTTPStatus.BAD_REQUEST
+
+    def test_extra_requires_album(self, api, tmp_path):
+        """Extras can only be added to an album."""
+        extra_path = tmp_path / "cover.jpg"
+        extra_path.touch()
+
+        status, _, _ = request(api, "POST", "/items", body={"path": str(extra_path)})
+
+        assert status == HTTPStatus.BAD_REQUEST
+
+
+class TestErrors:
+    """Test handling unexpected errors."""
+
+    def test_internal_error(self, api, caplog):
+        """Unexpected errors are logged, and returned as an internal server error."""
+        with patch.object(
+            api_core, "_get_item", autospec=True, side_effect=RuntimeError("oops")
+        ):
+            status, _, body = request(api, "GET", "/items/album/1")
+
+        assert status == HTTPStatus.INTERNAL_SERVER_ERROR
+        assert body["error"]
+        assert "oops" not in body["error"]
+        assert any(record.exc_info for record in caplog.records)
+
+    def test_locked(self, api):
+        """Requests fail as unavailable if the library is locked for too long."""
+        locked_error = sa.exc.OperationalError(
+            "UPDATE", {}, sqlite3.OperationalError("database is locked")
+        )
+        with patch.object(
+            api_core, "_edit_item", autospec=True, side_effect=locked_error
+        ):
+            status, headers, body = request(
+                api, "PATCH", "/items/album/1", body={"title": "new"}
+            )
+
+        assert status == HTTPStatus.SERVICE_UNAVAILABLE
+        assert headers["Retry-After"]
+        assert body["error"]
+
+    def test_serialized_writes(self, api):
+        """Requests that write to the library are handled one at a time."""
+        running = threading.Lock()
+
+        def edit_item(*_):
+            assert running.acquire(blocking=False)
+            threading.Event().wait(0.05)
+            running.release()
+            return {}
+
+        async def edit_items():
+            return await asyncio.gather(
+                api.request(
+                    "PATCH",
+                    "/items/album/1",
+                    {"Content-Type": "application/json"},
+                    b"{}",
+                ),
+                api.request("DELETE", "/items/album/1"),
+            )
+
+        with (
+            patch.object(api_core, "_edit_item", side_effect=edit_item),
+            patch.object(api_core, "_remove_item", side_effect=edit_item),
+        ):
+            responses = asyncio.run(edit_items())
+
+        assert [response.status for response in responses] == [
+            HTTPStatus.OK,
+            HTTPStatus.NO_CONTENT,
+        ]
+
+
+class TestAuthorization:
+    """Test refusing unauthorized requests."""
+
+    @pytest.mark.parametrize("host", ["localhost", "127.0.0.1:8338", "[::1]:8338"])
+    def test_local_host(self, api, host):
+        """Requests may be sent to the local host."""
+        status, _, _ = request(api, "GET", "/items", {"Host": host})
+
+        assert status == HTTPStatus.OK
+
+    def test_other_host(self, api):
+        """Requests sent to other hosts, e.g. through DNS rebinding, are refused."""
+        status, _, _ = request(api, "GET", "/items", {"Host": "evil.example:8338"})
+
+        assert status == HTTPStatus.FORBIDDEN
+
+    def test_any_host(self, api):
+        """Any host may be allowed, e.g. for a Unix socket."""
+        any_host_api = Api(workers=1, hosts=None)
+        try:
+            status, _, _ = request(any_host_api, "GET", "/items", {"Host": "moe"})
+        finally:
+            any_host_api.close()
+
+        assert status == HTTPStatus.OK
+
+    @pytest.mark.parametrize(
+        "headers", [{}, {"Authorization": "Bearer wrong"}, {"Authorization": "secret"}]
+    )
+    def test_token_required(self, api, headers):
+        """Requests without the token are unauthorized, if one is given."""
+        token_api = Api(workers=1, token="secret")
+        try:
+            status, response_headers, _ = request(token_api, "GET", "/items", headers)
+        finally:
+            token_api.close()
+
+        assert status == HTTPStatus.UNAUTHORIZED
+        assert response_headers["WWW-Authenticate"] == "Bearer"
+
+    def test_token(self, api):
+        """Requests with the token are authorized."""
+        token_api = Api(workers=1, token="secret")
+        try:
+            status, _, _ = request(
+                token_api, "GET", "/items", {"Authorization": "Bearer secret"}
+            )
+        finally:
+            token_api.close()
+
+        assert status == HTTPStatus.OK
+
+
+class TestServer:
+    """Test serving the api over HTTP."""
+
+    def test_requests(self, api):
+        """The api is served over HTTP, with keep-alive connections."""
+        add_albums(album_factory())
+
+        async def get_items() -> list[bytes]:
+            server = await start_server(api, "127.0.0.1", 0)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                responses = []
+                for _ in range(2):
+                    writer.write(
+                        b"GET /items?type=album HTTP/1.1\r\nHost: localhost\r\n\r\n"
+                    )
+                    responses.append(await _read_response(reader))
+                writer.close()
+                await writer.wait_closed()
+
+            return responses
+
+        responses = asyncio.run(get_items())
+
+        for response in responses:
+            assert len(json.loads(response)["items"]) == 1
+
+    def test_bad_request(self, api):
+        """Malformed requests are a bad request."""
+
+        async def send_bad_request() -> bytes:
+            server = await start_server(api, "127.0.0.1", 0)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(b"GARBAGE\r\n\r\n")
+                status_line = await reader.readline()
+                writer.close()
+                await writer.wait_closed()
+
+            return status_line
+
+        assert asyncio.run(send_bad_request()).startswith(b"HTTP/1.1 400")
+
+    def test_negative_content_length(self, api):
+        """Negative content lengths are a bad request."""
+
+        async def send_request() -> bytes:
+            server = await start_server(api, "127.0.0.1", 0)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(b"POST /items HTTP/1.1\r\nContent-Length: -1\r\n\r\n")
+                status_line = await reader.readline()
+                writer.close()
+                await writer.wait_closed()
+
+            return status_line
+
+        assert asyncio.run(send_request()).startswith(b"HTTP/1.1 400")
+
+    def test_idle_timeout(self, api):
+        """Idle connections are closed."""
+
+        async def wait_for_close() -> bytes:
+            server = await start_server(api, "127.0.0.1", 0)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                data = await asyncio.wait_for(reader.read(), 5)
+                writer.close()
+                await writer.wait_closed()
+
+            return data
+
+        with patch.object(api_core, "READ_TIMEOUT", 0.01):
+            assert asyncio.run(wait_for_close()) == b""
+
+
+async def _read_response(reader: asyncio.StreamReader) -> bytes:
+    """Reads the body of an HTTP response."""
+    status_line = await reader.readline()
+    assert status_line.startswith(b"HTTP/1.1 200")
+
+    content_length = 0
+    while (line := await reader.readline()) != b"\r\n":
+        name, value = line.decode().split(":", 1)
+        if name.lower() == "content-length":
+            content_length = int(value)
+
+    return await reader.readexactly(content_length)
@@ -199,6 +199,7 @@ def track_factory(
         else:
             shutil.copyfile(EMPTY_MP3_FILE, track.path)
         moe.write.write_tags(track)
+        track.refresh_audio_properties(force=True)
 
     return track
 
@@ -0,0 +1,67 @@
+"""Tests the ``db`` plugin cli."""
+
+from unittest.mock import ANY, patch
+
+import pytest
+
+import moe.cli
+from moe.query import QueryError
+
+
+@pytest.fixture
+def mock_analyze():
+    """Mock the `analyze_db()` api call."""
+    with patch("moe.db.analyze_db", autospec=True) as mock_analyze:
+        yield mock_analyze
+
+
+@pytest.fixture
+def mock_find_scans():
+    """Mock the `find_scans()` api call."""
+    with patch("moe.db.find_scans", autospec=True) as mock_find_scans:
+        mock_find_scans.return_value = []
+        yield mock_find_scans
+
+
+@pytest.fixture
+def _tmp_db_config(tmp_config):
+    """A temporary config for the db plugin with the cli."""
+    tmp_config('default_plugins = ["cli", "db"]')
+
+
+@pytest.mark.usefixtures("_tmp_db_config")
+class TestAnalyzeCommand:
+    """Test the `db analyze` command."""
+
+    def test_analyze(self, capsys, mock_analyze, mock_find_scans):
+        """Analyze the database and check the default query terms."""
+        moe.cli.main(["db", "analyze"])
+
+        mock_analyze.assert_called_once_with(ANY)
+        mock_find_scans.assert_called_once_with(ANY, None)
+        assert "No query terms scan the library." in capsys.readouterr().out
+
+    def test_terms(self, capsys, mock_analyze, mock_find_scans):
+        """Report any given query terms that scan the library."""
+        mock_find_scans.return_value = ["t:genre:pop"]
+
+        moe.cli.main(["db", "analyze", "t:genre:pop", "a:artist:a"])
+
+        mock_find_scans.assert_called_once_with(ANY, ["t:genre:pop", "a:artist:a"])
+        assert "\tt:genre:pop" in capsys.readouterr().out
+
+    def test_invalid_term(self, mock_analyze, mock_find_scans):
+        """Exit with non-zero code if a query term is invalid."""
+        mock_find_scans.side_effect = QueryError
+
+        with pytest.raises(SystemExit) as error:
+            moe.cli.main(["db", "analyze", "bad"])
+
+        assert error.value.code != 0
+
+    def test_subcommand_required(self):
+        """A db subcommand must be given."""
+        with pytest.raises(SystemExit) as error:
+            moe.cli.main(["db"])
+
+        assert error.value.code != 0
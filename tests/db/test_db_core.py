@@ -0,0 +1,94 @@
+"""Tests the core api for maintaining and inspecting the database."""
+
+import pytest
+import sqlalchemy as sa
+
+from moe import db
+from moe.config import moe_sessionmaker
+from moe.query import QueryError, QueryType
+from tests.conftest import album_factory
+
+
+class TestAnalyzeDB:
+    """Test `analyze_db()`."""
+
+    def test_analyze(self, tmp_session):
+        """Statistics are gathered for the library tables."""
+        tmp_session.add(album_factory())
+        tmp_session.flush()
+
+        db.analyze_db(tmp_session)
+
+        stat_tables = tmp_session.execute(
+            sa.text("SELECT DISTINCT tbl FROM sqlite_stat1")
+        ).scalars()
+        assert {"album", "track"} <= set(stat_tables)
+
+
+class TestExplainQuery:
+    """Test `explain_query()`."""
+
+    def test_indexed_field(self, tmp_session):
+        """String matches on indexed fields search the index."""
+        plan = db.explain_query(tmp_session, "a:artist:beat%", QueryType.ALBUM)
+
+        assert any("USING INDEX ix_album_artist" in step for step in plan)
+
+    def test_path(self, tmp_session):
+        """Paths are searched via their unique index."""
+        plan = db.explain_query(tmp_session, "t:path:/a.mp3", QueryType.TRACK)
+
+        assert not any(step.startswith("SCAN track") for step in plan)
+
+    def test_related_items(self, tmp_session):
+        """Related item terms search by the album id index."""
+        plan = db.explain_query(tmp_session, "t:title:a", QueryType.ALBUM)
+
+        assert any("USING INDEX ix_track__album_id" in step for step in plan)
+
+    def test_multi_value_field(self, tmp_session):
+        """Multi-value fields are searched via their side table's value index."""
+        plan = db.explain_query(tmp_session, "t:genre:jazz", QueryType.TRACK)
+
+        assert any("USING INDEX ix_track_genres_value" in step for step in plan)
+
+    def test_indexed_custom_field(self, tmp_config):
+        """Indexed custom fields are searched via their side table's index."""
+        tmp_config(
+            "default_plugins = []\nindexed_fields = {album = ['blah']}", tmp_db=True
+        )
+
+        with moe_sessionmaker.begin() as session:
+            indexed_plan = db.explain_query(session, "a:blah:a", QueryType.ALBUM)
+            other_plan = db.explain_query(session, "a:other:a", QueryType.ALBUM)
+
+        assert any("ix_album_custom_field_value" in step for step in indexed_plan)
+        assert "SCAN album" in other_plan
+
+    def test_invalid_query(self, tmp_session):
+        """Raise a QueryError if the query is invalid."""
+        with pytest.raises(QueryError):
+            db.explain_query(tmp_session, "bad_term", QueryType.TRACK)
+
+
+class TestFindScans:
+    """Test `find_scans()`."""
+
+    def test_default_terms(self, tmp_session):
+        """Check a term for every field by default."""
+        scanned_terms = db.find_scans(tmp_session)
+
+        assert "t:track_num:a" in scanned_terms
+        assert "a:year:a" not in scanned_terms  # not a database column
+        assert "a:artist:a" not in scanned_terms
+        assert "t:title:a" not in scanned_terms
+        assert "e:path:a" not in scanned_terms
+
+    def test_given_terms(self, tmp_session):
+        """Each term is checked against its own item type."""
+        scanned_terms = db.find_scans(
+            tmp_session,
+            ["a:title:a", "e:blah:a", "a:date:2000..2001", "a:date:2000-01"],
+        )
+
+        assert scanned_terms == ["e:blah:a"]
@@ -11,6 +11,7 @@ import pytest
 import moe
 from moe import config, remove
 from moe.config import ExtraPlugin
+from moe.duplicate import get_duplicates
 from moe.library import Album, Extra, Track
 from tests.conftest import album_factory, extra_factory, track_factory
 
@@ -35,6 +36,34 @@ class DuplicatePlugin:
             item_a.path = Path("/")
 
 
+class TitleKeyPlugin:
+    """Test plugin considering tracks with the same title duplicates."""
+
+    @staticmethod
+    @moe.hookimpl
+    def is_unique_track(track, other):
+        """Tracks with the same title aren't unique."""
+        return track.title != other.title
+
+    @staticmethod
+    @moe.hookimpl
+    def get_unique_keys(item):
+        """Tracks with the same title are potential duplicates."""
+        if isinstance(item, Track):
+            return [{"title": item.title}]
+        return []
+
+
+class TitlePlugin:
+    """Test plugin considering tracks with the same title duplicates, without keys."""
+
+    @staticmethod
+    @moe.hookimpl
+    def is_unique_track(track, other):
+        """Tracks with the same title aren't unique."""
+        return track.title != other.title
+
+
 @pytest.fixture
 def _tmp_dup_config(tmp_config):
     """Tempory config enabling the cli and duplicate plugins."""
@@ -195,3 +224,75 @@ class TestEditNewItems:
         mock_resolve_duplicates.assert_any_call(mock_session, [extra])
         mock_resolve_duplicates.assert_any_call(mock_session, [track])
         assert mock_resolve_duplicates.call_count == num_dup_albums
+
+
+class TestGetDuplicates:
+    """Test ``get_duplicates()``."""
+
+    @pytest.fixture
+    def _tmp_get_dup_config(self, tmp_config):
+        """Temporary config with the duplicate plugin and library."""
+        tmp_config("default_plugins = ['duplicate']", tmp_db=True)
+
+    @pytest.mark.usefixtures("_tmp_get_dup_config")
+    def test_library_path(self, tmp_session):
+        """Items with the same path as an item in the library are duplicates."""
+        album = album_factory()
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        dup_album = album_factory(path=album.path)
+
+        assert get_duplicates(tmp_session, dup_album) == [album]
+
+    @pytest.mark.usefixtures("_tmp_get_dup_config")
+    def test_library_track_num(self, tmp_session):
+        """Tracks with the same album, disc, and track number are duplicates."""
+        album = album_factory(num_tracks=2)
+        tmp_session.add(album)
+        tmp_session.flush()
+        track = album.tracks[0]
+
+        dup_track = track_factory(
+            album=album,
+            path=album.path / "dup.mp3",
+            disc=track.disc,
+            track_num=track.track_num,
+        )
+
+        assert get_duplicates(tmp_session, dup_track) == [track]
+        album.tracks.remove(dup_track)  # don't add the duplicate to the library
+
+    @pytest.mark.usefixtures("_tmp_get_dup_config")
+    def test_library_unique(self, tmp_session):
+        """Items that don't share a unique key with any item aren't duplicates."""
+        tmp_session.add(album_factory())
+        tmp_session.flush()
+
+        assert not get_duplicates(tmp_session, album_factory())
+
+    @pytest.mark.usefixtures("_tmp_get_dup_config")
+    def test_others(self):
+        """Items can be compared against the given items instead of the library."""
+        track = track_factory()
+        others = [track_factory(), track_factory(path=track.path), track_factory()]
+
+        assert get_duplicates(MagicMock(), track, others) == [others[1]]
+
+    @pytest.mark.parametrize("plugin", [TitleKeyPlugin, TitlePlugin])
+    def test_plugin_uniqueness(self, tmp_config, tmp_session, plugin):
+        """Plugins' uniqueness conditions are used, with or without unique keys."""
+        tmp_config(
+            "default_plugins = ['duplicate']",
+            extra_plugins=[ExtraPlugin(plugin, "title_plugin")],
+            tmp_db=True,
+        )
+        track = track_factory(title="same")
+        tmp_session.add(track)
+        tmp_session.flush()
+
+        dup_track = track_factory(title="same")
+        others = [track_factory(title="other"), track_factory(title="same")]
+
+        assert get_duplicates(tmp_session, dup_track) == [track]
+        assert get_duplicates(tmp_session, dup_track, others) == [others[1]]
@@ -51,7 +51,7 @@ class TestCommand:
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.TRACK)
+        mock_query.assert_called_once_with(ANY, "*", QueryType.TRACK, load=ANY)
         mock_edit.assert_called_once_with(track, "track_num", "3", create_field=False)
 
     def test_album(self, mock_query, mock_edit):
@@ -62,7 +62,7 @@ class TestCommand:
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.ALBUM)
+        mock_query.assert_called_once_with(ANY, "*", QueryType.ALBUM, load=ANY)
         mock_edit.assert_called_once_with(album, "title", "edit", create_field=False)
 
     def test_extra(self, mock_query, mock_edit):
@@ -73,7 +73,7 @@ class TestCommand:
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.EXTRA)
+        mock_query.assert_called_once_with(ANY, "*", QueryType.EXTRA, load=ANY)
         mock_edit.assert_called_once_with(extra, "title", "edit", create_field=False)
 
     def test_multiple_items(self, mock_query, mock_edit):
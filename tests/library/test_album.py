@@ -1,9 +1,13 @@
 """Tests an Album object."""
 
 import datetime
+import threading
 from datetime import date
 from pathlib import Path
+from typing import ClassVar
+from unittest.mock import patch
 
+import mediafile
 import pytest
 
 import moe
@@ -33,6 +37,28 @@ class MyAlbumPlugin:
             return False
 
 
+class MyClassifierPlugin:
+    """Plugin that classifies every file as an extra."""
+
+    @staticmethod
+    @moe.hookimpl
+    def is_track_file(path):
+        """No files are track files."""
+        return False
+
+
+class MyThreadPlugin:
+    """Plugin that records which threads read tags on."""
+
+    thread_ids: ClassVar[set[int]] = set()
+
+    @staticmethod
+    @moe.hookimpl
+    def read_custom_tags(track_path, album_fields, track_fields):
+        """Record the current thread."""
+        MyThreadPlugin.thread_ids.add(threading.get_ident())
+
+
 class TestHooks:
     """Test album hooks."""
 
@@ -418,6 +444,66 @@ class TestFromDir:
         assert album.get_track(track1.track_num, track1.disc)
         assert album.get_track(track2.track_num, track2.disc)
 
+    def test_extras_not_parsed(self, tmp_config):
+        """Extras are classified without parsing them as track files."""
+        tmp_config()
+        album = album_factory(exists=True)
+
+        with patch(
+            "moe.library.track.mediafile.MediaFile", wraps=mediafile.MediaFile
+        ) as mock_mediafile:
+            Album.from_dir(album.path)
+
+        parsed_paths = {call.args[0] for call in mock_mediafile.call_args_list}
+        assert parsed_paths == {track.path for track in album.tracks}
+
+    def test_is_track_file_hook(self, tmp_config):
+        """Plugins can classify files before they are read."""
+        tmp_config(extra_plugins=[ExtraPlugin(MyClassifierPlugin, "classifier")])
+        album = album_factory(exists=True)
+
+        with pytest.raises(AlbumError):
+            Album.from_dir(album.path)
+
+    def test_read_threads(self, tmp_config):
+        """Reading track files concurrently creates the same album as serially."""
+        tmp_config()
+        album = album_factory(exists=True, num_tracks=8, num_extras=3)
+        serial_album = Album.from_dir(album.path)
+
+        tmp_config(settings="read_threads = 4")
+        threaded_album = Album.from_dir(album.path)
+
+        assert threaded_album == serial_album
+        assert [track.path for track in threaded_album.tracks] == [
+            track.path for track in serial_album.tracks
+        ]
+        assert [extra.path for extra in threaded_album.extras] == [
+            extra.path for extra in serial_album.extras
+        ]
+
+    def test_read_threads_hooks(self, tmp_config):
+        """Tag reading hooks are called on the calling thread."""
+        tmp_config(
+            settings="read_threads = 4",
+            extra_plugins=[ExtraPlugin(MyThreadPlugin, "thread_plugin")],
+        )
+        MyThreadPlugin.thread_ids.clear()
+        album = album_factory(exists=True, num_tracks=8)
+
+        Album.from_dir(album.path)
+
+        assert MyThreadPlugin.thread_ids == {threading.get_ident()}
+
+    def test_read_threads_no_valid_tracks(self, tmp_config, tmp_path):
+        """Error if no valid tracks are found when reading concurrently."""
+        tmp_config(settings="read_threads = 4")
+        (tmp_path / "extra.txt").touch()
+        (tmp_path / "cover.jpg").touch()
+
+        with pytest.raises(AlbumError):
+            Album.from_dir(tmp_path)
+
 
 class TestIsUnique:
     """Test `is_unique()`."""
@@ -1,11 +1,15 @@
 """Test shared library functionality."""
 
+import os
+
 import pytest
+import sqlalchemy as sa
 from sqlalchemy.exc import IntegrityError
 
 import moe
 from moe.config import ExtraPlugin, moe_sessionmaker
-from moe.library import Album, Extra, Track
+from moe.library import Album, Extra, MergeStrategy, Track
+from moe.library.lib_item import get_indexed_fields
 from tests.conftest import album_factory, extra_factory, track_factory
 
 
@@ -19,6 +23,12 @@ class LibItemPlugin:
         for item in items:
             item.custom["changed"] = "edited"
 
+    @staticmethod
+    @moe.hookimpl
+    def index_custom_fields():
+        """Index a custom field."""
+        return {"album": ["plugin_field"]}
+
     @staticmethod
     @moe.hookimpl
     def edit_new_items(session, items):
@@ -234,3 +244,189 @@ class TestPathType:
 
         with pytest.raises(IntegrityError):
             tmp_session.flush()
+
+
+class TestMultiValueTable:
+    """Test the side tables of multi-value fields."""
+
+    def _values(self, session, table_name):
+        """Returns the values of the given side table."""
+        return set(session.scalars(sa.text(f"SELECT value FROM {table_name}")))
+
+    def test_insert(self, tmp_session):
+        """Values are added with their item."""
+        track = track_factory(genres={"jazz", "pop"})
+        tmp_session.add(track)
+        tmp_session.flush()
+
+        assert self._values(tmp_session, "track_genres") == {"jazz", "pop"}
+
+    def test_update(self, tmp_session):
+        """Values are kept in sync with their field."""
+        album = album_factory(catalog_nums={"1"})
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        album.catalog_nums.add("2")
+        tmp_session.flush()
+        album.catalog_nums = None
+        album.tracks[0].artists = {"a", "b"}
+        tmp_session.flush()
+
+        assert not self._values(tmp_session, "album_catalog_nums")
+        assert self._values(tmp_session, "track_artists") == {"a", "b"}
+
+    def test_delete(self, tmp_session):
+        """Values are removed with their item."""
+        track = track_factory(genres={"jazz"})
+        tmp_session.add(track)
+        tmp_session.flush()
+
+        tmp_session.delete(track)
+        tmp_session.flush()
+
+        assert not self._values(tmp_session, "track_genres")
+
+
+class TestIndexedFields:
+    """Test indexing custom fields."""
+
+    def _values(self, session, table_name):
+        """Returns the (field, value) rows of the given side table."""
+        return set(
+            session.execute(sa.text(f"SELECT field, value FROM {table_name}")).tuples()
+        )
+
+    def test_config(self, tmp_config):
+        """Users can index custom fields of each item type."""
+        tmp_config("indexed_fields = {track = ['blah'], extra = ['blah']}", tmp_db=True)
+
+        assert get_indexed_fields() == {
+            "album": set(),
+            "extra": {"blah"},
+            "track": {"blah"},
+        }
+
+    def test_hook(self, tmp_config):
+        """Plugins can index custom fields."""
+        tmp_config(
+            "default_plugins = []",
+            extra_plugins=[ExtraPlugin(LibItemPlugin, "lib_item_test")],
+        )
+
+        assert get_indexed_fields()["album"] == {"plugin_field"}
+
+    def test_values_synced(self, tmp_config):
+        """Only the values of indexed custom fields are kept in sync."""
+        tmp_config(
+            "default_plugins = []\nindexed_fields = {track = ['blah']}", tmp_db=True
+        )
+        track = track_factory(blah=["one", 2], other="three")
+
+        with moe_sessionmaker.begin() as session:
+            session.add(track)
+            session.flush()
+            assert self._values(session, "track_custom") == {
+                ("blah", "one"),
+                ("blah", "2"),
+            }
+
+            track.custom["blah"] = "four"
+            session.flush()
+            assert self._values(session, "track_custom") == {("blah", "four")}
+
+            session.delete(track)
+            session.flush()
+            assert not self._values(session, "track_custom")
+
+    def test_declare_existing(self, tmp_config, tmp_path):
+        """Existing values are indexed when a field is first declared."""
+        tmp_config("default_plugins = []", init_db=True, config_dir=tmp_path)
+        with moe_sessionmaker.begin() as session:
+            session.add(album_factory(blah="one"))
+
+        tmp_config(
+            "default_plugins = []\nindexed_fields = {album = ['blah']}",
+            config_dir=tmp_path,
+            init_db=True,
+        )
+
+        with moe_sessionmaker.begin() as session:
+            assert self._values(session, "album_custom") == {("blah", "one")}
+
+    def test_undeclare(self, tmp_config, tmp_path):
+        """Values are removed when a field is no longer indexed."""
+        tmp_config(
+            "default_plugins = []\nindexed_fields = {album = ['blah']}",
+            config_dir=tmp_path,
+            init_db=True,
+        )
+        with moe_sessionmaker.begin() as session:
+            session.add(album_factory(blah="one"))
+
+        tmp_config("default_plugins = []", init_db=True, config_dir=tmp_path)
+
+        with moe_sessionmaker.begin() as session:
+            assert not self._values(session, "album_custom")
+
+
+class TestFileFingerprint:
+    """Test tracking whether an item's file changed since it was last synced."""
+
+    def test_never_synced(self, tmp_config):
+        """Items that were never synced with their file are changed."""
+        tmp_config()
+        extra = extra_factory(exists=True)
+
+        assert extra.is_file_changed()
+
+    def test_synced(self, tmp_config):
+        """Items are unchanged after syncing with their file."""
+        tmp_config()
+        extra = extra_factory(exists=True)
+
+        extra.set_file_synced()
+
+        assert not extra.is_file_changed()
+
+    def test_file_modified(self, tmp_config):
+        """Items are changed if their file is modified after syncing."""
+        tmp_config()
+        extra = extra_factory(exists=True)
+        extra.set_file_synced()
+
+        extra.path.write_text("modified")
+
+        assert extra.is_file_changed()
+
+    def test_file_replaced(self, tmp_config, tmp_path):
+        """Items are changed if their file is replaced by another file."""
+        tmp_config()
+        extra = extra_factory(exists=True)
+        extra.set_file_synced()
+        stat = extra.path.stat()
+        other_path = tmp_path / "other"
+        other_path.touch()
+        os.utime(other_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        other_path.replace(extra.path)
+
+        assert extra.is_file_changed()
+
+    def test_read_track(self, tmp_config):
+        """Tracks read from their file are synced."""
+        tmp_config()
+        track = track_factory(exists=True)
+
+        assert not Track.from_file(track.path).is_file_changed()
+
+    def test_merge(self, tmp_config):
+        """File fingerprints are merged along with items."""
+        tmp_config()
+        track = track_factory(exists=True)
+        track.path.write_bytes(track.path.read_bytes())
+        assert track.is_file_changed()
+
+        track.merge(Track.from_file(track.path), MergeStrategy.OVERWRITE)
+
+        assert not track.is_file_changed()
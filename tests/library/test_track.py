@@ -1,11 +1,15 @@
 """Tests a Track object."""
 
+from unittest.mock import patch
+
+import mediafile
 import pytest
 
 import moe
 import moe.write as moe_write
+from moe import config
 from moe.config import ExtraPlugin
-from moe.library import MergeStrategy, MetaTrack, Track, TrackError
+from moe.library import MergeStrategy, MetaTrack, Track, TrackError, TrackReadContext
 from moe.library.album import MetaAlbum
 from tests.conftest import album_factory, extra_factory, track_factory
 
@@ -28,6 +32,16 @@ class MyTrackPlugin:
         track_fields["title"] = "custom track title"
 
 
+class MyReadContextPlugin:
+    """Plugin that reads tags using the shared read context."""
+
+    @staticmethod
+    @moe.hookimpl
+    def read_custom_tags(track_fields, read_context):
+        """Read a custom field from the already parsed track file."""
+        track_fields["custom_title"] = read_context.audio_file.title
+
+
 class TestHooks:
     """Test track hooks."""
 
@@ -40,6 +54,65 @@ class TestHooks:
         assert not track.is_unique(dup_track)
 
 
+class TestIsTrackFile:
+    """Test the core `is_track_file` hook implementation."""
+
+    def test_track_file(self, tmp_config):
+        """Files with an audio extension and header may be tracks."""
+        tmp_config()
+        track = track_factory(exists=True)
+
+        assert config.CONFIG.pm.hook.is_track_file(path=track.path)
+
+    def test_flac(self, tmp_config):
+        """Flac files may be tracks."""
+        tmp_config()
+        track = track_factory(exists=True, audio_format="flac")
+
+        assert config.CONFIG.pm.hook.is_track_file(path=track.path)
+
+    def test_frame_sync(self, tmp_config, tmp_path):
+        """Untagged mpeg audio files may be tracks."""
+        tmp_config()
+        track_path = tmp_path / "track.mp3"
+        track_path.write_bytes(b"\xff\xfb\x90\x64" + bytes(8))
+
+        assert config.CONFIG.pm.hook.is_track_file(path=track_path)
+
+    def test_extension(self, tmp_config, tmp_path):
+        """Files without an audio extension are not tracks."""
+        tmp_config()
+        log_path = tmp_path / "rip.log"
+        log_path.write_bytes(b"ID3")
+
+        assert not config.CONFIG.pm.hook.is_track_file(path=log_path)
+
+    def test_header(self, tmp_config, tmp_path):
+        """Files with an audio extension but no audio header are not tracks."""
+        tmp_config()
+        track_path = tmp_path / "track.mp3"
+        track_path.write_text("not a track")
+
+        assert not config.CONFIG.pm.hook.is_track_file(path=track_path)
+
+    def test_empty(self, tmp_config, tmp_path):
+        """Empty files are not tracks."""
+        tmp_config()
+        track_path = tmp_path / "track.flac"
+        track_path.touch()
+
+        assert not config.CONFIG.pm.hook.is_track_file(path=track_path)
+
+    def test_config_extensions(self, tmp_config):
+        """Only the configured extensions are considered tracks."""
+        tmp_config(settings="audio_extensions = ['FLAC']")
+        mp3_track = track_factory(exists=True)
+        flac_track = track_factory(exists=True, audio_format="flac")
+
+        assert not config.CONFIG.pm.hook.is_track_file(path=mp3_track.path)
+        assert config.CONFIG.pm.hook.is_track_file(path=flac_track.path)
+
+
 class TestInit:
     """Test Track initialization."""
 
@@ -207,6 +280,33 @@ class TestFromFile:
         assert new_track.album.title == "custom album title"
         assert new_track.title == "custom track title"
 
+    def test_read_context(self, tmp_config):
+        """Plugins can read tags using the shared read context."""
+        tmp_config(
+            extra_plugins=[ExtraPlugin(MyReadContextPlugin, "read_context_plugin")]
+        )
+        track = track_factory(exists=True)
+        new_track = Track.from_file(track.path)
+
+        assert new_track.custom["custom_title"] == track.title
+
+    def test_parse_file_once(self, tmp_config):
+        """The track file is only parsed once regardless of the number of plugins."""
+        tmp_config(
+            extra_plugins=[
+                ExtraPlugin(MyTrackPlugin, "track_plugin"),
+                ExtraPlugin(MyReadContextPlugin, "read_context_plugin"),
+            ]
+        )
+        track = track_factory(exists=True)
+
+        with patch(
+            "moe.library.track.mediafile.MediaFile", wraps=mediafile.MediaFile
+        ) as mock_mediafile:
+            Track.from_file(track.path)
+
+        mock_mediafile.assert_called_once_with(track.path)
+
     def test_missing_artist(self, tmp_config):
         """Raise ValueError if track is missing both an artist and albumartist."""
         tmp_config()
@@ -285,6 +385,62 @@ class TestFromFile:
         assert new_track.album.path == album_path
 
 
+class TestTrackReadContext:
+    """Test the track read context."""
+
+    def test_audio_file_cached(self):
+        """The track file is parsed on first access and then cached."""
+        track = track_factory(exists=True)
+        read_context = TrackReadContext(track.path)
+
+        with patch(
+            "moe.library.track.mediafile.MediaFile", wraps=mediafile.MediaFile
+        ) as mock_mediafile:
+            mock_mediafile.assert_not_called()
+            assert read_context.audio_file is read_context.audio_file
+
+        mock_mediafile.assert_called_once_with(track.path)
+
+    def test_non_track_file(self):
+        """Raise an UnreadableFileError if the file is not a track file."""
+        extra = extra_factory(exists=True)
+
+        with pytest.raises(mediafile.UnreadableFileError):
+            TrackReadContext(extra.path).audio_file  # noqa: B018
+
+    def test_read_tags(self, tmp_config):
+        """Tags are read into the context's album and track fields."""
+        tmp_config()
+        track = track_factory(exists=True)
+        read_context = TrackReadContext(track.path)
+
+        read_context.read_tags()
+
+        assert read_context.album_fields["title"] == track.album.title
+        assert read_context.track_fields["title"] == track.title
+
+    def test_read_tags_non_track_file(self, tmp_config):
+        """Raise a TrackError if the file is not a track file."""
+        tmp_config()
+        extra = extra_factory(exists=True)
+
+        with pytest.raises(TrackError):
+            TrackReadContext(extra.path).read_tags()
+
+    def test_from_file_read_context(self, tmp_config):
+        """Tracks can be created from a context whose tags were already read."""
+        tmp_config()
+        track = track_factory(exists=True)
+        read_context = TrackReadContext(track.path)
+        read_context.read_tags()
+
+        with patch("moe.library.track.mediafile.MediaFile") as mock_mediafile:
+            new_track = Track.from_file(track.path, read_context=read_context)
+
+        mock_mediafile.assert_not_called()
+        assert new_track == track
+
+
 class TestEquality:
     """Test equality of tracks."""
 
@@ -470,6 +626,89 @@ class TestProperties:
         track = track_factory(exists=True)
         assert isinstance(track.duration, float)
 
+    def test_bitrate(self):
+        """We can get the bitrate of a track."""
+        track = track_factory(exists=True)
+
+        assert track.bitrate > 0
+
+
+class TestAudioProperties:
+    """Test the stored audio stream properties of a track."""
+
+    def test_from_file(self, tmp_config):
+        """Audio properties are stored when a track is created from a file."""
+        tmp_config()
+        track = Track.from_file(track_factory(exists=True).path)
+
+        with patch("moe.library.track.mediafile.MediaFile") as mock_mediafile:
+            assert track.audio_format == "mp3"
+            assert track.sample_rate == 44100  # noqa: PLR2004
+
+        mock_mediafile.assert_not_called()
+
+    def test_get_stored(self):
+        """Getting audio properties never reads the track file, even if changed."""
+        track = track_factory(exists=True)
+        with track.path.open("ab") as track_file:
+            track_file.write(b"\0")
+
+        with patch("moe.library.track.mediafile.MediaFile") as mock_mediafile:
+            assert track.audio_format == "mp3"
+            assert track.duration
+
+        mock_mediafile.assert_not_called()
+
+    def test_unchanged_file(self):
+        """Don't read the track file again if it hasn't changed."""
+        track = track_factory(exists=True)
+
+        assert not track.refresh_audio_properties()
+
+    def test_changed_file(self):
+        """Read the track file again if it has changed."""
+        track = track_factory(exists=True)
+
+        with track.path.open("ab") as track_file:
+            track_file.write(b"\0")
+
+        assert track.refresh_audio_properties()
+
+    def test_force(self):
+        """We can force reading the track file."""
+        track = track_factory(exists=True)
+
+        assert track.refresh_audio_properties(force=True)
+
+    def test_file_dne(self):
+        """Use the stored properties if the track file no longer exists."""
+        track = track_factory(exists=True)
+        duration = track.duration
+        track.path.unlink()
+
+        assert track.duration == duration
+
+    def test_merge(self, tmp_config):
+        """Audio properties are merged from other tracks."""
+        tmp_config()
+        track = track_factory(exists=True)
+        new_track = Track.from_file(track.path)
+
+        track.merge(new_track)
+
+        with patch("moe.library.track.mediafile.MediaFile") as mock_mediafile:
+            assert track.duration == new_track.duration
+        mock_mediafile.assert_not_called()
+
+    def test_query(self, tmp_config, tmp_session):
+        """Stored audio properties can be queried."""
+        tmp_config(settings="default_plugins = ['write']")
+        track = track_factory(exists=True)
+        tmp_session.add(track)
+        tmp_session.flush()
+
+        assert tmp_session.query(Track).filter(Track.audio_format == "mp3").one()
+
 
 class TestListDuplicates:
     """List fields should not cause duplicate errors (just merge silently)."""
@@ -27,7 +27,7 @@ def mock_query() -> Iterator[FunctionType]:
     Yields:
         Mock query
     """
-    with patch("moe.move.move_cli.cli_query", autospec=True) as mock_query:
+    with patch("moe.move.move_cli.cli_iter_query", autospec=True) as mock_query:
         yield mock_query
 
 
@@ -50,7 +50,7 @@ class TestCommand:
         moe.cli.main(cli_args)
 
         mock_move.assert_not_called()
-        mock_query.assert_called_once_with(ANY, "*", "album")
+        mock_query.assert_called_once_with(ANY, "*", "album", load=ANY)
 
     def test_move(self, mock_query, mock_move):
         """Test all items in the library are moved when the command is invoked."""
@@ -63,7 +63,7 @@ class TestCommand:
         for album in albums:
             mock_move.assert_any_call(album)
         assert mock_move.call_count == len(albums)
-        mock_query.assert_called_once_with(ANY, "*", "album")
+        mock_query.assert_called_once_with(ANY, "*", "album", load=ANY)
 
 
 class TestPluginRegistration:
@@ -49,7 +49,7 @@ class TestCollectionCommand:
             moe.cli.main(cli_args)
 
         mock_set.assert_called_once_with({"123"})
-        mock_query.assert_called_once_with(ANY, "*", "track")
+        mock_query.assert_called_once_with(ANY, "*", "track", load=ANY)
 
     def test_extra(self, mock_query):
         """Extras associated album's are used."""
@@ -65,7 +65,7 @@ class TestCollectionCommand:
             moe.cli.main(cli_args)
 
         mock_set.assert_called_once_with({"123"})
-        mock_query.assert_called_once_with(ANY, "*", "extra")
+        mock_query.assert_called_once_with(ANY, "*", "extra", load=ANY)
 
     def test_album(self, mock_query):
         """Albums associated releases are used."""
@@ -80,7 +80,7 @@ class TestCollectionCommand:
             moe.cli.main(cli_args)
 
         mock_set.assert_called_once_with({"123"})
-        mock_query.assert_called_once_with(ANY, "*", "album")
+        mock_query.assert_called_once_with(ANY, "*", "album", load=ANY)
 
     def test_remove(self, mock_query):
         """Releases are removed from a collection if `--remove` option used."""
@@ -145,7 +145,7 @@ class TestAddImportPromptChoice:
         mock_album = Mock()
         with (
             patch(
-                "moe.plugins.musicbrainz.mb_cli.questionary.text",
+                "questionary.text",
                 **{"return_value.ask.return_value": "new id"},
             ),
             patch(
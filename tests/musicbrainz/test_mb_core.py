@@ -11,6 +11,7 @@ import tests.resources.musicbrainz as mb_rsrc
 from moe import config
 from moe.config import ConfigValidationError
 from moe.library import Track
+from moe.library.lib_item import get_indexed_fields
 from tests.conftest import album_factory, track_factory
 
 
@@ -324,6 +325,17 @@ class TestCollectionsAutoAdd:
         assert any(record.levelname == "ERROR" for record in caplog.records)
 
 
+class TestIndexCustomFields:
+    """Test the custom fields indexed by the musicbrainz plugin."""
+
+    def test_release_ids(self, mb_config):
+        """Musicbrainz release IDs are indexed."""
+        indexed_fields = get_indexed_fields()
+
+        assert "mb_album_id" in indexed_fields["album"]
+        assert "mb_track_id" in indexed_fields["track"]
+
+
 class TestSyncMetadata:
     """Test the `sync_metadata` hook implementation."""
 
@@ -27,7 +27,7 @@ def mock_query() -> Iterator[FunctionType]:
     Yields:
         Mock query
     """
-    with patch("moe.read.read_cli.cli_query", autospec=True) as mock_query:
+    with patch("moe.read.read_cli.cli_iter_query", autospec=True) as mock_query:
         yield mock_query
 
 
@@ -49,8 +49,8 @@ class TestCommand:
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.TRACK)
-        mock_read.assert_called_once_with(track)
+        mock_query.assert_called_once_with(ANY, "*", QueryType.TRACK, load=ANY)
+        mock_read.assert_called_once_with(track, force=False)
 
     def test_album(self, mock_query, mock_read):
         """Albums are removed from the database with valid query."""
@@ -60,8 +60,8 @@ class TestCommand:
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.ALBUM)
-        mock_read.assert_called_once_with(album)
+        mock_query.assert_called_once_with(ANY, "*", QueryType.ALBUM, load=ANY)
+        mock_read.assert_called_once_with(album, force=False)
 
     def test_multiple_items(self, mock_query, mock_read):
         """We read all items returned from a query."""
@@ -71,9 +71,9 @@ class TestCommand:
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.TRACK)
+        mock_query.assert_called_once_with(ANY, "*", QueryType.TRACK, load=ANY)
         for track in tracks:
-            mock_read.assert_any_call(track)
+            mock_read.assert_any_call(track, force=False)
         assert mock_read.call_count == len(tracks)
 
     def test_file_dne(self, mock_query, mock_read):
@@ -111,6 +111,41 @@ class TestCommand:
 
         mock_rm.assert_called_once_with(ANY, track)
 
+    def test_properties(self, mock_query, mock_read):
+        """Only read audio properties if the properties argument is given."""
+        cli_args = ["read", "--properties", "*"]
+        track = track_factory()
+        mock_query.return_value = [track]
+
+        with patch(
+            "moe.read.read_audio_properties", autospec=True
+        ) as mock_read_properties:
+            moe.cli.main(cli_args)
+
+        mock_read_properties.assert_called_once_with(track)
+        mock_read.assert_not_called()
+
+    def test_force(self, mock_query, mock_read):
+        """Read unchanged items if the force argument is given."""
+        cli_args = ["read", "--force", "*"]
+        track = track_factory()
+        mock_query.return_value = [track]
+
+        moe.cli.main(cli_args)
+
+        mock_read.assert_called_once_with(track, force=True)
+
+    def test_report_skipped(self, capsys, mock_query, mock_read):
+        """Report how many unchanged items were skipped."""
+        cli_args = ["read", "*"]
+        tracks = [track_factory(), track_factory(), track_factory()]
+        mock_query.return_value = tracks
+        mock_read.side_effect = [False, True, False]
+
+        moe.cli.main(cli_args)
+
+        assert "Skipped 2 unchanged item(s)." in capsys.readouterr().out
+
 
 class TestPluginRegistration:
     """Test the `plugin_registration` hook implementation."""
@@ -1,5 +1,8 @@
 """Test read_core."""
 
+from unittest.mock import patch
+
+import mediafile
 import pytest
 
 from moe import read
@@ -13,19 +16,25 @@ def _tmp_read_config(tmp_config):
     tmp_config('default_plugins = ["read", "write"]')
 
 
+def _write_title(track: Track, title: str) -> None:
+    """Changes a track file's title tag outside of Moe."""
+    audio_file = mediafile.MediaFile(track.path)
+    audio_file.title = title
+    audio_file.save()
+
+
 @pytest.mark.usefixtures("_tmp_read_config")
 class TestReadItem:
     """Test read_item()."""
 
     def test_track(self):
         """We can read updates from a track file."""
-        track = track_factory(title="file", exists=True)
-
-        track.title = "changed"
-        assert Track.from_file(track.path).title == "file"
+        track = track_factory(title="db", exists=True)
+        _write_title(track, "file")
 
-        read.read_item(track)
+        assert read.read_item(track)
         assert track.title == "file"
+        assert not track.is_file_changed()
 
     def test_album(self):
         """We can read updates from an album directory."""
@@ -34,10 +43,129 @@ class TestReadItem:
         album.title = "changed"
         assert Album.from_dir(album.path).title == "file"
 
-        read.read_item(album)
+        assert read.read_item(album, force=True)
         assert album.title == "file"
 
+    def test_track_unchanged(self):
+        """Tracks whose file hasn't changed since it was last synced are skipped."""
+        track = track_factory(title="file", exists=True)
+        track.title = "db"
+
+        with patch("moe.library.track.mediafile.MediaFile") as mock_mediafile:
+            assert not read.read_item(track)
+
+        mock_mediafile.assert_not_called()
+        assert track.title == "db"
+
+    def test_track_force(self):
+        """Unchanged tracks are read if forced."""
+        track = track_factory(title="file", exists=True)
+        track.title = "db"
+
+        assert read.read_item(track, force=True)
+        assert track.title == "file"
+
+    def test_album_unchanged(self):
+        """Albums whose files haven't changed since last synced are skipped."""
+        album = album_factory(exists=True)
+        read.read_item(album)  # sync any extras
+        album.title = "db"
+
+        with patch("moe.library.track.mediafile.MediaFile") as mock_mediafile:
+            assert not read.read_item(album)
+
+        mock_mediafile.assert_not_called()
+        assert album.title == "db"
+
+    def test_album_changed_track(self):
+        """Only the changed track files of an album are read."""
+        album = album_factory(exists=True)
+        read.read_item(album)
+        changed_track = album.tracks[0]
+        _write_title(changed_track, "file")
+
+        with patch(
+            "moe.library.track.mediafile.MediaFile", wraps=mediafile.MediaFile
+        ) as mock_mediafile:
+            assert read.read_item(album)
+
+        mock_mediafile.assert_called_once_with(changed_track.path)
+        assert changed_track.title == "file"
+        assert not changed_track.is_file_changed()
+
+    def test_album_new_extra(self):
+        """New extras are added to the album without reading any tracks."""
+        album = album_factory(exists=True)
+        read.read_item(album)
+        extra_path = album.path / "new.log"
+        extra_path.touch()
+
+        with patch("moe.library.track.mediafile.MediaFile") as mock_mediafile:
+            assert read.read_item(album)
+
+        mock_mediafile.assert_not_called()
+        new_extra = album.get_extra(extra_path.relative_to(album.path))
+        assert new_extra
+        assert not new_extra.is_file_changed()
+        assert not read.read_item(album)
+
+    def test_extra(self):
+        """Extras have no tags to read."""
+        album = album_factory(exists=True)
+
+        assert not read.read_item(album.extras[0])
+
     def test_path_dne(self):
         """Raise FileNotFoundError if the item's path does not exist."""
         with pytest.raises(FileNotFoundError):
             read.read_item(track_factory())
+
+
+@pytest.mark.usefixtures("_tmp_read_config")
+class TestReadAudioProperties:
+    """Test read_audio_properties()."""
+
+    def test_track(self):
+        """We can read the audio properties of a track."""
+        track = track_factory(exists=True)
+
+        read.read_audio_properties(track)
+
+        assert not track.refresh_audio_properties()
+
+    def test_album(self):
+        """Read the audio properties of every track in an album."""
+        album = album_factory(exists=True)
+
+        read.read_audio_properties(album)
+
+        for track in album.tracks:
+            assert not track.refresh_audio_properties()
+
+    def test_unsynced_track(self):
+        """Tracks that were never synced are only read once."""
+        track = track_factory(exists=True)
+        track._synced_mtime_ns = None  # noqa: SLF001 simulates a migrated track
+        track._audio_format = None  # noqa: SLF001
+
+        read.read_audio_properties(track)
+        with patch("moe.library.track.mediafile.MediaFile") as mock_mediafile:
+            read.read_audio_properties(track)
+
+        mock_mediafile.assert_not_called()
+        assert track.audio_format == "mp3"
+        assert not track.is_file_changed()
+
+    def test_changed_track(self):
+        """Changed tracks stay changed until their tags are read."""
+        track = track_factory(exists=True)
+        _write_title(track, "new title")
+
+        read.read_audio_properties(track)
+
+        assert track.is_file_changed()
+
+    def test_path_dne(self):
+        """Raise FileNotFoundError if the item's path does not exist."""
+        with pytest.raises(FileNotFoundError):
+            read.read_audio_properties(track_factory())
@@ -49,7 +49,7 @@ class TestCommand:
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.TRACK)
+        mock_query.assert_called_once_with(ANY, "*", QueryType.TRACK, load=ANY)
         mock_rm.assert_called_once_with(ANY, track)
 
     def test_album(self, mock_query, mock_rm):
@@ -60,7 +60,7 @@ class TestCommand:
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.ALBUM)
+        mock_query.assert_called_once_with(ANY, "*", QueryType.ALBUM, load=ANY)
         mock_rm.assert_called_once_with(ANY, album)
 
     def test_extra(self, mock_query, mock_rm):
@@ -71,7 +71,7 @@ class TestCommand:
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.EXTRA)
+        mock_query.assert_called_once_with(ANY, "*", QueryType.EXTRA, load=ANY)
         mock_rm.assert_called_once_with(ANY, extra)
 
     def test_multiple_items(self, mock_query, mock_rm):
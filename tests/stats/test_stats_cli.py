@@ -0,0 +1,106 @@
+"""Tests the ``stats`` plugin cli."""
+
+from unittest.mock import ANY, patch
+
+import pytest
+
+import moe.cli
+from moe.query import QueryError, QueryType
+from moe.stats import Stats
+
+
+@pytest.fixture
+def mock_get_stats():
+    """Mock the `get_stats()` api call."""
+    with patch("moe.stats.get_stats", autospec=True) as mock_get_stats:
+        yield mock_get_stats
+
+
+@pytest.fixture
+def _tmp_stats_config(tmp_config):
+    """A temporary config for the stats plugin with the cli."""
+    tmp_config('default_plugins = ["cli", "stats"]')
+
+
+@pytest.mark.usefixtures("_tmp_stats_config")
+class TestCommand:
+    """Test the `stats` command."""
+
+    def test_totals(self, capsys, mock_get_stats):
+        """Display the totals of all matching items."""
+        mock_get_stats.return_value = [Stats(None, 12, 93784.4, 1_500_000)]
+
+        moe.cli.main(["stats", "*"])
+
+        mock_get_stats.assert_called_once_with(ANY, "*", QueryType.TRACK, group_by=None)
+        assert capsys.readouterr().out == (
+            "Tracks: 12\nDuration: 1 day, 2:03:04\nSize: 1.5 MB\n"
+        )
+
+    def test_extras(self, capsys, mock_get_stats):
+        """Extras are only counted."""
+        mock_get_stats.return_value = [Stats(None, 3, 0, 0)]
+
+        moe.cli.main(["stats", "-e", "*"])
+
+        assert capsys.readouterr().out == "Extras: 3\n"
+
+    def test_group_by(self, capsys, mock_get_stats):
+        """Display the statistics of each group."""
+        mock_get_stats.return_value = [
+            Stats("rock", 2, 120, 999),
+            Stats(None, 1, 60, 2_000_000_000),
+        ]
+
+        moe.cli.main(["stats", "-a", "-g", "genre", "*"])
+
+        mock_get_stats.assert_called_once_with(
+            ANY, "*", QueryType.ALBUM, group_by="genre"
+        )
+        assert capsys.readouterr().out == (
+            "rock: 2 album(s), 0:02:00, 999 B\n(none): 1 album(s), 0:01:00, 2.0 GB\n"
+        )
+
+    def test_unread(self, capsys, caplog, mock_get_stats):
+        """Display the number of unread tracks and how to read them."""
+        mock_get_stats.return_value = [Stats(None, 12, 60, 1000, 2)]
+
+        moe.cli.main(["stats", "*"])
+
+        assert capsys.readouterr().out.endswith("Unread tracks: 2\n")
+        assert "moe read" in caplog.text
+
+    def test_group_by_unread(self, capsys, mock_get_stats):
+        """Display the number of unread tracks in each group."""
+        mock_get_stats.return_value = [Stats("rock", 2, 60, 1000, 1)]
+
+        moe.cli.main(["stats", "-g", "genre", "*"])
+
+        assert capsys.readouterr().out == (
+            "rock: 2 track(s), 0:01:00, 1.0 KB, 1 unread track(s)\n"
+        )
+
+    def test_invalid_query(self, mock_get_stats):
+        """Exit with non-zero code if the query or field is invalid."""
+        mock_get_stats.side_effect = QueryError
+
+        with pytest.raises(SystemExit) as error:
+            moe.cli.main(["stats", "-g", "tracks", "*"])
+
+        assert error.value.code != 0
+
+
+class TestPluginRegistration:
+    """Test the `plugin_registration` hook implementation."""
+
+    def test_no_cli(self, tmp_config):
+        """Don't enable the stats cli plugin if the `cli` plugin is not enabled."""
+        config = tmp_config(settings='default_plugins = ["stats"]')
+
+        assert not config.pm.has_plugin("stats_cli")
+
+    def test_cli(self, tmp_config):
+        """Enable the stats cli plugin if the `cli` plugin is enabled."""
+        config = tmp_config(settings='default_plugins = ["stats", "cli"]')
+
+        assert config.pm.has_plugin("stats_cli")
@@ -0,0 +1,170 @@
+"""Tests the core api for computing statistics about the library."""
+
+import datetime
+
+import pytest
+import sqlalchemy as sa
+
+from moe import stats
+from moe.query import QueryError, QueryType
+from moe.stats import Stats
+from tests.conftest import album_factory, extra_factory, track_factory
+
+
+@pytest.fixture
+def set_audio_properties(tmp_session):
+    """Sets the stored duration and file size of every track in the library."""
+
+    def _set_audio_properties(duration: float, file_size: int):
+        tmp_session.flush()
+        tmp_session.execute(
+            sa.text("UPDATE track SET duration = :duration, synced_size = :file_size"),
+            {"duration": duration, "file_size": file_size},
+        )
+
+    return _set_audio_properties
+
+
+class TestGetStats:
+    """Test `get_stats()`."""
+
+    def test_tracks(self, tmp_session, set_audio_properties):
+        """Count the matching tracks and sum their durations and sizes."""
+        tmp_session.add(album_factory(num_tracks=3))
+        tmp_session.add(album_factory(num_tracks=2, artist="Beatles"))
+        set_audio_properties(60.5, 1000)
+
+        assert stats.get_stats(tmp_session, "*", QueryType.TRACK) == [
+            Stats(None, 5, 302.5, 5000)
+        ]
+        assert stats.get_stats(tmp_session, "a:artist:Beatles", QueryType.TRACK) == [
+            Stats(None, 2, 121, 2000)
+        ]
+
+    def test_albums(self, tmp_session, set_audio_properties):
+        """Albums include the durations and sizes of all their tracks."""
+        tmp_session.add(album_factory(num_tracks=3))
+        tmp_session.add(album_factory(num_tracks=0))
+        set_audio_properties(60, 1000)
+
+        assert stats.get_stats(tmp_session, "*", QueryType.ALBUM) == [
+            Stats(None, 2, 180, 3000)
+        ]
+
+    def test_extras(self, tmp_session):
+        """Extras are counted without a duration or size."""
+        album = album_factory(num_extras=0)
+        extra_factory(album=album)
+        extra_factory(album=album)
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        assert stats.get_stats(tmp_session, "*", QueryType.EXTRA) == [
+            Stats(None, 2, 0, 0)
+        ]
+
+    def test_no_matches(self, tmp_session):
+        """Empty statistics are returned if no items match."""
+        assert stats.get_stats(tmp_session, "*", QueryType.TRACK) == [
+            Stats(None, 0, 0, 0)
+        ]
+
+    def test_missing_properties(self, tmp_session):
+        """Tracks whose audio properties were never read are counted as unread."""
+        tmp_session.add(album_factory(num_tracks=2))
+        tmp_session.add(album_factory(num_tracks=0))
+        tmp_session.flush()
+
+        assert stats.get_stats(tmp_session, "*", QueryType.TRACK) == [
+            Stats(None, 2, 0, 0, 2)
+        ]
+        assert stats.get_stats(tmp_session, "*", QueryType.ALBUM) == [
+            Stats(None, 2, 0, 0, 2)
+        ]
+
+    def test_invalid_query(self, tmp_session):
+        """Raise a QueryError if the query is invalid."""
+        with pytest.raises(QueryError):
+            stats.get_stats(tmp_session, "bad", QueryType.TRACK)
+
+
+class TestGroupBy:
+    """Test grouping the statistics by a field."""
+
+    def test_album_field(self, tmp_session, set_audio_properties):
+        """Tracks can be grouped by a field of their album."""
+        tmp_session.add(album_factory(num_tracks=3, date=datetime.date(2000, 1, 1)))
+        tmp_session.add(
+            album_factory(num_tracks=1, title="a", date=datetime.date(1999, 1, 1))
+        )
+        tmp_session.add(
+            album_factory(num_tracks=1, title="b", date=datetime.date(1999, 2, 2))
+        )
+        set_audio_properties(10, 100)
+
+        assert stats.get_stats(
+            tmp_session, "*", QueryType.TRACK, group_by="a:year"
+        ) == [Stats(2000, 3, 30, 300), Stats(1999, 2, 20, 200)]
+
+    def test_album_type(self, tmp_session, set_audio_properties):
+        """Albums are grouped by their own fields if no type is given."""
+        tmp_session.add(album_factory(num_tracks=2, artist="Beatles"))
+        tmp_session.add(album_factory(num_tracks=1, artist="Beatles"))
+        tmp_session.add(album_factory(num_tracks=1, artist="Outkast"))
+        set_audio_properties(10, 100)
+
+        assert stats.get_stats(
+            tmp_session, "*", QueryType.ALBUM, group_by="artist"
+        ) == [Stats("Beatles", 2, 30, 300), Stats("Outkast", 1, 10, 100)]
+
+    def test_multi_value_field(self, tmp_session):
+        """Items are counted once per value of a multi-value field."""
+        album = album_factory(num_tracks=0)
+        track_factory(album=album, genres={"hip hop", "rock"})
+        track_factory(album=album, genres={"rock"})
+        track_factory(album=album)
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        assert stats.get_stats(tmp_session, "*", QueryType.TRACK, group_by="genre") == [
+            Stats("rock", 2, 0, 0, 2),
+            Stats(None, 1, 0, 0, 1),
+            Stats("hip hop", 1, 0, 0, 1),
+        ]
+
+    def test_custom_field(self, tmp_session):
+        """Items can be grouped by custom fields."""
+        album = album_factory(num_tracks=0)
+        track_factory(album=album, rating=5)
+        track_factory(album=album, rating=5)
+        track_factory(album=album, rating=3)
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        assert stats.get_stats(
+            tmp_session, "*", QueryType.TRACK, group_by="rating"
+        ) == [Stats(5, 2, 0, 0, 2), Stats(3, 1, 0, 0, 1)]
+
+    def test_extras(self, tmp_session):
+        """Extras can be grouped by their album's fields."""
+        beatles = album_factory(num_extras=0, artist="Beatles")
+        extra_factory(album=beatles)
+        outkast = album_factory(num_extras=0, artist="Outkast")
+        extra_factory(album=outkast)
+        extra_factory(album=outkast)
+        tmp_session.add_all([beatles, outkast])
+        tmp_session.flush()
+
+        assert stats.get_stats(
+            tmp_session, "*", QueryType.EXTRA, group_by="a:artist"
+        ) == [Stats("Outkast", 2, 0, 0), Stats("Beatles", 1, 0, 0)]
+
+    def test_relationship(self, tmp_session):
+        """Raise a QueryError if grouping by a relationship."""
+        with pytest.raises(QueryError):
+            stats.get_stats(tmp_session, "*", QueryType.ALBUM, group_by="tracks")
+
+    def test_unrelated_type(self, tmp_session):
+        """Raise a QueryError if grouping by a field of an unrelated item type."""
+        with pytest.raises(QueryError):
+            stats.get_stats(tmp_session, "*", QueryType.ALBUM, group_by="t:title")
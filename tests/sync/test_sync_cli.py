@@ -0,0 +1,101 @@
+"""Test the sync cli."""
+
+from pathlib import Path
+from unittest.mock import ANY, patch
+
+import pytest
+
+import moe.cli
+from moe.sync import LibraryDiff
+from tests.conftest import album_factory, track_factory
+
+
+@pytest.fixture
+def mock_diff():
+    """Mock the `diff_library()` api call, returning an empty diff by default."""
+    with patch("moe.sync.diff_library", autospec=True) as mock_diff:
+        mock_diff.return_value = LibraryDiff([], [], [], {}, [], [])
+        yield mock_diff
+
+
+@pytest.fixture
+def mock_sync():
+    """Mock the `sync_library()` api call."""
+    with patch("moe.sync.sync_library", autospec=True) as mock_sync:
+        mock_sync.return_value = []
+        yield mock_sync
+
+
+@pytest.fixture
+def _tmp_sync_config(tmp_config):
+    """A temporary config for the sync plugin with the cli."""
+    tmp_config('default_plugins = ["add", "cli", "read", "remove", "sync", "write"]')
+
+
+@pytest.mark.usefixtures("_tmp_sync_config")
+class TestCommand:
+    """Test the `sync` command."""
+
+    def test_sync(self, capsys, mock_diff, mock_sync):
+        """Sync the library and summarize the changes."""
+        mock_diff.return_value = LibraryDiff(
+            [album_factory()], [], [], {Path("/new"): []}, [track_factory()], []
+        )
+
+        moe.cli.main(["sync"])
+
+        mock_sync.assert_called_once_with(ANY, mock_diff.return_value)
+        assert (
+            "Added 1 album(s), read 1 album(s), moved 0 item(s), removed 1 item(s)."
+            in capsys.readouterr().out
+        )
+
+    def test_unmatched(self, capsys, mock_diff, mock_sync):
+        """Report any skipped files that don't belong to an album."""
+        mock_diff.return_value = LibraryDiff([], [], [], {}, [], [Path("/a.txt")])
+
+        moe.cli.main(["sync"])
+
+        mock_sync.assert_called_once()
+        assert "Skipped 1 file(s)" in capsys.readouterr().out
+
+    def test_failed(self, mock_diff, mock_sync):
+        """Exit with non-zero code if a new album couldn't be added."""
+        mock_diff.return_value = LibraryDiff([], [], [], {Path("/new"): []}, [], [])
+        mock_sync.return_value = [Path("/new")]
+
+        with pytest.raises(SystemExit) as error:
+            moe.cli.main(["sync"])
+
+        assert error.value.code != 0
+
+    def test_dry_run(self, capsys, mock_diff, mock_sync):
+        """Only display what would be synced if the dry-run argument is given."""
+        track = track_factory()
+        new_path = Path("/moved.mp3")
+        mock_diff.return_value = LibraryDiff(
+            [], [], [(track, new_path)], {}, [], [Path("/a.txt")]
+        )
+
+        moe.cli.main(["sync", "--dry-run"])
+
+        mock_sync.assert_not_called()
+        output = capsys.readouterr().out
+        assert f"move: {track.path}\n\t-> {new_path}" in output
+        assert "skip: /a.txt" in output
+
+
+class TestPluginRegistration:
+    """Test the `plugin_registration` hook implementation."""
+
+    def test_no_cli(self, tmp_config):
+        """Don't enable the sync cli plugin if the `cli` plugin is not enabled."""
+        config = tmp_config(settings='default_plugins = ["sync"]')
+
+        assert not config.pm.has_plugin("sync_cli")
+
+    def test_cli(self, tmp_config):
+        """Enable the sync cli plugin if the `cli` plugin is enabled."""
+        config = tmp_config(settings='default_plugins = ["sync", "cli"]')
+
+        assert config.pm.has_plugin("sync_cli")
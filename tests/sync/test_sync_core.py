@@ -0,0 +1,267 @@
+"""Test the sync core api."""
+
+import shutil
+from pathlib import PurePath
+
+import mediafile
+import pytest
+import sqlalchemy as sa
+
+from moe import read
+from moe import sync as moe_sync
+from moe.library import Album, Extra, Track
+from tests.conftest import album_factory
+
+
+@pytest.fixture
+def library_path(tmp_path, tmp_config):
+    """A temporary config and library path for the sync plugin.
+
+    Returns:
+        The (empty) library path.
+    """
+    tmp_config(
+        'default_plugins = ["add", "read", "remove", "sync", "write"]\n'
+        f"library_path = '{tmp_path.resolve()}'",
+        tmp_db=True,
+    )
+    return tmp_path.resolve()
+
+
+def _add_album(session, album):
+    """Adds an album to the library, synced with its files."""
+    session.add(album)
+    session.flush()
+    read.read_item(album)
+    session.flush()
+
+
+class TestDiffLibrary:
+    """Test `diff_library()`."""
+
+    def test_unchanged(self, library_path, tmp_session):
+        """Nothing differs if the library is synced with the filesystem."""
+        _add_album(tmp_session, album_factory(exists=True, path=library_path / "a"))
+
+        diff = moe_sync.diff_library(tmp_session)
+
+        assert not any(diff.changed_albums)
+        assert not any(diff.moved_albums)
+        assert not any(diff.moved_items)
+        assert not any(diff.new_albums)
+        assert not any(diff.removed_items)
+        assert not any(diff.unmatched_paths)
+
+    def test_new_album(self, library_path, tmp_session):
+        """New directories of tracks are new albums."""
+        album = album_factory(exists=True, path=library_path / "a")
+
+        diff = moe_sync.diff_library(tmp_session)
+
+        assert list(diff.new_albums) == [album.path]
+        assert set(diff.new_albums[album.path]) == {
+            item.path for item in [*album.tracks, *album.extras]
+        }
+
+    def test_new_multi_disc_album(self, library_path, tmp_session):
+        """Disc sub-directories are part of their parent's album."""
+        album = album_factory(exists=True, num_discs=2, path=library_path / "a")
+
+        diff = moe_sync.diff_library(tmp_session)
+
+        assert list(diff.new_albums) == [album.path]
+
+    def test_changed_track(self, library_path, tmp_session):
+        """Albums with modified track files are changed."""
+        album = album_factory(exists=True, path=library_path / "a")
+        _add_album(tmp_session, album)
+        audio_file = mediafile.MediaFile(album.tracks[0].path)
+        audio_file.title = "changed"
+        audio_file.save()
+
+        diff = moe_sync.diff_library(tmp_session)
+
+        assert diff.changed_albums == [album]
+
+    def test_new_file_in_album(self, library_path, tmp_session):
+        """Albums with new files in their directory are changed."""
+        album = album_factory(exists=True, path=library_path / "a")
+        _add_album(tmp_session, album)
+        (album.path / "new.log").touch()
+
+        diff = moe_sync.diff_library(tmp_session)
+
+        assert diff.changed_albums == [album]
+        assert not diff.new_albums
+
+    def test_removed_track(self, library_path, tmp_session):
+        """Tracks whose file no longer exists are removed."""
+        album = album_factory(exists=True, path=library_path / "a")
+        _add_album(tmp_session, album)
+        album.tracks[0].path.unlink()
+
+        diff = moe_sync.diff_library(tmp_session)
+
+        assert diff.removed_items == [album.tracks[0]]
+
+    def test_removed_album(self, library_path, tmp_session):
+        """Albums whose directory no longer exists are removed as a whole."""
+        album = album_factory(exists=True, path=library_path / "a")
+        _add_album(tmp_session, album)
+        shutil.rmtree(album.path)
+
+        diff = moe_sync.diff_library(tmp_session)
+
+        assert diff.removed_items == [album]
+
+    def test_moved_album(self, library_path, tmp_session):
+        """Albums whose directory moved are matched with their new path."""
+        album = album_factory(exists=True, num_discs=2, path=library_path / "a")
+        _add_album(tmp_session, album)
+        new_album_path = library_path / "b"
+        album.path.rename(new_album_path)
+
+        diff = moe_sync.diff_library(tmp_session)
+
+        assert diff.moved_albums == [(album, new_album_path)]
+        assert {new_path for _, new_path in diff.moved_items} == {
+            new_album_path / item.path.relative_to(album.path)
+            for item in [*album.tracks, *album.extras]
+        }
+        assert not diff.new_albums
+        assert not diff.removed_items
+
+    def test_copied_album(self, library_path, tmp_session):
+        """Copied files aren't moved, even with the same modification time and size."""
+        album = album_factory(exists=True, path=library_path / "a")
+        _add_album(tmp_session, album)
+        new_album_path = library_path / "b"
+        shutil.copytree(album.path, new_album_path)
+        shutil.rmtree(album.path)
+
+        diff = moe_sync.diff_library(tmp_session)
+
+        assert not diff.moved_albums
+        assert not diff.moved_items
+        assert diff.removed_items == [album]
+        assert list(diff.new_albums) == [new_album_path]
+
+    def test_unmatched(self, library_path, tmp_session):
+        """New files that don't belong to any album are unmatched."""
+        (library_path / "notes.txt").touch()
+        (library_path / "scans").mkdir()
+        (library_path / "scans" / "cover.jpg").touch()
+
+        diff = moe_sync.diff_library(tmp_session)
+
+        assert diff.unmatched_paths == [
+            library_path / "notes.txt",
+            library_path / "scans" / "cover.jpg",
+        ]
+        assert not diff.new_albums
+
+    def test_outside_library_path(self, library_path, tmp_path_factory, tmp_session):
+        """Items outside of the library path are never considered removed."""
+        album = album_factory(
+            exists=True, path=tmp_path_factory.mktemp("outside") / "a"
+        )
+        _add_album(tmp_session, album)
+
+        diff = moe_sync.diff_library(tmp_session)
+
+        assert not diff.removed_items
+
+    def test_batches(self, library_path, tmp_session):
+        """The result doesn't depend on the lookup batch size."""
+        album = album_factory(exists=True, num_tracks=5, path=library_path / "a")
+        _add_album(tmp_session, album)
+        album.tracks[0].path.unlink()
+
+        assert moe_sync.diff_library(tmp_session, batch_size=1) == (
+            moe_sync.diff_library(tmp_session)
+        )
+
+
+class TestSyncLibrary:
+    """Test `sync_library()`."""
+
+    def test_new_album(self, library_path, tmp_session):
+        """New albums are added to the library."""
+        album = album_factory(exists=True, path=library_path / "a")
+
+        assert not moe_sync.sync_library(tmp_session)
+
+        db_album = tmp_session.scalars(sa.select(Album)).one()
+        assert db_album.path == album.path
+        assert len(db_album.tracks) == len(album.tracks)
+        assert len(db_album.extras) == len(album.extras)
+
+    def test_new_extra(self, library_path, tmp_session):
+        """New files in an existing album's directory are added to the album."""
+        album = album_factory(exists=True, path=library_path / "a")
+        _add_album(tmp_session, album)
+        (album.path / "new.log").touch()
+
+        moe_sync.sync_library(tmp_session)
+
+        assert album.get_extra(PurePath("new.log"))
+        assert tmp_session.scalars(sa.select(Album)).one() == album
+
+    def test_changed_track(self, library_path, tmp_session):
+        """Modified track files are read."""
+        album = album_factory(exists=True, path=library_path / "a")
+        _add_album(tmp_session, album)
+        audio_file = mediafile.MediaFile(album.tracks[0].path)
+        audio_file.title = "changed"
+        audio_file.save()
+
+        moe_sync.sync_library(tmp_session)
+
+        assert album.tracks[0].title == "changed"
+
+    def test_removed(self, library_path, tmp_session):
+        """Items whose files no longer exist are removed from the library."""
+        album = album_factory(exists=True, path=library_path / "a")
+        _add_album(tmp_session, album)
+        album.tracks[0].path.unlink()
+
+        moe_sync.sync_library(tmp_session)
+
+        assert len(tmp_session.scalars(sa.select(Track)).all()) == 1
+        assert len(tmp_session.scalars(sa.select(Extra)).all()) == 1
+
+    def test_removed_album(self, library_path, tmp_session):
+        """Albums whose directories no longer exist are removed from the library."""
+        album = album_factory(exists=True, path=library_path / "a")
+        _add_album(tmp_session, album)
+        shutil.rmtree(album.path)
+
+        moe_sync.sync_library(tmp_session)
+
+        assert not tmp_session.scalars(sa.select(Album)).all()
+        assert not tmp_session.scalars(sa.select(Track)).all()
+
+    def test_moved_album(self, library_path, tmp_session):
+        """Moved albums are updated in place."""
+        album = album_factory(exists=True, path=library_path / "a")
+        _add_album(tmp_session, album)
+        new_album_path = library_path / "b"
+        album.path.rename(new_album_path)
+
+        moe_sync.sync_library(tmp_session)
+
+        assert tmp_session.scalars(sa.select(Album)).one() is album
+        assert album.path == new_album_path
+        for item in [*album.tracks, *album.extras]:
+            assert item.path.is_relative_to(new_album_path)
+            assert not item.is_file_changed()
+        assert not any(moe_sync.diff_library(tmp_session))
+
+    def test_failed_album(self, library_path, tmp_session):
+        """Return the directories of any new albums that couldn't be added."""
+        album = album_factory(exists=True, path=library_path / "a")
+        audio_file = mediafile.MediaFile(album.tracks[0].path)
+        audio_file.album = None
+        audio_file.save()
+
+        assert moe_sync.sync_library(tmp_session, batch_size=1) == [album.path]
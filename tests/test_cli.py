@@ -48,6 +48,31 @@ def test_default_config(tmp_config):
     moe.cli.main(cli_args)
 
 
+def test_load_command_plugins(tmp_config):
+    """Only the plugins of the sub-command being run are loaded."""
+    config = tmp_config(
+        settings="default_plugins = ['cli', 'edit', 'list', 'remove']", init_db=True
+    )
+
+    with pytest.raises(SystemExit):
+        moe.cli.main(["ls", "*"])
+
+    assert config.pm.is_deferred("edit")
+    assert config.pm.is_deferred("remove")
+
+
+def test_unknown_command(tmp_config):
+    """All sub-commands are loaded to show in the help message."""
+    config = tmp_config(settings="default_plugins = ['cli', 'edit', 'list', 'remove']")
+
+    with pytest.raises(SystemExit) as error:
+        moe.cli.main(["unknown"])
+
+    assert error.value.code != 0
+    assert not config.pm.is_deferred("edit")
+    assert not config.pm.is_deferred("remove")
+
+
 def test_config_validation_error():
     """Raise SystemExit if the config fails to pass its validation."""
     config.CONFIG = None
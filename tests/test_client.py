@@ -0,0 +1,70 @@
+"""Tests the ``moe`` entry point."""
+
+import socket
+from unittest.mock import patch
+
+import pytest
+
+from moe import client
+
+
+class TestMain:
+    """Test running the cli through the entry point."""
+
+    def test_no_daemon(self):
+        """Run the command with the cli if no daemon is running."""
+        with (
+            patch("moe.client.run_on_daemon", return_value=None, autospec=True),
+            patch("moe.cli.main", autospec=True) as mock_main,
+        ):
+            client.main(["ls", "*"])
+
+        mock_main.assert_called_once_with(["ls", "*"])
+
+    def test_daemon(self):
+        """Exit with the daemon's exit code if it ran the command."""
+        with (
+            patch("moe.client.run_on_daemon", return_value=3, autospec=True),
+            patch("moe.cli.main", autospec=True) as mock_main,
+            pytest.raises(SystemExit) as error,
+        ):
+            client.main(["ls", "*"])
+
+        assert error.value.code == 3  # noqa: PLR2004 arbitrary exit code
+        mock_main.assert_not_called()
+
+
+class TestRunOnDaemon:
+    """Test sending commands to the daemon."""
+
+    def test_no_socket(self, tmp_path):
+        """Don't run anything if there's no daemon socket."""
+        assert client.run_on_daemon(["ls", "*"], tmp_path / "moe.sock") is None
+
+    def test_stale_socket(self, tmp_path):
+        """Don't run anything if the daemon stopped without removing its socket."""
+        socket_path = tmp_path / "moe.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(str(socket_path))
+
+        assert client.run_on_daemon(["ls", "*"], socket_path) is None
+
+    @pytest.mark.parametrize("command", ["serve", "api"])
+    def test_local_commands(self, tmp_path, command):
+        """Commands that run until interrupted, e.g. the daemon, aren't sent to it."""
+        socket_path = tmp_path / "moe.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as daemon:
+            daemon.bind(str(socket_path))
+            daemon.listen()
+
+            assert client.run_on_daemon(["-v", command], socket_path) is None
+
+    def test_default_socket(self, tmp_path):
+        """The daemon's socket is in the configuration directory by default."""
+        with (
+            patch.dict("os.environ", {"MOE_CONFIG_DIR": str(tmp_path)}),
+            patch("moe.client.connect", return_value=None, autospec=True) as mock_conn,
+        ):
+            client.run_on_daemon(["ls", "*"])
+
+        mock_conn.assert_called_once_with(tmp_path / client.SOCKET_FILENAME)
@@ -1,17 +1,34 @@
 """Tests configuration."""
 
+import argparse
+import importlib
 import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import ANY, MagicMock, patch
 
+import alembic.config
+import alembic.script
 import dynaconf
 import pytest
+import sqlalchemy as sa
 
 import moe
 from moe import config
-from moe.config import CORE_PLUGINS, Config, ConfigValidationError, ExtraPlugin
+from moe.config import (
+    CORE_PLUGINS,
+    DEFAULT_PLUGINS,
+    OFFICIAL_PLUGINS,
+    SCHEMA_REVISION,
+    SQLITE_PRAGMAS,
+    Config,
+    ConfigValidationError,
+    ExtraPlugin,
+    PluginInfo,
+)
+from moe.library.lib_item import SABase, get_indexed_fields
 
 
 class TestInit:
@@ -170,6 +187,293 @@ class TestHooks:
         assert config.pm.has_plugin("config2")
 
 
+DEFERRED_PLUGINS = {
+    plugin_name: module
+    for plugin_name, module in {**DEFAULT_PLUGINS, **OFFICIAL_PLUGINS}.items()
+    if hasattr(importlib.import_module(module), "PLUGIN_INFO")
+}
+
+
+class MySubPlugin:
+    """Sub-plugin of `MyDeferredPlugin`."""
+
+    @staticmethod
+    @moe.hookimpl
+    def process_new_items(session, items):
+        """Process new items."""
+
+
+class MyDeferredPlugin:
+    """Plugin that defers registering its sub-plugin."""
+
+    PLUGIN_INFO = PluginInfo(hooks=frozenset({"process_new_items"}))
+
+    @staticmethod
+    @moe.hookimpl
+    def plugin_registration():
+        """Register the sub-plugin."""
+        config.CONFIG.pm.register(MySubPlugin, "deferred_sub")
+
+
+class TestLazyPlugins:
+    """Test deferring plugins until they're needed."""
+
+    @pytest.mark.parametrize("plugin_name", DEFERRED_PLUGINS)
+    def test_plugin_info(self, tmp_config, plugin_name):
+        """The plugin metadata matches the hooks and commands of its sub-plugins."""
+        config = tmp_config(
+            settings=f"default_plugins = ['cli', {plugin_name!r}]"
+            f"\nenable_plugins = [{plugin_name!r}]"
+        )
+        module = DEFERRED_PLUGINS[plugin_name]
+        plugin = config.pm.get_plugin(plugin_name)  # load any sub-plugins
+
+        def in_sub_plugin(module_name: str) -> bool:
+            return module_name.startswith(f"{module}.")
+
+        implied_hooks = {"add_command", "add_hooks", "plugin_registration"}
+        hooks = set()
+        for hook_name, hook_caller in vars(config.pm.hook).items():
+            if hook_name in implied_hooks:
+                continue
+            if hook_caller.spec and in_sub_plugin(
+                hook_caller.spec.namespace.__module__
+            ):
+                hooks.add(hook_name)
+            if any(
+                in_sub_plugin(hookimpl.plugin.__name__)
+                for hookimpl in hook_caller.get_hookimpls()
+            ):
+                hooks.add(hook_name)
+
+        cmd_parsers = argparse.ArgumentParser().add_subparsers()
+        config.pm.hook.add_command(cmd_parsers=cmd_parsers)
+
+        assert plugin.PLUGIN_INFO.hooks == hooks
+        assert plugin.PLUGIN_INFO.commands == set(cmd_parsers.choices)
+
+    def test_defer_plugins(self, tmp_config):
+        """Sub-plugins of plugins with metadata aren't registered during startup."""
+        config = tmp_config(settings="default_plugins = ['cli', 'edit', 'remove']")
+
+        assert config.pm.is_deferred("edit")
+        assert config.pm.is_deferred("remove")
+        assert not config.pm.is_deferred("cli")
+        assert dict(config.pm.list_name_plugin()).keys() == {
+            *CORE_PLUGINS,
+            "cli",
+            "edit",
+            "remove",
+        }
+
+    def test_defer_startup(self, tmp_config):
+        """Deferred plugins still validate settings and index fields on startup."""
+        config = tmp_config(
+            settings="default_plugins = ['cli', 'import', 'move']"
+            "\nenable_plugins = ['musicbrainz']",
+            init_db=True,
+        )
+
+        assert config.pm.is_deferred("import")
+        assert config.pm.is_deferred("move")
+        assert config.pm.is_deferred("musicbrainz")
+        assert config.settings.move.asciify_paths is False
+        assert get_indexed_fields()["album"] == {"mb_album_id"}
+
+    def test_invalid_deferred(self, tmp_config):
+        """Invalid settings of deferred plugins are an error on startup."""
+        with pytest.raises(ConfigValidationError):
+            tmp_config(
+                settings="default_plugins = ['cli']\nenable_plugins = ['api']"
+                "\n[api]\nport = -1"
+            )
+
+    def test_extra_plugin(self, tmp_config):
+        """Any plugin declaring its metadata can defer its sub-plugins."""
+        config = tmp_config(
+            extra_plugins=[ExtraPlugin(MyDeferredPlugin, "deferred")],
+        )
+
+        assert config.pm.is_deferred("deferred")
+        assert "deferred_sub" not in dict(config.pm.list_name_plugin())
+
+        config.pm.hook.process_new_items(session=MagicMock(), items=[])
+
+        assert not config.pm.is_deferred("deferred")
+        assert dict(config.pm.list_name_plugin())["deferred_sub"] is MySubPlugin
+
+    def test_load_threads(self, tmp_config):
+        """Deferred plugins are loaded once, even when needed by several threads."""
+        config = tmp_config(settings="default_plugins = ['cli', 'edit', 'remove']")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            plugins = list(
+                executor.map(lambda _: config.pm.get_plugin("remove_core"), range(8))
+            )
+
+        assert plugins[0]
+        assert all(plugin is plugins[0] for plugin in plugins)
+        assert not config.pm.is_deferred("remove")
+        assert config.pm.is_deferred("edit")
+
+    def test_load_on_hook(self, tmp_config):
+        """Deferred plugins are loaded once one of their hooks is accessed."""
+        config = tmp_config(settings="default_plugins = ['cli', 'edit', 'move']")
+
+        config.pm.hook.edit_new_items(session=MagicMock(), items=[])
+
+        assert not config.pm.is_deferred("move")
+        assert config.pm.is_deferred("edit")
+
+    def test_load_on_command(self, tmp_config):
+        """Only the plugins adding the command being run are loaded."""
+        config = tmp_config(settings="default_plugins = ['cli', 'edit', 'remove']")
+
+        config.pm.load_command_plugins("rm")
+
+        assert not config.pm.is_deferred("remove")
+        assert config.pm.is_deferred("edit")
+
+    def test_load_all_commands(self, tmp_config):
+        """All plugins with commands are loaded if the command is unknown."""
+        config = tmp_config(settings="default_plugins = ['cli', 'duplicate', 'edit']")
+
+        config.pm.load_command_plugins(None)
+
+        assert not config.pm.is_deferred("edit")
+        assert config.pm.is_deferred("duplicate")
+
+    def test_load_sub_plugin(self, tmp_config):
+        """Looking up a sub-plugin loads its deferred parent plugin."""
+        config = tmp_config(settings="default_plugins = ['cli', 'remove']")
+
+        assert config.pm.has_plugin("remove_cli")
+        assert not config.pm.is_deferred("remove")
+
+
+class TestInitDB:
+    """Test initializing the database."""
+
+    def test_head_revision(self):
+        """The baked-in schema revision is the head of the alembic migrations."""
+        alembic_cfg = alembic.config.Config(
+            str(Path(moe.config.__file__).parent / "moe_alembic" / "alembic.ini")
+        )
+        script = alembic.script.ScriptDirectory.from_config(alembic_cfg)
+
+        assert script.get_current_head() == SCHEMA_REVISION
+
+    def test_new_db(self, tmp_config):
+        """New databases are created at the head revision."""
+        config = tmp_config(init_db=True)
+
+        with config.engine.connect() as connection:
+            assert (
+                connection.exec_driver_sql(
+                    "SELECT version_num FROM alembic_version"
+                ).scalar()
+                == SCHEMA_REVISION
+            )
+
+    def test_skip_upgrade(self, tmp_config, tmp_path):
+        """Don't run alembic if the database is already up to date."""
+        tmp_config(init_db=True, config_dir=tmp_path)
+
+        with patch("moe.config._upgrade_db", autospec=True) as mock_upgrade:
+            tmp_config(init_db=True, config_dir=tmp_path)
+
+        mock_upgrade.assert_not_called()
+
+    def test_outdated_db(self, tmp_config, tmp_path):
+        """Upgrade the database if it isn't at the head revision."""
+        config = tmp_config(init_db=True, config_dir=tmp_path)
+        with config.engine.begin() as connection:
+            connection.exec_driver_sql(
+                "UPDATE alembic_version SET version_num = 'a83d6e0c5b17'"
+            )
+
+        with patch("moe.config._upgrade_db", autospec=True) as mock_upgrade:
+            tmp_config(init_db=True, config_dir=tmp_path)
+
+        mock_upgrade.assert_called_once_with(ANY, "a83d6e0c5b17")
+
+    def test_migrated_triggers_and_indexes(self, tmp_config):
+        """Migrations create the same triggers and indexes as the table definitions.
+
+        Alembic doesn't autogenerate triggers, and any migration that recreates a
+        table drops its triggers and index collations, so they're easy to lose.
+        """
+        config = tmp_config(init_db=True)
+        created_engine = sa.create_engine("sqlite:///:memory:")
+        SABase.metadata.create_all(created_engine)
+
+        schema_query = (
+            "SELECT type, name, sql FROM sqlite_master "
+            "WHERE type IN ('index', 'trigger') AND sql IS NOT NULL"
+        )
+        with config.engine.connect() as migrated, created_engine.connect() as created:
+            assert set(migrated.exec_driver_sql(schema_query)) == set(
+                created.exec_driver_sql(schema_query)
+            )
+
+
+class TestDatabaseOptions:
+    """Test the ``database`` configuration options."""
+
+    @staticmethod
+    def _pragmas(config: Config, *pragmas: str) -> dict:
+        """Returns the current values of the given pragmas."""
+        with config.engine.connect() as connection:
+            return {
+                pragma: connection.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+                for pragma in pragmas
+            }
+
+    def test_defaults(self, tmp_config):
+        """Performance defaults are applied to each connection."""
+        config = tmp_config(init_db=True)
+
+        assert self._pragmas(config, *SQLITE_PRAGMAS) == {
+            "busy_timeout": 5000,
+            "journal_mode": "wal",
+            "synchronous": 1,  # normal
+            "cache_size": -65536,
+            "mmap_size": 268435456,
+            "temp_store": 2,  # memory
+        }
+
+    def test_custom(self, tmp_config):
+        """Settings can be customized, and names are case-insensitive."""
+        config = tmp_config(
+            "database = {journal_mode = 'DELETE', synchronous = 'full', "
+            "cache_size = 1000, busy_timeout = 100}",
+            init_db=True,
+        )
+
+        assert self._pragmas(
+            config, "journal_mode", "synchronous", "cache_size", "busy_timeout"
+        ) == {
+            "journal_mode": "delete",
+            "synchronous": 2,  # full
+            "cache_size": 1000,
+            "busy_timeout": 100,
+        }
+
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            "database = {journal_mode = 'wal; DROP TABLE album'}",
+            "database = {synchronous = 'sometimes'}",
+            "database = {mmap_size = -1}",
+            "database = {cache_size = 'big'}",
+        ],
+    )
+    def test_invalid(self, tmp_config, settings):
+        """Raise a ConfigValidationError if a database setting is invalid."""
+        with pytest.raises(ConfigValidationError):
+            tmp_config(settings)
+
+
 class TestConfigOptions:
     """Test the various global configuration options."""
 
@@ -1,13 +1,13 @@
 """Tests the ``list`` plugin."""
 
 from collections.abc import Iterator
-from types import FunctionType
+from types import FunctionType, SimpleNamespace
 from unittest.mock import ANY, patch
 
 import pytest
 
 import moe.cli
-from moe.query import QueryType
+from moe.query import DEFAULT_ORDER_BY, QueryType
 from tests.conftest import album_factory, extra_factory, track_factory
 
 
@@ -20,7 +20,7 @@ def mock_query() -> Iterator[FunctionType]:
     Yields:
         Mock query
     """
-    with patch("moe.list.cli_query", autospec=True) as mock_query:
+    with patch("moe.list.cli_iter_query", autospec=True) as mock_query:
         yield mock_query
 
 
@@ -42,7 +42,13 @@ class TestParseArgs:
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.TRACK)
+        mock_query.assert_called_once_with(
+            ANY,
+            "*",
+            QueryType.TRACK,
+            order_by=DEFAULT_ORDER_BY[QueryType.TRACK],
+            load=ANY,
+        )
         assert capsys.readouterr().out.strip("\n") == str(track)
 
     def test_album(self, capsys, mock_query):
@@ -53,7 +59,13 @@ class TestParseArgs:
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.ALBUM)
+        mock_query.assert_called_once_with(
+            ANY,
+            "*",
+            QueryType.ALBUM,
+            order_by=DEFAULT_ORDER_BY[QueryType.ALBUM],
+            load=ANY,
+        )
         assert capsys.readouterr().out.strip("\n") == str(album)
 
     def test_extra(self, capsys, mock_query):
@@ -64,7 +76,13 @@ class TestParseArgs:
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.EXTRA)
+        mock_query.assert_called_once_with(
+            ANY,
+            "*",
+            QueryType.EXTRA,
+            order_by=DEFAULT_ORDER_BY[QueryType.EXTRA],
+            load=ANY,
+        )
         assert capsys.readouterr().out.strip("\n") == str(extra)
 
     def test_multiple_items(self, capsys, mock_query):
@@ -78,16 +96,34 @@ class TestParseArgs:
         out_str = "\n".join(str(track) for track in tracks)
         assert capsys.readouterr().out.strip("\n") == out_str
 
-    def test_paths(self, capsys, mock_query):
-        """Tracks are printed to stdout with valid query."""
+    def test_paths(self, capsys):
+        """Paths are printed from rows rather than library items."""
         track = track_factory()
         cli_args = ["list", "-p", "*"]
-        mock_query.return_value = [track]
+
+        with patch("moe.list.cli_iter_rows", autospec=True) as mock_rows:
+            mock_rows.return_value = [SimpleNamespace(path=track.path)]
+            moe.cli.main(cli_args)
+
+        mock_rows.assert_called_once_with(
+            ANY,
+            "*",
+            QueryType.TRACK,
+            ["path"],
+            order_by=DEFAULT_ORDER_BY[QueryType.TRACK],
+        )
+        assert capsys.readouterr().out.strip("\n") == str(track.path)
+
+    def test_sort(self, mock_query):
+        """Items are sorted by the given fields."""
+        cli_args = ["list", "--sort=-a:date,title", "*"]
+        mock_query.return_value = [track_factory()]
 
         moe.cli.main(cli_args)
 
-        mock_query.assert_called_once_with(ANY, "*", QueryType.TRACK)
-        assert capsys.readouterr().out.strip("\n") == str(track.path)
+        mock_query.assert_called_once_with(
+            ANY, "*", QueryType.TRACK, order_by=["-a:date", "title"], load=ANY
+        )
 
     def test_info_album(self, mock_query):
         """Print full info if the `--info` argument is given."""
@@ -120,6 +156,16 @@ class TestParseArgs:
         output = capsys.readouterr().out.split("\n")
         assert "custom: show me" in output
 
+    def test_info_multiple_items(self, capsys, mock_query):
+        """Each item's info is separated by a blank line."""
+        cli_args = ["list", "--info", "*"]
+        tracks = [track_factory(), track_factory()]
+        mock_query.return_value = tracks
+
+        moe.cli.main(cli_args)
+
+        assert capsys.readouterr().out.count("\n\n") == len(tracks) - 1
+
 
 class TestPluginRegistration:
     """Test the `plugin_registration` hook implementation."""
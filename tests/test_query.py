@@ -1,12 +1,23 @@
 """Tests the core query module."""
 
+from collections.abc import Iterator
 from datetime import date
 from unittest.mock import MagicMock
 
 import pytest
+import sqlalchemy as sa
 
+from moe.config import moe_sessionmaker
 from moe.library import Album, Extra, Track
-from moe.query import QueryError, QueryType, query
+from moe.query import (
+    DEFAULT_ORDER_BY,
+    QueryError,
+    QueryType,
+    _parse_query,
+    iter_query,
+    iter_rows,
+    query,
+)
 from tests.conftest import album_factory, extra_factory, track_factory
 
 
@@ -63,6 +74,26 @@ class TestQueries:
             tmp_session, f"a:original_year:{album.original_year}", QueryType.ALBUM
         )
 
+    @pytest.mark.parametrize(
+        ("date_value", "matches"),
+        [
+            ("1999", True),
+            ("1999-01", True),
+            ("1999-01-02", True),
+            ("1999-01-03", False),
+            ("1998", False),
+            ("1999-13", False),
+        ],
+    )
+    def test_date(self, tmp_session, date_value, matches):
+        """We can query a date field for a year, month, or date."""
+        tmp_session.add(album_factory(date=date(1999, 1, 2)))
+        tmp_session.flush()
+
+        assert bool(query(tmp_session, f"a:date:{date_value}", QueryType.ALBUM)) == (
+            matches
+        )
+
     def test_multiple_terms(self, tmp_session):
         """We should be able to query for multiple terms at once."""
         album = album_factory()
@@ -119,6 +150,17 @@ class TestQueries:
 
         assert query(tmp_session, "a:title::tmp", QueryType.ALBUM)
 
+    def test_regex_like_pre_filter(self, tmp_session):
+        """Regex queries pre-filtered with LIKE still match the same items."""
+        tmp_session.add(album_factory(title="The Beatles"))
+        tmp_session.add(album_factory(title="Abbey Road"))
+        tmp_session.flush()
+
+        albums = query(tmp_session, "'a:title::^the bea.*s$'", QueryType.ALBUM)
+        assert [album.title for album in albums] == ["The Beatles"]
+        assert not query(tmp_session, "a:title::^beatles", QueryType.ALBUM)
+        assert query(tmp_session, "a:title::road$", QueryType.ALBUM)
+
     def test_like_query(self, tmp_session):
         """Test sql LIKE queries. '%' and '_' are wildcard characters."""
         tmp_session.add(track_factory(track_num=1))
@@ -170,6 +212,41 @@ class TestQueries:
 
         assert len(query(tmp_session, "*", QueryType.ALBUM)) == 1
 
+    def test_missing_extras_with_other_extras(self, tmp_session):
+        """Albums without extras are returned even if other albums have extras."""
+        albums = [album_factory(num_extras=0), album_factory(num_extras=2)]
+        tmp_session.add_all(albums)
+        tmp_session.flush()
+
+        assert len(query(tmp_session, "*", QueryType.ALBUM)) == len(albums)
+        assert len(query(tmp_session, "*", QueryType.TRACK)) == len(
+            tmp_session.query(Track).all()
+        )
+
+    def test_related_terms_same_item(self, tmp_session):
+        """All terms of a related item type must match the same item."""
+        album = album_factory(num_tracks=0)
+        track_factory(album=album, title="one", track_num=1)
+        track_factory(album=album, title="two", track_num=2)
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        assert query(tmp_session, "t:title:one t:track_num:1", QueryType.ALBUM)
+        assert not query(tmp_session, "t:title:one t:track_num:2", QueryType.ALBUM)
+
+    def test_multi_value_no_duplicates(self, tmp_session):
+        """Items are only returned once if multiple values match."""
+        album = album_factory(num_tracks=2)
+        for track in album.tracks:
+            track.genres = {"pop", "pop rock"}
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        assert len(query(tmp_session, "genre:pop%", QueryType.TRACK)) == len(
+            album.tracks
+        )
+        assert len(query(tmp_session, "genre:pop%", QueryType.ALBUM)) == 1
+
     def test_custom_fields(self, tmp_session):
         """We can query a custom field."""
         album = album_factory(blah="album")
@@ -211,6 +288,24 @@ class TestQueries:
         assert query(tmp_session, "a:blah:1 e:blah:2 t:blah:3", QueryType.ALBUM)
         assert query(tmp_session, "t:blah:3 t:blah:track", QueryType.ALBUM)
 
+    def test_indexed_custom_field(self, tmp_config):
+        """We can query indexed custom fields."""
+        tmp_config(
+            "default_plugins = []\nindexed_fields = {track = ['blah']}", tmp_db=True
+        )
+        album = album_factory(num_tracks=0)
+        track_factory(album=album, blah=["track", 3])
+        track_factory(album=album, blah="other")
+
+        with moe_sessionmaker.begin() as session:
+            session.add(album)
+            session.flush()
+
+            assert len(query(session, "t:blah:trac%", QueryType.TRACK)) == 1
+            assert len(query(session, "t:blah:3 t:blah::^t", QueryType.TRACK)) == 1
+            assert query(session, "t:blah:TRACK", QueryType.ALBUM)
+            assert not query(session, "t:blah:none", QueryType.ALBUM)
+
     def test_numeric_query_range(self, tmp_session):
         """We can query for a range."""
         tmp_session.add(track_factory(track_num=2))
@@ -247,3 +342,468 @@ class TestQueries:
         assert len(query(tmp_session, "t:track_num:..3", QueryType.TRACK)) == len(
             tracks
         )
+
+    def test_numeric_range_literal_dots(self, tmp_session):
+        """Values without literal dots aren't treated as numeric ranges."""
+        tmp_session.add(track_factory(title="mp3"))
+        tmp_session.flush()
+
+        assert query(tmp_session, "title:mp3", QueryType.TRACK)
+
+    def test_audio_properties(self, tmp_config, tmp_session):
+        """We can query the stored audio properties of a track."""
+        tmp_config(settings="default_plugins = ['write']")
+        track = track_factory(exists=True)
+        tmp_session.add(track)
+        tmp_session.flush()
+
+        assert query(tmp_session, "audio_format:mp3", QueryType.TRACK)
+        assert query(tmp_session, "sample_rate:44100..", QueryType.TRACK)
+
+
+class TestBooleanQueries:
+    """Test joining query terms with boolean operators."""
+
+    @pytest.fixture
+    def albums(self, tmp_session) -> list[Album]:
+        """Albums to query for."""
+        albums = [
+            album_factory(title="Aquemini", label="LaFace"),
+            album_factory(title="ATLiens", label=None),
+            album_factory(title="Stankonia", label="Arista"),
+        ]
+        tmp_session.add_all(albums)
+        tmp_session.flush()
+        return albums
+
+    @staticmethod
+    def _titles(tmp_session, query_str: str) -> set[str]:
+        return {album.title for album in query(tmp_session, query_str, QueryType.ALBUM)}
+
+    @pytest.mark.usefixtures("albums")
+    def test_or(self, tmp_session):
+        """Items matching any term joined with OR are returned."""
+        assert self._titles(tmp_session, "a:title:aquemini OR a:title:stankonia") == {
+            "Aquemini",
+            "Stankonia",
+        }
+
+    @pytest.mark.usefixtures("albums")
+    @pytest.mark.parametrize("negated_term", ["-a:label:laface", "NOT a:label:laface"])
+    def test_not(self, tmp_session, negated_term):
+        """Negated terms match items without a value for the field."""
+        assert self._titles(tmp_session, negated_term) == {"ATLiens", "Stankonia"}
+
+    @pytest.mark.usefixtures("albums")
+    def test_precedence(self, tmp_session):
+        """AND binds tighter than OR, and parentheses group terms."""
+        assert self._titles(
+            tmp_session, "a:title:a% AND a:label:laface OR a:title:stankonia"
+        ) == {"Aquemini", "Stankonia"}
+        assert self._titles(
+            tmp_session, "a:title:a% (a:label:laface OR a:title:stankonia)"
+        ) == {"Aquemini"}
+        assert self._titles(tmp_session, "-(a:title:aquemini OR a:title:atliens)") == {
+            "Stankonia"
+        }
+
+    @pytest.mark.usefixtures("albums")
+    def test_regex_group(self, tmp_session):
+        """Parentheses inside a term aren't treated as grouping."""
+        assert self._titles(tmp_session, "(a:title::^(aq|st))") == {
+            "Aquemini",
+            "Stankonia",
+        }
+
+    def test_related_items(self, tmp_session, albums):
+        """Terms of other item types can be joined with OR."""
+        track = albums[0].tracks[0]
+        track.title = "Rosa Parks"
+        tmp_session.flush()
+
+        assert self._titles(
+            tmp_session, "'t:title:rosa parks' OR a:title:stankonia"
+        ) == {"Aquemini", "Stankonia"}
+
+    @pytest.mark.parametrize(
+        "query_str",
+        ["(a:title:a", "a:title:a)", "a:title:a OR", "NOT", "()", "'a:title:a"],
+    )
+    def test_invalid(self, tmp_session, query_str):
+        """Invalid boolean queries raise a QueryError."""
+        with pytest.raises(QueryError):
+            query(tmp_session, query_str, QueryType.ALBUM)
+
+    def test_parse_cache(self, tmp_session):
+        """Queries are only parsed once."""
+        _parse_query.cache_clear()
+
+        query(tmp_session, "a:title:a OR a:title:b", QueryType.ALBUM)
+        query(tmp_session, "a:title:a OR a:title:b", QueryType.TRACK)
+
+        assert _parse_query.cache_info().hits == 1
+
+
+class TestFullTextSearch:
+    """Test full-text search queries."""
+
+    def test_match(self, tmp_session):
+        """Words of a full-text indexed field are matched regardless of accents."""
+        album = album_factory(num_tracks=0)
+        track_factory(album=album, title="Déjà Vu", track_num=1)
+        track_factory(album=album, title="Deja", track_num=2)
+        track_factory(album=album, title="Vu", track_num=3)
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        tracks = query(tmp_session, "'title~deja vu'", QueryType.TRACK)
+
+        assert [track.title for track in tracks] == ["Déjà Vu"]
+
+    def test_prefix(self, tmp_session):
+        """Words can be matched by their prefix."""
+        tmp_session.add(track_factory(title="Hip Hop Hooray"))
+        tmp_session.flush()
+
+        assert query(tmp_session, "title~hoo*", QueryType.TRACK)
+
+    def test_ranked(self, tmp_session):
+        """The best matches are returned first."""
+        album = album_factory(num_tracks=0)
+        track_factory(album=album, title="Crazy in Love", track_num=1)
+        track_factory(album=album, title="Crazy Crazy Crazy", track_num=2)
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        tracks = query(tmp_session, "title~crazy", QueryType.TRACK)
+
+        assert [track.title for track in tracks] == [
+            "Crazy Crazy Crazy",
+            "Crazy in Love",
+        ]
+
+    def test_all_fields(self, tmp_session):
+        """Use '*' as the field to search all full-text indexed fields."""
+        tracks = [
+            track_factory(artist="Crazy Town", title="Butterfly"),
+            track_factory(artist="Outkast", title="Crazy"),
+        ]
+        tmp_session.add_all(tracks)
+        tmp_session.flush()
+
+        assert len(query(tmp_session, "*~crazy", QueryType.TRACK)) == len(tracks)
+
+    def test_other_item_type(self, tmp_session):
+        """Full-text search terms can be mixed with other item types."""
+        album = album_factory(title="Aquemini", label="LaFace")
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        assert query(tmp_session, "a:label~laface", QueryType.TRACK) == album.tracks
+        assert query(tmp_session, "a:title~aquemini a:label~laface", QueryType.ALBUM)
+        assert not query(tmp_session, "a:title~aquemini a:label~sony", QueryType.ALBUM)
+
+    def test_updated_items(self, tmp_session):
+        """The full-text search index is kept in sync with the library."""
+        track = track_factory(title="Before")
+        tmp_session.add(track)
+        tmp_session.flush()
+
+        track.title = "After"
+        tmp_session.flush()
+
+        assert not query(tmp_session, "title~before", QueryType.TRACK)
+        assert query(tmp_session, "title~after", QueryType.TRACK) == [track]
+
+        tmp_session.delete(track)
+        tmp_session.flush()
+
+        assert not query(tmp_session, "title~after", QueryType.TRACK)
+
+    def test_sql_updates(self, tmp_session):
+        """Items changed outside of the ORM are also kept in sync."""
+        track = track_factory(title="Before")
+        tmp_session.add(track)
+        tmp_session.flush()
+
+        tmp_session.execute(
+            sa.update(Track).where(Track.title == "Before").values(title="After")
+        )
+
+        assert not query(tmp_session, "title~before", QueryType.TRACK)
+        assert query(tmp_session, "title~after", QueryType.TRACK) == [track]
+
+    def test_field_not_indexed(self, tmp_session):
+        """Raise a QueryError if the field isn't full-text indexed."""
+        with pytest.raises(QueryError):
+            query(tmp_session, "track_num~1", QueryType.TRACK)
+
+        with pytest.raises(QueryError):
+            query(tmp_session, "e:path~1", QueryType.TRACK)
+
+    def test_invalid_search(self, tmp_session):
+        """Raise a QueryError if the full-text search query is invalid."""
+        with pytest.raises(QueryError):
+            query(tmp_session, "'title~crazy ('", QueryType.TRACK)
+
+
+class TestIterQuery:
+    """Test ``iter_query()``."""
+
+    def test_batches(self, tmp_session):
+        """All matching items are returned, regardless of the batch size."""
+        tracks = [track_factory(title=f"track {num}") for num in range(5)]
+        for track in tracks:
+            tmp_session.add(track)
+        tmp_session.flush()
+
+        items = list(
+            iter_query(tmp_session, "t:title:track%", QueryType.TRACK, batch_size=2)
+        )
+
+        assert sorted(item.title for item in items) == sorted(
+            track.title for track in tracks
+        )
+
+    def test_same_as_query(self, tmp_session):
+        """Iterating over a query returns the same items as a normal query."""
+        tmp_session.add(album_factory())
+        tmp_session.add(album_factory())
+        tmp_session.flush()
+
+        iter_items = iter_query(tmp_session, "*", QueryType.TRACK)
+        items = query(tmp_session, "*", QueryType.TRACK)
+
+        assert sorted(item.path for item in iter_items) == sorted(
+            item.path for item in items
+        )
+
+    def test_invalid_query(self, tmp_session):
+        """Invalid queries raise a QueryError once iteration begins."""
+        items = iter_query(tmp_session, "t:title~'\"'", QueryType.TRACK)
+
+        with pytest.raises(QueryError):
+            next(items)
+
+
+class TestIterRows:
+    """Test ``iter_rows()``."""
+
+    def test_fields(self, tmp_session):
+        """Rows contain the values of the given fields, in order."""
+        album = album_factory(num_tracks=0)
+        track = track_factory(album=album, title="Jazzy Belle", track_num=2)
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        rows = list(
+            iter_rows(tmp_session, "*", QueryType.TRACK, ["path", "title", "track_num"])
+        )
+
+        assert rows == [(track.path, "Jazzy Belle", 2)]
+        assert rows[0].path == track.path
+        assert rows[0].title == "Jazzy Belle"
+
+    def test_no_items(self, tmp_session):
+        """Rows don't create or track any library items."""
+        album = album_factory()
+        tmp_session.add(album)
+        tmp_session.flush()
+        tmp_session.expunge_all()
+
+        rows = iter_rows(tmp_session, "*", QueryType.TRACK, ["path"])
+
+        assert sorted(row.path for row in rows) == sorted(
+            track.path for track in album.tracks
+        )
+        assert not list(tmp_session)
+
+    def test_album_fields(self, tmp_session):
+        """Album fields can be selected alongside ordering by the album."""
+        album = album_factory(title="ATLiens", num_extras=0)
+        extra_factory(album=album)
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        rows = list(
+            iter_rows(
+                tmp_session,
+                "a:title:ATLiens",
+                QueryType.EXTRA,
+                ["path", "a:title"],
+                order_by=DEFAULT_ORDER_BY[QueryType.EXTRA],
+            )
+        )
+
+        assert rows == [(album.extras[0].path, "ATLiens")]
+        assert rows[0].a_title == "ATLiens"
+
+    def test_custom_field(self, tmp_session):
+        """Custom fields can be selected."""
+        tmp_session.add(album_factory(num_tracks=0, rating=5))
+        tmp_session.flush()
+
+        rows = list(iter_rows(tmp_session, "*", QueryType.ALBUM, ["rating"]))
+
+        assert rows == [(5,)]
+
+    def test_same_order_as_iter_query(self, tmp_session):
+        """Rows are ordered the same as items."""
+        tmp_session.add_all([album_factory(), album_factory(), album_factory()])
+        tmp_session.flush()
+        order_by = ["-a:date", "title"]
+
+        rows = iter_rows(
+            tmp_session, "*", QueryType.TRACK, ["path"], order_by=order_by, batch_size=2
+        )
+        items = iter_query(tmp_session, "*", QueryType.TRACK, order_by=order_by)
+
+        assert [row.path for row in rows] == [item.path for item in items]
+
+    @pytest.mark.parametrize("field", ["tracks", "bad field", "t:title"])
+    def test_invalid_field(self, tmp_session, field):
+        """Relationships and fields of unrelated items can't be selected."""
+        rows = iter_rows(tmp_session, "*", QueryType.ALBUM, [field])
+
+        with pytest.raises(QueryError):
+            next(rows)
+
+
+class TestOrderBy:
+    """Test ordering query results."""
+
+    def test_default_track_order(self, tmp_session):
+        """Tracks are ordered by album, then disc, then track number."""
+        album_b = album_factory(title="b", num_tracks=0)
+        album_a = album_factory(title="A", num_tracks=0)
+        track_factory(album=album_b, track_num=1)
+        track_factory(album=album_a, track_num=2, disc=2)
+        track_factory(album=album_a, track_num=3)
+        track_factory(album=album_a, track_num=1, disc=2)
+        tmp_session.add_all([album_a, album_b])
+        tmp_session.flush()
+
+        tracks = query(
+            tmp_session,
+            "*",
+            QueryType.TRACK,
+            order_by=DEFAULT_ORDER_BY[QueryType.TRACK],
+        )
+
+        assert [
+            (track.album.title, track.disc, track.track_num) for track in tracks
+        ] == [
+            ("A", 1, 3),
+            ("A", 2, 1),
+            ("A", 2, 2),
+            ("b", 1, 1),
+        ]
+
+    def test_descending(self, tmp_session):
+        """Keys prefixed with '-' are ordered in descending order."""
+        tmp_session.add(album_factory(date=date(2000, 1, 1)))
+        tmp_session.add(album_factory(date=date(2020, 1, 1)))
+        tmp_session.flush()
+
+        albums = query(tmp_session, "*", QueryType.ALBUM, order_by=["-date"])
+
+        assert [album.date.year for album in albums] == [2020, 2000]
+
+    def test_custom_field(self, tmp_session):
+        """Items can be ordered by custom fields, with empty values last."""
+        tmp_session.add(album_factory())
+        tmp_session.add(album_factory(rating=5))
+        tmp_session.add(album_factory(rating=1))
+        tmp_session.flush()
+
+        albums = query(tmp_session, "*", QueryType.ALBUM, order_by=["rating"])
+
+        assert [album.custom.get("rating") for album in albums] == [1, 5, None]
+
+    def test_streaming(self, tmp_session):
+        """Iterated queries are ordered the same."""
+        tmp_session.add(album_factory(title="b"))
+        tmp_session.add(album_factory(title="a"))
+        tmp_session.flush()
+
+        albums = iter_query(
+            tmp_session, "*", QueryType.ALBUM, order_by=["title"], batch_size=1
+        )
+
+        assert [album.title for album in albums] == ["a", "b"]
+
+    def test_pages(self, tmp_session):
+        """Ordered queries can be paged through with a limit and offset."""
+        for title in ["c", "a", "d", "b"]:
+            tmp_session.add(album_factory(title=title))
+        tmp_session.flush()
+
+        pages = [
+            query(tmp_session, "*", QueryType.ALBUM, order_by=["title"], limit=3),
+            query(
+                tmp_session, "*", QueryType.ALBUM, order_by=["title"], limit=3, offset=3
+            ),
+        ]
+
+        assert [[album.title for album in page] for page in pages] == [
+            ["a", "b", "c"],
+            ["d"],
+        ]
+
+    @pytest.mark.parametrize("key", ["t:title", "tracks", "bad key", "a:path;"])
+    def test_invalid_key(self, tmp_session, key):
+        """Invalid keys, or keys of unrelated item types, raise a QueryError."""
+        with pytest.raises(QueryError):
+            query(tmp_session, "*", QueryType.ALBUM, order_by=[key])
+
+
+class TestLoad:
+    """Test loading relationships along with the queried items."""
+
+    @pytest.fixture
+    def selects(self, tmp_session) -> Iterator[list[str]]:
+        """Records the SELECT statements executed by ``tmp_session``."""
+        statements: list[str] = []
+
+        def record_statement(conn, cursor, statement, *args):
+            if statement.startswith("SELECT"):
+                statements.append(statement)
+
+        engine = tmp_session.get_bind()
+        sa.event.listen(engine, "before_cursor_execute", record_statement)
+        yield statements
+        sa.event.remove(engine, "before_cursor_execute", record_statement)
+
+    def test_album_collections(self, tmp_session, selects):
+        """Album tracks and extras can be loaded without a query per album."""
+        tmp_session.add_all([album_factory(), album_factory(), album_factory()])
+        tmp_session.flush()
+        tmp_session.expunge_all()
+
+        albums = query(tmp_session, "*", QueryType.ALBUM, load=("tracks", "extras"))
+        query_selects = len(selects)
+        for album in albums:
+            assert album.tracks
+            assert album.extras
+
+        assert len(selects) == query_selects
+
+    def test_nested(self, tmp_session, selects):
+        """Nested relationships can be loaded."""
+        tmp_session.add_all([album_factory(), album_factory()])
+        tmp_session.flush()
+        tmp_session.expunge_all()
+
+        tracks = iter_query(
+            tmp_session, "*", QueryType.TRACK, load=("album.extras",), batch_size=1
+        )
+        for track in tracks:
+            track_selects = len(selects)
+            assert track.album.extras
+            assert len(selects) == track_selects
+
+    @pytest.mark.parametrize("rel_path", ["title", "tracks.bad", ""])
+    def test_invalid_relationship(self, tmp_session, rel_path):
+        """Loading anything other than a relationship raises a QueryError."""
+        with pytest.raises(QueryError):
+            query(tmp_session, "*", QueryType.ALBUM, load=(rel_path,))
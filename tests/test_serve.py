@@ -0,0 +1,278 @@
+"""Tests the ``serve`` plugin."""
+
+import argparse
+import fcntl
+import json
+import os
+import socket
+import stat
+from unittest.mock import patch
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm.session import Session
+
+import moe
+import moe.cli
+from moe import config
+from moe.client import SOCKET_FILENAME, STD_FDS
+from moe.config import ExtraPlugin, moe_sessionmaker
+from moe.library import Album
+from moe.serve import (
+    LOCK_FILENAME,
+    _get_peer_uid,
+    _handle_connection,
+    _listen,
+    _receive_request,
+    _write_lock,
+)
+from tests.conftest import album_factory
+
+
+class EnvPlugin:
+    """Adds a command that prints its environment and terminal."""
+
+    @staticmethod
+    @moe.hookimpl
+    def add_command(cmd_parsers: argparse._SubParsersAction):
+        """Adds the ``env`` command."""
+        env_parser = cmd_parsers.add_parser("env")
+        env_parser.set_defaults(func=EnvPlugin.print_env)
+
+    @staticmethod
+    def print_env(session: Session, args: argparse.Namespace):
+        """Prints the test variable, and the width and color system of the console."""
+        console = moe.cli.console
+        console.print(
+            os.environ["MOE_TEST"], console.width, console.color_system, highlight=False
+        )
+
+
+@pytest.fixture
+def _tmp_serve_config(tmp_config):
+    """A temporary config for the serve plugin with the cli and a library."""
+    tmp_config('default_plugins = ["cli", "list", "serve"]', init_db=True)
+
+
+def run_command(args: list[str], env: dict[str, str] | None = None) -> int:
+    """Runs a command through the daemon's connection handler.
+
+    Args:
+        args: Commandline arguments of the command.
+        env: Environment of the client. Defaults to the current environment.
+
+    Returns:
+        The exit code of the command.
+    """
+    client, server = socket.socketpair()
+    with client, server:
+        request = {"args": args, "cwd": ".", "env": env or dict(os.environ)}
+        socket.send_fds(client, [json.dumps(request).encode() + b"\n"], list(STD_FDS))
+        _handle_connection(server)
+
+        responses = client.makefile("rb")
+        assert "pid" in json.loads(responses.readline())
+        return json.loads(responses.readline())["exit_code"]
+
+
+@pytest.mark.usefixtures("_tmp_serve_config")
+class TestRunCommand:
+    """Test running commands sent to the daemon."""
+
+    def test_output(self, capfd):
+        """Commands write to the client's standard streams."""
+        album = album_factory()
+        with moe_sessionmaker.begin() as session:
+            session.add(album)
+            album_str = str(album)
+
+        exit_code = run_command(["ls", "-a", "*"])
+
+        assert exit_code == 0
+        assert capfd.readouterr().out.strip("\n") == album_str
+
+    def test_exit_code(self):
+        """The exit code of a failed command is sent to the client."""
+        exit_code = run_command(["ls", "*"])  # empty library
+
+        assert exit_code == 1
+
+    def test_invalid_command(self, capfd):
+        """Commands with invalid arguments exit like they would with the cli."""
+        exit_code = run_command(["not_a_command"])
+
+        assert exit_code == 2  # noqa: PLR2004 argparse's exit code
+        assert "invalid choice" in capfd.readouterr().err
+
+    def test_env(self, capfd, tmp_config):
+        """Commands use the client's environment and terminal."""
+        tmp_config(
+            'default_plugins = ["cli", "serve"]',
+            init_db=True,
+            extra_plugins=[ExtraPlugin(EnvPlugin, "env_plugin")],
+        )
+
+        env = {"COLUMNS": "42", "FORCE_COLOR": "1", "MOE_TEST": "client"}
+        exit_code = run_command(["env"], env=env)
+
+        assert exit_code == 0
+        assert capfd.readouterr().out.strip() == "client 42 standard"
+
+
+class TestConnection:
+    """Test accepting connections from clients."""
+
+    def test_socket_permissions(self, tmp_path):
+        """Only the current user can connect to the socket."""
+        socket_path = tmp_path / SOCKET_FILENAME
+        umask = os.umask(0o022)
+        try:
+            with _listen(socket_path):
+                assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600  # noqa: PLR2004
+            assert os.umask(0o022) == 0o022  # noqa: PLR2004 the umask is restored
+        finally:
+            os.umask(umask)
+
+    @pytest.mark.skipif(
+        not hasattr(socket, "SO_PEERCRED"), reason="SO_PEERCRED is Linux only"
+    )
+    def test_peer_uid(self):
+        """The user id of the client is checked."""
+        client, server = socket.socketpair()
+        with client, server:
+            assert _get_peer_uid(server) == os.getuid()
+
+    def test_other_user(self):
+        """Commands from other users aren't run."""
+        client, server = socket.socketpair()
+        with (
+            client,
+            server,
+            patch("moe.serve._get_peer_uid", return_value=os.getuid() + 1),
+            patch("moe.serve.os.fork", autospec=True) as mock_fork,
+        ):
+            _handle_connection(server)
+
+        mock_fork.assert_not_called()
+
+    def test_receive_timeout(self):
+        """Clients that don't send a request are timed out."""
+        client, server = socket.socketpair()
+        with client, server, patch("moe.serve._RECV_TIMEOUT", 0.01):
+            assert _receive_request(server) is None
+
+    def test_no_request(self):
+        """Clients may connect without sending a request, e.g. to check the daemon."""
+        client, server = socket.socketpair()
+        with server:
+            client.close()
+
+            assert _receive_request(server) is None
+
+    def test_incomplete_request(self):
+        """Requests cut off by the client closing the connection are invalid."""
+        client, server = socket.socketpair()
+        with server:
+            socket.send_fds(client, [b'{"args": '], list(STD_FDS))
+            client.close()
+
+            assert _receive_request(server) is None
+
+
+@pytest.mark.usefixtures("_tmp_serve_config")
+class TestWriteLock:
+    """Test locking the library while commands write to it."""
+
+    def is_locked(self) -> bool:
+        """Returns whether the library lock is held by a command."""
+        lock_path = config.CONFIG.config_dir / LOCK_FILENAME
+        with lock_path.open("a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return True
+
+            return False
+
+    def test_read(self):
+        """Reading the library doesn't take the lock."""
+        with _write_lock(), moe_sessionmaker.begin() as session:
+            session.scalars(sa.select(Album)).all()
+
+            assert not self.is_locked()
+
+    def test_write(self):
+        """The lock is held from the first write until the session is committed."""
+        with _write_lock():
+            with moe_sessionmaker.begin() as session:
+                session.add(album_factory())
+                assert not self.is_locked()
+
+                session.flush()
+                assert self.is_locked()
+
+            assert not self.is_locked()
+
+    def test_statement(self):
+        """Statements that write to the library take the lock."""
+        with _write_lock(), moe_sessionmaker.begin() as session:
+            session.execute(sa.text("ANALYZE"))
+
+            assert self.is_locked()
+
+    def test_rollback(self):
+        """The lock is released if the session is rolled back."""
+        with _write_lock(), moe_sessionmaker() as session:
+            session.add(album_factory())
+            session.flush()
+            session.rollback()
+
+            assert not self.is_locked()
+
+    def test_listeners_removed(self):
+        """Sessions outside of the command don't take the lock."""
+        with _write_lock():
+            pass
+
+        with moe_sessionmaker.begin() as session:
+            session.add(album_factory())
+            session.flush()
+
+            assert not self.is_locked()
+
+
+@pytest.mark.usefixtures("_tmp_serve_config")
+class TestParseArgs:
+    """Test the plugin argument parser."""
+
+    def test_serve(self):
+        """Serve on the socket in the configuration directory."""
+        with patch("moe.serve.serve", autospec=True) as mock_serve:
+            moe.cli.main(["serve"])
+
+        mock_serve.assert_called_once_with(config.CONFIG.config_dir / SOCKET_FILENAME)
+
+    def test_already_running(self):
+        """Exit if a daemon is already running."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as daemon:
+            daemon.bind(str(config.CONFIG.config_dir / SOCKET_FILENAME))
+            daemon.listen()
+
+            with (
+                patch("moe.serve.serve", autospec=True) as mock_serve,
+                pytest.raises(SystemExit) as error,
+            ):
+                moe.cli.main(["serve"])
+
+        assert error.value.code != 0
+        mock_serve.assert_not_called()
+
+
+class TestPluginRegistration:
+    """Test the `plugin_registration` hook implementation."""
+
+    def test_no_cli(self, tmp_config):
+        """Don't enable the serve plugin if the `cli` plugin is not enabled."""
+        config = tmp_config(settings='default_plugins = ["serve"]')
+
+        assert not config.pm.has_plugin("serve")
@@ -1,6 +1,7 @@
 """Tests the ``write`` plugin."""
 
 import datetime
+import os
 from unittest.mock import MagicMock, patch
 
 import mediafile
@@ -15,8 +16,12 @@ from tests.conftest import album_factory, extra_factory, track_factory
 
 @pytest.fixture
 def mock_write():
-    """Mock the `write_tags` api call."""
-    with patch("moe.write.write_tags", autospec=True) as mock_edit:
+    """Mock writing tags to track files."""
+    with patch(
+        "moe.write._write_track_file",
+        autospec=True,
+        return_value=os.stat_result((0,) * 10),
+    ) as mock_edit:
         yield mock_edit
 
 
@@ -122,6 +127,46 @@ class TestWriteTags:
         assert new_album.original_date == original_date
         assert new_album.track_total == track_total
 
+    def test_file_synced(self, tmp_config):
+        """Tracks are synced with their file after writing their tags."""
+        tmp_config()
+        track = track_factory(exists=True)
+        track.path.write_bytes(track.path.read_bytes())
+        assert track.is_file_changed()
+
+        moe_write.write_tags(track)
+
+        assert not track.is_file_changed()
+
+    def test_file_synced_during_flush(self, tmp_config, tmp_session):
+        """Tracks written during a flush are synced as part of the same flush."""
+        tmp_config(settings="default_plugins = ['write']", tmp_db=True)
+        track = track_factory(exists=True)
+        tmp_session.add(track)
+        tmp_session.flush()
+
+        track.title = "new title"
+        tmp_session.flush()
+
+        assert not tmp_session.dirty
+        tmp_session.expire(track)
+        assert not track.is_file_changed()
+
+    def test_album_file_synced_during_flush(self, tmp_config, tmp_session):
+        """Unchanged tracks of a changed album are also synced in the same flush."""
+        tmp_config(settings="default_plugins = ['write']", tmp_db=True)
+        album = album_factory(exists=True)
+        tmp_session.add(album)
+        tmp_session.flush()
+
+        album.title = "new title"
+        tmp_session.flush()
+
+        assert not any(tmp_session.is_modified(item) for item in tmp_session.dirty)
+        for track in album.tracks:
+            tmp_session.expire(track)
+            assert not track.is_file_changed()
+
 
 @pytest.mark.usefixtures("_tmp_write_config")
 class TestProcessNewItems:
@@ -222,3 +267,27 @@ class TestProcessChangedItems:
         )
 
         mock_write.assert_called_once_with(track)
+
+    def test_only_audio_properties_changed(self, tmp_session, mock_write):
+        """Don't write tags if only the stored audio properties of a track changed."""
+        track = track_factory(exists=True)
+        tmp_session.add(track)
+        tmp_session.flush()
+        mock_write.reset_mock()
+
+        track.refresh_audio_properties(force=True)
+        config.CONFIG.pm.hook.process_changed_items(session=tmp_session, items=[track])
+
+        mock_write.assert_not_called()
+
+    def test_only_path_changed(self, tmp_session, mock_write):
+        """Don't write tags if only the path of an item changed."""
+        album = album_factory(exists=True)
+        tmp_session.add(album)
+        tmp_session.flush()
+        mock_write.reset_mock()
+
+        album.path /= "moved"
+        config.CONFIG.pm.hook.process_changed_items(session=tmp_session, items=[album])
+
+        mock_write.assert_not_called()
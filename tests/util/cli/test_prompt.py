@@ -20,7 +20,7 @@ class TestChoicePrompt:
         assert track.title != "a"
 
         with patch(
-            "moe.util.cli.prompt.questionary.select",
+            "questionary.select",
             **{"return_value.ask.return_value": "a"},
         ):
             prompt_choice = choice_prompt([mock_choice1, mock_choice2])
@@ -34,7 +34,7 @@ class TestChoicePrompt:
 
         with (
             patch(
-                "moe.util.cli.prompt.questionary.select",
+                "questionary.select",
                 **{"return_value.ask.return_value": "a"},
             ),
             pytest.raises(SystemExit) as error,
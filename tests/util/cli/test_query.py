@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from moe.query import QueryError, QueryType
-from moe.util.cli import cli_query, query_parser
+from moe.util.cli import cli_iter_query, cli_query, query_parser
 
 
 @pytest.fixture
@@ -35,7 +35,9 @@ class TestCLIQuery:
             cli_query(mock_session, "bad query", QueryType.TRACK)
 
         assert error.value.code != 0
-        mock_query.assert_called_once_with(mock_session, "bad query", QueryType.TRACK)
+        mock_query.assert_called_once_with(
+            mock_session, "bad query", QueryType.TRACK, load=()
+        )
 
     def test_empty_query(self, mock_query):
         """Exit with non-zero code if bad query given."""
@@ -46,7 +48,7 @@ class TestCLIQuery:
             cli_query(mock_session, "*", QueryType.TRACK)
 
         assert error.value.code != 0
-        mock_query.assert_called_once_with(mock_session, "*", QueryType.TRACK)
+        mock_query.assert_called_once_with(mock_session, "*", QueryType.TRACK, load=())
 
     def test_good_query(self, mock_query):
         """Call a good query if items passed."""
@@ -56,7 +58,47 @@ class TestCLIQuery:
         items = cli_query(mock_session, "*", QueryType.TRACK)
 
         assert items == ["item1", "item2"]
-        mock_query.assert_called_once_with(mock_session, "*", QueryType.TRACK)
+        mock_query.assert_called_once_with(mock_session, "*", QueryType.TRACK, load=())
+
+
+class TestCLIIterQuery:
+    """Test `cli_iter_query`."""
+
+    @pytest.fixture
+    def mock_iter_query(self) -> Iterator[FunctionType]:
+        """Mock a database iter_query call."""
+        with patch("moe.util.cli.query.iter_query", autospec=True) as mock_iter_query:
+            yield mock_iter_query
+
+    def test_bad_query(self, mock_iter_query):
+        """Exit with non-zero code if bad query given, before iterating."""
+        mock_iter_query.return_value.__next__.side_effect = QueryError
+
+        with pytest.raises(SystemExit) as error:
+            cli_iter_query(MagicMock(), "bad query", QueryType.TRACK)
+
+        assert error.value.code != 0
+
+    def test_empty_query(self, mock_iter_query):
+        """Exit with non-zero code if no items are found."""
+        mock_iter_query.return_value = iter([])
+
+        with pytest.raises(SystemExit) as error:
+            cli_iter_query(MagicMock(), "*", QueryType.TRACK)
+
+        assert error.value.code != 0
+
+    def test_good_query(self, mock_iter_query):
+        """All items are iterated over, including the one checked for."""
+        mock_iter_query.return_value = iter(["item1", "item2"])
+        mock_session = MagicMock()
+
+        items = cli_iter_query(mock_session, "*", QueryType.TRACK)
+
+        assert list(items) == ["item1", "item2"]
+        mock_iter_query.assert_called_once_with(
+            mock_session, "*", QueryType.TRACK, order_by=None, load=()
+        )
 
 
 class TestQueryParser:
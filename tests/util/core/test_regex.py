@@ -0,0 +1,55 @@
+"""Tests regular expression matching for queries."""
+
+import pytest
+
+from moe.util.core import compile_regexp, regexp, regexp_like_pattern
+
+
+class TestRegexp:
+    """Test ``regexp()``."""
+
+    def test_case_insensitive(self):
+        """Matches should be case-insensitive."""
+        assert regexp("^the", "The Beatles")
+        assert not regexp("^beatles", "The Beatles")
+
+    def test_non_str(self):
+        """Non-str values are matched against their str."""
+        assert regexp(r"^\d+$", 2020)
+
+    def test_compiled_once(self):
+        """Patterns are only compiled once."""
+        compile_regexp.cache_clear()
+
+        regexp("abc", "abc")
+        regexp("abc", "def")
+
+        assert compile_regexp.cache_info().misses == 1
+
+
+class TestRegexpLikePattern:
+    """Test ``regexp_like_pattern()``."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "like_pattern"),
+        [
+            ("beat.*s", "%beat%"),
+            ("^the", "the%"),
+            ("^a?bc", "%bc%"),
+            ("ab+c", "%ab%"),
+            ("a{2}bc", "%bc%"),
+            ("(abc)?de", "%de%"),
+            ("[^]abc]de", "%de%"),
+            (r"\.mp3$", "%.mp3%"),
+            (r"\bword\b", "%word%"),
+            ("100%_a/b", "%100/%/_a//b%"),
+        ],
+    )
+    def test_required_literal(self, pattern, like_pattern):
+        """The longest literal run required by the pattern is used."""
+        assert regexp_like_pattern(pattern) == like_pattern
+
+    @pytest.mark.parametrize("pattern", ["abc|def", "(?i)abc", ".*", "[a-z]+", "é"])
+    def test_no_pattern(self, pattern):
+        """Patterns without a guaranteed literal, or that are ambiguous, return None."""
+        assert regexp_like_pattern(pattern) is None